@@ -0,0 +1,24 @@
+from agno.agent import AgentKnowledge
+from agno.embedder import EmbeddingCache
+from agno.embedder.cache import SqliteEmbeddingCacheBackend
+from agno.embedder.openai import OpenAIEmbedder
+from agno.vectordb.pgvector import PgVector
+
+# Keep the 1024 most recent embeddings in memory, and every embedding in a local SQLite file
+embedding_cache = EmbeddingCache(max_size=1024, backend=SqliteEmbeddingCacheBackend(db_file="tmp/embedding_cache.db"))
+embedder = OpenAIEmbedder(embedding_cache=embedding_cache)
+
+# The second call is served from the cache
+embeddings = embedder.get_cached_embedding("The quick brown fox jumps over the lazy dog.")
+embeddings = embedder.get_cached_embedding("The quick brown fox jumps over the lazy dog.")
+print(f"Cache hits: {embedding_cache.hits}, misses: {embedding_cache.misses}")
+
+# Query embeddings and re-ingested chunks are served from the cache too
+knowledge_base = AgentKnowledge(
+    vector_db=PgVector(
+        db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        table_name="cached_openai_embeddings",
+        embedder=embedder,
+    ),
+    num_documents=2,
+)
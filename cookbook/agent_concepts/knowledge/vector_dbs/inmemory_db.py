@@ -0,0 +1,24 @@
+# install numpy - `uv pip install numpy`
+# Add OPENAI_API_KEY to your environment variables for the agent response
+
+from agno.agent import Agent
+from agno.knowledge.pdf_url import PDFUrlKnowledgeBase
+from agno.vectordb.inmemory import InMemoryVectorDb, SearchType
+
+# The collection is searched in-process and persisted to tmp/inmemorydb
+vector_db = InMemoryVectorDb(collection="recipes", path="tmp/inmemorydb", search_type=SearchType.hybrid)
+
+# Create a new PDFUrlKnowledgeBase
+knowledge_base = PDFUrlKnowledgeBase(
+    urls=["https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf"],
+    vector_db=vector_db,
+)
+
+# Load the knowledge base - after first run, comment out
+knowledge_base.load(recreate=False)
+# Writes are saved in batches, save the rest now
+vector_db.flush()
+
+# Create and use the agent
+agent = Agent(knowledge=knowledge_base, show_tool_calls=True)
+agent.print_response("Show me how to make Tom Kha Gai", markdown=True)
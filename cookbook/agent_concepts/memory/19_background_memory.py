@@ -0,0 +1,51 @@
+"""
+This example shows you how to create memories and session summaries in the background.
+
+With a `MemoryJobQueue` on the memory, runs return as soon as the answer is ready and the memory updates are done
+by background workers. Updates for the same user are coalesced, and the next run of the user waits for them.
+
+The SQLite backend keeps queued jobs on disk, so jobs interrupted by a restart are replayed.
+"""
+
+from uuid import uuid4
+
+from agno.agent.agent import Agent
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
+from agno.memory.v2.jobs import MemoryJobQueue, SqliteMemoryJobBackend
+from agno.memory.v2.memory import Memory
+from agno.models.openai import OpenAIChat
+from rich.pretty import pprint
+
+memory = Memory(
+    db=SqliteMemoryDb(table_name="memory", db_file="tmp/memory.db"),
+    job_queue=MemoryJobQueue(backend=SqliteMemoryJobBackend(db_file="tmp/memory_jobs.db")),
+)
+
+# Reset the memory for this example
+memory.clear()
+
+session_id = str(uuid4())
+john_doe_id = "john_doe@example.com"
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    memory=memory,
+    enable_user_memories=True,
+    enable_session_summaries=True,
+)
+
+agent.print_response(
+    "My name is John Doe and I like to hike in the mountains on weekends.",
+    stream=True,
+    user_id=john_doe_id,
+    session_id=session_id,
+)
+
+# This run waits for the memory update of the first run before it starts
+agent.print_response(
+    "What are my hobbies?", stream=True, user_id=john_doe_id, session_id=session_id
+)
+
+memory.wait_for_jobs(user_id=john_doe_id)
+pprint(memory.get_user_memories(user_id=john_doe_id))
+pprint(memory.get_session_summary(session_id=session_id, user_id=john_doe_id))
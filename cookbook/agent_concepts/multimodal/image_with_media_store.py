@@ -0,0 +1,25 @@
+"""Store image bytes in a content-addressed media store, so the session only holds references."""
+
+from pathlib import Path
+
+from agno.agent import Agent
+from agno.media import Image
+from agno.models.openai import OpenAIChat
+from agno.storage.media import LocalMediaStore
+from agno.storage.sqlite import SqliteStorage
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o"),
+    storage=SqliteStorage(table_name="media_store_sessions", db_file="tmp/agent.db"),
+    # Identical images are stored once, and loaded only when the model needs them
+    media_store=LocalMediaStore(base_dir="tmp/media"),
+    add_history_to_messages=True,
+    markdown=True,
+)
+
+image_path = Path(__file__).parent.joinpath("sample.jpg")
+agent.print_response(
+    "Write a 3 sentence fiction story about the image",
+    images=[Image(content=image_path.read_bytes())],
+)
+agent.print_response("Now make the story funnier")
@@ -0,0 +1,47 @@
+"""Evaluate an agent against a dataset of cases, running cases concurrently and resuming interrupted runs.
+
+Each line of the dataset is a case with an `input`, and an `expected_output` and/or `expected_tool_calls`.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+from agno.agent import Agent
+from agno.eval.batch import BatchEval, BatchEvalResult
+from agno.models.openai import OpenAIChat
+from agno.tools.calculator import CalculatorTools
+
+dataset = Path("tmp/calculator_cases.jsonl")
+dataset.parent.mkdir(parents=True, exist_ok=True)
+dataset.write_text(
+    "\n".join(
+        json.dumps(
+            {
+                "id": f"multiply-{i}",
+                "input": f"What is {i} times {i + 1}?",
+                "expected_output": str(i * (i + 1)),
+                "expected_tool_calls": ["multiply"],
+            }
+        )
+        for i in range(1, 21)
+    )
+)
+
+evaluation = BatchEval(
+    name="Calculator Batch Evaluation",
+    cases=str(dataset),
+    agent=Agent(
+        model=OpenAIChat(id="gpt-4o"),
+        tools=[CalculatorTools(enable_all=True)],
+        instructions="You must use the calculator tools for arithmetic.",
+    ),
+    model=OpenAIChat(id="o4-mini"),
+    additional_guidelines="Its ok for the output to include additional text relevant to the calculation.",
+    concurrency=8,
+    # Rerunning the script skips the cases that already finished
+    checkpoint_file="tmp/calculator_cases_checkpoint.jsonl",
+)
+
+result: Optional[BatchEvalResult] = evaluation.run(print_summary=True, print_results=True)
+assert result is not None and result.avg_score >= 8
@@ -0,0 +1,29 @@
+"""Run `pip install agno` to install dependencies."""
+
+from agno.document.base import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.eval.performance import PerformanceEval
+
+# ~5M characters of prose with mixed whitespace
+paragraph = "Agno is a lightweight library for building agents.\n\n  It is\tfast, and it is simple. " * 60
+document = Document(name="large_document", content=paragraph * 1000)
+
+fixed_chunking = FixedSizeChunking(chunk_size=5000, overlap=200)
+recursive_chunking = RecursiveChunking(chunk_size=5000, overlap=200)
+
+
+def chunk_fixed():
+    return fixed_chunking.chunk(document)
+
+
+def chunk_recursive():
+    return recursive_chunking.chunk(document)
+
+
+fixed_eval = PerformanceEval(name="Fixed size chunking", func=chunk_fixed, num_iterations=5)
+recursive_eval = PerformanceEval(name="Recursive chunking", func=chunk_recursive, num_iterations=5)
+
+if __name__ == "__main__":
+    fixed_eval.run(print_results=True, print_summary=True)
+    recursive_eval.run(print_results=True, print_summary=True)
@@ -0,0 +1,51 @@
+"""Benchmark framework overhead under concurrent load, with no model provider or network.
+
+Run `pip install agno httpx fastapi` to install dependencies.
+"""
+
+from agno.agent import Agent
+from agno.app.fastapi.app import FastAPIApp
+from agno.eval.load import LoadTest, agent_request, app_request
+from agno.models.scripted import ScriptedModel, ScriptedToolCall, ScriptedTurn
+
+
+def get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"It is sunny in {city}"
+
+
+# A model that calls a tool, then streams its answer: 50ms to the first token, 5ms per token
+model = ScriptedModel(
+    script=[
+        ScriptedTurn(tool_calls=[ScriptedToolCall(name="get_weather", arguments={"city": "Paris"})]),
+        "The weather in Paris is sunny, with a light breeze in the afternoon.",
+    ],
+    latency=0.05,
+    token_latency=0.005,
+)
+
+
+def get_agent() -> Agent:
+    return Agent(agent_id="weather-agent", model=model, tools=[get_weather], telemetry=False, monitoring=False)
+
+
+agent_load_test = LoadTest(
+    name="Agent under load",
+    func=agent_request(get_agent(), "What is the weather in Paris?", stream=True),
+    num_requests=200,
+    concurrency=20,
+    warmup_requests=10,
+)
+
+fastapi_app = FastAPIApp(agents=[get_agent()], monitoring=False)
+app_load_test = LoadTest(
+    name="FastAPI app under load",
+    func=app_request(fastapi_app.get_app(), "What is the weather in Paris?", agent_id="weather-agent", stream=True),
+    num_requests=200,
+    concurrency=20,
+    warmup_requests=10,
+)
+
+if __name__ == "__main__":
+    agent_load_test.run(print_summary=True)
+    app_load_test.run(print_summary=True)
@@ -0,0 +1,94 @@
+"""Microbenchmarks of the per-token overhead of streaming runs, with no model provider or network.
+
+Each benchmark streams a scripted response of NUM_TOKENS tokens and reports the time and the allocations per token:
+- the peak memory traced while streaming, divided by the number of tokens
+- the memory blocks still allocated after the run, divided by the number of tokens (stored events, for example)
+
+Run `pip install agno` to install dependencies.
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.scripted import ScriptedModel
+from agno.team.team import Team
+
+NUM_TOKENS = 2000
+
+text = " ".join(f"token{i}" for i in range(NUM_TOKENS))
+
+
+def get_agent(**kwargs) -> Agent:
+    return Agent(model=ScriptedModel(script=[text]), telemetry=False, monitoring=False, **kwargs)
+
+
+agent = get_agent()
+agent_storing_events = get_agent(store_events=True, events_to_skip=[])
+team = Team(
+    members=[get_agent(name="Member")],
+    model=ScriptedModel(script=[text]),
+    telemetry=False,
+    monitoring=False,
+)
+
+
+def stream_agent():
+    for _ in agent.run("Hello", stream=True):
+        pass
+
+
+def stream_agent_storing_events():
+    for _ in agent_storing_events.run("Hello", stream=True):
+        pass
+
+
+def stream_agent_as_json():
+    # What the FastAPI and Playground routers do for every chunk
+    for chunk in agent.run("Hello", stream=True):
+        chunk.to_json()
+
+
+def stream_team():
+    for _ in team.run("Hello", stream=True):
+        pass
+
+
+benchmarks = {
+    "Agent stream": stream_agent,
+    "Agent stream, storing events": stream_agent_storing_events,
+    "Agent stream, serialized to JSON": stream_agent_as_json,
+    "Team stream": stream_team,
+}
+
+
+def measure_per_token(name: str, func: Callable[[], None]) -> None:
+    func()  # Warm up
+
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+
+    print(
+        f"{name}: {elapsed / NUM_TOKENS * 1e6:.1f} µs/token, "
+        f"{peak / NUM_TOKENS:.0f} peak bytes/token, "
+        f"{retained_blocks / NUM_TOKENS:.1f} retained blocks/token"
+    )
+
+
+if __name__ == "__main__":
+    for name, func in benchmarks.items():
+        measure_per_token(name, func)
+
+    for name, func in benchmarks.items():
+        PerformanceEval(name=name, func=func, num_iterations=10, warmup_runs=2).run(print_summary=True)
@@ -1,32 +1,68 @@
-from agno.agent.agent import (
-    Agent,
-    AgentKnowledge,
-    AgentMemory,
-    AgentSession,
-    Function,
-    Memory,
-    Message,
-    Storage,
-    Toolkit,
-)
-from agno.run.response import (
-    MemoryUpdateCompletedEvent,
-    MemoryUpdateStartedEvent,
-    ReasoningCompletedEvent,
-    ReasoningStartedEvent,
-    ReasoningStepEvent,
-    RunEvent,
-    RunResponse,
-    RunResponseCancelledEvent,
-    RunResponseCompletedEvent,
-    RunResponseContentEvent,
-    RunResponseContinuedEvent,
-    RunResponseErrorEvent,
-    RunResponseEvent,
-    RunResponsePausedEvent,
-    RunResponseStartedEvent,
-    ToolCallCompletedEvent,
-    ToolCallStartedEvent,
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.agent.agent import Agent
+    from agno.knowledge.agent import AgentKnowledge
+    from agno.memory.agent import AgentMemory
+    from agno.memory.v2.memory import Memory
+    from agno.models.message import Message
+    from agno.run.response import (
+        MemoryUpdateCompletedEvent,
+        MemoryUpdateStartedEvent,
+        ReasoningCompletedEvent,
+        ReasoningStartedEvent,
+        ReasoningStepEvent,
+        RunEvent,
+        RunResponse,
+        RunResponseCancelledEvent,
+        RunResponseCompletedEvent,
+        RunResponseContentEvent,
+        RunResponseContinuedEvent,
+        RunResponseErrorEvent,
+        RunResponseEvent,
+        RunResponsePausedEvent,
+        RunResponseStartedEvent,
+        ToolCallCompletedEvent,
+        ToolCallStartedEvent,
+    )
+    from agno.storage.base import Storage
+    from agno.storage.session.agent import AgentSession
+    from agno.tools.function import Function
+    from agno.tools.toolkit import Toolkit
+
+# Exports are imported on first access, so importing a submodule (eg: agno.agent.metrics) does not load the Agent
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Agent": "agno.agent.agent",
+        "AgentKnowledge": "agno.knowledge.agent",
+        "AgentMemory": "agno.memory.agent",
+        "Memory": "agno.memory.v2.memory",
+        "Message": "agno.models.message",
+        "MemoryUpdateCompletedEvent": "agno.run.response",
+        "MemoryUpdateStartedEvent": "agno.run.response",
+        "ReasoningCompletedEvent": "agno.run.response",
+        "ReasoningStartedEvent": "agno.run.response",
+        "ReasoningStepEvent": "agno.run.response",
+        "RunEvent": "agno.run.response",
+        "RunResponse": "agno.run.response",
+        "RunResponseCancelledEvent": "agno.run.response",
+        "RunResponseCompletedEvent": "agno.run.response",
+        "RunResponseContentEvent": "agno.run.response",
+        "RunResponseContinuedEvent": "agno.run.response",
+        "RunResponseErrorEvent": "agno.run.response",
+        "RunResponseEvent": "agno.run.response",
+        "RunResponsePausedEvent": "agno.run.response",
+        "RunResponseStartedEvent": "agno.run.response",
+        "ToolCallCompletedEvent": "agno.run.response",
+        "ToolCallStartedEvent": "agno.run.response",
+        "Storage": "agno.storage.base",
+        "AgentSession": "agno.storage.session.agent",
+        "Function": "agno.tools.function",
+        "Toolkit": "agno.tools.toolkit",
+    },
 )
 
 __all__ = [
@@ -6,6 +6,7 @@ from dataclasses import asdict, dataclass
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -20,18 +21,16 @@ from typing import (
     Type,
     Union,
     cast,
-    get_args,
     overload,
 )
 from uuid import uuid4
 
 from pydantic import BaseModel
+from typing_extensions import TypeGuard
 
 from agno.agent.metrics import SessionMetrics
 from agno.exceptions import ModelProviderError, StopAgentRun
-from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
-from agno.memory.agent import AgentMemory, AgentRun
 from agno.memory.v2.memory import Memory, SessionSummary
 from agno.memory.v2.schema import UserMemory
 from agno.models.base import Model
@@ -41,16 +40,19 @@ from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
 from agno.run.messages import RunMessages
 from agno.run.response import (
+    RUN_RESPONSE_EVENT_TYPES,
     RunEvent,
     RunResponse,
     RunResponseEvent,
     RunResponsePausedEvent,
 )
-from agno.run.team import TeamRunResponse, TeamRunResponseEvent
+from agno.run.team import TEAM_RUN_RESPONSE_EVENT_TYPES, TeamRunResponse, TeamRunResponseEvent
 from agno.storage.base import Storage
+from agno.storage.media.base import MediaStore, use_media_store
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
+from agno.tracing import Tracer, trace_run, traced
 from agno.utils.events import (
     create_memory_update_completed_event,
     create_memory_update_started_event,
@@ -69,6 +71,7 @@ from agno.utils.events import (
     create_tool_call_completed_event,
     create_tool_call_started_event,
 )
+from agno.utils.lazy import is_instance_of, lazy_exports
 from agno.utils.log import (
     log_debug,
     log_error,
@@ -93,6 +96,26 @@ from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
+    from agno.memory.agent import AgentMemory
+
+
+# The legacy memory and knowledge classes used to be imported here, keep them importable from this module
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgentKnowledge": "agno.knowledge.agent",
+        "AgentMemory": "agno.memory.agent",
+        "AgentRun": "agno.memory.agent",
+    },
+)
+
+
+def _is_agent_memory(memory: Any) -> TypeGuard["AgentMemory"]:
+    """True for the legacy AgentMemory, which is only imported when it is used"""
+    return is_instance_of(memory, "agno.memory.agent", "AgentMemory")
+
 
 @dataclass(init=False)
 class Agent:
@@ -169,6 +192,8 @@ class Agent:
 
     # --- Agent Storage ---
     storage: Optional[Storage] = None
+    # Store for media content. If set, sessions hold references to media instead of inline base64 content.
+    media_store: Optional[MediaStore] = None
     # Extra data stored with this agent
     extra_data: Optional[Dict[str, Any]] = None
 
@@ -339,6 +364,8 @@ class Agent:
     # telemetry=True logs minimal telemetry for analytics
     # This helps us improve the Agent and provide better support
     telemetry: bool = True
+    # Records each run as a trace of spans (model calls, tool calls, storage, knowledge search, ...)
+    tracer: Optional[Tracer] = None
 
     def __init__(
         self,
@@ -373,6 +400,7 @@ class Agent:
         retriever: Optional[Callable[..., Optional[List[Union[Dict, str]]]]] = None,
         references_format: Literal["json", "yaml"] = "json",
         storage: Optional[Storage] = None,
+        media_store: Optional[MediaStore] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
@@ -431,6 +459,7 @@ class Agent:
         debug_level: Literal[1, 2] = 1,
         monitoring: bool = False,
         telemetry: bool = True,
+        tracer: Optional[Tracer] = None,
     ):
         self.model = model
         self.name = name
@@ -469,6 +498,7 @@ class Agent:
         self.references_format = references_format
 
         self.storage = storage
+        self.media_store = media_store
         self.extra_data = extra_data
 
         self.tools = tools
@@ -547,6 +577,7 @@ class Agent:
         self.debug_level = debug_level
         self.monitoring = monitoring
         self.telemetry = telemetry
+        self.tracer = tracer
 
         # --- Params not to be set by user ---
         self.session_metrics: Optional[SessionMetrics] = None
@@ -573,6 +604,8 @@ class Agent:
         self._formatter: Optional[SafeFormatter] = None
 
         self._memory_deepcopy_done: bool = False
+        # Memory updates waiting for their session to be written, by session id
+        self._memory_updates_to_queue: Dict[str, Dict[str, Any]] = {}
 
     def set_agent_id(self) -> str:
         if self.agent_id is None:
@@ -978,6 +1011,7 @@ class Agent:
         **kwargs: Any,
     ) -> Iterator[RunResponseEvent]: ...
 
+    @trace_run("agent.run")
     def run(
         self,
         message: Optional[Union[str, List, Dict, Message, BaseModel]] = None,
@@ -1005,6 +1039,9 @@ class Agent:
         # Initialize the Agent
         self.initialize_agent()
 
+        # Wait for queued memory updates of this user, so the run reads its own writes
+        self._wait_for_memory_jobs(user_id=user_id)
+
         # Read existing session from storage
         self.read_from_storage(session_id=session_id)
 
@@ -1356,6 +1393,7 @@ class Agent:
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
 
+    @trace_run("agent.run")
     async def arun(
         self,
         message: Optional[Union[str, List, Dict, Message, BaseModel]] = None,
@@ -1386,6 +1424,9 @@ class Agent:
         # Initialize the Agent
         self.initialize_agent()
 
+        # Wait for queued memory updates of this user, so the run reads its own writes
+        await self._await_memory_jobs(user_id=user_id)
+
         # Read existing session from storage
         self.read_from_storage(session_id=session_id)
 
@@ -1587,6 +1628,7 @@ class Agent:
         knowledge_filters: Optional[Dict[str, Any]] = None,
     ) -> Iterator[RunResponseEvent]: ...
 
+    @trace_run("agent.continue_run")
     def continue_run(
         self,
         run_response: Optional[RunResponse] = None,
@@ -1680,6 +1722,9 @@ class Agent:
         self.stream = self.stream or stream
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
+        # Wait for queued memory updates of this user, so the run reads its own writes
+        self._wait_for_memory_jobs(user_id=user_id)
+
         # Read existing session from storage
         self.read_from_storage(session_id=session_id)
 
@@ -1977,6 +2022,7 @@ class Agent:
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
 
+    @trace_run("agent.continue_run")
     async def acontinue_run(
         self,
         run_response: Optional[RunResponse] = None,
@@ -2070,6 +2116,9 @@ class Agent:
         self.stream = self.stream or stream
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
+        # Wait for queued memory updates of this user, so the run reads its own writes
+        await self._await_memory_jobs(user_id=user_id)
+
         # Read existing session from storage
         self.read_from_storage(session_id=session_id)
 
@@ -2805,12 +2854,12 @@ class Agent:
         session_id: str,
         index_of_last_user_message: int = 0,
     ):
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Add the system message to the memory
             if run_messages.system_message is not None:
                 self.memory.add_system_message(
@@ -2828,6 +2877,8 @@ class Agent:
             if len(messages_for_memory) > 0:
                 self.memory.add_messages(messages=messages_for_memory)
 
+            from agno.memory.agent import AgentRun
+
             # Create an AgentRun object to add to memory
             agent_run = AgentRun(response=run_response)
             agent_run.message = run_messages.user_message
@@ -2863,12 +2914,12 @@ class Agent:
             self.memory.add_run(session_id=session_id, run=run_response)
 
     def _set_session_metrics(self, run_messages: RunMessages):
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Calculate session metrics
             self.session_metrics = self.calculate_metrics(self.memory.messages)
         elif isinstance(self.memory, Memory):
@@ -2880,6 +2931,7 @@ class Agent:
                     run_messages.messages
                 )  # Calculate metrics for the session
 
+    @traced("agent.update_memory")
     def _update_memory(
         self,
         run_messages: RunMessages,
@@ -2888,12 +2940,12 @@ class Agent:
         stream_intermediate_steps: bool = False,
     ) -> Iterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Update the memories with the user message if needed
             if (
                 self.memory.create_user_memories
@@ -2941,6 +2993,7 @@ class Agent:
         elif isinstance(self.memory, Memory):
             yield from self._make_memories_and_summaries(run_messages, session_id, user_id)  # type: ignore
 
+    @traced("agent.update_memory")
     async def _aupdate_memory(
         self,
         run_messages: RunMessages,
@@ -2949,12 +3002,12 @@ class Agent:
         stream_intermediate_steps: bool = False,
     ) -> AsyncIterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
-        if isinstance(self.memory, AgentMemory):
-            self.memory = cast(AgentMemory, self.memory)
+        if _is_agent_memory(self.memory):
+            self.memory = cast("AgentMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             # Update the memories with the user message if needed
             if (
                 self.memory.create_user_memories
@@ -3143,8 +3196,8 @@ class Agent:
         parse_structured_output: bool = False,
         stream_intermediate_steps: bool = False,
     ) -> Iterator[RunResponseEvent]:
-        if isinstance(model_response_event, tuple(get_args(RunResponseEvent))) or isinstance(
-            model_response_event, tuple(get_args(TeamRunResponseEvent))
+        if isinstance(model_response_event, RUN_RESPONSE_EVENT_TYPES) or isinstance(
+            model_response_event, TEAM_RUN_RESPONSE_EVENT_TYPES
         ):
             # We just bubble the event up
             yield self._handle_event(model_response_event, run_response)  # type: ignore
@@ -3430,6 +3483,10 @@ class Agent:
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
+        if self.memory.job_queue is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
 
@@ -3503,6 +3560,11 @@ class Agent:
     ) -> AsyncIterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
+
+        if self.memory.job_queue is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         tasks = []
 
         # Create user memories from single message
@@ -3561,6 +3623,63 @@ class Agent:
                     create_memory_update_completed_event(from_run_response=self.run_response), self.run_response
                 )
 
+    def _enqueue_memories_and_summaries(
+        self,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Hand the memory and summary updates of this run to the memory job queue, without waiting for them."""
+        self.memory = cast(Memory, self.memory)
+
+        messages: List[Message] = []
+        if self.enable_user_memories:
+            user_message_str = (
+                run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+            )
+            if user_message_str:
+                messages.append(Message(role="user", content=user_message_str))
+            for _im in run_messages.extra_messages or []:
+                if isinstance(_im, Message):
+                    messages.append(_im)
+                elif isinstance(_im, dict):
+                    try:
+                        messages.append(Message(**_im))
+                    except Exception as e:
+                        log_warning(f"Failed to validate message during memory update: {e}")
+                else:
+                    log_warning(f"Unsupported message type: {type(_im)}")
+
+        if messages or self.enable_session_summaries:
+            update: Dict[str, Any] = {
+                "messages": messages,
+                "session_id": session_id if self.enable_session_summaries else None,
+                "user_id": user_id,
+                "storage": self.storage,
+            }
+            if self.storage is None:
+                log_debug("Queueing memory and summary updates.")
+                self.memory.enqueue_update(**update)
+            else:
+                # Queued once the session is written, so the background summary is stored on top of this run
+                self._memory_updates_to_queue[session_id] = update
+
+    def _queue_memory_update(self, session_id: str) -> None:
+        """Queue the memory update of a run, after its session was written to storage."""
+        update = self._memory_updates_to_queue.pop(session_id, None)
+        if update is not None and isinstance(self.memory, Memory):
+            log_debug("Queueing memory and summary updates.")
+            self.memory.enqueue_update(**update)
+
+    def _wait_for_memory_jobs(self, user_id: Optional[str] = None) -> None:
+        """Wait for queued memory updates of the user, so the run reads its own writes."""
+        if isinstance(self.memory, Memory) and self.memory.job_queue is not None:
+            self.memory.wait_for_jobs(user_id=user_id)
+
+    async def _await_memory_jobs(self, user_id: Optional[str] = None) -> None:
+        if isinstance(self.memory, Memory) and self.memory.job_queue is not None:
+            await asyncio.to_thread(self.memory.wait_for_jobs, user_id)
+
     def _raise_if_async_tools(self) -> None:
         """Raise an exception if any tools contain async functions"""
         if self.tools is None:
@@ -3648,7 +3767,7 @@ class Agent:
             )
             self._rebuild_tools = True
 
-        if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
+        if _is_agent_memory(self.memory) and self.memory.create_user_memories:
             agent_tools.append(self.update_memory)
         elif isinstance(self.memory, Memory) and self.enable_agentic_memory:
             agent_tools.append(self.get_update_user_memory_function(user_id=user_id, async_mode=async_mode))
@@ -3903,8 +4022,8 @@ class Agent:
 
         """Get an AgentSession object, which can be saved to the database"""
         if self.memory is not None:
-            if isinstance(self.memory, AgentMemory):
-                self.memory = cast(AgentMemory, self.memory)
+            if _is_agent_memory(self.memory):
+                self.memory = cast("AgentMemory", self.memory)
                 memory_dict = self.memory.to_dict()
                 # We only persist the runs for the current session ID (not all runs in memory)
                 memory_dict["runs"] = [
@@ -4055,9 +4174,11 @@ class Agent:
         if self.memory is None:
             self.memory = session.memory  # type: ignore
 
-        if not (isinstance(self.memory, AgentMemory) or isinstance(self.memory, Memory)):
+        if not (_is_agent_memory(self.memory) or isinstance(self.memory, Memory)):
             # Is it a dict of `AgentMemory`?
             if isinstance(self.memory, dict) and "create_user_memories" in self.memory:
+                from agno.memory.agent import AgentMemory
+
                 # Convert dict to AgentMemory
                 self.memory = AgentMemory(**self.memory)
                 # Convert dict to Memory
@@ -4070,10 +4191,12 @@ class Agent:
                 raise TypeError(f"Expected memory to be a dict or AgentMemory, but got {type(self.memory)}")
 
         if session.memory is not None:
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 try:
                     if "runs" in session.memory:
                         try:
+                            from agno.memory.agent import AgentRun
+
                             self.memory.runs = []
                             for run in session.memory["runs"]:
                                 self.memory.runs.append(AgentRun.model_validate(run))
@@ -4148,17 +4271,28 @@ class Agent:
                     from agno.memory.v2.memory import SessionSummary as SessionSummaryV2
 
                     try:
-                        self.memory.summaries = {
+                        summaries = {
                             user_id: {
                                 session_id: SessionSummaryV2.from_dict(summary)
                                 for session_id, summary in user_session_summaries.items()
                             }
                             for user_id, user_session_summaries in session.memory["summaries"].items()
                         }
+                        # Keep summaries written in the background since the session was stored
+                        for user_id, user_session_summaries in (self.memory.summaries or {}).items():
+                            for session_id, summary in user_session_summaries.items():
+                                stored = summaries.get(user_id, {}).get(session_id)
+                                if stored is None or (
+                                    summary.last_updated is not None
+                                    and (stored.last_updated is None or summary.last_updated > stored.last_updated)
+                                ):
+                                    summaries.setdefault(user_id, {})[session_id] = summary
+                        self.memory.summaries = summaries
                     except Exception as e:
                         log_warning(f"Failed to load session summaries: {e}")
         log_debug(f"-*- AgentSession loaded: {session.session_id}")
 
+    @traced("agent.read_from_storage")
     def read_from_storage(
         self,
         session_id: str,
@@ -4173,10 +4307,11 @@ class Agent:
         """
         if self.storage is not None:
             # Get a single session from storage
-            self.agent_session = cast(AgentSession, self.storage.read(session_id=session_id))
+            self.agent_session = cast(AgentSession, self.storage.traced_read(session_id=session_id))
             if self.agent_session is not None:
                 # Load the agent session
-                self.load_agent_session(session=self.agent_session)
+                with use_media_store(self.media_store):
+                    self.load_agent_session(session=self.agent_session)
         return self.agent_session
 
     def refresh_from_storage(self, session_id: str) -> None:
@@ -4188,35 +4323,25 @@ class Agent:
         if not self.storage:
             return
 
-        agent_session_from_db = self.storage.read(session_id=session_id)  # type: ignore
+        agent_session_from_db = self.storage.traced_read(session_id=session_id)  # type: ignore
         if (
             agent_session_from_db is not None
             and agent_session_from_db.memory is not None  # type: ignore
             and "runs" in agent_session_from_db.memory  # type: ignore
         ):
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 return
             try:
-                if self.memory.runs is None:  # type: ignore
-                    self.memory.runs = {}  # type: ignore
-                if session_id not in self.memory.runs:  # type: ignore
-                    self.memory.runs[session_id] = []  # type: ignore
-                for run in agent_session_from_db.memory["runs"]:  # type: ignore
-                    run_session_id = run["session_id"]
-                    skip = False
-                    for existing_run in self.memory.runs[run_session_id]:  # type: ignore
-                        if existing_run.run_id == run["run_id"]:
-                            skip = True
-                            break
-                    if skip:
-                        continue
-                    if "team_id" in run:
-                        self.memory.runs[run_session_id].append(TeamRunResponse.from_dict(run))  # type: ignore
-                    else:
-                        self.memory.runs[run_session_id].append(RunResponse.from_dict(run))  # type: ignore
+                # Only runs that are not already in memory are deserialized and added
+                with use_media_store(self.media_store):
+                    self.memory.merge_runs_from_storage(  # type: ignore
+                        session_id=session_id,
+                        runs=agent_session_from_db.memory["runs"],  # type: ignore
+                    )
             except Exception as e:
                 log_warning(f"Failed to load runs from memory: {e}")
 
+    @traced("agent.write_to_storage")
     def write_to_storage(
         self, session_id: str, user_id: Optional[str] = None, refresh_session: Optional[bool] = False
     ) -> Optional[AgentSession]:
@@ -4229,10 +4354,10 @@ class Agent:
             if refresh_session:
                 self.refresh_from_storage(session_id=session_id)
 
-            self.agent_session = cast(
-                AgentSession,
-                self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
-            )
+            with use_media_store(self.media_store):
+                agent_session = self.get_agent_session(session_id=session_id, user_id=user_id)
+            self.agent_session = cast(AgentSession, self.storage.traced_upsert(session=agent_session))
+            self._queue_memory_update(session_id)
 
         if not self.cache_session:
             if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
@@ -4243,8 +4368,10 @@ class Agent:
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             if introduction is not None:
+                from agno.memory.agent import AgentRun
+
                 # Add an introduction as the first response from the Agent
                 if len(self.memory.runs) == 0:
                     self.memory.add_run(
@@ -4306,7 +4433,7 @@ class Agent:
         """
         self.agent_session = None
         if self.memory is not None:
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 self.memory.clear()
             elif isinstance(self.memory, Memory):
                 self.memory.clear()
@@ -4345,6 +4472,7 @@ class Agent:
             log_warning(f"Template substitution failed: {e}")
             return message
 
+    @traced("agent.get_system_message")
     def get_system_message(self, session_id: str, user_id: Optional[str] = None) -> Optional[Message]:
         """Return the system message for the Agent.
 
@@ -4548,7 +4676,7 @@ class Agent:
             system_message_content += "Stop running when the success_criteria is met.\n\n"
         # 3.3.10 Then add memories to the system prompt
         if self.memory:
-            if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
+            if _is_agent_memory(self.memory) and self.memory.create_user_memories:
                 if self.memory.memories and len(self.memory.memories) > 0:
                     system_message_content += (
                         "You have access to memories from previous interactions with the user that you can use:\n\n"
@@ -4605,7 +4733,7 @@ class Agent:
                     )
 
             # 3.3.11 Then add a summary of the interaction to the system prompt
-            if isinstance(self.memory, AgentMemory) and self.memory.create_session_summary:
+            if _is_agent_memory(self.memory) and self.memory.create_session_summary:
                 if self.memory.summary is not None:
                     system_message_content += "Here is a brief summary of your previous interactions:\n\n"
                     system_message_content += "<summary_of_previous_interactions>\n"
@@ -4818,6 +4946,7 @@ class Agent:
             **kwargs,
         )
 
+    @traced("agent.get_run_messages")
     def get_run_messages(
         self,
         *,
@@ -4901,7 +5030,7 @@ class Agent:
             from copy import deepcopy
 
             history: List[Message] = []
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 history = self.memory.get_messages_from_last_n_runs(
                     last_n=self.num_history_runs, skip_role=self.system_message_role
                 )
@@ -5065,7 +5194,7 @@ class Agent:
             if user_id is None:
                 user_id = "default"
             return self.memory.get_session_summary(session_id=session_id, user_id=user_id)
-        elif isinstance(self.memory, AgentMemory):
+        elif _is_agent_memory(self.memory):
             return self.memory.summary
         else:
             raise ValueError(f"Memory type {type(self.memory)} not supported")
@@ -5080,7 +5209,7 @@ class Agent:
 
         if isinstance(self.memory, Memory):
             return self.memory.get_user_memories(user_id=user_id)
-        elif isinstance(self.memory, AgentMemory):
+        elif _is_agent_memory(self.memory):
             raise ValueError("AgentMemory does not support get_user_memories")
         else:
             raise ValueError(f"Memory type {type(self.memory)} not supported")
@@ -5283,6 +5412,7 @@ class Agent:
             return transfer_instructions
         return ""
 
+    @traced("agent.knowledge_search")
     def get_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -5355,6 +5485,7 @@ class Agent:
             log_warning(f"Error searching knowledge base: {e}")
             raise e
 
+    @traced("agent.knowledge_search")
     async def aget_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -5605,7 +5736,7 @@ class Agent:
 
         gen_session_name_prompt = "Conversation\n"
         messages_for_generating_session_name = []
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             try:
                 message_pairs = self.memory.get_message_pairs()
                 for message_pair in message_pairs[:3]:
@@ -5676,7 +5807,7 @@ class Agent:
         if self.memory is None:
             return []
 
-        if isinstance(self.memory, AgentMemory):
+        if _is_agent_memory(self.memory):
             return self.memory.messages
         elif isinstance(self.memory, Memory):
             return self.memory.get_messages_from_last_n_runs(
@@ -5779,6 +5910,7 @@ class Agent:
 
         return updated_reasoning_content
 
+    @traced("agent.reasoning")
     def reason(self, run_messages: RunMessages) -> Iterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
         # Yield a reasoning started event
@@ -6002,6 +6134,7 @@ class Agent:
                     self.run_response,
                 )
 
+    @traced("agent.reasoning")
     async def areason(self, run_messages: RunMessages) -> Any:
         self.run_response = cast(RunResponse, self.run_response)
         # Yield a reasoning started event
@@ -6374,8 +6507,9 @@ class Agent:
 
     def _handle_event(self, event: RunResponseEvent, run_response: RunResponse):
         # We only store events that are not run_response_content events
-        events_to_skip = [event.value for event in self.events_to_skip] if self.events_to_skip else []
-        if self.store_events and event.event not in events_to_skip:
+        if self.store_events and not (
+            self.events_to_skip and any(event.event == skipped.value for skipped in self.events_to_skip)
+        ):
             if run_response.events is None:
                 run_response.events = []
             run_response.events.append(event)
@@ -6445,7 +6579,7 @@ class Agent:
             import json
 
             history: List[Dict[str, Any]] = []
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 agent_chats = self.memory.get_message_pairs()
 
                 if len(agent_chats) == 0:
@@ -6495,7 +6629,7 @@ class Agent:
             """
             import json
 
-            if isinstance(self.memory, AgentMemory):
+            if _is_agent_memory(self.memory):
                 tool_calls = self.memory.get_tool_calls(num_calls=num_calls)
             elif isinstance(self.memory, Memory):
                 tool_calls = self.memory.get_tool_calls(session_id=session_id, num_calls=num_calls)
@@ -6726,7 +6860,7 @@ class Agent:
         Returns:
             str: A string indicating the status of the task.
         """
-        self.memory = cast(AgentMemory, self.memory)
+        self.memory = cast("AgentMemory", self.memory)
         try:
             return self.memory.update_memory(input=task, force=True) or "Memory updated successfully"
         except Exception as e:
@@ -6789,6 +6923,7 @@ class Agent:
 
         return run_data
 
+    @traced("agent.telemetry")
     def _log_agent_run(self, session_id: str, user_id: Optional[str] = None) -> None:
         self.set_monitoring()
 
@@ -6817,6 +6952,7 @@ class Agent:
         except Exception as e:
             log_debug(f"Could not create agent event: {e}")
 
+    @traced("agent.telemetry")
     async def _alog_agent_run(self, session_id: str, user_id: Optional[str] = None) -> None:
         self.set_monitoring()
 
@@ -6934,7 +7070,7 @@ class Agent:
                     knowledge_filters=knowledge_filters,
                     **kwargs,
                 ):
-                    if isinstance(resp, tuple(get_args(RunResponseEvent))):
+                    if isinstance(resp, RUN_RESPONSE_EVENT_TYPES):
                         if resp.is_paused:
                             resp = cast(RunResponsePausedEvent, resp)
                             response_panel = create_paused_run_response_panel(resp)
@@ -7074,7 +7210,7 @@ class Agent:
                             live_log.update(Group(*panels))
 
                     if (
-                        isinstance(resp, tuple(get_args(RunResponseEvent)))
+                        isinstance(resp, RUN_RESPONSE_EVENT_TYPES)
                         and hasattr(resp, "citations")
                         and resp.citations is not None
                         and resp.citations.urls is not None
@@ -7385,7 +7521,7 @@ class Agent:
                 )
 
                 async for resp in result:
-                    if isinstance(resp, tuple(get_args(RunResponseEvent))):
+                    if isinstance(resp, RUN_RESPONSE_EVENT_TYPES):
                         if resp.is_paused:
                             response_panel = create_paused_run_response_panel(resp)
                             panels.append(response_panel)
@@ -7526,7 +7662,7 @@ class Agent:
                         live_log.update(Group(*panels))
 
                     if (
-                        isinstance(resp, tuple(get_args(RunResponseEvent)))
+                        isinstance(resp, RUN_RESPONSE_EVENT_TYPES)
                         and hasattr(resp, "citations")
                         and resp.citations is not None
                         and resp.citations.urls is not None
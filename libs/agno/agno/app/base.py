@@ -3,14 +3,12 @@ from os import getenv
 from typing import Any, Dict, Optional, Union
 from uuid import uuid4
 
-import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRouter
 from starlette.middleware.cors import CORSMiddleware
 
 from agno.agent.agent import Agent
-from agno.api.app import AppCreate, create_app
 from agno.app.settings import APIAppSettings
 from agno.team.team import Team
 from agno.utils.log import log_debug, log_info
@@ -163,6 +161,8 @@ class BaseAPIApp(ABC):
         self.register_app_on_platform()
         log_info(f"Starting API on {host}:{port}")
 
+        import uvicorn
+
         uvicorn.run(app=app, host=host, port=port, reload=reload, **kwargs)
 
     def register_app_on_platform(self) -> None:
@@ -170,6 +170,8 @@ class BaseAPIApp(ABC):
         if not self.monitoring:
             return
 
+        from agno.api.app import AppCreate, create_app
+
         try:
             log_debug(f"Creating app on Platform: {self.name}, {self.app_id}")
             create_app(app=AppCreate(name=self.name, app_id=self.app_id, config=self.to_dict()))
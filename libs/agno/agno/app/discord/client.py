@@ -1,10 +1,10 @@
+from functools import partial
 from os import getenv
 from textwrap import dedent
 from typing import Optional, Union
 
-import requests
-
 from agno.agent.agent import Agent, RunResponse
+from agno.app.message_queue import SessionMessageQueue
 from agno.media import Audio, File, Image, Video
 from agno.team.team import Team, TeamRunResponse
 from agno.utils.log import log_info, log_warning
@@ -51,10 +51,16 @@ class RequiresConfirmationView(discord.ui.View):
 
 class DiscordClient:
     def __init__(
-        self, agent: Optional[Agent] = None, team: Optional[Team] = None, client: Optional[discord.Client] = None
+        self,
+        agent: Optional[Agent] = None,
+        team: Optional[Team] = None,
+        client: Optional[discord.Client] = None,
+        message_queue: Optional[SessionMessageQueue] = None,
     ):
         self.agent = agent
         self.team = team
+        # Messages are processed in order per channel, without blocking the gateway event loop
+        self.message_queue = message_queue or SessionMessageQueue()
         if client is None:
             self.intents = discord.Intents.all()
             self.client = discord.Client(intents=self.intents)
@@ -69,74 +75,81 @@ class DiscordClient:
                 log_info(f"sent {message.content}")
                 return
 
-            message_image = None
-            message_video = None
-            message_audio = None
-            message_file = None
-            media_url = None
-            message_text = message.content
-            message_url = message.jump_url
-            message_user = message.author.name
-            message_user_id = message.author.id
-
-            if message.attachments:
-                media = message.attachments[0]
-                media_type = media.content_type
-                media_url = media.url
-                if media_type.startswith("image/"):
-                    message_image = media_url
-                elif media_type.startswith("video/"):
-                    req = requests.get(media_url)
-                    video = req.content
-                    message_video = video
-                elif media_type.startswith("application/"):
-                    req = requests.get(media_url)
-                    document = req.content
-                    message_file = document
-                elif media_type.startswith("audio/"):
-                    message_audio = media_url
-
-            log_info(f"processing message:{message_text} \n with media: {media_url} \n url:{message_url}")
-            if isinstance(message.channel, discord.Thread):
-                thread = message.channel
-            elif isinstance(message.channel, discord.channel.DMChannel):
-                thread = message.channel  # type: ignore
-            elif isinstance(message.channel, discord.TextChannel):
-                thread = await message.create_thread(name=f"{message_user}'s thread")
-            else:
-                log_info(f"received {message.content} but not in a supported channel")
-                return
+            accepted = self.message_queue.submit(
+                str(message.channel.id), partial(self._process_message, message), idempotency_key=str(message.id)
+            )
+            if not accepted:
+                # Discord does not redeliver messages, so the user is asked to send it again
+                await message.channel.send("I'm receiving too many messages right now, please try again in a moment.")
+
+    async def _process_message(self, message: "discord.Message"):
+        message_image = None
+        message_video = None
+        message_audio = None
+        message_file = None
+        media_url = None
+        message_text = message.content
+        message_url = message.jump_url
+        message_user = message.author.name
+        message_user_id = message.author.id
+
+        if message.attachments:
+            media = message.attachments[0]
+            media_type = media.content_type
+            media_url = media.url
+            if media_type.startswith("image/"):
+                message_image = media_url
+            elif media_type.startswith("video/"):
+                # Read the attachment without blocking the event loop
+                video = await media.read()
+                message_video = video
+            elif media_type.startswith("application/"):
+                document = await media.read()
+                message_file = document
+            elif media_type.startswith("audio/"):
+                message_audio = media_url
+
+        log_info(f"processing message:{message_text} \n with media: {media_url} \n url:{message_url}")
+        if isinstance(message.channel, discord.Thread):
+            thread = message.channel
+        elif isinstance(message.channel, discord.channel.DMChannel):
+            thread = message.channel  # type: ignore
+        elif isinstance(message.channel, discord.TextChannel):
+            thread = await message.create_thread(name=f"{message_user}'s thread")
+        else:
+            log_info(f"received {message.content} but not in a supported channel")
+            return
 
-            async with thread.typing():
-                # TODO Unhappy with the duplication here but it keeps MyPy from complaining
-                additional_context = dedent(f"""
-                    Discord username: {message_user}
-                    Discord url: {message_url}
-                    """)
-                if self.agent:
-                    self.agent.additional_context = additional_context
-                    agent_response: RunResponse = await self.agent.arun(
-                        message_text,
-                        user_id=message_user_id,
-                        session_id=str(thread.id),
-                        images=[Image(url=message_image)] if message_image else None,
-                        videos=[Video(content=message_video)] if message_video else None,
-                        audio=[Audio(url=message_audio)] if message_audio else None,
-                        files=[File(content=message_file)] if message_file else None,
-                    )
-                    await self._handle_response_in_thread(agent_response, thread)
-                elif self.team:
-                    self.team.additional_context = additional_context
-                    team_response: TeamRunResponse = await self.team.arun(
-                        message_text,
-                        user_id=message_user_id,
-                        session_id=str(thread.id),
-                        images=[Image(url=message_image)] if message_image else None,
-                        videos=[Video(content=message_video)] if message_video else None,
-                        audio=[Audio(url=message_audio)] if message_audio else None,
-                        files=[File(content=message_file)] if message_file else None,
-                    )
-                    await self._handle_response_in_thread(team_response, thread)
+        async with thread.typing():
+            # TODO Unhappy with the duplication here but it keeps MyPy from complaining
+            additional_context = dedent(f"""
+                Discord username: {message_user}
+                Discord url: {message_url}
+                """)
+            if self.agent:
+                self.agent.additional_context = additional_context
+                agent_response: RunResponse = await self.agent.arun(
+                    message_text,
+                    user_id=message_user_id,
+                    session_id=str(thread.id),
+                    images=[Image(url=message_image)] if message_image else None,
+                    videos=[Video(content=message_video)] if message_video else None,
+                    audio=[Audio(url=message_audio)] if message_audio else None,
+                    files=[File(content=message_file)] if message_file else None,
+                )
+                await self._handle_response_in_thread(agent_response, thread)
+            elif self.team:
+                self.team.additional_context = additional_context
+                team_response: TeamRunResponse = await self.team.arun(
+                    message_text,
+                    user_id=message_user_id,
+                    session_id=str(thread.id),
+                    images=[Image(url=message_image)] if message_image else None,
+                    videos=[Video(content=message_video)] if message_video else None,
+                    audio=[Audio(url=message_audio)] if message_audio else None,
+                    files=[File(content=message_file)] if message_file else None,
+                )
+                await self._handle_response_in_thread(team_response, thread)
 
     async def handle_hitl(
         self, run_response: RunResponse, thread: Union[discord.Thread, discord.TextChannel]
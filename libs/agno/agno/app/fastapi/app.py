@@ -1,7 +1,6 @@
 import logging
 from typing import List, Optional, Union
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.routing import APIRouter
 
@@ -102,4 +101,6 @@ class FastAPIApp(BaseAPIApp):
 
         log_info(f"Starting API on {host}:{port}")
 
+        import uvicorn
+
         uvicorn.run(app=app, host=host, port=port, reload=reload, **kwargs)
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+from agno.utils.log import log_debug, log_error, log_warning
+
+MessageHandler = Callable[[], Awaitable[Any]]
+
+
+class SessionMessageQueue:
+    """
+    Processes messages received by the Slack, WhatsApp and Discord apps off the request path.
+
+    - Messages with an idempotency key seen in the last `dedup_ttl_seconds` are dropped, so platform retries of the
+      same event (eg: Slack re-sends events it did not get a response for in 3 seconds) are processed once.
+    - Messages of one session are processed one at a time, in the order they arrived, while different sessions are
+      processed in parallel.
+    - At most `max_workers` messages are processed at once and at most `max_queue_size` wait, new messages are
+      rejected when the queue is full. Rejected messages are not remembered, so a retry of the same event is queued
+      once there is room.
+    """
+
+    def __init__(self, max_workers: int = 8, max_queue_size: int = 1000, dedup_ttl_seconds: float = 600.0):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.dedup_ttl_seconds = dedup_ttl_seconds
+
+        # session_id -> handlers waiting to run, in arrival order
+        self._sessions: Dict[str, Deque[MessageHandler]] = {}
+        # idempotency key -> time it was first seen, oldest first
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set["asyncio.Task"] = set()
+
+        self.num_pending = 0
+        self.num_active = 0
+        self.num_processed = 0
+        self.num_failed = 0
+        self.num_duplicates = 0
+        self.num_rejected = 0
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "pending": self.num_pending,
+            "active": self.num_active,
+            "sessions": len(self._sessions),
+            "processed": self.num_processed,
+            "failed": self.num_failed,
+            "duplicates": self.num_duplicates,
+            "rejected": self.num_rejected,
+        }
+
+    def _is_duplicate(self, idempotency_key: str) -> bool:
+        now = time.time()
+        while self._seen:
+            key, seen_at = next(iter(self._seen.items()))
+            if now - seen_at <= self.dedup_ttl_seconds:
+                break
+            self._seen.popitem(last=False)
+        return idempotency_key in self._seen
+
+    def submit(self, session_id: str, handler: MessageHandler, idempotency_key: Optional[str] = None) -> bool:
+        """
+        Queue `handler` to run after the messages already queued for `session_id`. Must be called on the event loop.
+        Returns False if the queue is full, so the caller can ask the platform to retry the message later.
+        Duplicates are dropped and return True, as the message was already accepted.
+        """
+        if idempotency_key is not None and self._is_duplicate(idempotency_key):
+            self.num_duplicates += 1
+            log_debug(f"Ignoring duplicate message: {idempotency_key}")
+            return True
+
+        if self.num_pending >= self.max_queue_size:
+            self.num_rejected += 1
+            log_warning(f"Message queue is full ({self.num_pending} pending), rejecting message for {session_id}")
+            return False
+
+        if idempotency_key is not None:
+            self._seen[idempotency_key] = time.time()
+        self.num_pending += 1
+        queue = self._sessions.get(session_id)
+        if queue is not None:
+            # The session is being processed, its worker picks the message up
+            queue.append(handler)
+            return True
+
+        self._sessions[session_id] = deque([handler])
+        task = asyncio.get_running_loop().create_task(self._process_session(session_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _process_session(self, session_id: str) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        queue = self._sessions[session_id]
+        try:
+            while queue:
+                async with self._semaphore:
+                    handler = queue.popleft()
+                    self.num_pending -= 1
+                    self.num_active += 1
+                    try:
+                        await handler()
+                        self.num_processed += 1
+                    except Exception as e:
+                        self.num_failed += 1
+                        log_error(f"Error processing message for session {session_id}: {e}")
+                    finally:
+                        self.num_active -= 1
+        finally:
+            self._sessions.pop(session_id, None)
+
+    async def join(self) -> None:
+        """Wait until every queued message is processed"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
@@ -1,6 +1,7 @@
 from typing import Any, List, Optional, Union, cast
 
-from agno.agent.agent import Agent, AgentRun, Function, Toolkit
+from agno.agent.agent import Agent, Function, Toolkit
+from agno.memory.agent import AgentRun
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.storage.session.agent import AgentSession
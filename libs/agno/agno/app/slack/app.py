@@ -1,8 +1,10 @@
 import logging
+from typing import Any, Optional
 
 from fastapi.routing import APIRouter
 
 from agno.app.base import BaseAPIApp
+from agno.app.message_queue import SessionMessageQueue
 from agno.app.slack.async_router import get_async_router
 from agno.app.slack.sync_router import get_sync_router
 
@@ -12,8 +14,13 @@ logger = logging.getLogger(__name__)
 class SlackAPI(BaseAPIApp):
     type = "slack"
 
+    def __init__(self, *args: Any, message_queue: Optional[SessionMessageQueue] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Queue the async router processes incoming messages on
+        self.message_queue: SessionMessageQueue = message_queue or SessionMessageQueue()
+
     def get_router(self) -> APIRouter:
         return get_sync_router(agent=self.agent, team=self.team)
 
     def get_async_router(self) -> APIRouter:
-        return get_async_router(agent=self.agent, team=self.team)
+        return get_async_router(agent=self.agent, team=self.team, message_queue=self.message_queue)
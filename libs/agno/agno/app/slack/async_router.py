@@ -1,19 +1,33 @@
+import asyncio
+from functools import partial
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
 
 from agno.agent.agent import Agent
+from agno.app.message_queue import SessionMessageQueue
 from agno.app.slack.security import verify_slack_signature
 from agno.team.team import Team
 from agno.tools.slack import SlackTools
 from agno.utils.log import log_info
 
 
-def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def get_async_router(
+    agent: Optional[Agent] = None, team: Optional[Team] = None, message_queue: Optional[SessionMessageQueue] = None
+) -> APIRouter:
     router = APIRouter()
+    message_queue = message_queue or SessionMessageQueue()
+    # One Slack client for all messages, so connections are reused
+    slack_tools: Optional[SlackTools] = None
+
+    def _get_slack_tools() -> SlackTools:
+        nonlocal slack_tools
+        if slack_tools is None:
+            slack_tools = SlackTools()
+        return slack_tools
 
     @router.post("/slack/events")
-    async def slack_events(request: Request, background_tasks: BackgroundTasks):
+    async def slack_events(request: Request):
         body = await request.body()
         timestamp = request.headers.get("X-Slack-Request-Timestamp")
         slack_signature = request.headers.get("X-Slack-Signature", "")
@@ -37,7 +51,14 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                 log_info("bot event")
                 pass
             else:
-                background_tasks.add_task(_process_slack_event, event)
+                # Messages of a thread are processed in order, and Slack retries are dropped by event id
+                session_id = event.get("thread_ts") or event.get("ts") or event.get("channel", "")
+                accepted = message_queue.submit(
+                    session_id, partial(_process_slack_event, event), idempotency_key=data.get("event_id")
+                )
+                if not accepted:
+                    # Slack retries events that fail, the retry is queued once there is room
+                    raise HTTPException(status_code=503, detail="Too many messages, try again later")
 
         return {"status": "ok"}
 
@@ -60,20 +81,33 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
             elif team:
                 response = await team.arun(message_text, user_id=user if user else None, session_id=session_id)  # type: ignore
 
+            # The Slack client is blocking, messages are sent from a thread to keep the event loop free
+            loop = asyncio.get_running_loop()
             if response.reasoning_content:
-                _send_slack_message(
-                    channel=channel_id, message=f"Reasoning: \n{response.reasoning_content}", thread_ts=ts, italics=True
+                await loop.run_in_executor(
+                    None,
+                    partial(
+                        _send_slack_message,
+                        channel=channel_id,
+                        message=f"Reasoning: \n{response.reasoning_content}",
+                        thread_ts=ts,
+                        italics=True,
+                    ),
                 )
-            _send_slack_message(channel=channel_id, message=response.content or "", thread_ts=ts)
+            await loop.run_in_executor(
+                None, partial(_send_slack_message, channel=channel_id, message=response.content or "", thread_ts=ts)
+            )
 
     def _send_slack_message(channel: str, thread_ts: str, message: str, italics: bool = False):
         if len(message) <= 40000:
             if italics:
                 # Handle multi-line messages by making each line italic
                 formatted_message = "\n".join([f"_{line}_" for line in message.split("\n")])
-                SlackTools().send_message_thread(channel=channel, text=formatted_message or "", thread_ts=thread_ts)
+                _get_slack_tools().send_message_thread(
+                    channel=channel, text=formatted_message or "", thread_ts=thread_ts
+                )
             else:
-                SlackTools().send_message_thread(channel=channel, text=message or "", thread_ts=thread_ts)
+                _get_slack_tools().send_message_thread(channel=channel, text=message or "", thread_ts=thread_ts)
             return
 
         # Split message into batches of 4000 characters (WhatsApp message limit is 4096)
@@ -85,8 +119,8 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
             if italics:
                 # Handle multi-line messages by making each line italic
                 formatted_batch = "\n".join([f"_{line}_" for line in batch_message.split("\n")])
-                SlackTools().send_message_thread(channel=channel, text=formatted_batch or "", thread_ts=thread_ts)
+                _get_slack_tools().send_message_thread(channel=channel, text=formatted_batch or "", thread_ts=thread_ts)
             else:
-                SlackTools().send_message_thread(channel=channel, text=message or "", thread_ts=thread_ts)
+                _get_slack_tools().send_message_thread(channel=channel, text=message or "", thread_ts=thread_ts)
 
     return router
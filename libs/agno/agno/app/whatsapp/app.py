@@ -1,6 +1,9 @@
+from typing import Any, Optional
+
 from fastapi.routing import APIRouter
 
 from agno.app.base import BaseAPIApp
+from agno.app.message_queue import SessionMessageQueue
 from agno.app.whatsapp.async_router import get_async_router
 from agno.app.whatsapp.sync_router import get_sync_router
 
@@ -8,8 +11,13 @@ from agno.app.whatsapp.sync_router import get_sync_router
 class WhatsappAPI(BaseAPIApp):
     type = "whatsapp"
 
+    def __init__(self, *args: Any, message_queue: Optional[SessionMessageQueue] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Queue the async router processes incoming messages on
+        self.message_queue: SessionMessageQueue = message_queue or SessionMessageQueue()
+
     def get_router(self) -> APIRouter:
         return get_sync_router(agent=self.agent, team=self.team)
 
     def get_async_router(self) -> APIRouter:
-        return get_async_router(agent=self.agent, team=self.team)
+        return get_async_router(agent=self.agent, team=self.team, message_queue=self.message_queue)
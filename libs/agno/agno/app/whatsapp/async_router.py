@@ -1,11 +1,13 @@
 import base64
+from functools import partial
 from os import getenv
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from agno.agent.agent import Agent
+from agno.app.message_queue import SessionMessageQueue
 from agno.media import Audio, File, Image, Video
 from agno.team.team import Team
 from agno.tools.whatsapp import WhatsAppTools
@@ -15,15 +17,27 @@ from agno.utils.whatsapp import get_media_async, send_image_message_async, typin
 from .security import validate_webhook_signature
 
 
-def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def get_async_router(
+    agent: Optional[Agent] = None, team: Optional[Team] = None, message_queue: Optional[SessionMessageQueue] = None
+) -> APIRouter:
     router = APIRouter()
 
     if agent is None and team is None:
         raise ValueError("Either agent or team must be provided.")
 
+    message_queue = message_queue or SessionMessageQueue()
+    # One WhatsApp client for all messages, it sends through the shared HTTP client
+    whatsapp_tools: Optional[WhatsAppTools] = None
+
+    def _get_whatsapp_tools() -> WhatsAppTools:
+        nonlocal whatsapp_tools
+        if whatsapp_tools is None:
+            whatsapp_tools = WhatsAppTools(async_mode=True)
+        return whatsapp_tools
+
     @router.get("/status")
     async def status():
-        return {"status": "available"}
+        return {"status": "available", "queue": message_queue.get_metrics()}
 
     @router.get("/webhook")
     async def verify_webhook(request: Request):
@@ -44,7 +58,7 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
         raise HTTPException(status_code=403, detail="Invalid verify token or mode")
 
     @router.post("/webhook")
-    async def webhook(request: Request, background_tasks: BackgroundTasks):
+    async def webhook(request: Request):
         """Handle incoming WhatsApp messages"""
         try:
             # Get raw payload for signature validation
@@ -64,6 +78,7 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                 return {"status": "ignored"}
 
             # Process messages in background
+            num_rejected = 0
             for entry in body.get("entry", []):
                 for change in entry.get("changes", []):
                     messages = change.get("value", {}).get("messages", [])
@@ -71,11 +86,24 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                     if not messages:
                         continue
 
+                    # Messages of a user are processed in order, and redeliveries are dropped by message id
                     message = messages[0]
-                    background_tasks.add_task(process_message, message, agent, team)
+                    accepted = message_queue.submit(
+                        message.get("from", ""),
+                        partial(process_message, message, agent, team),
+                        idempotency_key=message.get("id"),
+                    )
+                    if not accepted:
+                        num_rejected += 1
+
+            if num_rejected > 0:
+                # WhatsApp redelivers the webhook, the accepted messages are then dropped as duplicates
+                raise HTTPException(status_code=503, detail="Too many messages, try again later")
 
             return {"status": "processing"}
 
+        except HTTPException:
+            raise
         except Exception as e:
             log_error(f"Error processing webhook: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -186,9 +214,9 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
             if italics:
                 # Handle multi-line messages by making each line italic
                 formatted_message = "\n".join([f"_{line}_" for line in message.split("\n")])
-                await WhatsAppTools().send_text_message_async(recipient=recipient, text=formatted_message)
+                await _get_whatsapp_tools().send_text_message_async(recipient=recipient, text=formatted_message)
             else:
-                await WhatsAppTools().send_text_message_async(recipient=recipient, text=message)
+                await _get_whatsapp_tools().send_text_message_async(recipient=recipient, text=message)
             return
 
         # Split message into batches of 4000 characters (WhatsApp message limit is 4096)
@@ -200,8 +228,8 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
             if italics:
                 # Handle multi-line messages by making each line italic
                 formatted_batch = "\n".join([f"_{line}_" for line in batch_message.split("\n")])
-                await WhatsAppTools().send_text_message_async(recipient=recipient, text=formatted_batch)
+                await _get_whatsapp_tools().send_text_message_async(recipient=recipient, text=formatted_batch)
             else:
-                await WhatsAppTools().send_text_message_async(recipient=recipient, text=batch_message)
+                await _get_whatsapp_tools().send_text_message_async(recipient=recipient, text=batch_message)
 
     return router
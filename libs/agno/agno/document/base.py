@@ -24,7 +24,7 @@ class Document:
         if _embedder is None:
             raise ValueError("No embedder provided")
 
-        self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
+        self.embedding, self.usage = _embedder.get_cached_embedding_and_usage(self.content)
 
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
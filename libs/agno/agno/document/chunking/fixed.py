@@ -1,8 +1,11 @@
-from typing import List
+from typing import Iterator, List
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
 
+# Characters a chunk may end on, so words are not split in half
+_SEPARATORS = (" ", "\n", "\r", "\t")
+
 
 class FixedSizeChunking(ChunkingStrategy):
     """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
@@ -17,19 +20,23 @@ class FixedSizeChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
+        return list(self.iter_chunks(document))
+
+    def iter_chunks(self, document: Document) -> Iterator[Document]:
+        """Lazily split document into fixed-size chunks with optional overlap"""
         content = self.clean_text(document.content)
         content_length = len(content)
-        chunked_documents: List[Document] = []
         chunk_number = 1
         chunk_meta_data = document.meta_data
         start = 0
         while start + self.overlap < content_length:
             end = min(start + self.chunk_size, content_length)
 
-            # Ensure we're not splitting a word in half
+            # Ensure we're not splitting a word in half: break at the last separator in (start, end]
             if end < content_length:
-                while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
-                    end -= 1
+                end = max(content.rfind(separator, start + 1, end + 1) for separator in _SEPARATORS)
+                if end == -1:
+                    end = start
 
             # If the entire chunk is a word, then just split it at chunk_size
             if end == start:
@@ -44,14 +51,14 @@ class FixedSizeChunking(ChunkingStrategy):
             elif document.name:
                 chunk_id = f"{document.name}_{chunk_number}"
             meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
+            yield Document(
+                id=chunk_id,
+                name=document.name,
+                meta_data=meta_data,
+                content=chunk,
             )
             chunk_number += 1
-            start = end - self.overlap
-        return chunked_documents
+            new_start = end - self.overlap
+            if new_start <= start:  # Prevent infinite loop when a break point falls inside the overlap
+                new_start = end
+            start = new_start
@@ -1,5 +1,5 @@
 import warnings
-from typing import List
+from typing import Iterator, List
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
@@ -24,23 +24,28 @@ class RecursiveChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Recursively chunk text by finding natural break points"""
+        return list(self.iter_chunks(document))
+
+    def iter_chunks(self, document: Document) -> Iterator[Document]:
+        """Lazily chunk text by finding natural break points"""
         if len(document.content) <= self.chunk_size:
-            return [document]
+            yield document
+            return
 
-        chunks: List[Document] = []
         start = 0
         chunk_meta_data = document.meta_data
         chunk_number = 1
         content = self.clean_text(document.content)
+        content_length = len(content)
 
-        while start < len(content):
-            end = min(start + self.chunk_size, len(content))
+        while start < content_length:
+            end = min(start + self.chunk_size, content_length)
 
-            if end < len(content):
+            if end < content_length:
                 for sep in ["\n", "."]:
-                    last_sep = content[start:end].rfind(sep)
+                    last_sep = content.rfind(sep, start, end)
                     if last_sep != -1:
-                        end = start + last_sep + 1
+                        end = last_sep + 1
                         break
 
             chunk = content[start:end]
@@ -51,13 +56,11 @@ class RecursiveChunking(ChunkingStrategy):
                 chunk_id = f"{document.id}_{chunk_number}"
             chunk_number += 1
             meta_data["chunk_size"] = len(chunk)
-            chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
+            yield Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk)
 
             new_start = end - self.overlap
             if new_start <= start:  # Prevent infinite loop
                 new_start = min(
-                    len(content), start + max(1, self.chunk_size // 10)
+                    content_length, start + max(1, self.chunk_size // 10)
                 )  # Move forward by at least 10% of chunk size
             start = new_start
-
-        return chunks
@@ -1,8 +1,12 @@
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 from agno.document.base import Document
 
+# Any run of whitespace (newlines, spaces, tabs, carriage returns, form feeds, vertical tabs)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 class ChunkingStrategy(ABC):
     """Base class for chunking strategies"""
@@ -11,21 +15,10 @@ class ChunkingStrategy(ABC):
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
 
-    def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
+    def iter_chunks(self, document: Document) -> Iterator[Document]:
+        """Yield the chunks of a document one at a time"""
+        yield from self.chunk(document)
 
-        return cleaned_text
+    def clean_text(self, text: str) -> str:
+        """Clean the text by collapsing every run of whitespace into a single space"""
+        return _WHITESPACE_PATTERN.sub(" ", text)
@@ -1,5 +1,7 @@
 from agno.embedder.base import Embedder
+from agno.embedder.cache import EmbeddingCache
 
 __all__ = [
     "Embedder",
+    "EmbeddingCache",
 ]
@@ -1,5 +1,36 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import json
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.embedder.cache import EmbeddingCache
+from agno.tracing.span import traced
+
+# Fields that do not change the embeddings (credentials, clients and transport settings), left out of cache keys
+_NON_OUTPUT_FIELDS = {
+    "embedding_cache",
+    "api_key",
+    "aws_access_key_id",
+    "aws_secret_access_key",
+    "aws_region",
+    "azure_ad_token",
+    "azure_ad_token_provider",
+    "organization",
+    "user",
+    "headers",
+    "client_params",
+    "client_kwargs",
+    "timeout",
+    "max_retries",
+    "batch_size",
+    "batch_wait_ms",
+    "num_threads",
+    "device",
+}
+_KEY_VALUE_TYPES = (str, int, float, bool, list, tuple, dict, type(None))
+
+
+def _get_embedder_span_attributes(embedder: "Embedder", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"embedder": type(embedder).__name__, "model": getattr(embedder, "id", None)}
 
 
 @dataclass
@@ -7,9 +38,82 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Cache for embeddings. Can be shared by several embedders, entries are keyed by embedder and text.
+    embedding_cache: Optional[EmbeddingCache] = None
+
+    @property
+    def embedding_cache_key(self) -> str:
+        """
+        Identity of the embedding model, used to namespace cache entries.
+
+        Built from every field that changes the embeddings, e.g. the model id, dimensions, input or task type,
+        prompt and host. Clients and fields listed in `_NON_OUTPUT_FIELDS` are left out. Override this in
+        subclasses whose output depends on other state.
+        """
+        key_fields = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in _NON_OUTPUT_FIELDS and isinstance(getattr(self, f.name), _KEY_VALUE_TYPES)
+        }
+        return f"{self.__class__.__name__}:{json.dumps(key_fields, sort_keys=True, default=str)}"
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts. Embedders that support batch requests override this to embed them in one request."""
+        return [self.get_embedding(text) for text in texts]
+
+    @traced("embedder.embed", attributes=_get_embedder_span_attributes)
+    def get_cached_embedding(self, text: str) -> List[float]:
+        """Return the embedding for `text`, using the embedding cache if one is configured."""
+        cache = self.embedding_cache
+        if cache is None:
+            return self.get_embedding(text)
+
+        embedder_key = self.embedding_cache_key
+        embedding = cache.get(embedder_key, text)
+        if embedding is None:
+            embedding = self.get_embedding(text)
+            # Failed requests return an empty embedding, which is not cached
+            if embedding:
+                cache.set(embedder_key, text, embedding)
+        return embedding
+
+    @traced("embedder.embed", attributes=_get_embedder_span_attributes)
+    def get_cached_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        """Return the embedding and usage for `text`, using the embedding cache if one is configured."""
+        cache = self.embedding_cache
+        if cache is None:
+            return self.get_embedding_and_usage(text)
+
+        embedder_key = self.embedding_cache_key
+        embedding = cache.get(embedder_key, text)
+        if embedding is not None:
+            # Cache hits make no API call, so there is no usage to report
+            return embedding, None
+
+        embedding, usage = self.get_embedding_and_usage(text)
+        if embedding:
+            cache.set(embedder_key, text, embedding)
+        return embedding, usage
+
+    @traced("embedder.embed", attributes=_get_embedder_span_attributes)
+    def get_cached_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Return the embeddings for `texts`, embedding the ones missing from the embedding cache in one batch."""
+        cache = self.embedding_cache
+        if cache is None:
+            return self.get_embeddings(texts)
+
+        embedder_key = self.embedding_cache_key
+        cached = [cache.get(embedder_key, text) for text in texts]
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        if missing:
+            for i, embedding in zip(missing, self.get_embeddings([texts[i] for i in missing])):
+                cached[i] = embedding
+                if embedding:
+                    cache.set(embedder_key, texts[i], embedding)
+        return [embedding or [] for embedding in cached]
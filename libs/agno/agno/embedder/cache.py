@@ -0,0 +1,193 @@
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any, List, Optional
+
+from agno.utils.log import log_debug, logger
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text before it is used as a cache key, so whitespace-only differences share an embedding."""
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def cache_key(embedder_key: str, text: str) -> str:
+    return sha256(f"{embedder_key}\n{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+def _to_bytes(embedding: List[float]) -> bytes:
+    return array("d", embedding).tobytes()
+
+
+def _from_bytes(data: bytes) -> List[float]:
+    embedding = array("d")
+    embedding.frombytes(data)
+    return embedding.tolist()
+
+
+class EmbeddingCacheBackend(ABC):
+    """Base class for persistent embedding cache tiers"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[List[float]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, embedding: List[float]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class SqliteEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Embedding cache tier stored in a local SQLite file"""
+
+    def __init__(self, db_file: str = "tmp/embedding_cache.db", table_name: str = "embedding_cache"):
+        self.db_file = db_file
+        self.table_name = table_name
+
+        if db_file != ":memory:":
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_file, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            row = self._connection.execute(f"SELECT embedding FROM {self.table_name} WHERE key = ?", (key,)).fetchone()
+        return _from_bytes(row[0]) if row else None
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, embedding) VALUES (?, ?)",
+                (key, _to_bytes(embedding)),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+
+class RedisEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Embedding cache tier stored in Redis, shared between processes"""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        prefix: str = "agno_embedding",
+        expire: Optional[int] = None,
+        redis_client: Optional[Any] = None,
+    ):
+        try:
+            from redis import Redis
+        except ImportError:
+            raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+        self.prefix = prefix
+        self.expire = expire
+        self.redis_client = redis_client or Redis(host=host, port=port, db=db, password=password)
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[List[float]]:
+        data = self.redis_client.get(self._get_key(key))
+        return _from_bytes(data) if data else None
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        self.redis_client.set(self._get_key(key), _to_bytes(embedding), ex=self.expire)
+
+    def clear(self) -> None:
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            self.redis_client.delete(key)
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache: an in-memory LRU in front of an optional persistent backend.
+
+    Entries are keyed by `Embedder.embedding_cache_key` and the whitespace-normalized text. The embedder key is the
+    class name plus the JSON of every field that can change the output (clients, credentials and the other fields in
+    `_NON_OUTPUT_FIELDS` are left out), so one cache can be shared by several embedders. Backend errors are logged
+    and treated as cache misses.
+    """
+
+    def __init__(self, max_size: int = 1024, backend: Optional[EmbeddingCacheBackend] = None):
+        self.max_size = max_size
+        self.backend = backend
+
+        # Embeddings are stored as packed float arrays to keep the memory tier compact
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, embedder_key: str, text: str) -> Optional[List[float]]:
+        key = cache_key(embedder_key, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.tolist()
+
+        embedding = None
+        if self.backend is not None:
+            try:
+                embedding = self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"Error reading from embedding cache: {e}")
+
+        if embedding is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._put(key, embedding)
+        return embedding
+
+    def set(self, embedder_key: str, text: str, embedding: List[float]) -> None:
+        if not embedding:
+            return
+        key = cache_key(embedder_key, text)
+        self._put(key, embedding)
+        if self.backend is not None:
+            try:
+                self.backend.set(key, embedding)
+            except Exception as e:
+                logger.warning(f"Error writing to embedding cache: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.backend is not None:
+            self.backend.clear()
+        log_debug("Embedding cache cleared")
+
+    def _put(self, key: str, embedding: List[float]) -> None:
+        with self._lock:
+            self._entries[key] = array("d", embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
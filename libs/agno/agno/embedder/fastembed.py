@@ -3,6 +3,7 @@ from typing import Dict, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
+from agno.utils.model_registry import local_model_registry, model_key
 
 try:
     import numpy as np
@@ -24,11 +25,35 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    # Number of ONNX runtime threads used for inference
+    num_threads: Optional[int] = None
+    # Maximum number of texts embedded in one forward pass
+    batch_size: int = 32
+    # How long to wait for concurrent requests to join a batch
+    batch_wait_ms: float = 0.0
+
+    @property
+    def model_key(self) -> Tuple[str, ...]:
+        return model_key("fastembed", self.id, self.num_threads)
+
+    def get_model(self) -> TextEmbedding:
+        return local_model_registry.get(
+            self.model_key, lambda: TextEmbedding(model_name=self.id, threads=self.num_threads)
+        )
+
+    def preload(self) -> None:
+        """Load the model now instead of on the first request."""
+        self.get_model()
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)[0]
+        model = self.get_model()
+        batcher = local_model_registry.get_batcher(
+            self.model_key + model_key("embed", self.batch_size),
+            lambda texts: list(model.embed(texts, batch_size=self.batch_size)),
+            max_batch_size=self.batch_size,
+            max_wait_ms=self.batch_wait_ms,
+        )
+        embedding_list = batcher([text])[0]
         if isinstance(embedding_list, np.ndarray):
             return embedding_list.tolist()
 
@@ -38,6 +63,9 @@ class FastEmbedEmbedder(Embedder):
             logger.warning(e)
             return []
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [embedding.tolist() for embedding in self.get_model().embed(texts, batch_size=self.batch_size)]
+
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         embedding = self.get_embedding(text=text)
         # Currently, FastEmbed does not provide usage information
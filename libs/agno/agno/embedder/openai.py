@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -42,7 +42,7 @@ class OpenAIEmbedder(Embedder):
         self.openai_client = OpenAIClient(**_client_params)
         return self.openai_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -64,6 +64,14 @@ class OpenAIEmbedder(Embedder):
             logger.warning(e)
             return []
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts, up to 2048 per request."""
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), 2048):
+            response: CreateEmbeddingResponse = self.response(text=texts[start : start + 2048])
+            embeddings.extend(data.embedding for data in sorted(response.data, key=lambda data: data.index))
+        return embeddings
+
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         response: CreateEmbeddingResponse = self.response(text=text)
 
@@ -3,6 +3,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
+from agno.utils.model_registry import local_model_registry, model_key
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -19,18 +20,66 @@ except ImportError:
 
 @dataclass
 class SentenceTransformerEmbedder(Embedder):
+    """
+    Embedder for local SentenceTransformer models.
+
+    Models are loaded once per process and shared through the local model registry, and concurrent
+    `get_embedding` calls for single texts are micro-batched into one forward pass.
+    """
+
     id: str = "sentence-transformers/all-MiniLM-L6-v2"
     dimensions: int = 384
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    # Device to load the model on, e.g. "cpu", "cuda" or "mps". Defaults to the best available device.
+    device: Optional[str] = None
+    # Number of torch threads used for CPU inference. This is a process-wide torch setting.
+    num_threads: Optional[int] = None
+    # Maximum number of texts encoded in one forward pass
+    batch_size: int = 32
+    # How long to wait for concurrent requests to join a batch
+    batch_wait_ms: float = 0.0
+
+    @property
+    def model_key(self) -> Tuple[str, ...]:
+        return model_key("sentence-transformer", self.id, self.device)
+
+    def _load_model(self) -> SentenceTransformer:
+        if self.num_threads is not None:
+            import torch
+
+            torch.set_num_threads(self.num_threads)
+        return SentenceTransformer(model_name_or_path=self.id, device=self.device)
+
+    def get_model(self) -> SentenceTransformer:
+        if self.sentence_transformer_client:
+            return self.sentence_transformer_client
+        return local_model_registry.get(self.model_key, self._load_model)
+
+    def preload(self) -> None:
+        """Load the model now instead of on the first request."""
+        self.get_model()
+
+    def _encode(self, text: Union[str, List[str]]):
+        model = self.get_model()
+        if self.sentence_transformer_client or not isinstance(text, str):
+            return model.encode(
+                text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings, batch_size=self.batch_size
+            )
+
+        batcher = local_model_registry.get_batcher(
+            self.model_key + model_key("encode", self.prompt, self.normalize_embeddings, self.batch_size),
+            lambda texts: model.encode(
+                texts, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings, batch_size=self.batch_size
+            ),
+            max_batch_size=self.batch_size,
+            max_wait_ms=self.batch_wait_ms,
+        )
+        return batcher([text])[0]
 
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        if not self.sentence_transformer_client:
-            model = SentenceTransformer(model_name_or_path=self.id)
-        else:
-            model = self.sentence_transformer_client
-        embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
+        embedding = self._encode(text)
         try:
             if isinstance(embedding, np.ndarray):
                 return embedding.tolist()
@@ -40,5 +89,8 @@ class SentenceTransformerEmbedder(Embedder):
             logger.warning(e)
             return []
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._encode(texts).tolist()
+
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
@@ -0,0 +1,391 @@
+import asyncio
+import csv
+import json
+import time
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field, fields
+from hashlib import sha256
+from os import getenv
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from uuid import uuid4
+
+from agno.agent import Agent
+from agno.eval.accuracy import AccuracyEval
+from agno.eval.reliability import ReliabilityEval
+from agno.eval.utils import store_result_in_file
+from agno.models.base import Model
+from agno.team.team import Team
+from agno.utils.log import log_debug, logger, set_log_level_to_debug, set_log_level_to_info
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@dataclass
+class EvalCase:
+    """A single evaluation case: an input, and the expected answer and/or tool calls."""
+
+    input: str
+    expected_output: Optional[str] = None
+    expected_tool_calls: Optional[List[str]] = None
+    # Stable identifier used to resume interrupted runs. Derived from the case contents if not provided.
+    id: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.id is None:
+            contents = json.dumps([self.input, self.expected_output, self.expected_tool_calls])
+            self.id = sha256(contents.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EvalCase":
+        data = {key: value for key, value in data.items() if value not in (None, "")}
+        if "input" not in data:
+            raise ValueError(f"Evaluation case is missing an 'input': {data}")
+
+        expected_tool_calls = data.pop("expected_tool_calls", None)
+        if isinstance(expected_tool_calls, str):
+            # CSV cells hold a JSON list or a semicolon separated list of tool names
+            if expected_tool_calls.startswith("["):
+                expected_tool_calls = json.loads(expected_tool_calls)
+            else:
+                expected_tool_calls = [name.strip() for name in expected_tool_calls.split(";") if name.strip()]
+
+        case_id = data.pop("id", None)
+        return cls(
+            input=str(data.pop("input")),
+            expected_output=data.pop("expected_output", None),
+            expected_tool_calls=expected_tool_calls,
+            id=str(case_id) if case_id is not None else None,
+            metadata=data.pop("metadata", data),
+        )
+
+
+def load_eval_cases(path: Union[str, Path]) -> List[EvalCase]:
+    """Load evaluation cases from a JSONL or CSV file."""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            return [EvalCase.from_dict(row) for row in csv.DictReader(f)]
+    with path.open(encoding="utf-8") as f:
+        return [EvalCase.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+@dataclass
+class EvalCaseResult:
+    case_id: str
+    input: str
+    output: Optional[str] = None
+    # Seconds taken by the Agent or Team to answer
+    latency: Optional[float] = None
+
+    # Accuracy evaluation, for cases with an expected output
+    expected_output: Optional[str] = None
+    score: Optional[int] = None
+    reason: Optional[str] = None
+    # Seconds taken by the evaluator agent
+    evaluation_latency: Optional[float] = None
+
+    # Reliability evaluation, for cases with expected tool calls
+    reliability_status: Optional[str] = None
+    failed_tool_calls: Optional[List[str]] = None
+    passed_tool_calls: Optional[List[str]] = None
+
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchEvalResult:
+    results: List[EvalCaseResult] = field(default_factory=list)
+
+    num_cases: int = field(init=False)
+    num_errors: int = field(init=False)
+    avg_score: float = field(init=False)
+    min_score: float = field(init=False)
+    max_score: float = field(init=False)
+    std_dev_score: float = field(init=False)
+    reliability_pass_rate: float = field(init=False)
+    avg_latency: float = field(init=False)
+    median_latency: float = field(init=False)
+    p95_latency: float = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        import statistics
+
+        self.num_cases = len(self.results)
+        self.num_errors = len([r for r in self.results if r.error is not None])
+
+        scores = [r.score for r in self.results if r.score is not None]
+        self.avg_score = statistics.mean(scores) if scores else 0
+        self.min_score = min(scores) if scores else 0
+        self.max_score = max(scores) if scores else 0
+        self.std_dev_score = statistics.stdev(scores) if len(scores) > 1 else 0
+
+        statuses = [r.reliability_status for r in self.results if r.reliability_status is not None]
+        self.reliability_pass_rate = statuses.count("PASSED") / len(statuses) if statuses else 0
+
+        latencies = sorted(r.latency for r in self.results if r.latency is not None)
+        self.avg_latency = statistics.mean(latencies) if latencies else 0
+        self.median_latency = statistics.median(latencies) if latencies else 0
+        self.p95_latency = statistics.quantiles(latencies, n=100)[94] if len(latencies) > 1 else self.avg_latency
+
+    def print_summary(self, console: Optional["Console"] = None):
+        from rich.box import ROUNDED
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        summary_table = Table(
+            box=ROUNDED,
+            border_style="blue",
+            show_header=False,
+            title="[ Batch Evaluation Summary ]",
+            title_style="bold sky_blue1",
+            title_justify="center",
+        )
+        summary_table.add_row("Number of Cases", f"{self.num_cases}")
+        summary_table.add_row("Number of Errors", f"{self.num_errors}")
+        summary_table.add_row("Average Score", f"{self.avg_score:.2f}")
+        summary_table.add_row("Minimum Score", f"{self.min_score:.2f}")
+        summary_table.add_row("Maximum Score", f"{self.max_score:.2f}")
+        summary_table.add_row("Standard Deviation", f"{self.std_dev_score:.2f}")
+        summary_table.add_row("Reliability Pass Rate", f"{self.reliability_pass_rate:.0%}")
+        summary_table.add_row("Average Latency", f"{self.avg_latency:.3f}s")
+        summary_table.add_row("Median Latency", f"{self.median_latency:.3f}s")
+        summary_table.add_row("95th %ile Latency", f"{self.p95_latency:.3f}s")
+        console.print(summary_table)
+
+    def print_results(self, console: Optional["Console"] = None):
+        from rich.box import ROUNDED
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        results_table = Table(
+            box=ROUNDED,
+            border_style="blue",
+            title="[ Batch Evaluation Results ]",
+            title_style="bold sky_blue1",
+            title_justify="center",
+        )
+        results_table.add_column("Case")
+        results_table.add_column("Input")
+        results_table.add_column("Score")
+        results_table.add_column("Reliability")
+        results_table.add_column("Latency")
+        results_table.add_column("Error")
+        for result in self.results:
+            results_table.add_row(
+                result.case_id,
+                result.input,
+                f"{result.score}/10" if result.score is not None else "-",
+                result.reliability_status or "-",
+                f"{result.latency:.3f}s" if result.latency is not None else "-",
+                result.error or "",
+            )
+        console.print(results_table)
+
+
+@dataclass
+class BatchEval:
+    """
+    Evaluate an Agent or Team against a dataset of cases, running cases concurrently.
+
+    Cases with an `expected_output` are scored by an evaluator agent, like `AccuracyEval`.
+    Cases with `expected_tool_calls` are checked like `ReliabilityEval`.
+
+    Up to `concurrency` cases run at a time, each on a copy of the Agent or Team. If `checkpoint_file` is set,
+    every finished case is appended to it, and a rerun skips the cases already in the file. Failed cases are not
+    checkpointed, so they are retried on the next run.
+    """
+
+    # Evaluation cases, or the path of a JSONL or CSV file to load them from
+    cases: Union[str, Path, List[EvalCase]]
+    # Agent to evaluate
+    agent: Optional[Agent] = None
+    # Team to evaluate
+    team: Optional[Team] = None
+    # Number of cases evaluated at the same time
+    concurrency: int = 8
+    # JSONL file of finished cases, used to resume interrupted runs
+    checkpoint_file: Optional[str] = None
+
+    # Evaluation name
+    name: Optional[str] = None
+    # Evaluation UUID
+    eval_id: str = field(default_factory=lambda: str(uuid4()))
+    # Result of the evaluation
+    result: Optional[BatchEvalResult] = None
+
+    # Model for the evaluator agent
+    model: Optional[Model] = None
+    # Agent used to evaluate the answers
+    evaluator_agent: Optional[Agent] = None
+    # Guidelines for the evaluator agent
+    additional_guidelines: Optional[Union[str, List[str]]] = None
+    # Additional context to the evaluator agent
+    additional_context: Optional[str] = None
+
+    # Print summary of results
+    print_summary: bool = False
+    # Print detailed results
+    print_results: bool = False
+    # If set, results will be saved in the given file path
+    file_path_to_save_results: Optional[str] = None
+    # Enable debug logs
+    debug_mode: bool = getenv("AGNO_DEBUG", "false").lower() == "true"
+
+    def get_cases(self) -> List[EvalCase]:
+        if isinstance(self.cases, (str, Path)):
+            return load_eval_cases(self.cases)
+        return self.cases
+
+    def read_checkpoint(self) -> Dict[str, EvalCaseResult]:
+        """Return the finished cases recorded in the checkpoint file, by case id."""
+        if self.checkpoint_file is None or not Path(self.checkpoint_file).exists():
+            return {}
+
+        field_names = {f.name for f in fields(EvalCaseResult)}
+        results: Dict[str, EvalCaseResult] = {}
+        with open(self.checkpoint_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written line from an interrupted run
+                    continue
+                result = EvalCaseResult(**{key: value for key, value in data.items() if key in field_names})
+                results[result.case_id] = result
+        return results
+
+    def write_checkpoint(self, result: EvalCaseResult) -> None:
+        if self.checkpoint_file is None:
+            return
+        path = Path(self.checkpoint_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(result)) + "\n")
+
+    def _get_accuracy_eval(self, case: EvalCase) -> AccuracyEval:
+        return AccuracyEval(
+            input=case.input,
+            expected_output=case.expected_output or "",
+            agent=self.agent,
+            team=self.team,
+            model=self.model,
+            # The evaluator agent keeps run state, so concurrent cases each need their own copy
+            evaluator_agent=self.evaluator_agent.deep_copy() if self.evaluator_agent is not None else None,
+            additional_guidelines=self.additional_guidelines,
+            additional_context=self.additional_context,
+            monitoring=False,
+        )
+
+    async def evaluate_case(self, case: EvalCase) -> EvalCaseResult:
+        """Run the Agent or Team on a case, then score its answer and check its tool calls."""
+        result = EvalCaseResult(case_id=case.id, input=case.input, expected_output=case.expected_output)  # type: ignore
+        try:
+            start = time.perf_counter()
+            if self.agent is not None:
+                response = await self.agent.deep_copy().arun(message=case.input)
+            else:
+                # Teams have no deep_copy(), but support deepcopy
+                response = await deepcopy(self.team).arun(message=case.input)  # type: ignore
+            result.latency = time.perf_counter() - start
+            result.output = response.get_content_as_string() if response.content is not None else None
+
+            if case.expected_output is not None:
+                if not result.output:
+                    raise ValueError("The Agent did not generate an answer")
+                accuracy_eval = self._get_accuracy_eval(case)
+                start = time.perf_counter()
+                evaluation = await accuracy_eval.aevaluate_answer(
+                    input=case.input,
+                    evaluator_agent=accuracy_eval.get_evaluator_agent(),
+                    evaluation_input=accuracy_eval.get_evaluation_input(
+                        case.input, case.expected_output, result.output
+                    ),
+                    evaluator_expected_output=case.expected_output,
+                    agent_output=result.output,
+                )
+                result.evaluation_latency = time.perf_counter() - start
+                if evaluation is None:
+                    raise ValueError("The evaluator agent failed to score the answer")
+                result.score = evaluation.score
+                result.reason = evaluation.reason
+
+            if case.expected_tool_calls is not None:
+                reliability = ReliabilityEval(
+                    agent_response=response if self.agent is not None else None,
+                    team_response=response if self.team is not None else None,
+                    expected_tool_calls=case.expected_tool_calls,
+                    monitoring=False,
+                ).evaluate()
+                result.reliability_status = reliability.eval_status
+                result.failed_tool_calls = reliability.failed_tool_calls
+                result.passed_tool_calls = reliability.passed_tool_calls
+        except Exception as e:
+            logger.error(f"Failed to evaluate case {case.id}: {e}")
+            result.error = str(e)
+        return result
+
+    async def arun(self, *, print_summary: bool = False, print_results: bool = False) -> Optional[BatchEvalResult]:
+        if self.agent is None and self.team is None:
+            logger.error("You need to provide one of 'agent' or 'team' to run the evaluation.")
+            return None
+
+        if self.agent is not None and self.team is not None:
+            logger.error("Provide only one of 'agent' or 'team' to run the evaluation.")
+            return None
+
+        set_log_level_to_debug() if self.debug_mode else set_log_level_to_info()
+        log_debug(f"************ Batch Evaluation Start: {self.eval_id} ************")
+
+        cases = self.get_cases()
+        finished = self.read_checkpoint()
+        pending = [case for case in cases if case.id not in finished]
+        if finished:
+            log_debug(f"Resuming from checkpoint: {len(cases) - len(pending)} of {len(cases)} cases already evaluated")
+
+        semaphore = asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def run_case(case: EvalCase) -> None:
+            async with semaphore:
+                result = await self.evaluate_case(case)
+            if result.error is None:
+                self.write_checkpoint(result)
+            finished[case.id] = result  # type: ignore
+
+        await asyncio.gather(*(run_case(case) for case in pending))
+
+        # Keep the results in dataset order
+        self.result = BatchEvalResult(results=[finished[case.id] for case in cases if case.id in finished])  # type: ignore
+
+        # Save result to file if requested
+        if self.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=self.file_path_to_save_results,
+                name=self.name,
+                eval_id=self.eval_id,
+                result=self.result,
+            )
+
+        # Print results if requested
+        if self.print_results or print_results:
+            self.result.print_results()
+        if self.print_summary or print_summary:
+            self.result.print_summary()
+
+        log_debug(f"*********** Batch Evaluation {self.eval_id} Finished ***********")
+        return self.result
+
+    def run(self, *, print_summary: bool = False, print_results: bool = False) -> Optional[BatchEvalResult]:
+        """Run the batch evaluation in a new event loop."""
+        return asyncio.run(self.arun(print_summary=print_summary, print_results=print_results))
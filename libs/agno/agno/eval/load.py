@@ -0,0 +1,428 @@
+import asyncio
+import inspect
+import json
+import time
+import tracemalloc
+from copy import deepcopy
+from dataclasses import dataclass, field
+from os import getenv
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from agno.eval.utils import store_result_in_file
+from agno.run.response import RunEvent
+from agno.utils.lazy import is_instance_of
+from agno.utils.log import log_debug, log_warning, set_log_level_to_debug, set_log_level_to_info
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+def _percentile(data: List[float], percentile: int) -> float:
+    import statistics
+
+    if not data:
+        return 0
+    if len(data) == 1:
+        return data[0]
+    return statistics.quantiles(sorted(data), n=100)[percentile - 1]
+
+
+def _is_token(item: Any) -> bool:
+    """Whether a streamed item carries generated content, as opposed to a lifecycle event."""
+    if isinstance(item, (str, bytes)):
+        return len(item) > 0
+    return bool(getattr(item, "content", None))
+
+
+@dataclass
+class LoadTestResult:
+    """Throughput, latency and resource usage of a load test."""
+
+    # Latency of every successful request in seconds
+    latencies: List[float] = field(default_factory=list)
+    # Time to first token of every successful streaming request in seconds
+    times_to_first_token: List[float] = field(default_factory=list)
+    # Number of failed requests
+    num_errors: int = 0
+    # Number of failed requests per error
+    error_counts: Dict[str, int] = field(default_factory=dict)
+    # Wall clock duration of the test in seconds
+    duration: float = 0.0
+    # CPU time used by the process during the test in seconds
+    cpu_time: float = 0.0
+    # Peak traced memory during the test in MiB
+    peak_memory: float = 0.0
+
+    num_requests: int = field(init=False)
+    requests_per_second: float = field(init=False)
+    cpu_utilization: float = field(init=False)
+    avg_latency: float = field(init=False)
+    p50_latency: float = field(init=False)
+    p95_latency: float = field(init=False)
+    p99_latency: float = field(init=False)
+    p50_time_to_first_token: float = field(init=False)
+    p95_time_to_first_token: float = field(init=False)
+    p99_time_to_first_token: float = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        self.num_requests = len(self.latencies) + self.num_errors
+        self.requests_per_second = len(self.latencies) / self.duration if self.duration > 0 else 0
+        self.cpu_utilization = self.cpu_time / self.duration if self.duration > 0 else 0
+        self.avg_latency = sum(self.latencies) / len(self.latencies) if self.latencies else 0
+        self.p50_latency = _percentile(self.latencies, 50)
+        self.p95_latency = _percentile(self.latencies, 95)
+        self.p99_latency = _percentile(self.latencies, 99)
+        self.p50_time_to_first_token = _percentile(self.times_to_first_token, 50)
+        self.p95_time_to_first_token = _percentile(self.times_to_first_token, 95)
+        self.p99_time_to_first_token = _percentile(self.times_to_first_token, 99)
+
+    def print_summary(self, console: Optional["Console"] = None):
+        """
+        Prints a summary table of the computed stats.
+        """
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        summary_table = Table(title="Load Test Summary", show_header=True, header_style="bold magenta")
+        summary_table.add_column("Metric", style="cyan")
+        summary_table.add_column("Value", style="green")
+
+        summary_table.add_row("Requests", str(self.num_requests))
+        summary_table.add_row("Errors", str(self.num_errors))
+        summary_table.add_row("Duration (seconds)", f"{self.duration:.3f}")
+        summary_table.add_row("Requests per second", f"{self.requests_per_second:.2f}")
+        summary_table.add_row("Average latency (seconds)", f"{self.avg_latency:.6f}")
+        summary_table.add_row("p50 latency (seconds)", f"{self.p50_latency:.6f}")
+        summary_table.add_row("p95 latency (seconds)", f"{self.p95_latency:.6f}")
+        summary_table.add_row("p99 latency (seconds)", f"{self.p99_latency:.6f}")
+        if self.times_to_first_token:
+            summary_table.add_row("p50 time to first token (seconds)", f"{self.p50_time_to_first_token:.6f}")
+            summary_table.add_row("p95 time to first token (seconds)", f"{self.p95_time_to_first_token:.6f}")
+            summary_table.add_row("p99 time to first token (seconds)", f"{self.p99_time_to_first_token:.6f}")
+        summary_table.add_row("CPU time (seconds)", f"{self.cpu_time:.3f}")
+        summary_table.add_row("CPU utilization", f"{self.cpu_utilization:.0%}")
+        if self.peak_memory:
+            summary_table.add_row("Peak memory (MiB)", f"{self.peak_memory:.3f}")
+
+        console.print(summary_table)
+
+        if self.error_counts:
+            errors_table = Table(title="Errors", show_header=True, header_style="bold red")
+            errors_table.add_column("Error", style="red")
+            errors_table.add_column("Count", style="green")
+            for error, count in sorted(self.error_counts.items(), key=lambda item: item[1], reverse=True):
+                errors_table.add_row(error, str(count))
+            console.print(errors_table)
+
+
+@dataclass
+class LoadTest:
+    """
+    Measure throughput and latency of a function under concurrent load.
+
+    `func` is called with the request index (0 to num_requests - 1) and can be:
+    - an async function, returning a result or an async iterator (e.g. `await agent.arun(..., stream=True)`)
+    - a sync function, returning a result or an iterator. Sync functions run in worker threads.
+    When the result is an iterator it is consumed, and the time to the first item with content is recorded as the
+    time to first token.
+
+    `concurrency` requests are kept in flight at all times. Use `agent_request`, `workflow_request` and
+    `app_request` to build the function for an Agent, Team, Workflow or FastAPI app, and `ScriptedModel` to take
+    the model provider out of the measurement.
+
+    Peak memory is measured with tracemalloc, which slows down allocations. Only compare results with the same
+    `measure_memory` setting.
+    """
+
+    # Function to call for each request
+    func: Callable[[int], Any]
+    # Total number of measured requests
+    num_requests: int = 100
+    # Number of requests in flight at the same time
+    concurrency: int = 10
+    # Number of requests to run before measuring (not included in the results)
+    warmup_requests: int = 0
+    measure_memory: bool = True
+
+    # Evaluation name
+    name: Optional[str] = None
+    # Evaluation UUID
+    eval_id: str = field(default_factory=lambda: str(uuid4()))
+    # Result of the evaluation
+    result: Optional[LoadTestResult] = None
+
+    # Print summary of results
+    print_summary: bool = False
+    # If set, results will be saved in the given file path
+    file_path_to_save_results: Optional[str] = None
+    # Enable debug logs
+    debug_mode: bool = getenv("AGNO_DEBUG", "false").lower() == "true"
+
+    def _call_sync(self, index: int) -> Optional[float]:
+        """Run a sync function in a worker thread, returning its time to first token."""
+        start = time.perf_counter()
+        response = self.func(index)
+        time_to_first_token = None
+        if inspect.isgenerator(response) or (hasattr(response, "__iter__") and hasattr(response, "__next__")):
+            for item in response:
+                if time_to_first_token is None and _is_token(item):
+                    time_to_first_token = time.perf_counter() - start
+        return time_to_first_token
+
+    async def _request(self, index: int) -> Tuple[float, Optional[float]]:
+        """Run a single request, returning its latency and time to first token."""
+        start = time.perf_counter()
+        time_to_first_token = None
+        if asyncio.iscoroutinefunction(self.func) or inspect.isasyncgenfunction(self.func):
+            response = self.func(index)
+            if inspect.isawaitable(response):
+                response = await response
+            if hasattr(response, "__aiter__"):
+                async for item in response:
+                    if time_to_first_token is None and _is_token(item):
+                        time_to_first_token = time.perf_counter() - start
+        else:
+            time_to_first_token = await asyncio.to_thread(self._call_sync, index)
+        return time.perf_counter() - start, time_to_first_token
+
+    async def _run_requests(self, num_requests: int, start_index: int = 0) -> LoadTestResult:
+        result = LoadTestResult()
+        next_index = start_index
+        end_index = start_index + num_requests
+
+        async def worker():
+            nonlocal next_index
+            while next_index < end_index:
+                index = next_index
+                next_index += 1
+                try:
+                    latency, time_to_first_token = await self._request(index)
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    if error not in result.error_counts:
+                        log_warning(f"Request {index} failed: {error}")
+                    result.error_counts[error] = result.error_counts.get(error, 0) + 1
+                    result.num_errors += 1
+                    continue
+                result.latencies.append(latency)
+                if time_to_first_token is not None:
+                    result.times_to_first_token.append(time_to_first_token)
+
+        await asyncio.gather(*(worker() for _ in range(max(min(self.concurrency, num_requests), 1))))
+        return result
+
+    def _set_log_level(self):
+        if self.debug_mode:
+            set_log_level_to_debug()
+        else:
+            set_log_level_to_info()
+
+    async def arun(self, *, print_summary: bool = False) -> LoadTestResult:
+        """
+        Run the load test.
+        1. Do optional warm-up requests.
+        2. Run the measured requests, tracking CPU time and peak memory
+        3. Save results if requested
+        4. Print results as requested
+        """
+        self._set_log_level()
+        log_debug(f"************ Load Test Start: {self.eval_id} ************")
+
+        # 1. Do optional warm-up requests
+        if self.warmup_requests > 0:
+            await self._run_requests(self.warmup_requests)
+
+        # 2. Run the measured requests
+        if self.measure_memory:
+            tracemalloc.start()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            result = await self._run_requests(self.num_requests, start_index=self.warmup_requests)
+            result.duration = time.perf_counter() - start
+            result.cpu_time = time.process_time() - cpu_start
+            if self.measure_memory:
+                result.peak_memory = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            if self.measure_memory:
+                tracemalloc.stop()
+        result.compute_stats()
+        self.result = result
+
+        # 3. Save result to file if requested
+        if self.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=self.file_path_to_save_results,
+                name=self.name,
+                eval_id=self.eval_id,
+                result=self.result,
+            )
+
+        # 4. Print results if requested
+        if self.print_summary or print_summary:
+            self.result.print_summary()
+
+        log_debug(f"************ Load Test End: {self.eval_id} ************")
+        return self.result
+
+    def run(self, *, print_summary: bool = False) -> LoadTestResult:
+        """Run the load test in a new event loop."""
+        return asyncio.run(self.arun(print_summary=print_summary))
+
+
+def _copy(instance: Any) -> Any:
+    """Copy an Agent with `deep_copy()`. Teams and Workflows have no `deep_copy()` and are copied with `deepcopy`."""
+    if is_instance_of(instance, "agno.agent.agent", "Agent"):
+        return instance.deep_copy()
+    return deepcopy(instance)
+
+
+def agent_request(
+    agent: Any, message: str, stream: bool = False, copy: bool = True, **kwargs: Any
+) -> Callable[[int], Any]:
+    """
+    Build a load test function that runs an Agent or Team, each request in its own session.
+
+    Agents and Teams keep run state on the instance, so by default every request runs on a copy.
+    Set `copy=False` to share one instance, the way the FastAPI routers do.
+    """
+
+    async def request(index: int) -> Any:
+        instance = _copy(agent) if copy else agent
+        return await instance.arun(message, stream=stream, session_id=f"load-test-{index}", **kwargs)
+
+    return request
+
+
+def workflow_request(workflow: Any, copy: bool = True, **kwargs: Any) -> Callable[[int], Any]:
+    """
+    Build a load test function that runs a Workflow (v1 or v2) with the given inputs, each request in its own session.
+
+    By default every request runs on a copy of the workflow. Set `copy=False` to share one instance.
+    """
+    # Legacy workflows take the session id as a field, Workflow v2 takes it as a run argument
+    is_legacy = is_instance_of(workflow, "agno.workflow.workflow", "Workflow")
+
+    async def request(index: int) -> Any:
+        session_id = f"load-test-{index}"
+        if is_legacy:
+            instance = workflow.deep_copy(update={"session_id": session_id}) if copy else workflow
+            return await instance.arun(**kwargs)
+        instance = deepcopy(workflow) if copy else workflow
+        return await instance.arun(session_id=session_id, **kwargs)
+
+    return request
+
+
+async def _asgi_request(api_app: Any, path: str, params: Dict[str, str], form: Dict[str, str]) -> AsyncIterator[bytes]:
+    """
+    Post a form to an ASGI app in-process, yielding the response body chunks as the app sends them.
+
+    The app is called directly (rather than through an HTTP client transport) so streamed responses are not buffered.
+    """
+    body = urlencode(form).encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": urlencode(params).encode("utf-8"),
+        "headers": [
+            (b"host", b"load-test"),
+            (b"content-type", b"application/x-www-form-urlencoded"),
+            (b"content-length", str(len(body)).encode("utf-8")),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("load-test", 80),
+    }
+    messages: asyncio.Queue = asyncio.Queue()
+    body_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        await messages.put(message)
+
+    app_task = asyncio.create_task(api_app(scope, receive, send))
+    app_task.add_done_callback(lambda _: messages.put_nowait(None))
+    try:
+        while True:
+            message = await messages.get()
+            if message is None:
+                # The app returned (or raised) without finishing the response
+                app_task.result()
+                raise RuntimeError("The app did not send a complete response")
+            if message["type"] == "http.response.start":
+                if message["status"] >= 400:
+                    raise RuntimeError(f"Request failed with status {message['status']}")
+            elif message["type"] == "http.response.body":
+                if message.get("body"):
+                    yield message["body"]
+                if not message.get("more_body", False):
+                    return
+    finally:
+        disconnected.set()
+        if not app_task.done():
+            app_task.cancel()
+
+
+def app_request(
+    api_app: Any,
+    message: Optional[str] = None,
+    *,
+    agent_id: Optional[str] = None,
+    team_id: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    workflow_input: Optional[str] = None,
+    stream: bool = False,
+    path: str = "/runs",
+) -> Callable[[int], Any]:
+    """
+    Build a load test function that posts to the `/runs` endpoint of an in-process FastAPI app (`FastAPIApp.get_app()`).
+
+    No server or network is involved. When streaming, the time to first token is the time to the first content event.
+    """
+    params = {
+        key: value
+        for key, value in (("agent_id", agent_id), ("team_id", team_id), ("workflow_id", workflow_id))
+        if value is not None
+    }
+
+    def get_form(index: int) -> Dict[str, str]:
+        form = {"stream": str(stream).lower(), "session_id": f"load-test-{index}"}
+        if message is not None:
+            form["message"] = message
+        if workflow_input is not None:
+            form["workflow_input"] = workflow_input
+        return form
+
+    async def stream_request(index: int) -> AsyncIterator[str]:
+        async for chunk in _asgi_request(api_app, path, params, get_form(index)):
+            text = chunk.decode("utf-8")
+            # Agent and Team streams start with lifecycle events, only content events count as tokens
+            yield text if workflow_id is not None or RunEvent.run_response_content.value in text else ""
+
+    async def request(index: int) -> Any:
+        body = b"".join([chunk async for chunk in _asgi_request(api_app, path, params, get_form(index))])
+        return json.loads(body)
+
+    return stream_request if stream else request
@@ -63,6 +63,42 @@ class ReliabilityEval:
     # Log the results to the Agno platform. On by default.
     monitoring: bool = getenv("AGNO_MONITOR", "true").lower() == "true"
 
+    def evaluate(self) -> ReliabilityResult:
+        """Check the tool calls made in the response against the expected tool calls."""
+        actual_tool_calls = None
+        if self.agent_response is not None:
+            messages = self.agent_response.messages
+        elif self.team_response is not None:
+            messages = list(self.team_response.messages or [])
+            for member_response in self.team_response.member_responses:
+                if member_response.messages is not None:
+                    messages += member_response.messages
+
+        for message in reversed(messages or []):  # type: ignore
+            if message.tool_calls:
+                if actual_tool_calls is None:
+                    actual_tool_calls = list(message.tool_calls)
+                else:
+                    actual_tool_calls.append(message.tool_calls[0])  # type: ignore
+
+        failed_tool_calls = []
+        passed_tool_calls = []
+        for tool_call in actual_tool_calls or []:
+            tool_name = tool_call.get("function", {}).get("name")
+            if not tool_name:
+                continue
+            else:
+                if tool_name not in self.expected_tool_calls:  # type: ignore
+                    failed_tool_calls.append(tool_call.get("function", {}).get("name"))
+                else:
+                    passed_tool_calls.append(tool_call.get("function", {}).get("name"))
+
+        return ReliabilityResult(
+            eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
+            failed_tool_calls=failed_tool_calls,
+            passed_tool_calls=passed_tool_calls,
+        )
+
     def run(self, *, print_results: bool = False) -> Optional[ReliabilityResult]:
         if self.agent_response is None and self.team_response is None:
             raise ValueError("You need to provide 'agent_response' or 'team_response' to run the evaluation.")
@@ -82,39 +118,7 @@ class ReliabilityEval:
             status = Status("Running evaluation...", spinner="dots", speed=1.0, refresh_per_second=10)
             live_log.update(status)
 
-            actual_tool_calls = None
-            if self.agent_response is not None:
-                messages = self.agent_response.messages
-            elif self.team_response is not None:
-                messages = self.team_response.messages or []
-                for member_response in self.team_response.member_responses:
-                    if member_response.messages is not None:
-                        messages += member_response.messages
-
-            for message in reversed(messages):  # type: ignore
-                if message.tool_calls:
-                    if actual_tool_calls is None:
-                        actual_tool_calls = message.tool_calls
-                    else:
-                        actual_tool_calls.append(message.tool_calls[0])  # type: ignore
-
-            failed_tool_calls = []
-            passed_tool_calls = []
-            for tool_call in actual_tool_calls:  # type: ignore
-                tool_name = tool_call.get("function", {}).get("name")
-                if not tool_name:
-                    continue
-                else:
-                    if tool_name not in self.expected_tool_calls:  # type: ignore
-                        failed_tool_calls.append(tool_call.get("function", {}).get("name"))
-                    else:
-                        passed_tool_calls.append(tool_call.get("function", {}).get("name"))
-
-            self.result = ReliabilityResult(
-                eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
-                failed_tool_calls=failed_tool_calls,
-                passed_tool_calls=passed_tool_calls,
-            )
+            self.result = self.evaluate()
 
         # Save result to file if requested
         if self.file_path_to_save_results is not None and self.result is not None:
@@ -175,39 +179,7 @@ class ReliabilityEval:
             status = Status("Running evaluation...", spinner="dots", speed=1.0, refresh_per_second=10)
             live_log.update(status)
 
-            actual_tool_calls = None
-            if self.agent_response is not None:
-                messages = self.agent_response.messages
-            elif self.team_response is not None:
-                messages = self.team_response.messages or []
-                for member_response in self.team_response.member_responses:
-                    if member_response.messages is not None:
-                        messages += member_response.messages
-
-            for message in reversed(messages):  # type: ignore
-                if message.tool_calls:
-                    if actual_tool_calls is None:
-                        actual_tool_calls = message.tool_calls
-                    else:
-                        actual_tool_calls.append(message.tool_calls[0])  # type: ignore
-
-            failed_tool_calls = []
-            passed_tool_calls = []
-            for tool_call in actual_tool_calls:  # type: ignore
-                tool_name = tool_call.get("function", {}).get("name")
-                if not tool_name:
-                    continue
-                else:
-                    if tool_name not in self.expected_tool_calls:  # type: ignore
-                        failed_tool_calls.append(tool_call.get("function", {}).get("name"))
-                    else:
-                        passed_tool_calls.append(tool_call.get("function", {}).get("name"))
-
-            self.result = ReliabilityResult(
-                eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
-                failed_tool_calls=failed_tool_calls,
-                passed_tool_calls=passed_tool_calls,
-            )
+            self.result = self.evaluate()
 
         # Save result to file if requested
         if self.file_path_to_save_results is not None and self.result is not None:
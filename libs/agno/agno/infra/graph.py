@@ -0,0 +1,203 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set
+
+from pydantic import BaseModel
+
+from agno.infra.resource import InfraResource
+from agno.utils.log import logger
+
+
+class ResourceGraph:
+    """
+    Dependency graph of the resources in a workspace operation.
+
+    A resource depends on the resources in its `depends_on`, on the resources it reads through a reference
+    (e.g. an `AwsReference` to a getter of another resource) and on resources of the types it needs:
+    `type_dependencies` maps a resource type to the types it needs, and types missing from the map depend on every
+    type earlier in `install_order`. With `reverse=True` (deletes) the edges are reversed, so dependents go first.
+
+    `run()` executes an action on every resource once its dependencies are done, up to `max_workers` at a time,
+    so independent resources are provisioned concurrently and the total time is bound by the longest chain.
+    """
+
+    def __init__(
+        self,
+        resources: Sequence[InfraResource],
+        install_order: Optional[Mapping[str, int]] = None,
+        type_dependencies: Optional[Mapping[str, Sequence[str]]] = None,
+        reverse: bool = False,
+    ):
+        self.install_order = install_order or {}
+        self.type_dependencies = type_dependencies
+        self.reverse = reverse
+
+        # Deduplicate, adding the explicit dependencies of every resource
+        self.resources: List[InfraResource] = []
+        seen: Set[InfraResource] = set()
+        pending = deque(resources)
+        while pending:
+            resource = pending.popleft()
+            if resource in seen:
+                continue
+            seen.add(resource)
+            self.resources.append(resource)
+            for dep in resource.depends_on or []:
+                if isinstance(dep, InfraResource) and dep not in seen:
+                    logger.debug(f"-*- Adding {dep.name}, dependency of {resource.name}")
+                    pending.append(dep)
+        self.resources.sort(key=self._order)
+
+        # resource -> resources that must be done before it
+        self.dependencies: Dict[InfraResource, Set[InfraResource]] = {resource: set() for resource in self.resources}
+        self._build_edges()
+        self.waves: List[List[InfraResource]] = self._build_waves()
+
+    def _order(self, resource: InfraResource) -> int:
+        order = self.install_order.get(resource.__class__.__name__, 5000)
+        return -order if self.reverse else order
+
+    def _add_edge(self, resource: InfraResource, dependency: InfraResource) -> None:
+        if resource is dependency or resource == dependency:
+            return
+        if self.reverse:
+            self.dependencies[dependency].add(resource)
+        else:
+            self.dependencies[resource].add(dependency)
+
+    def _build_edges(self) -> None:
+        by_type: Dict[str, List[InfraResource]] = {}
+        for resource in self.resources:
+            by_type.setdefault(resource.__class__.__name__, []).append(resource)
+
+        explicit: Set[tuple] = set()
+        for resource in self.resources:
+            deps = [dep for dep in resource.depends_on or [] if isinstance(dep, InfraResource)]
+            for dep in deps + self._get_referenced_resources(resource):
+                if dep in self.dependencies:
+                    self._add_edge(resource, dep)
+                    explicit.add((dep, resource))
+
+        for resource in self.resources:
+            resource_type = resource.__class__.__name__
+            if self.type_dependencies is not None and resource_type in self.type_dependencies:
+                needed_types: Sequence[str] = self.type_dependencies[resource_type]
+            else:
+                order = self.install_order.get(resource_type, 5000)
+                needed_types = [t for t in by_type if self.install_order.get(t, 5000) < order]
+            for needed_type in needed_types:
+                for dependency in by_type.get(needed_type, []):
+                    # An explicit dependency in the other direction wins over the type order
+                    if (resource, dependency) not in explicit:
+                        self._add_edge(resource, dependency)
+
+    def _get_referenced_resources(self, resource: InfraResource) -> List[InfraResource]:
+        """Resources in the graph whose getters are referenced from the fields of `resource`, including nested rules."""
+        referenced: List[InfraResource] = []
+        visited: Set[int] = set()
+        pending: List[Any] = [value for field, value in resource if field not in ("depends_on", "active_resource")]
+        while pending:
+            value = pending.pop()
+            if id(value) in visited:
+                continue
+            visited.add(id(value))
+            if isinstance(value, InfraResource) and value in self.dependencies:
+                # Another resource of the graph, only ordered by an explicit depends_on
+                continue
+            if isinstance(value, BaseModel):
+                pending.extend(v for field, v in value if field not in ("depends_on", "active_resource"))
+            elif isinstance(value, (list, tuple, set)):
+                pending.extend(value)
+            elif isinstance(value, dict):
+                pending.extend(value.values())
+            else:
+                owner = getattr(getattr(value, "reference", None), "__self__", None)
+                if isinstance(owner, InfraResource) and owner in self.dependencies and owner not in referenced:
+                    referenced.append(owner)
+        return referenced
+
+    def _build_waves(self) -> List[List[InfraResource]]:
+        remaining: Dict[InfraResource, Set[InfraResource]] = {
+            resource: set(deps) for resource, deps in self.dependencies.items()
+        }
+        waves: List[List[InfraResource]] = []
+        while remaining:
+            wave = [resource for resource in self.resources if resource in remaining and not remaining[resource]]
+            if not wave:
+                # Dependency cycle: break it with the first resource in install order
+                wave = [next(resource for resource in self.resources if resource in remaining)]
+                logger.debug(f"-*- Dependency cycle at {wave[0].name}, adding it first")
+            for resource in wave:
+                remaining.pop(resource)
+            for deps in remaining.values():
+                deps.difference_update(wave)
+            waves.append(wave)
+
+        # Cycles are broken the same way when the graph runs
+        position = {resource: i for i, wave in enumerate(waves) for resource in wave}
+        for resource, deps in self.dependencies.items():
+            deps.difference_update([dep for dep in deps if position[dep] >= position[resource]])
+        return waves
+
+    def ordered(self) -> List[InfraResource]:
+        """The resources in a valid serial order."""
+        return [resource for wave in self.waves for resource in wave]
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def run(
+        self,
+        action: Callable[[InfraResource], bool],
+        max_workers: int = 1,
+        stop_on_failure: bool = False,
+    ) -> int:
+        """
+        Run `action` on every resource after its dependencies, with up to `max_workers` running at once.
+
+        A resource fails when the action returns False or raises. With `stop_on_failure`, no new resources are
+        started after a failure and the running ones are waited for. Otherwise, like a serial run, the remaining
+        resources are still processed.
+        Returns the number of resources the action succeeded for.
+        """
+        num_succeeded = 0
+
+        def _run(resource: InfraResource) -> bool:
+            try:
+                return bool(action(resource))
+            except Exception as e:
+                logger.error(f"Failed {resource.get_resource_type()}: {resource.get_resource_name()}")
+                logger.error(e)
+                logger.error("Please fix and try again...")
+                return False
+
+        if max_workers <= 1:
+            for resource in self.ordered():
+                if _run(resource):
+                    num_succeeded += 1
+                elif stop_on_failure:
+                    break
+            return num_succeeded
+
+        done: Set[InfraResource] = set()
+        pending = self.ordered()
+        running: Dict[Future, InfraResource] = {}
+        stopped = False
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-infra") as executor:
+            while pending or running:
+                if not stopped:
+                    ready = [resource for resource in pending if self.dependencies[resource] <= done]
+                    for resource in ready[: max_workers - len(running)]:
+                        pending.remove(resource)
+                        running[executor.submit(_run, resource)] = resource
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    resource = running.pop(future)
+                    done.add(resource)
+                    if future.result():
+                        num_succeeded += 1
+                    elif stop_on_failure:
+                        stopped = True
+        return num_succeeded
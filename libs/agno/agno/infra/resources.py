@@ -11,6 +11,12 @@ class InfraResources(InfraBase):
     apps: Optional[List[Any]] = None
     resources: Optional[List[Any]] = None
 
+    def get_max_concurrent_resources(self) -> int:
+        """Number of resources processed at the same time."""
+        if self.workspace_settings is not None:
+            return max(self.workspace_settings.max_concurrent_resources, 1)
+        return 1
+
     def create_resources(
         self,
         group_filter: Optional[str] = None,
@@ -0,0 +1,95 @@
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from agno.utils.log import logger
+
+
+class ResourceStateCache:
+    """
+    State of the remote resources read during one workspace operation.
+
+    Resources are read in groups: the first read of a resource describes every known resource of its group with one
+    batched call (eg: one `describe_services` for all ECS services in a cluster) and later reads are served from the
+    cache. Resources are registered with `register()` so they are described in the same batch, and keys that were not
+    registered are loaded when they are first read.
+
+    Creating, updating or deleting a resource invalidates it, after which it is always read from the API again.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        # group -> keys of the resources in the group
+        self._keys: Dict[str, Set[str]] = {}
+        # group -> key -> state of the resource, None if it does not exist
+        self._states: Dict[str, Dict[str, Any]] = {}
+        # group -> lock held while the group is loaded, so concurrent reads share one batch
+        self._group_locks: Dict[str, Lock] = {}
+        # resources that were mutated during the operation
+        self._invalidated: Set[Tuple[str, str]] = set()
+        # Number of batched reads, used for debugging
+        self.num_batch_reads: int = 0
+
+    def register(self, group: str, key: str) -> None:
+        with self._lock:
+            self._keys.setdefault(group, set()).add(key)
+
+    def get(
+        self,
+        group: str,
+        key: str,
+        load_group: Callable[[List[str]], Optional[Dict[str, Any]]],
+        load_one: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Returns the state of a resource.
+
+        `load_group` reads a list of keys with as few calls as possible and returns their state by key, keys missing
+        from the result do not exist, and None means the group can not be read in a batch. `load_one` reads the
+        resource on its own, and is used for invalidated resources and when `load_group` fails or returns None.
+        """
+        with self._lock:
+            invalidated = (group, key) in self._invalidated
+            if not invalidated:
+                self._keys.setdefault(group, set()).add(key)
+                group_lock = self._group_locks.setdefault(group, Lock())
+        if invalidated:
+            if load_one is not None:
+                return load_one()
+            return (load_group([key]) or {}).get(key)
+
+        with group_lock:
+            with self._lock:
+                states = self._states.setdefault(group, {})
+                if key in states:
+                    return states[key]
+                keys = sorted(k for k in self._keys[group] if k not in states and (group, k) not in self._invalidated)
+
+            try:
+                logger.debug(f"Reading {len(keys)} resources in group {group}")
+                loaded = load_group(keys)
+            except Exception as e:
+                logger.debug(f"Could not read group {group}: {e}")
+                return load_one() if load_one is not None else None
+            if loaded is None:
+                return load_one() if load_one is not None else None
+
+            with self._lock:
+                self.num_batch_reads += 1
+                for k in keys:
+                    # Skip resources invalidated while the group was loading
+                    if (group, k) not in self._invalidated:
+                        states[k] = loaded.get(k)
+            return loaded.get(key)
+
+    def invalidate(self, group: str, key: str) -> None:
+        with self._lock:
+            self._invalidated.add((group, key))
+            self._states.get(group, {}).pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+            self._states.clear()
+            self._group_locks.clear()
+            self._invalidated.clear()
+            self.num_batch_reads = 0
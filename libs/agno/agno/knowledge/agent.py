@@ -61,7 +61,7 @@ class AgentKnowledge(BaseModel):
 
             _num_documents = num_documents or self.num_documents
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            return self.vector_db.traced_search(query=query, limit=_num_documents, filters=filters)
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -78,7 +78,7 @@ class AgentKnowledge(BaseModel):
             _num_documents = num_documents or self.num_documents
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
             try:
-                return await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+                return await self.vector_db.async_traced_search(query=query, limit=_num_documents, filters=filters)
             except NotImplementedError:
                 logger.info("Vector db does not support async search")
                 return self.search(query=query, num_documents=_num_documents, filters=filters)
@@ -1,7 +1,68 @@
+from collections import OrderedDict
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
+
+from agno.storage.media.base import MediaStore, get_active_media_store
+from agno.utils.log import log_warning
+
+
+class _DownloadCache:
+    """LRU cache of downloaded URL content, bounded by the total size of the cached content."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_item_bytes: int = 8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        # Larger downloads are not cached, so they are not kept in memory
+        self.max_item_bytes = max_item_bytes
+
+        self._entries: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+        self._size: int = 0
+        self._lock = Lock()
+
+    def get(self, url: str) -> Optional[Tuple[bytes, str]]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url: str, entry: Tuple[bytes, str]) -> None:
+        if len(entry[0]) > self.max_item_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(url, None)
+            if previous is not None:
+                self._size -= len(previous[0])
+            self._entries[url] = entry
+            self._size += len(entry[0])
+            while self._size > self.max_bytes:
+                _, (content, _) = self._entries.popitem(last=False)
+                self._size -= len(content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_download_cache = _DownloadCache()
+
+
+def _download(url: str) -> Tuple[bytes, str]:
+    """Download a URL, returning its content and MIME type. Successful downloads are cached per process."""
+    entry = _download_cache.get(url)
+    if entry is not None:
+        return entry
+
+    import httpx
+
+    response = httpx.get(url)
+    response.raise_for_status()
+    entry = (response.content, response.headers.get("Content-Type", "").split(";")[0])
+    _download_cache.set(url, entry)
+    return entry
 
 
 class Media(BaseModel):
@@ -79,7 +140,55 @@ class AudioArtifact(Media):
         return {k: v for k, v in response_dict.items() if v is not None}
 
 
-class Video(BaseModel):
+class StoredContent(BaseModel):
+    """
+    Media whose content can live in a media store.
+
+    While a media store is active (see `agno.storage.media.use_media_store`), `to_dict` writes the content to the
+    store and serializes a `content_ref` instead of inline base64. Media loaded from a reference fetches its content
+    lazily with `load_content`.
+    """
+
+    content: Optional[Any] = None
+    content_ref: Optional[str] = None  # Reference to the content in a media store
+    _media_store: Optional[MediaStore] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.content_ref is not None:
+            self._media_store = get_active_media_store()
+
+    def load_content(self) -> Optional[Any]:
+        """Fetch the content from the media store if only a reference is held."""
+        if self.content is None and self.content_ref is not None:
+            media_store = self._media_store or get_active_media_store()
+            if media_store is None:
+                log_warning(f"No media store available to load {self.content_ref}")
+                return None
+            self.content = media_store.get(self.content_ref)
+        return self.content
+
+    def _content_to_dict(self) -> Dict[str, Any]:
+        if self.content_ref is None and isinstance(self.content, bytes):
+            media_store = get_active_media_store()
+            if media_store is not None:
+                self.content_ref = media_store.put(self.content)
+                self._media_store = media_store
+        if self.content_ref is not None:
+            return {"content_ref": self.content_ref}
+
+        import base64
+        import zlib
+
+        return {
+            "content": base64.b64encode(
+                zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
+            ).decode("utf-8")
+            if self.content
+            else None
+        }
+
+
+class Video(StoredContent):
     filepath: Optional[Union[Path, str]] = None  # Absolute local location for video
     content: Optional[Any] = None  # Actual video bytes content
     url: Optional[str] = None  # Remote location for video
@@ -110,7 +219,7 @@ class Video(BaseModel):
         data["content"] = content
 
         # Count how many fields are set (not None)
-        count = len([field for field in [filepath, content, url] if field is not None])
+        count = len([field for field in [filepath, content, url, data.get("content_ref")] if field is not None])
 
         if count == 0:
             raise ValueError("One of `filepath` or `content` or `url` must be provided.")
@@ -120,15 +229,8 @@ class Video(BaseModel):
         return data
 
     def to_dict(self) -> Dict[str, Any]:
-        import base64
-        import zlib
-
         response_dict = {
-            "content": base64.b64encode(
-                zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
-            ).decode("utf-8")
-            if self.content
-            else None,
+            **self._content_to_dict(),
             "filepath": self.filepath,
             "format": self.format,
         }
@@ -139,7 +241,7 @@ class Video(BaseModel):
         return cls(url=artifact.url)
 
 
-class Audio(BaseModel):
+class Audio(StoredContent):
     content: Optional[Any] = None  # Actual audio bytes content
     filepath: Optional[Union[Path, str]] = None  # Absolute local location for audio
     url: Optional[str] = None  # Remote location for audio
@@ -170,7 +272,7 @@ class Audio(BaseModel):
         data["content"] = content
 
         # Count how many fields are set (not None)
-        count = len([field for field in [filepath, content, url] if field is not None])
+        count = len([field for field in [filepath, content, url, data.get("content_ref")] if field is not None])
 
         if count == 0:
             raise ValueError("One of `filepath` or `content` or `url` must be provided.")
@@ -181,23 +283,14 @@ class Audio(BaseModel):
 
     @property
     def audio_url_content(self) -> Optional[bytes]:
-        import httpx
-
         if self.url:
-            return httpx.get(self.url).content
+            return _download(self.url)[0]
         else:
             return None
 
     def to_dict(self) -> Dict[str, Any]:
-        import base64
-        import zlib
-
         response_dict = {
-            "content": base64.b64encode(
-                zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
-            ).decode("utf-8")
-            if self.content
-            else None,
+            **self._content_to_dict(),
             "filepath": self.filepath,
             "format": self.format,
         }
@@ -236,7 +329,7 @@ class AudioResponse(BaseModel):
         return {k: v for k, v in response_dict.items() if v is not None}
 
 
-class Image(BaseModel):
+class Image(StoredContent):
     url: Optional[str] = None  # Remote location for image
     filepath: Optional[Union[Path, str]] = None  # Absolute local location for image
     content: Optional[Any] = None  # Actual image bytes content
@@ -248,10 +341,8 @@ class Image(BaseModel):
 
     @property
     def image_url_content(self) -> Optional[bytes]:
-        import httpx
-
         if self.url:
-            return httpx.get(self.url).content
+            return _download(self.url)[0]
         else:
             return None
 
@@ -280,7 +371,7 @@ class Image(BaseModel):
         data["content"] = content
 
         # Count how many fields are set (not None)
-        count = len([field for field in [url, filepath, content] if field is not None])
+        count = len([field for field in [url, filepath, content, data.get("content_ref")] if field is not None])
 
         if count == 0:
             raise ValueError("One of `url`, `filepath`, or `content` must be provided.")
@@ -290,15 +381,8 @@ class Image(BaseModel):
         return data
 
     def to_dict(self) -> Dict[str, Any]:
-        import base64
-        import zlib
-
         response_dict = {
-            "content": base64.b64encode(
-                zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
-            ).decode("utf-8")
-            if self.content
-            else None,
+            **self._content_to_dict(),
             "filepath": self.filepath,
             "url": self.url,
             "detail": self.detail,
@@ -355,12 +439,7 @@ class File(BaseModel):
 
     @property
     def file_url_content(self) -> Optional[Tuple[bytes, str]]:
-        import httpx
-
         if self.url:
-            response = httpx.get(self.url)
-            content = response.content
-            mime_type = response.headers.get("Content-Type", "").split(";")[0]
-            return content, mime_type
+            return _download(self.url)
         else:
             return None
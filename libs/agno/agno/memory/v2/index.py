@@ -0,0 +1,122 @@
+from math import sqrt
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+from agno.utils.log import log_debug, log_warning
+
+
+def estimate_memory_tokens(memory: Dict[str, Any]) -> int:
+    """Rough token count of a memory as rendered in the memory manager prompt (~4 characters per token)."""
+    return (len(str(memory["memory_id"])) + len(str(memory["memory"])) + 16) // 4
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = sqrt(sum(x * x for x in a)) * sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class MemoryIndex:
+    """
+    Per-user index of memory embeddings, used to pick the existing memories relevant to new messages.
+
+    Memories are embedded once, in batches, and re-embedded only when their text changes.
+    """
+
+    def __init__(self, embedder: Embedder):
+        self.embedder = embedder
+        # user_id -> memory_id -> (memory text, embedding)
+        self._entries: Dict[str, Dict[str, Tuple[str, List[float]]]] = {}
+        self._lock = Lock()
+
+    def _get_embeddings(self, user_id: str, memories: List[Dict[str, Any]]) -> Dict[str, List[float]]:
+        with self._lock:
+            entries = dict(self._entries.get(user_id, {}))
+
+        index: Dict[str, Tuple[str, List[float]]] = {}
+        to_embed: List[Tuple[str, str]] = []
+        for memory in memories:
+            memory_id, text = memory["memory_id"], memory["memory"]
+            entry = entries.get(memory_id)
+            if entry is None or entry[0] != text:
+                to_embed.append((memory_id, text))
+            else:
+                index[memory_id] = entry
+
+        # New and changed memories are embedded in one batch, so a cold index costs one request
+        if to_embed:
+            embeddings = self.embedder.get_cached_embeddings([text for _, text in to_embed])
+            for (memory_id, text), embedding in zip(to_embed, embeddings):
+                index[memory_id] = (text, embedding)
+
+        # Memories that no longer exist are dropped from the index
+        with self._lock:
+            self._entries[user_id] = index
+        return {memory_id: embedding for memory_id, (_, embedding) in index.items()}
+
+    def search(self, user_id: str, query: str, memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return `memories` ordered from most to least similar to `query`."""
+        query_embedding = self.embedder.get_cached_embedding(query)
+        embeddings = self._get_embeddings(user_id, memories)
+        scores = {
+            memory_id: _cosine_similarity(query_embedding, embedding) if embedding else 0.0
+            for memory_id, embedding in embeddings.items()
+        }
+        return sorted(memories, key=lambda memory: scores.get(memory["memory_id"], 0.0), reverse=True)
+
+    def clear(self, user_id: Optional[str] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+def select_memories(
+    memories: List[Dict[str, Any]],
+    query: str,
+    user_id: str,
+    index: Optional[MemoryIndex] = None,
+    num_relevant: int = 20,
+    num_recent: int = 5,
+    max_tokens: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Pick the existing memories to show the memory manager: the `num_relevant` memories most similar to `query`
+    and the `num_recent` most recently updated ones, within `max_tokens`. Without an index, only recency is used.
+    The selected memories keep their original order.
+
+    With no token budget, all memories are returned unless there is an index to rank them.
+    """
+    fits = max_tokens is None or sum(estimate_memory_tokens(memory) for memory in memories) <= max_tokens
+    if fits and (index is None or len(memories) <= num_relevant + num_recent):
+        return memories
+
+    recent = sorted(memories, key=lambda memory: memory.get("last_updated") or "", reverse=True)
+
+    ranked: List[Dict[str, Any]] = []
+    if index is not None and query:
+        try:
+            ranked = index.search(user_id, query, memories)[:num_relevant]
+        except Exception as e:
+            log_warning(f"Error ranking memories, using the most recent ones: {e}")
+
+    # The most relevant memories get the budget first, then the most recent ones.
+    # Without relevance scores, the budget is filled with the most recent memories.
+    candidates = ranked + recent[:num_recent] if ranked else recent
+    selected_ids = set()
+    budget = max_tokens
+    for memory in candidates:
+        if memory["memory_id"] in selected_ids:
+            continue
+        if budget is not None:
+            tokens = estimate_memory_tokens(memory)
+            if tokens > budget:
+                continue
+            budget -= tokens
+        selected_ids.add(memory["memory_id"])
+
+    selected = [memory for memory in memories if memory["memory_id"] in selected_ids]
+    log_debug(f"Selected {len(selected)} of {len(memories)} existing memories")
+    return selected
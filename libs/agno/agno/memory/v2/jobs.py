@@ -0,0 +1,321 @@
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Condition, Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning, logger
+
+if TYPE_CHECKING:
+    from agno.memory.v2.memory import Memory
+    from agno.storage.base import Storage
+
+
+@dataclass
+class MemoryJob:
+    """Deferred memory work for one user: messages to extract memories from and sessions to summarize."""
+
+    user_id: str
+    messages: List[Message] = field(default_factory=list)
+    session_ids: List[str] = field(default_factory=list)
+    id: str = field(default_factory=lambda: str(uuid4()))
+    created_at: float = field(default_factory=time.time)
+    attempts: int = 0
+
+    def merge(self, messages: Optional[List[Message]] = None, session_id: Optional[str] = None) -> None:
+        """Fold another update for the same user into this job."""
+        if messages:
+            self.messages.extend(messages)
+        if session_id is not None and session_id not in self.session_ids:
+            self.session_ids.append(session_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            # Memory extraction only reads the text of the messages
+            "messages": [{"role": message.role, "content": message.get_content_string()} for message in self.messages],
+            "session_ids": self.session_ids,
+            "created_at": self.created_at,
+            "attempts": self.attempts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MemoryJob":
+        return cls(
+            id=data["id"],
+            user_id=data["user_id"],
+            messages=[Message(**message) for message in data.get("messages", [])],
+            session_ids=data.get("session_ids", []),
+            created_at=data.get("created_at", time.time()),
+            attempts=data.get("attempts", 0),
+        )
+
+
+class MemoryJobBackend(ABC):
+    """Base class for durable memory job stores. Jobs are saved when queued and deleted once they are done."""
+
+    @abstractmethod
+    def save(self, job: MemoryJob) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, job_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self) -> List[MemoryJob]:
+        raise NotImplementedError
+
+
+class SqliteMemoryJobBackend(MemoryJobBackend):
+    """Memory job store in a local SQLite file"""
+
+    def __init__(self, db_file: str = "tmp/memory_jobs.db", table_name: str = "memory_jobs"):
+        self.db_file = db_file
+        self.table_name = table_name
+
+        if db_file != ":memory:":
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_file, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                "(id TEXT PRIMARY KEY, created_at REAL NOT NULL, data TEXT NOT NULL)"
+            )
+
+    def save(self, job: MemoryJob) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (id, created_at, data) VALUES (?, ?, ?)",
+                (job.id, job.created_at, json.dumps(job.to_dict())),
+            )
+
+    def delete(self, job_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE id = ?", (job_id,))
+
+    def load(self) -> List[MemoryJob]:
+        with self._lock:
+            rows = self._connection.execute(f"SELECT data FROM {self.table_name} ORDER BY created_at").fetchall()
+        return [MemoryJob.from_dict(json.loads(row[0])) for row in rows]
+
+
+class RedisMemoryJobBackend(MemoryJobBackend):
+    """Memory job store in Redis, shared between processes"""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        key: str = "agno_memory_jobs",
+        redis_client: Optional[Any] = None,
+    ):
+        try:
+            from redis import Redis
+        except ImportError:
+            raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+        self.key = key
+        self.redis_client = redis_client or Redis(host=host, port=port, db=db, password=password)
+
+    def save(self, job: MemoryJob) -> None:
+        self.redis_client.hset(self.key, job.id, json.dumps(job.to_dict()))
+
+    def delete(self, job_id: str) -> None:
+        self.redis_client.hdel(self.key, job_id)
+
+    def load(self) -> List[MemoryJob]:
+        jobs = [MemoryJob.from_dict(json.loads(data)) for data in self.redis_client.hvals(self.key)]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+
+class MemoryJobQueue:
+    """
+    Runs memory extraction and session summaries in background workers, off the response path.
+
+    Updates are coalesced per user: while a user's job is waiting or running, new updates for that user are merged
+    into a single pending job, so a burst of messages triggers one memory update. Jobs for the same user never run
+    concurrently. `wait()` blocks until a user's queued work is done, which runs call before reading memories so
+    they always see their own writes.
+
+    Session summaries are written to the storage the job was submitted with. With a backend, queued jobs are
+    persisted and jobs left over from a previous process are replayed by `recover()`. Recovered jobs have no storage,
+    their summaries are stored with the session the next time it is written.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 3,
+        backend: Optional[MemoryJobBackend] = None,
+        delay: float = 0.0,
+        max_retries: int = 1,
+        retry_delay: float = 1.0,
+    ):
+        self.max_workers = max_workers
+        self.backend = backend
+        # Seconds a job waits before it starts, so closely spaced updates for a user are merged
+        self.delay = delay
+        # Number of times a failed job is retried before it is dropped
+        self.max_retries = max_retries
+        # Seconds to wait before the first retry, doubled on every following retry
+        self.retry_delay = retry_delay
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._condition = Condition()
+        # Jobs that have not started, with the memory they run against and the storage for their summaries, by user
+        self._pending: Dict[str, Tuple[MemoryJob, "Memory", Optional["Storage"]]] = {}
+        # Users with a worker draining their jobs
+        self._active: Set[str] = set()
+        self._recovered = False
+
+    def submit(
+        self,
+        memory: "Memory",
+        user_id: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+        session_id: Optional[str] = None,
+        storage: Optional["Storage"] = None,
+    ) -> MemoryJob:
+        """Queue a memory update for a user, merging it into the user's pending job if there is one."""
+        user_id = user_id or "default"
+        with self._condition:
+            pending = self._pending.get(user_id)
+            if pending is not None:
+                job = pending[0]
+                job.merge(messages=messages, session_id=session_id)
+                storage = storage or pending[2]
+                log_debug(f"Merged memory update into pending job {job.id} for user {user_id}")
+            else:
+                job = MemoryJob(user_id=user_id)
+                job.merge(messages=messages, session_id=session_id)
+            self._pending[user_id] = (job, memory, storage)
+            self._save(job)
+            self._schedule(user_id)
+        return job
+
+    def recover(self, memory: "Memory") -> int:
+        """Queue the jobs persisted in the backend by a previous process. Returns the number of recovered jobs."""
+        if self.backend is None or self._recovered:
+            return 0
+        self._recovered = True
+        try:
+            jobs = self.backend.load()
+        except Exception as e:
+            logger.warning(f"Error loading memory jobs: {e}")
+            return 0
+
+        with self._condition:
+            for job in jobs:
+                pending = self._pending.get(job.user_id)
+                if pending is not None and pending[0].id != job.id:
+                    pending[0].merge(messages=job.messages)
+                    for session_id in job.session_ids:
+                        pending[0].merge(session_id=session_id)
+                    self._save(pending[0])
+                    self._delete(job.id)
+                else:
+                    self._pending[job.user_id] = (job, memory, None)
+                self._schedule(job.user_id)
+        if jobs:
+            log_debug(f"Recovered {len(jobs)} memory jobs")
+        return len(jobs)
+
+    def has_pending(self, user_id: Optional[str] = None) -> bool:
+        """Whether there is queued or running work, for a user or for anyone."""
+        with self._condition:
+            return self._has_pending(user_id)
+
+    def wait(self, user_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """Block until the queued work for a user (or for everyone) is done. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._has_pending(user_id), timeout=timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        if wait:
+            self.wait()
+        with self._condition:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _has_pending(self, user_id: Optional[str]) -> bool:
+        if user_id is None:
+            return bool(self._pending or self._active)
+        return user_id in self._pending or user_id in self._active
+
+    def _schedule(self, user_id: str) -> None:
+        # Called with the condition held. One worker drains each user's jobs, so they never run concurrently.
+        if user_id in self._active:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-memory")
+        self._active.add(user_id)
+        self._executor.submit(self._drain, user_id)
+
+    def _drain(self, user_id: str) -> None:
+        try:
+            while True:
+                with self._condition:
+                    pending = self._pending.get(user_id)
+                    if pending is None:
+                        self._active.discard(user_id)
+                        self._condition.notify_all()
+                        return
+                    job = pending[0]
+
+                remaining = job.created_at + self.delay - time.time()
+                if remaining > 0:
+                    time.sleep(remaining)
+
+                with self._condition:
+                    job, memory, storage = self._pending.pop(user_id)
+                self._process(job, memory, storage)
+        except Exception as e:
+            logger.error(f"Memory job worker failed: {e}")
+            with self._condition:
+                self._pending.pop(user_id, None)
+                self._active.discard(user_id)
+                self._condition.notify_all()
+
+    def _process(self, job: MemoryJob, memory: "Memory", storage: Optional["Storage"]) -> None:
+        retry_delay = self.retry_delay
+        while True:
+            job.attempts += 1
+            try:
+                memory.process_job(job, storage=storage)
+                break
+            except Exception as e:
+                if job.attempts > self.max_retries:
+                    log_warning(f"Memory job {job.id} failed after {job.attempts} attempts: {e}")
+                    break
+                log_warning(f"Memory job {job.id} failed, retrying in {retry_delay:.1f}s: {e}")
+                self._save(job)
+                time.sleep(retry_delay)
+                retry_delay *= 2
+        self._delete(job.id)
+
+    def _save(self, job: MemoryJob) -> None:
+        if self.backend is None:
+            return
+        try:
+            self.backend.save(job)
+        except Exception as e:
+            logger.warning(f"Error saving memory job: {e}")
+
+    def _delete(self, job_id: str) -> None:
+        if self.backend is None:
+            return
+        try:
+            self.backend.delete(job_id)
+        except Exception as e:
+            logger.warning(f"Error deleting memory job: {e}")
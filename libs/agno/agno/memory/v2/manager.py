@@ -1,10 +1,13 @@
+import asyncio
 from copy import deepcopy
 from dataclasses import dataclass
 from textwrap import dedent
 from typing import Any, Callable, Dict, List, Optional
 
+from agno.embedder.base import Embedder
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.index import MemoryIndex, select_memories
 from agno.memory.v2.schema import UserMemory
 from agno.models.base import Model
 from agno.models.message import Message
@@ -28,6 +31,16 @@ class MemoryManager:
     # Additional instructions for the manager
     additional_instructions: Optional[str] = None
 
+    # Embedder used to pick the existing memories relevant to the new messages.
+    # If not provided, all existing memories are added to the prompt (within max_memory_tokens).
+    embedder: Optional[Embedder] = None
+    # Number of the most relevant existing memories added to the prompt
+    num_relevant_memories: int = 20
+    # Number of the most recently updated existing memories added to the prompt
+    num_recent_memories: int = 5
+    # Maximum number of tokens (estimated) of existing memories added to the prompt
+    max_memory_tokens: Optional[int] = None
+
     # Whether memories were created in the last run
     memories_updated: bool = False
 
@@ -37,6 +50,10 @@ class MemoryManager:
         system_message: Optional[str] = None,
         memory_capture_instructions: Optional[str] = None,
         additional_instructions: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
+        num_relevant_memories: int = 20,
+        num_recent_memories: int = 5,
+        max_memory_tokens: Optional[int] = None,
     ):
         self.model = model
         if self.model is not None and isinstance(self.model, str):
@@ -44,6 +61,11 @@ class MemoryManager:
         self.system_message = system_message
         self.memory_capture_instructions = memory_capture_instructions
         self.additional_instructions = additional_instructions
+        self.embedder = embedder
+        self.num_relevant_memories = num_relevant_memories
+        self.num_recent_memories = num_recent_memories
+        self.max_memory_tokens = max_memory_tokens
+        self._memory_index: Optional[MemoryIndex] = MemoryIndex(embedder) if embedder is not None else None
         self._tools_for_model: Optional[List[Dict[str, Any]]] = None
         self._functions_for_model: Optional[Dict[str, Function]] = None
 
@@ -64,6 +86,28 @@ class MemoryManager:
             except Exception as e:
                 log_warning(f"Could not add function {tool}: {e}")
 
+    def get_relevant_memories(
+        self, existing_memories: List[Dict[str, Any]], query: str, user_id: str
+    ) -> List[Dict[str, Any]]:
+        """Select the existing memories to add to the prompt: the most relevant to `query` and the most recent."""
+        return select_memories(
+            existing_memories,
+            query=query,
+            user_id=user_id,
+            index=self._memory_index,
+            num_relevant=self.num_relevant_memories,
+            num_recent=self.num_recent_memories,
+            max_tokens=self.max_memory_tokens,
+        )
+
+    async def aget_relevant_memories(
+        self, existing_memories: List[Dict[str, Any]], query: str, user_id: str
+    ) -> List[Dict[str, Any]]:
+        if self._memory_index is None:
+            return self.get_relevant_memories(existing_memories, query=query, user_id=user_id)
+        # Embedding calls are blocking
+        return await asyncio.to_thread(self.get_relevant_memories, existing_memories, query, user_id)
+
     def get_system_message(
         self,
         existing_memories: Optional[List[Dict[str, Any]]] = None,
@@ -159,6 +203,8 @@ class MemoryManager:
         else:
             input_string = f"{', '.join([m.get_content_string() for m in messages if m.role == 'user' and m.content])}"
 
+        existing_memories = self.get_relevant_memories(existing_memories, query=input_string, user_id=user_id)
+
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.determine_tools_for_model(
@@ -208,6 +254,8 @@ class MemoryManager:
         else:
             input_string = f"{', '.join([m.get_content_string() for m in messages if m.role == 'user' and m.content])}"
 
+        existing_memories = await self.aget_relevant_memories(existing_memories, query=input_string, user_id=user_id)
+
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.determine_tools_for_model(
@@ -252,6 +300,8 @@ class MemoryManager:
 
         log_debug("MemoryManager Start", center=True)
 
+        existing_memories = self.get_relevant_memories(existing_memories, query=task, user_id=user_id)
+
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.determine_tools_for_model(
@@ -295,6 +345,8 @@ class MemoryManager:
 
         log_debug("MemoryManager Start", center=True)
 
+        existing_memories = await self.aget_relevant_memories(existing_memories, query=task, user_id=user_id)
+
         model_copy = deepcopy(self.model)
         # Update the Model (set defaults, add logit etc.)
         self.determine_tools_for_model(
@@ -3,13 +3,14 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel, Field
 
 from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.jobs import MemoryJob, MemoryJobQueue
 from agno.memory.v2.manager import MemoryManager
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.memory.v2.summarizer import SessionSummarizer
@@ -22,6 +23,9 @@ from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debu
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
 
+if TYPE_CHECKING:
+    from agno.storage.base import Storage
+
 
 class MemorySearchResponse(BaseModel):
     """Model for Memory Search Response."""
@@ -106,6 +110,9 @@ class Memory:
     # Whether to clear memories
     clear_memories: bool = False
 
+    # Queue that creates memories and summaries in the background, after the run has returned
+    job_queue: Optional[MemoryJobQueue] = None
+
     debug_mode: bool = False
     version: int = 2
 
@@ -121,10 +128,14 @@ class Memory:
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
+        job_queue: Optional[MemoryJobQueue] = None,
     ):
         self.memories = memories or {}
         self.summaries = summaries or {}
         self.runs = runs or {}
+        # Index of run_id -> position in self.runs[session_id], with the runs list it was built from.
+        # Hits are checked against the list and misses rebuild it, so direct changes to the list are picked up.
+        self._run_index: Dict[str, Tuple[List[Union[RunResponse, TeamRunResponse]], Dict[str, int]]] = {}
 
         self.debug_mode = debug_mode
 
@@ -142,6 +153,11 @@ class Memory:
 
         self.db = db
 
+        self.job_queue = job_queue
+        # Replay jobs a previous process left in a durable queue
+        if self.job_queue is not None:
+            self.job_queue.recover(self)
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
@@ -401,8 +417,13 @@ class Memory:
         return self.runs.get(session_id, [])
 
     # -*- Agent Functions
-    def create_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
+    def create_session_summary(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        runs: Optional[List[Union[RunResponse, TeamRunResponse]]] = None,
+    ) -> Optional[SessionSummary]:
+        """Creates a summary of the session. `runs` replaces the runs of the session in memory, if provided."""
 
         if not self.summary_manager:
             raise ValueError("Summarizer not initialized")
@@ -412,18 +433,31 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = self.summary_manager.run(conversation=self.get_messages_for_session(session_id=session_id))
+        previous_summary, conversation, num_runs, last_run_id = self._get_summary_input(session_id, user_id, runs=runs)
+        if self.summary_manager.incremental and not self.summary_manager.should_update(num_runs, conversation):
+            log_debug("Session summary is up to date.")
+            return self.get_session_summary(session_id=session_id, user_id=user_id)
+
+        summary_response = self.summary_manager.run(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            last_run_id=last_run_id,
         )
         self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
 
         return session_summary
 
-    async def acreate_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
+    async def acreate_session_summary(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        runs: Optional[List[Union[RunResponse, TeamRunResponse]]] = None,
+    ) -> Optional[SessionSummary]:
+        """Creates a summary of the session. `runs` replaces the runs of the session in memory, if provided."""
         if not self.summary_manager:
             raise ValueError("Summarizer not initialized")
 
@@ -432,17 +466,34 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = await self.summary_manager.arun(
-            conversation=self.get_messages_for_session(session_id=session_id)
-        )
+        previous_summary, conversation, num_runs, last_run_id = self._get_summary_input(session_id, user_id, runs=runs)
+        if self.summary_manager.incremental and not self.summary_manager.should_update(num_runs, conversation):
+            log_debug("Session summary is up to date.")
+            return self.get_session_summary(session_id=session_id, user_id=user_id)
+
+        summary_response = await self.summary_manager.arun(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            last_run_id=last_run_id,
         )
         self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
         return session_summary
 
+    def _get_existing_memories(self, user_id: str) -> List[Dict[str, Any]]:
+        """The memories of a user in the format the memory manager expects."""
+        return [
+            {
+                "memory_id": memory_id,
+                "memory": memory.memory,
+                "last_updated": memory.last_updated.isoformat() if memory.last_updated else None,
+            }
+            for memory_id, memory in (self.memories or {}).get(user_id, {}).items()
+        ]
+
     def create_user_memories(
         self,
         message: Optional[str] = None,
@@ -474,10 +525,7 @@ class Memory:
         if refresh_from_db:
             self.refresh_from_db(user_id=user_id)
 
-        existing_memories = self.memories.get(user_id, {})  # type: ignore
-        existing_memories = [
-            {"memory_id": memory_id, "memory": memory.memory} for memory_id, memory in existing_memories.items()
-        ]
+        existing_memories = self._get_existing_memories(user_id)
         response = self.memory_manager.create_or_update_memories(  # type: ignore
             messages=messages,
             existing_memories=existing_memories,
@@ -522,10 +570,7 @@ class Memory:
         if refresh_from_db:
             self.refresh_from_db(user_id=user_id)
 
-        existing_memories = self.memories.get(user_id, {})  # type: ignore
-        existing_memories = [
-            {"memory_id": memory_id, "memory": memory.memory} for memory_id, memory in existing_memories.items()
-        ]
+        existing_memories = self._get_existing_memories(user_id)
 
         response = await self.memory_manager.acreate_or_update_memories(  # type: ignore
             messages=messages,
@@ -541,6 +586,82 @@ class Memory:
 
         return response
 
+    def enqueue_update(
+        self,
+        messages: Optional[List[Message]] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        storage: Optional["Storage"] = None,
+    ) -> MemoryJob:
+        """
+        Queue memory creation from `messages` and a summary of `session_id` on the background job queue.
+        The summary is written to the session in `storage`, if provided.
+        """
+        if self.job_queue is None:
+            raise ValueError("Job queue not initialized")
+        return self.job_queue.submit(self, user_id=user_id, messages=messages, session_id=session_id, storage=storage)
+
+    def wait_for_jobs(self, user_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """Wait until the queued memory updates of a user are done, so the next read sees them."""
+        if self.job_queue is None:
+            return True
+        return self.job_queue.wait(user_id=user_id or "default", timeout=timeout)
+
+    def process_job(self, job: MemoryJob, storage: Optional["Storage"] = None) -> None:
+        """
+        Run a queued memory job: one memory update for all its messages, then the session summaries.
+        Summaries are written to the sessions in `storage`, if provided.
+        """
+        # Finished work is removed from the job, so a retry only repeats what failed
+        if job.messages:
+            self.create_user_memories(messages=job.messages, user_id=job.user_id)
+            job.messages = []
+        while job.session_ids:
+            session_id = job.session_ids[0]
+            # The session may have been dropped from memory by the time the job runs, e.g. with cache_session=False
+            runs = self._get_stored_session_runs(storage, session_id=session_id) if storage is not None else None
+            summary = self.create_session_summary(session_id=session_id, user_id=job.user_id, runs=runs)
+            if summary is not None and storage is not None:
+                self._store_session_summary(storage, session_id=session_id, user_id=job.user_id, summary=summary)
+            job.session_ids.pop(0)
+
+    def _get_stored_session_runs(
+        self, storage: "Storage", session_id: str
+    ) -> Optional[List[Union[RunResponse, TeamRunResponse]]]:
+        """The runs of a session read from storage, or None if the session is not stored."""
+        from agno.storage.session.agent import AgentSession
+        from agno.storage.session.team import TeamSession
+
+        session = storage.traced_read(session_id=session_id)
+        if not isinstance(session, (AgentSession, TeamSession)) or not session.memory or "runs" not in session.memory:
+            return None
+        try:
+            return [
+                TeamRunResponse.from_dict(run) if "team_id" in run else RunResponse.from_dict(run)
+                for run in session.memory["runs"]
+            ]
+        except Exception as e:
+            log_warning(f"Failed to load runs of session {session_id} from storage: {e}")
+            return None
+
+    def _store_session_summary(
+        self, storage: "Storage", session_id: str, user_id: str, summary: SessionSummary
+    ) -> None:
+        """Write a summary created in the background to its stored session, which was written before it existed."""
+        from agno.storage.session.agent import AgentSession
+        from agno.storage.session.team import TeamSession
+
+        session = storage.traced_read(session_id=session_id)
+        if not isinstance(session, (AgentSession, TeamSession)):
+            log_debug(f"Session {session_id} not found in storage, summary not stored")
+            return
+        memory = dict(session.memory or {})
+        summaries = dict(memory.get("summaries") or {})
+        summaries[user_id] = {**summaries.get(user_id, {}), session_id: summary.to_dict()}
+        memory["summaries"] = summaries
+        session.memory = memory
+        storage.traced_upsert(session)
+
     def update_memory_task(self, task: str, user_id: Optional[str] = None) -> str:
         """Updates the memory with a task"""
         if not self.memory_manager:
@@ -555,10 +676,7 @@ class Memory:
 
         self.refresh_from_db(user_id=user_id)
 
-        existing_memories = self.memories.get(user_id, {})  # type: ignore
-        existing_memories = [
-            {"memory_id": memory_id, "memory": memory.memory} for memory_id, memory in existing_memories.items()
-        ]
+        existing_memories = self._get_existing_memories(user_id)
         # The memory manager updates the DB directly
         response = self.memory_manager.run_memory_task(  # type: ignore
             task=task,
@@ -589,10 +707,7 @@ class Memory:
 
         self.refresh_from_db(user_id=user_id)
 
-        existing_memories = self.memories.get(user_id, {})  # type: ignore
-        existing_memories = [
-            {"memory_id": memory_id, "memory": memory.memory} for memory_id, memory in existing_memories.items()
-        ]
+        existing_memories = self._get_existing_memories(user_id)
         # The memory manager updates the DB directly
         response = await self.memory_manager.arun_memory_task(  # type: ignore
             task=task,
@@ -641,12 +756,26 @@ class Memory:
     ) -> List[Message]:
         """Returns a list of messages for the session that iterate through user message and assistant response."""
 
+        session_runs = self.runs.get(session_id, []) if self.runs else []
+        return self._get_messages_from_runs(
+            session_runs,
+            user_role=user_role,
+            assistant_role=assistant_role,
+            skip_history_messages=skip_history_messages,
+        )
+
+    def _get_messages_from_runs(
+        self,
+        runs: List[Union[RunResponse, TeamRunResponse]],
+        user_role: str = "user",
+        assistant_role: Optional[List[str]] = None,
+        skip_history_messages: bool = True,
+    ) -> List[Message]:
         if assistant_role is None:
             assistant_role = ["assistant", "model", "CHATBOT"]
 
         final_messages: List[Message] = []
-        session_runs = self.runs.get(session_id, []) if self.runs else []
-        for run_response in session_runs:
+        for run_response in runs:
             if run_response and run_response.messages:
                 user_message_from_run = None
                 assistant_message_from_run = None
@@ -672,6 +801,74 @@ class Memory:
                     final_messages.append(assistant_message_from_run)
         return final_messages
 
+    def _get_summary_input(
+        self, session_id: str, user_id: str, runs: Optional[List[Union[RunResponse, TeamRunResponse]]] = None
+    ) -> Tuple[Optional[SessionSummary], List[Message], int, Optional[str]]:
+        """
+        Returns what the summarizer needs for a session: the summary to update, the conversation to summarize,
+        the number of runs in it and the id of the last run.
+        In incremental mode only the runs after the previous summary are returned.
+        """
+        if runs is not None:
+            session_runs = runs
+        else:
+            session_runs = self.runs.get(session_id, []) if self.runs else []
+        last_run_id = getattr(session_runs[-1], "run_id", None) if session_runs else None
+
+        previous_summary = None
+        if self.summary_manager is not None and self.summary_manager.incremental:
+            previous_summary = self.get_session_summary(session_id=session_id, user_id=user_id)
+            position = None
+            if previous_summary is not None and previous_summary.last_run_id is not None:
+                if runs is not None:
+                    run_ids = [getattr(run, "run_id", None) for run in runs]
+                    if previous_summary.last_run_id in run_ids:
+                        position = run_ids.index(previous_summary.last_run_id)
+                else:
+                    position = self.get_run_position(session_id=session_id, run_id=previous_summary.last_run_id)
+            if position is None:
+                # The previous summary cannot be continued, summarize the whole session
+                previous_summary = None
+            else:
+                session_runs = session_runs[position + 1 :]
+
+        return previous_summary, self._get_messages_from_runs(session_runs), len(session_runs), last_run_id
+
+    def _build_run_index(
+        self, session_id: str, session_runs: List[Union[RunResponse, TeamRunResponse]]
+    ) -> Dict[str, int]:
+        """Builds the run_id -> position index for a session. Runs without a run_id are not indexed."""
+        index: Dict[str, int] = {}
+        for position, run in enumerate(session_runs):
+            run_id = getattr(run, "run_id", None)
+            if run_id is not None:
+                index[run_id] = position
+        self._run_index[session_id] = (session_runs, index)
+        return index
+
+    def get_run_position(self, session_id: str, run_id: str) -> Optional[int]:
+        """Get the position of a run in the runs list for a session, or None if the run is not in memory"""
+        session_runs = self.runs.get(session_id) if self.runs else None
+        if not session_runs:
+            return None
+
+        cached = self._run_index.get(session_id)
+        if cached is not None and cached[0] is session_runs:
+            position = cached[1].get(run_id)
+            if (
+                position is not None
+                and position < len(session_runs)
+                and getattr(session_runs[position], "run_id", None) == run_id
+            ):
+                return position
+
+        # The run is not indexed or the runs list was modified directly, rebuild the index before trusting a miss
+        return self._build_run_index(session_id, session_runs).get(run_id)
+
+    def has_run(self, session_id: str, run_id: str) -> bool:
+        """Check if a run with the given run_id is in memory for a session"""
+        return self.get_run_position(session_id=session_id, run_id=run_id) is not None
+
     def add_run(self, session_id: str, run: Union[RunResponse, TeamRunResponse]) -> None:
         """Adds a RunResponse to the runs list."""
         if not self.runs:
@@ -683,17 +880,58 @@ class Memory:
         # Check if run already exists with the same run_id
         if hasattr(run, "run_id") and run.run_id:
             run_id = run.run_id
-            # Look for existing run with same ID
-            for i, existing_run in enumerate(self.runs[session_id]):
-                if hasattr(existing_run, "run_id") and existing_run.run_id == run_id:
-                    # Replace existing run
-                    self.runs[session_id][i] = run
-                    log_debug(f"Replaced existing run with run_id {run_id} in memory")
-                    return
-
-        self.runs[session_id].append(run)
+            position = self.get_run_position(session_id=session_id, run_id=run_id)
+            if position is not None:
+                # Replace existing run
+                self.runs[session_id][position] = run
+                log_debug(f"Replaced existing run with run_id {run_id} in memory")
+                return
+
+        self._append_run(session_id, run)
         log_debug("Added RunResponse to Memory")
 
+    def _append_run(self, session_id: str, run: Union[RunResponse, TeamRunResponse]) -> None:
+        """Appends a run that is not in memory yet, keeping the run index in sync."""
+        session_runs = self.runs[session_id]  # type: ignore
+        session_runs.append(run)
+        cached = self._run_index.get(session_id)
+        if run.run_id is not None and cached is not None and cached[0] is session_runs:
+            cached[1][run.run_id] = len(session_runs) - 1
+
+    def merge_runs_from_storage(self, session_id: str, runs: List[Dict[str, Any]]) -> int:
+        """Adds stored runs for a session that are not already in memory.
+
+        Only runs with an unknown run_id are deserialized, existing runs are left as is.
+
+        Returns:
+            int: The number of runs added.
+        """
+        if self.runs is None:
+            self.runs = {}
+        if session_id not in self.runs:
+            self.runs[session_id] = []
+
+        # Index each session once, instead of rebuilding the index for every new run
+        indexes: Dict[str, Dict[str, int]] = {}
+        num_added = 0
+        for run in runs:
+            run_session_id = run.get("session_id") or session_id
+            if run_session_id not in self.runs:
+                self.runs[run_session_id] = []
+            index = indexes.get(run_session_id)
+            if index is None:
+                index = self._build_run_index(run_session_id, self.runs[run_session_id])
+                indexes[run_session_id] = index
+
+            run_id = run.get("run_id")
+            if run_id is not None and run_id in index:
+                continue
+            run_response = TeamRunResponse.from_dict(run) if "team_id" in run else RunResponse.from_dict(run)
+            # Also updates the index of the session
+            self._append_run(run_session_id, run_response)
+            num_added += 1
+        return num_added
+
     def get_messages_from_last_n_runs(
         self,
         session_id: str,
@@ -982,6 +1220,7 @@ class Memory:
         self.memories = {}
         self.summaries = {}
         self.runs = {}
+        self._run_index = {}
 
     # -*- Team Functions
     def add_interaction_to_team_context(
@@ -1090,8 +1329,12 @@ class Memory:
         memo[id(self)] = copied_obj
 
         # Copy attributes, reusing specific objects
-        shared_objects = {"db", "memory_manager", "summary_manager", "team_context"}
+        shared_objects = {"db", "memory_manager", "summary_manager", "team_context", "job_queue"}
         for k, v in self.__dict__.items():
+            if k == "_run_index":
+                # The index references the original runs lists, it is rebuilt on demand
+                setattr(copied_obj, k, {})
+                continue
             setattr(copied_obj, k, v if k in shared_objects else deepcopy(v, memo))
 
         return copied_obj
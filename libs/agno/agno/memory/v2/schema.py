@@ -38,12 +38,15 @@ class SessionSummary:
     summary: str
     topics: Optional[List[str]] = None
     last_updated: Optional[datetime] = None
+    # The last run included in the summary, used to update it incrementally
+    last_run_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         _dict = {
             "summary": self.summary,
             "topics": self.topics,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+            "last_run_id": self.last_run_id,
         }
         return {k: v for k, v in _dict.items() if v is not None}
 
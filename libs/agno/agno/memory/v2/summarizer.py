@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
+from agno.memory.v2.schema import SessionSummary
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -39,6 +40,13 @@ class SessionSummarizer:
     # Additional instructions for the summarizer. If not provided, a default prompt will be used.
     additional_instructions: Optional[str] = None
 
+    # If True, update the previous summary with the runs since it was made, instead of summarizing the whole session
+    incremental: bool = False
+    # Incremental mode only: update the summary once this many runs are not summarized yet
+    update_every_n_runs: Optional[int] = None
+    # Incremental mode only: update the summary once the runs not summarized yet reach roughly this many tokens
+    update_every_n_tokens: Optional[int] = None
+
     # Whether the summarizer has created a summary
     summary_updated: bool = False
 
@@ -47,12 +55,33 @@ class SessionSummarizer:
         model: Optional[Model] = None,
         system_message: Optional[str] = None,
         additional_instructions: Optional[str] = None,
+        incremental: bool = False,
+        update_every_n_runs: Optional[int] = None,
+        update_every_n_tokens: Optional[int] = None,
     ):
         self.model = model
         if self.model is not None and isinstance(self.model, str):
             raise ValueError("Model must be a Model object, not a string")
         self.system_message = system_message
         self.additional_instructions = additional_instructions
+        self.incremental = incremental
+        self.update_every_n_runs = update_every_n_runs
+        self.update_every_n_tokens = update_every_n_tokens
+
+    def should_update(self, num_runs: int, conversation: List[Message]) -> bool:
+        """Whether enough of the session is not summarized yet to update an incremental summary."""
+        if num_runs == 0:
+            return False
+        if self.update_every_n_runs is None and self.update_every_n_tokens is None:
+            return True
+        if self.update_every_n_runs is not None and num_runs >= self.update_every_n_runs:
+            return True
+        if self.update_every_n_tokens is not None:
+            # Rough estimate of 4 characters per token
+            num_tokens = sum(len(message.get_content_string()) for message in conversation) // 4
+            if num_tokens >= self.update_every_n_tokens:
+                return True
+        return False
 
     def get_response_format(self, model: Model) -> Union[Dict[str, Any], Type[BaseModel]]:
         if model.supports_native_structured_outputs:
@@ -70,20 +99,38 @@ class SessionSummarizer:
             return {"type": "json_object"}
 
     def get_system_message(
-        self, conversation: List[Message], response_format: Union[Dict[str, Any], Type[BaseModel]]
+        self,
+        conversation: List[Message],
+        response_format: Union[Dict[str, Any], Type[BaseModel]],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Message:
         if self.system_message is not None:
             return Message(role="system", content=self.system_message)
 
         # -*- Return a system message for summarization
-        system_prompt = dedent("""\
-        Analyze the following conversation between a user and an assistant, and extract the following details:
-          - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
-          - Topics (Optional[List[str]]): List the topics discussed in the session.
-        Keep the summary concise and to the point. Only include relevant information.
-
-        <conversation>
-        """)
+        if previous_summary is None:
+            system_prompt = dedent("""\
+            Analyze the following conversation between a user and an assistant, and extract the following details:
+              - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            <conversation>
+            """)
+        else:
+            system_prompt = dedent("""\
+            Below is the summary of a session between a user and an assistant, followed by the messages exchanged since it was written.
+            Update the summary with the new messages, and extract the following details:
+              - Summary (str): Provide a concise summary of the whole session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the whole session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            <previous_summary>
+            """)
+            system_prompt += previous_summary.summary + "\n"
+            if previous_summary.topics:
+                system_prompt += "Topics: " + ", ".join(previous_summary.topics) + "\n"
+            system_prompt += "</previous_summary>\n\n<conversation>\n"
         conversation_messages = []
         for message in conversation:
             if message.role == "user":
@@ -104,6 +151,7 @@ class SessionSummarizer:
     def run(
         self,
         conversation: List[Message],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Optional[SessionSummaryResponse]:
         if self.model is None:
             log_error("No model provided for summary_manager")
@@ -120,7 +168,7 @@ class SessionSummarizer:
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(conversation, response_format=response_format),
+            self.get_system_message(conversation, response_format=response_format, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
@@ -161,6 +209,7 @@ class SessionSummarizer:
     async def arun(
         self,
         conversation: List[Message],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Optional[SessionSummaryResponse]:
         if self.model is None:
             log_error("No model provided for summary_manager")
@@ -177,7 +226,7 @@ class SessionSummarizer:
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(conversation, response_format=response_format),
+            self.get_system_message(conversation, response_format=response_format, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
@@ -216,9 +216,102 @@ class AwsBedrock(Model):
 
         return {k: v for k, v in request_kwargs.items() if v is not None}
 
+    def _format_message(self, message: Message) -> Dict[str, Any]:
+        """
+        Format a user, assistant or tool message for the request.
+
+        Returns:
+            Dict[str, Any]: The formatted message.
+        """
+        formatted_message: Dict[str, Any] = {"role": message.role, "content": []}
+        # Handle tool results
+        if isinstance(message.content, list):
+            formatted_message["content"].extend(message.content)
+        elif message.tool_calls:
+            tool_use_content = []
+            for tool_call in message.tool_calls:
+                try:
+                    # Parse arguments with error handling for empty or invalid JSON
+                    arguments = tool_call["function"]["arguments"]
+                    if not arguments or arguments.strip() == "":
+                        tool_input = {}
+                    else:
+                        tool_input = json.loads(arguments)
+                except (json.JSONDecodeError, KeyError) as e:
+                    log_warning(f"Failed to parse tool call arguments: {e}")
+                    tool_input = {}
+
+                tool_use_content.append(
+                    {
+                        "toolUse": {
+                            "toolUseId": tool_call["id"],
+                            "name": tool_call["function"]["name"],
+                            "input": tool_input,
+                        }
+                    }
+                )
+            formatted_message["content"].extend(tool_use_content)
+        else:
+            formatted_message["content"].append({"text": message.content})
+
+        if message.images:
+            for image in message.images:
+                if not image.content or not image.format:
+                    raise ValueError("Image content and format are required.")
+
+                if image.format not in ["png", "jpeg", "webp", "gif"]:
+                    raise ValueError(f"Unsupported image format: {image.format}")
+
+                formatted_message["content"].append(
+                    {
+                        "image": {
+                            "format": image.format,
+                            "source": {
+                                "bytes": image.content,
+                            },
+                        }
+                    }
+                )
+        if message.audio:
+            log_warning("Audio input is currently unsupported.")
+
+        if message.videos:
+            for video in message.videos:
+                if not video.content or not video.format:
+                    raise ValueError("Video content and format are required.")
+
+                if video.format not in [
+                    "mp4",
+                    "mov",
+                    "mkv",
+                    "webm",
+                    "flv",
+                    "mpeg",
+                    "mpg",
+                    "wmv",
+                    "three_gp",
+                ]:
+                    raise ValueError(f"Unsupported video format: {video.format}")
+
+                formatted_message["content"].append(
+                    {
+                        "video": {
+                            "format": video.format,
+                            "source": {
+                                "bytes": video.content,
+                            },
+                        }
+                    }
+                )
+        if message.files is not None and len(message.files) > 0:
+            log_warning("File input is currently unsupported.")
+
+        return formatted_message
+
     def _format_messages(self, messages: List[Message]) -> Tuple[List[Dict[str, Any]], Optional[List[Dict[str, Any]]]]:
         """
         Format the messages for the request.
+        Messages are formatted once and the payload is reused on later requests, see `Message.get_formatted`.
 
         Returns:
             Tuple[List[Dict[str, Any]], Optional[List[Dict[str, Any]]]]: The formatted messages.
@@ -229,90 +322,7 @@ class AwsBedrock(Model):
             if message.role == "system":
                 system_message = [{"text": message.content}]
             else:
-                formatted_message: Dict[str, Any] = {"role": message.role, "content": []}
-                # Handle tool results
-                if isinstance(message.content, list):
-                    formatted_message["content"].extend(message.content)
-                elif message.tool_calls:
-                    tool_use_content = []
-                    for tool_call in message.tool_calls:
-                        try:
-                            # Parse arguments with error handling for empty or invalid JSON
-                            arguments = tool_call["function"]["arguments"]
-                            if not arguments or arguments.strip() == "":
-                                tool_input = {}
-                            else:
-                                tool_input = json.loads(arguments)
-                        except (json.JSONDecodeError, KeyError) as e:
-                            log_warning(f"Failed to parse tool call arguments: {e}")
-                            tool_input = {}
-
-                        tool_use_content.append(
-                            {
-                                "toolUse": {
-                                    "toolUseId": tool_call["id"],
-                                    "name": tool_call["function"]["name"],
-                                    "input": tool_input,
-                                }
-                            }
-                        )
-                    formatted_message["content"].extend(tool_use_content)
-                else:
-                    formatted_message["content"].append({"text": message.content})
-
-                if message.images:
-                    for image in message.images:
-                        if not image.content or not image.format:
-                            raise ValueError("Image content and format are required.")
-
-                        if image.format not in ["png", "jpeg", "webp", "gif"]:
-                            raise ValueError(f"Unsupported image format: {image.format}")
-
-                        formatted_message["content"].append(
-                            {
-                                "image": {
-                                    "format": image.format,
-                                    "source": {
-                                        "bytes": image.content,
-                                    },
-                                }
-                            }
-                        )
-                if message.audio:
-                    log_warning("Audio input is currently unsupported.")
-
-                if message.videos:
-                    for video in message.videos:
-                        if not video.content or not video.format:
-                            raise ValueError("Video content and format are required.")
-
-                        if video.format not in [
-                            "mp4",
-                            "mov",
-                            "mkv",
-                            "webm",
-                            "flv",
-                            "mpeg",
-                            "mpg",
-                            "wmv",
-                            "three_gp",
-                        ]:
-                            raise ValueError(f"Unsupported video format: {video.format}")
-
-                        formatted_message["content"].append(
-                            {
-                                "video": {
-                                    "format": video.format,
-                                    "source": {
-                                        "bytes": video.content,
-                                    },
-                                }
-                            }
-                        )
-                if message.files is not None and len(message.files) > 0:
-                    log_warning("File input is currently unsupported.")
-
-                formatted_messages.append(formatted_message)
+                formatted_messages.append(message.get_formatted(type(self), self._format_message))
         # TODO: Add caching: https://docs.aws.amazon.com/bedrock/latest/userguide/conversation-inference-call.html
         return formatted_messages, system_message
 
@@ -1,6 +1,9 @@
 import asyncio
 import collections.abc
+import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
@@ -29,6 +32,7 @@ from agno.run.response import RunResponseContentEvent, RunResponseEvent
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunResponseEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
+from agno.tracing.span import traced
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
@@ -61,6 +65,16 @@ def _log_messages(messages: List[Message]) -> None:
         m.log(metrics=False)
 
 
+def _load_media_content(messages: List[Message]) -> None:
+    """
+    Fetch the content of media that is only held as a media store reference, so the model can send it.
+    """
+    for m in messages:
+        for media in (*(m.images or []), *(m.audio or []), *(m.videos or [])):
+            if media.content is None and media.content_ref is not None:
+                media.load_content()
+
+
 def _add_usage_metrics_to_assistant_message(assistant_message: Message, response_usage: Any) -> None:
     """
     Add usage metrics from the model provider to the assistant message.
@@ -222,6 +236,120 @@ def _handle_agent_exception(a_exc: AgentRunException, additional_messages: Optio
             m.stop_after_tool_call = True
 
 
+def _tool_call_arguments_complete(tool_call: Dict[str, Any]) -> bool:
+    """True if the streamed arguments of a tool call form a complete JSON object."""
+    arguments = (tool_call.get("function") or {}).get("arguments")
+    if isinstance(arguments, dict):
+        return True
+    if not isinstance(arguments, str) or not arguments.rstrip().endswith("}"):
+        return False
+    try:
+        return isinstance(json.loads(arguments), dict)
+    except ValueError:
+        return False
+
+
+def _execute_dispatched_function_call(function_call: FunctionCall, timer: Timer) -> FunctionExecutionResult:
+    try:
+        return function_call.execute()
+    finally:
+        timer.stop()
+
+
+class StreamingToolDispatcher:
+    """
+    Starts the tool calls of a streaming response as soon as their arguments are complete, while the model is still
+    streaming the rest of the response.
+
+    Tool calls are checked in order and only tools that can run without pausing the run are started early. The
+    results are collected in order by `run_function_calls` / `arun_function_calls` once the response is complete.
+    """
+
+    def __init__(self, model: "Model", functions: Optional[Dict[str, Function]], max_calls: Optional[int] = None):
+        self.model = model
+        self.functions = functions
+        # Number of tool calls that can still run in this response, given the tool call limit
+        self.max_calls = max_calls
+
+        # call_id -> started function call
+        self.function_calls: Dict[str, FunctionCall] = {}
+        # call_id -> future (sync) or task (async) running the function call
+        self.executions: Dict[str, Any] = {}
+        self.timers: Dict[str, Timer] = {}
+
+        self._next_index = 0
+        self._num_calls = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_ready_function_calls(self, tool_calls_data: List[Any]) -> List[FunctionCall]:
+        tool_calls = self.model.parse_tool_calls(tool_calls_data)
+        ready: List[FunctionCall] = []
+        while self._next_index < len(tool_calls):
+            tool_call = tool_calls[self._next_index]
+            # Later tool calls wait for this one, so the tool call limit is applied in order
+            if not tool_call or not _tool_call_arguments_complete(tool_call):
+                break
+            self._next_index += 1
+
+            function_call = get_function_call_for_tool_call(tool_call, self.functions)
+            if function_call is None or function_call.error is not None or function_call.call_id is None:
+                continue
+            self._num_calls += 1
+            if self.max_calls is not None and self._num_calls > self.max_calls:
+                continue
+            function = function_call.function
+            if (
+                function.requires_confirmation
+                or function.requires_user_input
+                or function.external_execution
+                or function.name == "get_user_input"
+            ):
+                continue
+            ready.append(function_call)
+        return ready
+
+    def dispatch(self, tool_calls_data: List[Any]) -> None:
+        """Start the tool calls that became complete, each in a worker thread."""
+        for function_call in self._get_ready_function_calls(tool_calls_data):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="agno-tool")
+            log_debug(f"Starting tool call early: {function_call.get_call_str()}")
+            timer = Timer()
+            timer.start()
+            self.function_calls[function_call.call_id] = function_call  # type: ignore
+            self.timers[function_call.call_id] = timer  # type: ignore
+            # Run in a copy of the current context, so the tool call is traced as part of the run
+            self.executions[function_call.call_id] = self._executor.submit(  # type: ignore
+                copy_context().run, _execute_dispatched_function_call, function_call, timer
+            )
+
+    def adispatch(self, tool_calls_data: List[Any]) -> None:
+        """Start the tool calls that became complete, each in an asyncio task."""
+        for function_call in self._get_ready_function_calls(tool_calls_data):
+            log_debug(f"Starting tool call early: {function_call.get_call_str()}")
+            self.function_calls[function_call.call_id] = function_call  # type: ignore
+            self.executions[function_call.call_id] = asyncio.ensure_future(  # type: ignore
+                self.model.arun_function_call(function_call)
+            )
+
+    def use_started_function_calls(self, function_calls: List[FunctionCall]) -> List[FunctionCall]:
+        """Replace the function calls of the complete response with the ones already started."""
+        return [self.function_calls.get(fc.call_id, fc) if fc.call_id else fc for fc in function_calls]  # type: ignore
+
+    def close(self) -> None:
+        """Stop tracking the response. Started tool calls that were never collected are cancelled if possible."""
+        for execution in self.executions.values():
+            execution.cancel()
+        self.executions.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def _get_model_span_attributes(model: "Model", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"model": model.id, "provider": model.get_provider()}
+
+
 @dataclass
 class Model(ABC):
     # ID of the model to use.
@@ -231,6 +359,10 @@ class Model(ABC):
     # Provider for this Model. This is not sent to the Model API.
     provider: Optional[str] = None
 
+    # Start tool calls while the response is still streaming, as soon as their arguments are complete.
+    # Tools then run concurrently with each other and with the rest of the response, so they must be thread-safe.
+    early_tool_dispatch: bool = False
+
     # -*- Do not set the following attributes directly -*-
     # -*- Set them on the Agent instead -*-
 
@@ -257,6 +389,14 @@ class Model(ABC):
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Trace every implementation of the streaming provider calls
+        for name in ("process_response_stream", "aprocess_response_stream"):
+            method = cls.__dict__.get(name)
+            if method is not None:
+                setattr(cls, name, traced("model.invoke", attributes=_get_model_span_attributes)(method))
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -311,6 +451,7 @@ class Model(ABC):
         """
         pass
 
+    @traced("model.response", attributes=_get_model_span_attributes)
     def response(
         self,
         messages: List[Message],
@@ -328,6 +469,7 @@ class Model(ABC):
         log_debug(f"Model: {self.id}", center=True, symbol="-")
 
         _log_messages(messages)
+        _load_media_content(messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -423,6 +565,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Response End", center=True, symbol="-")
         return model_response
 
+    @traced("model.response", attributes=_get_model_span_attributes)
     async def aresponse(
         self,
         messages: List[Message],
@@ -439,6 +582,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        _load_media_content(messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -533,6 +677,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response End", center=True, symbol="-")
         return model_response
 
+    @traced("model.invoke", attributes=_get_model_span_attributes)
     def _process_model_response(
         self,
         messages: List[Message],
@@ -589,6 +734,7 @@ class Model(ABC):
                 model_response.extra = {}
             model_response.extra.update(provider_response.extra)
 
+    @traced("model.invoke", attributes=_get_model_span_attributes)
     async def _aprocess_model_response(
         self,
         messages: List[Message],
@@ -708,6 +854,7 @@ class Model(ABC):
 
         return assistant_message
 
+    @traced("model.invoke", attributes=_get_model_span_attributes)
     def process_response_stream(
         self,
         messages: List[Message],
@@ -733,6 +880,7 @@ class Model(ABC):
             )
         assistant_message.metrics.stop_timer()
 
+    @traced("model.response", attributes=_get_model_span_attributes)
     def response_stream(
         self,
         messages: List[Message],
@@ -750,111 +898,137 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        _load_media_content(messages)
 
         function_call_count = 0
 
-        while True:
-            assistant_message = Message(role=self.assistant_message_role)
-            # Create assistant message and stream data
-            stream_data = MessageData()
-            if stream_model_response:
-                # Generate response
-                yield from self.process_response_stream(
-                    messages=messages,
-                    assistant_message=assistant_message,
-                    stream_data=stream_data,
-                    response_format=response_format,
-                    tools=tools,
-                    tool_choice=tool_choice or self._tool_choice,
-                )
+        tool_dispatcher: Optional[StreamingToolDispatcher] = None
+        try:
+            while True:
+                assistant_message = Message(role=self.assistant_message_role)
+                # Create assistant message and stream data
+                stream_data = MessageData()
+                tool_dispatcher = None
+                if stream_model_response:
+                    if self.early_tool_dispatch and functions:
+                        tool_dispatcher = StreamingToolDispatcher(
+                            self,
+                            functions,
+                            max_calls=tool_call_limit - function_call_count if tool_call_limit is not None else None,
+                        )
 
-                # Populate assistant message from stream data
-                if stream_data.response_content:
-                    assistant_message.content = stream_data.response_content
-                if stream_data.response_thinking:
-                    assistant_message.thinking = stream_data.response_thinking
-                if stream_data.response_redacted_thinking:
-                    assistant_message.redacted_thinking = stream_data.response_redacted_thinking
-                if stream_data.response_provider_data:
-                    assistant_message.provider_data = stream_data.response_provider_data
-                if stream_data.response_citations:
-                    assistant_message.citations = stream_data.response_citations
-                if stream_data.response_audio:
-                    assistant_message.audio_output = stream_data.response_audio
-                if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
-                    assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
+                    # Generate response
+                    for model_response_delta in self.process_response_stream(
+                        messages=messages,
+                        assistant_message=assistant_message,
+                        stream_data=stream_data,
+                        response_format=response_format,
+                        tools=tools,
+                        tool_choice=tool_choice or self._tool_choice,
+                    ):
+                        if tool_dispatcher is not None and model_response_delta.tool_calls:
+                            tool_dispatcher.dispatch(stream_data.response_tool_calls)
+                        yield model_response_delta
+
+                    # Populate assistant message from stream data
+                    if stream_data.response_content:
+                        assistant_message.content = stream_data.response_content
+                    if stream_data.response_thinking:
+                        assistant_message.thinking = stream_data.response_thinking
+                    if stream_data.response_redacted_thinking:
+                        assistant_message.redacted_thinking = stream_data.response_redacted_thinking
+                    if stream_data.response_provider_data:
+                        assistant_message.provider_data = stream_data.response_provider_data
+                    if stream_data.response_citations:
+                        assistant_message.citations = stream_data.response_citations
+                    if stream_data.response_audio:
+                        assistant_message.audio_output = stream_data.response_audio
+                    if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
+                        assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
 
-            else:
-                model_response = ModelResponse()
-                self._process_model_response(
-                    messages=messages,
-                    assistant_message=assistant_message,
-                    model_response=model_response,
-                    response_format=response_format,
-                    tools=tools,
-                    tool_choice=tool_choice or self._tool_choice,
-                )
-                yield model_response
+                else:
+                    model_response = ModelResponse()
+                    self._process_model_response(
+                        messages=messages,
+                        assistant_message=assistant_message,
+                        model_response=model_response,
+                        response_format=response_format,
+                        tools=tools,
+                        tool_choice=tool_choice or self._tool_choice,
+                    )
+                    yield model_response
 
-            # Add assistant message to messages
-            messages.append(assistant_message)
-            assistant_message.log(metrics=True)
+                # Add assistant message to messages
+                messages.append(assistant_message)
+                assistant_message.log(metrics=True)
 
-            # Handle tool calls if present
-            if assistant_message.tool_calls is not None:
-                # Prepare function calls
-                function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
-                    assistant_message, messages, functions
-                )
-                function_call_results: List[Message] = []
+                # Handle tool calls if present
+                if assistant_message.tool_calls is not None:
+                    # Prepare function calls
+                    function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
+                        assistant_message, messages, functions
+                    )
+                    function_call_results: List[Message] = []
+                    if tool_dispatcher is not None:
+                        function_calls_to_run = tool_dispatcher.use_started_function_calls(function_calls_to_run)
+
+                    # Execute function calls
+                    for function_call_response in self.run_function_calls(
+                        function_calls=function_calls_to_run,
+                        function_call_results=function_call_results,
+                        current_function_call_count=function_call_count,
+                        function_call_limit=tool_call_limit,
+                        tool_dispatcher=tool_dispatcher,
+                    ):
+                        yield function_call_response
+                    if tool_dispatcher is not None:
+                        tool_dispatcher.close()
 
-                # Execute function calls
-                for function_call_response in self.run_function_calls(
-                    function_calls=function_calls_to_run,
-                    function_call_results=function_call_results,
-                    current_function_call_count=function_call_count,
-                    function_call_limit=tool_call_limit,
-                ):
-                    yield function_call_response
+                    # Add a function call for each successful execution
+                    function_call_count += len(function_call_results)
 
-                # Add a function call for each successful execution
-                function_call_count += len(function_call_results)
+                    # Format and add results to messages
+                    if stream_data and stream_data.extra is not None:
+                        self.format_function_call_results(
+                            messages=messages, function_call_results=function_call_results, **stream_data.extra
+                        )
+                    else:
+                        self.format_function_call_results(
+                            messages=messages, function_call_results=function_call_results
+                        )
 
-                # Format and add results to messages
-                if stream_data and stream_data.extra is not None:
-                    self.format_function_call_results(
-                        messages=messages, function_call_results=function_call_results, **stream_data.extra
-                    )
-                else:
-                    self.format_function_call_results(messages=messages, function_call_results=function_call_results)
+                    for function_call_result in function_call_results:
+                        function_call_result.log(metrics=True)
 
-                for function_call_result in function_call_results:
-                    function_call_result.log(metrics=True)
+                    # Check if we should stop after tool calls
+                    if any(m.stop_after_tool_call for m in function_call_results):
+                        break
 
-                # Check if we should stop after tool calls
-                if any(m.stop_after_tool_call for m in function_call_results):
-                    break
+                    # If we have any tool calls that require confirmation, break the loop
+                    if any(fc.function.requires_confirmation for fc in function_calls_to_run):
+                        break
 
-                # If we have any tool calls that require confirmation, break the loop
-                if any(fc.function.requires_confirmation for fc in function_calls_to_run):
-                    break
+                    # If we have any tool calls that require external execution, break the loop
+                    if any(fc.function.external_execution for fc in function_calls_to_run):
+                        break
 
-                # If we have any tool calls that require external execution, break the loop
-                if any(fc.function.external_execution for fc in function_calls_to_run):
-                    break
+                    # If we have any tool calls that require user input, break the loop
+                    if any(fc.function.requires_user_input for fc in function_calls_to_run):
+                        break
 
-                # If we have any tool calls that require user input, break the loop
-                if any(fc.function.requires_user_input for fc in function_calls_to_run):
-                    break
+                    # Continue loop to get next response
+                    continue
 
-                # Continue loop to get next response
-                continue
-
-            # No tool calls or finished processing them
-            break
+                # No tool calls or finished processing them
+                break
+        finally:
+            # Cancel tool calls still running when the stream fails or is closed early
+            if tool_dispatcher is not None:
+                tool_dispatcher.close()
 
         log_debug(f"{self.get_provider()} Response Stream End", center=True, symbol="-")
 
+    @traced("model.invoke", attributes=_get_model_span_attributes)
     async def aprocess_response_stream(
         self,
         messages: List[Message],
@@ -881,6 +1055,7 @@ class Model(ABC):
                 yield model_response
         assistant_message.metrics.stop_timer()
 
+    @traced("model.response", attributes=_get_model_span_attributes)
     async def aresponse_stream(
         self,
         messages: List[Message],
@@ -898,107 +1073,131 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        _load_media_content(messages)
 
         function_call_count = 0
 
-        while True:
-            # Create assistant message and stream data
-            assistant_message = Message(role=self.assistant_message_role)
-            stream_data = MessageData()
-            if stream_model_response:
-                # Generate response
-                async for response in self.aprocess_response_stream(
-                    messages=messages,
-                    assistant_message=assistant_message,
-                    stream_data=stream_data,
-                    response_format=response_format,
-                    tools=tools,
-                    tool_choice=tool_choice or self._tool_choice,
-                ):
-                    yield response
-
-                # Populate assistant message from stream data
-                if stream_data.response_content:
-                    assistant_message.content = stream_data.response_content
-                if stream_data.response_thinking:
-                    assistant_message.thinking = stream_data.response_thinking
-                if stream_data.response_redacted_thinking:
-                    assistant_message.redacted_thinking = stream_data.response_redacted_thinking
-                if stream_data.response_provider_data:
-                    assistant_message.provider_data = stream_data.response_provider_data
-                if stream_data.response_audio:
-                    assistant_message.audio_output = stream_data.response_audio
-                if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
-                    assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
+        tool_dispatcher: Optional[StreamingToolDispatcher] = None
+        try:
+            while True:
+                # Create assistant message and stream data
+                assistant_message = Message(role=self.assistant_message_role)
+                stream_data = MessageData()
+                tool_dispatcher = None
+                if stream_model_response:
+                    if self.early_tool_dispatch and functions:
+                        tool_dispatcher = StreamingToolDispatcher(
+                            self,
+                            functions,
+                            max_calls=tool_call_limit - function_call_count if tool_call_limit is not None else None,
+                        )
 
-            else:
-                model_response = ModelResponse()
-                await self._aprocess_model_response(
-                    messages=messages,
-                    assistant_message=assistant_message,
-                    model_response=model_response,
-                    response_format=response_format,
-                    tools=tools,
-                    tool_choice=tool_choice or self._tool_choice,
-                )
-                yield model_response
+                    # Generate response
+                    async for response in self.aprocess_response_stream(
+                        messages=messages,
+                        assistant_message=assistant_message,
+                        stream_data=stream_data,
+                        response_format=response_format,
+                        tools=tools,
+                        tool_choice=tool_choice or self._tool_choice,
+                    ):
+                        if tool_dispatcher is not None and response.tool_calls:
+                            tool_dispatcher.adispatch(stream_data.response_tool_calls)
+                        yield response
+
+                    # Populate assistant message from stream data
+                    if stream_data.response_content:
+                        assistant_message.content = stream_data.response_content
+                    if stream_data.response_thinking:
+                        assistant_message.thinking = stream_data.response_thinking
+                    if stream_data.response_redacted_thinking:
+                        assistant_message.redacted_thinking = stream_data.response_redacted_thinking
+                    if stream_data.response_provider_data:
+                        assistant_message.provider_data = stream_data.response_provider_data
+                    if stream_data.response_audio:
+                        assistant_message.audio_output = stream_data.response_audio
+                    if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
+                        assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
 
-            # Add assistant message to messages
-            messages.append(assistant_message)
-            assistant_message.log(metrics=True)
+                else:
+                    model_response = ModelResponse()
+                    await self._aprocess_model_response(
+                        messages=messages,
+                        assistant_message=assistant_message,
+                        model_response=model_response,
+                        response_format=response_format,
+                        tools=tools,
+                        tool_choice=tool_choice or self._tool_choice,
+                    )
+                    yield model_response
 
-            # Handle tool calls if present
-            if assistant_message.tool_calls is not None:
-                # Prepare function calls
-                function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
-                    assistant_message, messages, functions
-                )
-                function_call_results: List[Message] = []
+                # Add assistant message to messages
+                messages.append(assistant_message)
+                assistant_message.log(metrics=True)
 
-                # Execute function calls
-                async for function_call_response in self.arun_function_calls(
-                    function_calls=function_calls_to_run,
-                    function_call_results=function_call_results,
-                    current_function_call_count=function_call_count,
-                    function_call_limit=tool_call_limit,
-                ):
-                    yield function_call_response
+                # Handle tool calls if present
+                if assistant_message.tool_calls is not None:
+                    # Prepare function calls
+                    function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
+                        assistant_message, messages, functions
+                    )
+                    function_call_results: List[Message] = []
+                    if tool_dispatcher is not None:
+                        function_calls_to_run = tool_dispatcher.use_started_function_calls(function_calls_to_run)
+
+                    # Execute function calls
+                    async for function_call_response in self.arun_function_calls(
+                        function_calls=function_calls_to_run,
+                        function_call_results=function_call_results,
+                        current_function_call_count=function_call_count,
+                        function_call_limit=tool_call_limit,
+                        tool_dispatcher=tool_dispatcher,
+                    ):
+                        yield function_call_response
+                    if tool_dispatcher is not None:
+                        tool_dispatcher.close()
 
-                # Add a function call for each successful execution
-                function_call_count += len(function_call_results)
+                    # Add a function call for each successful execution
+                    function_call_count += len(function_call_results)
 
-                # Format and add results to messages
-                if stream_data and stream_data.extra is not None:
-                    self.format_function_call_results(
-                        messages=messages, function_call_results=function_call_results, **stream_data.extra
-                    )
-                else:
-                    self.format_function_call_results(messages=messages, function_call_results=function_call_results)
+                    # Format and add results to messages
+                    if stream_data and stream_data.extra is not None:
+                        self.format_function_call_results(
+                            messages=messages, function_call_results=function_call_results, **stream_data.extra
+                        )
+                    else:
+                        self.format_function_call_results(
+                            messages=messages, function_call_results=function_call_results
+                        )
 
-                for function_call_result in function_call_results:
-                    function_call_result.log(metrics=True)
+                    for function_call_result in function_call_results:
+                        function_call_result.log(metrics=True)
 
-                # Check if we should stop after tool calls
-                if any(m.stop_after_tool_call for m in function_call_results):
-                    break
+                    # Check if we should stop after tool calls
+                    if any(m.stop_after_tool_call for m in function_call_results):
+                        break
 
-                # If we have any tool calls that require confirmation, break the loop
-                if any(fc.function.requires_confirmation for fc in function_calls_to_run):
-                    break
+                    # If we have any tool calls that require confirmation, break the loop
+                    if any(fc.function.requires_confirmation for fc in function_calls_to_run):
+                        break
 
-                # If we have any tool calls that require external execution, break the loop
-                if any(fc.function.external_execution for fc in function_calls_to_run):
-                    break
+                    # If we have any tool calls that require external execution, break the loop
+                    if any(fc.function.external_execution for fc in function_calls_to_run):
+                        break
 
-                # If we have any tool calls that require user input, break the loop
-                if any(fc.function.requires_user_input for fc in function_calls_to_run):
-                    break
+                    # If we have any tool calls that require user input, break the loop
+                    if any(fc.function.requires_user_input for fc in function_calls_to_run):
+                        break
 
-                # Continue loop to get next response
-                continue
+                    # Continue loop to get next response
+                    continue
 
-            # No tool calls or finished processing them
-            break
+                # No tool calls or finished processing them
+                break
+        finally:
+            # Cancel tool calls still running when the stream fails or is closed early
+            if tool_dispatcher is not None:
+                tool_dispatcher.close()
 
         log_debug(f"{self.get_provider()} Async Response Stream End", center=True, symbol="-")
 
@@ -1012,7 +1211,7 @@ class Model(ABC):
             assistant_message.metrics.set_time_to_first_token()
 
         # Add role to assistant message
-        if model_response_delta.role is not None:
+        if model_response_delta.role is not None and model_response_delta.role != assistant_message.role:
             assistant_message.role = model_response_delta.role
 
         should_yield = False
@@ -1169,10 +1368,19 @@ class Model(ABC):
         function_call: FunctionCall,
         function_call_results: List[Message],
         additional_messages: Optional[List[Message]] = None,
+        tool_dispatcher: Optional[StreamingToolDispatcher] = None,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        # The function call may have been started while the response was streaming
+        execution: Optional[Future] = None
+        if tool_dispatcher is not None and function_call.call_id is not None:
+            execution = tool_dispatcher.executions.pop(function_call.call_id, None)
+
         # Start function call
-        function_call_timer = Timer()
-        function_call_timer.start()
+        if execution is not None:
+            function_call_timer = tool_dispatcher.timers[function_call.call_id]  # type: ignore
+        else:
+            function_call_timer = Timer()
+            function_call_timer.start()
         # Yield a tool_call_started event
         yield ModelResponse(
             content=function_call.get_call_str(),
@@ -1189,7 +1397,10 @@ class Model(ABC):
         # Run function calls sequentially
         function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
         try:
-            function_execution_result = function_call.execute()
+            if execution is not None:
+                function_execution_result = execution.result()
+            else:
+                function_execution_result = function_call.execute()
         except AgentRunException as a_exc:
             # Update additional messages from function call
             _handle_agent_exception(a_exc, additional_messages)
@@ -1201,7 +1412,8 @@ class Model(ABC):
         function_call_success = function_execution_result.status == "success"
 
         # Stop function call timer
-        function_call_timer.stop()
+        if execution is None:
+            function_call_timer.stop()
 
         # Process function call output
         function_call_output: str = ""
@@ -1265,6 +1477,7 @@ class Model(ABC):
         additional_messages: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        tool_dispatcher: Optional[StreamingToolDispatcher] = None,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
@@ -1354,7 +1567,10 @@ class Model(ABC):
                 continue
 
             yield from self.run_function_call(
-                function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
+                function_call=fc,
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+                tool_dispatcher=tool_dispatcher,
             )
 
         # Add any additional messages at the end
@@ -1408,6 +1624,7 @@ class Model(ABC):
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
         skip_pause_check: bool = False,
+        tool_dispatcher: Optional[StreamingToolDispatcher] = None,
     ) -> AsyncIterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
@@ -1532,8 +1749,14 @@ class Model(ABC):
                 )
             ]
 
+        # Function calls started while the response was streaming are awaited instead of started again
+        executions = tool_dispatcher.executions if tool_dispatcher is not None else {}
         results = await asyncio.gather(
-            *(self.arun_function_call(fc) for fc in function_calls_to_run), return_exceptions=True
+            *(
+                (executions.pop(fc.call_id, None) if fc.call_id is not None else None) or self.arun_function_call(fc)
+                for fc in function_calls_to_run
+            ),
+            return_exceptions=True,
         )
 
         # Process results
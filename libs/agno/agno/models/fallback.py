@@ -0,0 +1,370 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from math import ceil
+from threading import Lock
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Type, cast
+from weakref import finalize
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.utils.log import log_debug, log_warning
+
+# The member model that served the most recent request in the current context.
+# Used to delegate provider specific post-processing (tool call parsing, tool result formatting).
+_active_model: ContextVar[Optional[Model]] = ContextVar("agno_fallback_active_model", default=None)
+
+# Sentinel for an exhausted stream
+_END = object()
+
+
+@dataclass
+class _ModelResult:
+    """A raw provider response, tagged with the member model that produced it."""
+
+    model: Model
+    response: Any
+
+
+@dataclass
+class FallbackModel(Model):
+    """
+    A composite model that wraps a list of models and calls them in order.
+
+    - Fallback: if a model raises an error (or exceeds `timeout`), the next model in the list is tried.
+    - Hedging: if `hedge=True` and a model has not answered after its hedge delay, a duplicate request is sent to
+      the next model in the list. The first response to complete is used and the other request is cancelled.
+
+    The hedge delay for each model is the `hedge_percentile` of its recently observed latencies
+    (time to first chunk for streams). Until `min_latency_samples` are recorded, `hedge_delay` is used.
+
+    All models should accept the same conversation format, e.g. the same model deployed in different regions or
+    compatible models from the same provider.
+    """
+
+    id: str = ""
+    name: str = "FallbackModel"
+    provider: Optional[str] = None
+
+    # Models to call, in order of preference
+    models: List[Model] = field(default_factory=list)
+    # Errors that trigger a fallback to the next model. Any other error is raised immediately.
+    fallback_on: Tuple[Type[BaseException], ...] = (Exception,)
+    # Maximum seconds to wait for a model (or a hedged pair of models) before falling back
+    timeout: Optional[float] = None
+
+    # Send a duplicate request to the next model if the current one is slow
+    hedge: bool = False
+    # Seconds to wait before hedging, used until enough latency samples are recorded
+    hedge_delay: float = 2.0
+    # Percentile of the observed latencies to use as the hedge delay
+    hedge_percentile: float = 95.0
+    # Number of latency samples required before the percentile is used
+    min_latency_samples: int = 20
+    # Number of latency samples to keep per model
+    latency_window: int = 500
+    # Maximum number of worker threads used for sync hedging and timeouts
+    max_workers: int = 8
+
+    _latencies: Dict[int, Deque[float]] = field(default_factory=dict, init=False, repr=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False)
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if not self.models:
+            raise ValueError("FallbackModel requires at least one model")
+        primary = self.models[0]
+        self.id = self.id or primary.id
+        self.provider = self.provider or primary.get_provider()
+        self.supports_native_structured_outputs = all(m.supports_native_structured_outputs for m in self.models)
+        self.supports_json_schema_outputs = all(m.supports_json_schema_outputs for m in self.models)
+        self.assistant_message_role = primary.assistant_message_role
+        self.tool_message_role = primary.tool_message_role
+        super().__post_init__()
+
+    def to_dict(self) -> Dict[str, Any]:
+        _dict = super().to_dict()
+        _dict["models"] = [m.to_dict() for m in self.models]
+        return _dict
+
+    # -*- Latency tracking
+    def record_latency(self, index: int, latency: float) -> None:
+        """Record a latency sample (in seconds) for the model at `index`."""
+        with self._lock:
+            samples = self._latencies.get(index)
+            if samples is None:
+                samples = deque(maxlen=self.latency_window)
+                self._latencies[index] = samples
+            samples.append(latency)
+
+    def get_latency_percentile(self, index: int, percentile: Optional[float] = None) -> Optional[float]:
+        """Return the given percentile of the recorded latencies for the model at `index`."""
+        with self._lock:
+            samples = sorted(self._latencies.get(index) or [])
+        if not samples:
+            return None
+        percentile = self.hedge_percentile if percentile is None else percentile
+        rank = max(ceil(percentile / 100 * len(samples)) - 1, 0)
+        return samples[min(rank, len(samples) - 1)]
+
+    def get_hedge_delay(self, index: int) -> float:
+        with self._lock:
+            num_samples = len(self._latencies.get(index) or [])
+        if num_samples < self.min_latency_samples:
+            return self.hedge_delay
+        return self.get_latency_percentile(index) or self.hedge_delay
+
+    # -*- Sync execution
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-fallback")
+                # Stop the worker threads once this model is garbage collected
+                finalize(self, self._executor.shutdown, wait=False)
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker threads used for sync hedging and timeouts. They are started again when needed."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __deepcopy__(self, memo):
+        new_model = super().__deepcopy__(memo)
+        # Each copy has its own lock and worker threads
+        new_model._lock = Lock()
+        new_model._executor = None
+        return new_model
+
+    def _timed_call(self, index: int, call: Callable[[Model], Any]) -> Any:
+        start = perf_counter()
+        result = call(self.models[index])
+        self.record_latency(index, perf_counter() - start)
+        return result
+
+    @staticmethod
+    def _cancel_futures(futures: List[Future], discard: Optional[Callable[[Any], None]] = None) -> None:
+        """Cancel requests that lost the race. Requests that are already running are discarded on completion."""
+
+        def _discard(future: Future) -> None:
+            if discard is not None and not future.cancelled() and future.exception() is None:
+                discard(future.result())
+
+        for future in futures:
+            if not future.cancel():
+                future.add_done_callback(_discard)
+
+    def _run_attempt(
+        self,
+        index: int,
+        hedge_index: Optional[int],
+        call: Callable[[Model], Any],
+        discard: Optional[Callable[[Any], None]] = None,
+    ) -> Tuple[int, Any]:
+        if hedge_index is None and self.timeout is None:
+            return index, self._timed_call(index, call)
+
+        executor = self._get_executor()
+        deadline = perf_counter() + self.timeout if self.timeout is not None else None
+        pending: Dict[Future, int] = {executor.submit(self._timed_call, index, call): index}
+        error: Optional[BaseException] = None
+
+        wait_for = self.get_hedge_delay(index) if hedge_index is not None else None
+        while True:
+            if deadline is not None:
+                remaining = max(deadline - perf_counter(), 0)
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+            done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                future_index = pending.pop(future)
+                if future.exception() is None:
+                    self._cancel_futures(list(pending), discard)
+                    return future_index, future.result()
+                error = future.exception()
+
+            if hedge_index is not None:
+                # The primary is slow or failed, send the hedged request
+                log_debug(f"Hedging request to {self.models[hedge_index].id}")
+                pending[executor.submit(self._timed_call, hedge_index, call)] = hedge_index
+                hedge_index = None
+            elif not pending:
+                raise error  # type: ignore
+            elif deadline is not None and perf_counter() >= deadline:
+                self._cancel_futures(list(pending), discard)
+                raise TimeoutError(f"No response from model within {self.timeout} seconds")
+            wait_for = None
+
+    def _call(self, call: Callable[[Model], Any], discard: Optional[Callable[[Any], None]] = None) -> Any:
+        error: Optional[BaseException] = None
+        index = 0
+        while index < len(self.models):
+            hedge_index = index + 1 if self.hedge and index + 1 < len(self.models) else None
+            try:
+                winner, result = self._run_attempt(index, hedge_index, call, discard)
+                _active_model.set(self.models[winner])
+                return result
+            except self.fallback_on as e:
+                error = e
+                log_warning(f"Model {self.models[index].id} failed: {e}")
+            index += 1 if hedge_index is None else 2
+        raise error  # type: ignore
+
+    # -*- Async execution
+    async def _atimed_call(self, index: int, call: Callable[[Model], Any]) -> Any:
+        start = perf_counter()
+        result = await call(self.models[index])
+        self.record_latency(index, perf_counter() - start)
+        return result
+
+    async def _arun_attempt(
+        self,
+        index: int,
+        hedge_index: Optional[int],
+        call: Callable[[Model], Any],
+        discard: Optional[Callable[[Any], Any]] = None,
+    ) -> Tuple[int, Any]:
+        if hedge_index is None:
+            return index, await asyncio.wait_for(self._atimed_call(index, call), timeout=self.timeout)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout if self.timeout is not None else None
+        pending: Dict[asyncio.Task, int] = {asyncio.ensure_future(self._atimed_call(index, call)): index}
+        error: Optional[BaseException] = None
+
+        async def _cancel(tasks: List[asyncio.Task]) -> None:
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                try:
+                    result = await task
+                    if discard is not None:
+                        await discard(result)
+                except BaseException:
+                    pass
+
+        wait_for: Optional[float] = self.get_hedge_delay(index)
+        try:
+            while True:
+                if deadline is not None:
+                    remaining = max(deadline - loop.time(), 0)
+                    wait_for = remaining if wait_for is None else min(wait_for, remaining)
+                done, _ = await asyncio.wait(list(pending), timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    task_index = pending.pop(task)
+                    if task.exception() is None:
+                        return task_index, task.result()
+                    error = task.exception()
+
+                if hedge_index is not None:
+                    log_debug(f"Hedging request to {self.models[hedge_index].id}")
+                    pending[asyncio.ensure_future(self._atimed_call(hedge_index, call))] = hedge_index
+                    hedge_index = None
+                elif not pending:
+                    raise error  # type: ignore
+                elif deadline is not None and loop.time() >= deadline:
+                    raise asyncio.TimeoutError(f"No response from model within {self.timeout} seconds")
+                wait_for = None
+        finally:
+            # Cancel the losing (or timed out) requests
+            await _cancel(list(pending))
+
+    async def _acall(self, call: Callable[[Model], Any], discard: Optional[Callable[[Any], Any]] = None) -> Any:
+        error: Optional[BaseException] = None
+        index = 0
+        while index < len(self.models):
+            hedge_index = index + 1 if self.hedge and index + 1 < len(self.models) else None
+            try:
+                winner, result = await self._arun_attempt(index, hedge_index, call, discard)
+                _active_model.set(self.models[winner])
+                return result
+            except self.fallback_on as e:
+                error = e
+                log_warning(f"Model {self.models[index].id} failed: {e}")
+            index += 1 if hedge_index is None else 2
+        raise error  # type: ignore
+
+    # -*- Model interface
+    def invoke(self, *args, **kwargs) -> _ModelResult:
+        return self._call(lambda model: _ModelResult(model=model, response=model.invoke(*args, **kwargs)))
+
+    async def ainvoke(self, *args, **kwargs) -> _ModelResult:
+        async def _call(model: Model) -> _ModelResult:
+            return _ModelResult(model=model, response=await model.ainvoke(*args, **kwargs))
+
+        return await self._acall(_call)
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[_ModelResult]:
+        """Stream from the first model to produce a chunk. Errors after the first chunk are not retried."""
+
+        def _first_chunk(model: Model) -> Tuple[Model, Iterator[Any], List[Any]]:
+            stream = iter(model.invoke_stream(*args, **kwargs))
+            return model, stream, [chunk for chunk in [next(stream, _END)] if chunk is not _END]
+
+        def _discard(result: Tuple[Model, Iterator[Any], List[Any]]) -> None:
+            close = getattr(result[1], "close", None)
+            if close is not None:
+                close()
+
+        model, stream, first = self._call(_first_chunk, discard=_discard)
+        for chunk in first:
+            yield _ModelResult(model=model, response=chunk)
+        for chunk in stream:
+            yield _ModelResult(model=model, response=chunk)
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[_ModelResult]:  # type: ignore
+        """Stream from the first model to produce a chunk. Errors after the first chunk are not retried."""
+
+        async def _first_chunk(model: Model) -> Tuple[Model, AsyncIterator[Any], List[Any]]:
+            # Providers implement ainvoke_stream as an async generator, calling it returns the stream
+            stream = cast(AsyncIterator[Any], model.ainvoke_stream(*args, **kwargs)).__aiter__()
+            try:
+                return model, stream, [await stream.__anext__()]
+            except StopAsyncIteration:
+                return model, stream, []
+
+        async def _discard(result: Tuple[Model, AsyncIterator[Any], List[Any]]) -> None:
+            aclose = getattr(result[1], "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        model, stream, first = await self._acall(_first_chunk, discard=_discard)
+        for chunk in first:
+            yield _ModelResult(model=model, response=chunk)
+        async for chunk in stream:
+            yield _ModelResult(model=model, response=chunk)
+
+    def parse_provider_response(self, response: _ModelResult, **kwargs) -> ModelResponse:  # type: ignore
+        return response.model.parse_provider_response(response.response, **kwargs)
+
+    def parse_provider_response_delta(self, response: _ModelResult) -> ModelResponse:  # type: ignore
+        return response.model.parse_provider_response_delta(response.response)
+
+    # -*- Provider specific helpers are delegated to the model that served the request
+    def _get_active_model(self) -> Model:
+        active = _active_model.get()
+        if active is not None and any(active is model for model in self.models):
+            return active
+        return self.models[0]
+
+    def parse_tool_calls(self, tool_calls_data: List[Any]) -> List[Dict[str, Any]]:
+        return self._get_active_model().parse_tool_calls(tool_calls_data)
+
+    def format_function_call_results(
+        self, messages: List[Message], function_call_results: List[Message], **kwargs
+    ) -> None:
+        self._get_active_model().format_function_call_results(
+            messages=messages, function_call_results=function_call_results, **kwargs
+        )
+
+    def get_system_message_for_model(self, tools: Optional[List[Any]] = None) -> Optional[str]:
+        return self.system_prompt or self.models[0].get_system_message_for_model(tools)
+
+    def get_instructions_for_model(self, tools: Optional[List[Any]] = None) -> Optional[List[str]]:
+        return self.instructions or self.models[0].get_instructions_for_model(tools)
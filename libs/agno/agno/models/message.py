@@ -1,9 +1,9 @@
 import json
 from dataclasses import asdict, dataclass
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -221,6 +221,32 @@ class Message(BaseModel):
 
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
+    # Provider payloads built from this message, by formatter key. Reset whenever a field is assigned.
+    _formatted: Dict[Hashable, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "metrics" and name[0] != "_":
+            # Read the private attributes directly, pydantic's attribute lookup is slow on this hot path
+            private = self.__pydantic_private__
+            if private and private.get("_formatted"):
+                # Replace rather than clear, as copies of this message may share the dict
+                private["_formatted"] = {}
+
+    def get_formatted(self, key: Hashable, formatter: Callable[["Message"], Any]) -> Any:
+        """
+        Return the provider payload for this message, calling `formatter` only the first time for a given key.
+
+        Within a run the history is sent to the model on every tool call round-trip, so caching the payload means
+        each message (and its images or audio) is converted once. The key must identify the formatter and any
+        settings that change its output. The returned payload is shared and must not be modified.
+        """
+        formatted = self._formatted.get(key)
+        if formatted is None:
+            formatted = formatter(self)
+            self._formatted[key] = formatted
+        return formatted
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
@@ -310,6 +310,20 @@ class OpenAIChat(Model):
             message_dict["content"] = ""
         return message_dict
 
+    def _format_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
+        """
+        Format messages into the format expected by OpenAI, reusing the payloads formatted for earlier requests.
+
+        Args:
+            messages (List[Message]): The messages to format.
+
+        Returns:
+            List[Dict[str, Any]]: The formatted messages.
+        """
+        # The payload depends on the (sub)class formatter and the role map
+        key = (type(self), tuple(sorted(self.role_map.items())) if self.role_map else None)
+        return [message.get_formatted(key, self._format_message) for message in messages]
+
     def invoke(
         self,
         messages: List[Message],
@@ -329,7 +343,7 @@ class OpenAIChat(Model):
         try:
             return self.get_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 **self.get_request_params(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
         except RateLimitError as e:
@@ -389,7 +403,7 @@ class OpenAIChat(Model):
         try:
             return await self.get_async_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 **self.get_request_params(response_format=response_format, tools=tools, tool_choice=tool_choice),
             )
         except RateLimitError as e:
@@ -450,7 +464,7 @@ class OpenAIChat(Model):
         try:
             yield from self.get_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 stream=True,
                 stream_options={"include_usage": True},
                 **self.get_request_params(response_format=response_format, tools=tools, tool_choice=tool_choice),
@@ -513,7 +527,7 @@ class OpenAIChat(Model):
         try:
             async_stream = await self.get_async_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],  # type: ignore
+                messages=self._format_messages(messages),  # type: ignore
                 stream=True,
                 stream_options={"include_usage": True},
                 **self.get_request_params(response_format=response_format, tools=tools, tool_choice=tool_choice),
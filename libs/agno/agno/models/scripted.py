@@ -0,0 +1,188 @@
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+_TOKEN_PATTERN = re.compile(r"\s*\S+")
+
+
+@dataclass
+class ScriptedToolCall:
+    """A tool call the scripted model asks for."""
+
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ScriptedTurn:
+    """One scripted model response: text, tool calls, or both."""
+
+    content: Optional[str] = None
+    tool_calls: List[ScriptedToolCall] = field(default_factory=list)
+    # Overrides the model latency for this turn
+    latency: Optional[float] = None
+
+
+@dataclass
+class _ScriptedResponse:
+    """The raw response produced by the scripted model."""
+
+    content: Optional[str] = None
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+    usage: Optional[Dict[str, int]] = None
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens = _TOKEN_PATTERN.findall(text)
+    trailing = text[sum(len(token) for token in tokens) :]
+    if trailing:
+        tokens.append(trailing)
+    return tokens
+
+
+def _count_tokens(messages: List[Message]) -> int:
+    return sum(len(_TOKEN_PATTERN.findall(str(message.content))) for message in messages if message.content)
+
+
+@dataclass
+class ScriptedModel(Model):
+    """
+    An offline, deterministic model that plays back a script. Useful for tests and for benchmarking framework overhead
+    without a network connection or provider costs.
+
+    The script is replayed from the start for every run: the turn to play is the number of assistant messages since
+    the last user message, so the first turn can ask for tools and the next one answers once the tool results are in.
+    When the script runs out, `default_response` is returned. Concurrent sessions never share script state.
+
+    Latency is simulated with `time.sleep` / `asyncio.sleep`: `latency` before the first token, then `token_latency`
+    for every streamed chunk of `tokens_per_chunk` tokens. Streamed tool calls arrive one per chunk.
+    """
+
+    id: str = "scripted"
+    name: str = "ScriptedModel"
+    provider: str = "Scripted"
+
+    # Turns played in order. A string is shorthand for a text-only turn.
+    script: Optional[List[Union[str, ScriptedTurn]]] = None
+    default_response: str = "This is a scripted response."
+
+    # Seconds before the first token
+    latency: float = 0.0
+    # Seconds between streamed chunks
+    token_latency: float = 0.0
+    # Number of whitespace separated tokens per streamed chunk
+    tokens_per_chunk: int = 1
+
+    def get_turn(self, messages: List[Message]) -> ScriptedTurn:
+        """Select the scripted turn for the current position in the conversation."""
+        turn_index = 0
+        for message in reversed(messages):
+            if message.role == "user":
+                break
+            if message.role == self.assistant_message_role:
+                turn_index += 1
+
+        if self.script is not None and turn_index < len(self.script):
+            turn = self.script[turn_index]
+            return ScriptedTurn(content=turn) if isinstance(turn, str) else turn
+        return ScriptedTurn(content=self.default_response)
+
+    def _build_response(self, turn: ScriptedTurn, messages: List[Message]) -> _ScriptedResponse:
+        tool_calls = None
+        if turn.tool_calls:
+            tool_calls = [
+                {
+                    "id": f"call_{len(messages)}_{i}",
+                    "type": "function",
+                    "function": {"name": tool_call.name, "arguments": json.dumps(tool_call.arguments)},
+                }
+                for i, tool_call in enumerate(turn.tool_calls)
+            ]
+        input_tokens = _count_tokens(messages)
+        output_tokens = len(_tokenize(turn.content)) if turn.content else 0
+        return _ScriptedResponse(
+            content=turn.content,
+            tool_calls=tool_calls,
+            usage={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+
+    def _get_chunks(self, content: Optional[str]) -> List[str]:
+        if not content:
+            return []
+        tokens = _tokenize(content)
+        size = max(self.tokens_per_chunk, 1)
+        return ["".join(tokens[i : i + size]) for i in range(0, len(tokens), size)]
+
+    def _latency(self, turn: ScriptedTurn) -> float:
+        return turn.latency if turn.latency is not None else self.latency
+
+    def invoke(self, messages: List[Message], **kwargs) -> _ScriptedResponse:
+        turn = self.get_turn(messages)
+        delay = self._latency(turn) + self.token_latency * len(self._get_chunks(turn.content))
+        if delay > 0:
+            time.sleep(delay)
+        return self._build_response(turn, messages)
+
+    async def ainvoke(self, messages: List[Message], **kwargs) -> _ScriptedResponse:
+        turn = self.get_turn(messages)
+        delay = self._latency(turn) + self.token_latency * len(self._get_chunks(turn.content))
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._build_response(turn, messages)
+
+    def invoke_stream(self, messages: List[Message], **kwargs) -> Iterator[_ScriptedResponse]:
+        turn = self.get_turn(messages)
+        response = self._build_response(turn, messages)
+        if self._latency(turn) > 0:
+            time.sleep(self._latency(turn))
+        for i, chunk in enumerate(self._get_chunks(response.content)):
+            if i > 0 and self.token_latency > 0:
+                time.sleep(self.token_latency)
+            yield _ScriptedResponse(content=chunk)
+        for tool_call in response.tool_calls or []:
+            if self.token_latency > 0:
+                time.sleep(self.token_latency)
+            yield _ScriptedResponse(tool_calls=[tool_call])
+        yield _ScriptedResponse(usage=response.usage)
+
+    async def ainvoke_stream(self, messages: List[Message], **kwargs) -> AsyncIterator[_ScriptedResponse]:  # type: ignore
+        turn = self.get_turn(messages)
+        response = self._build_response(turn, messages)
+        if self._latency(turn) > 0:
+            await asyncio.sleep(self._latency(turn))
+        for i, chunk in enumerate(self._get_chunks(response.content)):
+            if i > 0 and self.token_latency > 0:
+                await asyncio.sleep(self.token_latency)
+            yield _ScriptedResponse(content=chunk)
+        for tool_call in response.tool_calls or []:
+            if self.token_latency > 0:
+                await asyncio.sleep(self.token_latency)
+            yield _ScriptedResponse(tool_calls=[tool_call])
+        yield _ScriptedResponse(usage=response.usage)
+
+    def parse_provider_response(self, response: _ScriptedResponse, **kwargs) -> ModelResponse:
+        return ModelResponse(
+            role=self.assistant_message_role,
+            content=response.content,
+            tool_calls=response.tool_calls or [],
+            response_usage=response.usage,
+        )
+
+    def parse_provider_response_delta(self, response: _ScriptedResponse) -> ModelResponse:
+        return ModelResponse(
+            role=self.assistant_message_role,
+            content=response.content,
+            tool_calls=response.tool_calls or [],
+            response_usage=response.usage,
+        )
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.document import Document
 from agno.reranker.base import Reranker
 from agno.utils.log import logger
+from agno.utils.model_registry import local_model_registry, model_key
 
 try:
     from sentence_transformers import CrossEncoder
@@ -11,15 +12,54 @@ except ImportError:
 
 
 class SentenceTransformerReranker(Reranker):
+    """
+    Reranker for local cross-encoder models.
+
+    The cross-encoder is loaded once per process and shared through the local model registry, and the sentence pairs
+    of concurrent `rerank` calls are micro-batched into shared forward passes.
+    """
+
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
+    # Device to load the model on, e.g. "cpu", "cuda" or "mps". Defaults to the best available device.
+    device: Optional[str] = None
+    # Number of torch threads used for CPU inference. This is a process-wide torch setting.
+    num_threads: Optional[int] = None
+    # Maximum number of sentence pairs scored in one forward pass
+    batch_size: int = 32
+    # How long to wait for concurrent requests to join a batch
+    batch_wait_ms: float = 0.0
+
+    @property
+    def model_key(self) -> Tuple[str, ...]:
+        return model_key("cross-encoder", self.model, self.device, self.model_kwargs)
+
+    def _load_model(self) -> CrossEncoder:
+        if self.num_threads is not None:
+            import torch
+
+            torch.set_num_threads(self.num_threads)
+        return CrossEncoder(model_name_or_path=self.model, device=self.device, model_kwargs=self.model_kwargs)
+
+    def get_model(self) -> CrossEncoder:
+        return local_model_registry.get(self.model_key, self._load_model)
+
+    def preload(self) -> None:
+        """Load the model now instead of on the first request."""
+        self.get_model()
 
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+        sentence_transformer_client = self.get_model()
+        batcher = local_model_registry.get_batcher(
+            self.model_key + model_key("predict", self.batch_size),
+            lambda pairs: sentence_transformer_client.predict(pairs, batch_size=self.batch_size).tolist(),
+            max_batch_size=self.batch_size,
+            max_wait_ms=self.batch_wait_ms,
+        )
 
         top_n = self.top_n
         if top_n and not (0 < top_n):
@@ -30,7 +70,7 @@ class SentenceTransformerReranker(Reranker):
 
         sentence_pairs = [[query, doc.content] for doc in documents]
 
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
+        scores = batcher(sentence_pairs)
         for index, score in enumerate(scores):
             doc = documents[index]
             doc.reranking_score = score
@@ -1,4 +1,5 @@
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -10,28 +11,48 @@ from agno.models.response import ToolExecution
 from agno.reasoning.step import ReasoningStep
 from agno.utils.log import log_error
 
+# Event fields serialized separately in `BaseRunResponseEvent.to_dict`
+_SEPARATELY_SERIALIZED_FIELDS = frozenset(
+    [
+        "tools",
+        "tool",
+        "extra_data",
+        "image",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "member_responses",
+    ]
+)
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy a field value the way `dataclasses.asdict` does, without copying strings and numbers."""
+    if type(value) in _SCALAR_TYPES:
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return {_copy_value(k): _copy_value(v) for k, v in value.items()}
+    return deepcopy(value)
+
 
 @dataclass
 class BaseRunResponseEvent:
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "tools",
-                "tool",
-                "extra_data",
-                "image",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "member_responses",
-            ]
-        }
+        # Events are serialized once per streamed chunk, so only the fields kept in the output are copied
+        _dict = {}
+        for f in fields(self):
+            if f.name in _SEPARATELY_SERIALIZED_FIELDS:
+                continue
+            value = getattr(self, f.name)
+            if value is not None:
+                _dict[f.name] = _copy_value(value)
 
         if hasattr(self, "extra_data") and self.extra_data is not None:
             _dict["extra_data"] = (
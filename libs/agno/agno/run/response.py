@@ -1,7 +1,7 @@
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from time import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args
 
 from pydantic import BaseModel
 
@@ -196,6 +196,9 @@ RunResponseEvent = Union[
     ParserModelResponseCompletedEvent,
 ]
 
+# The event classes in RunResponseEvent, for isinstance checks on every streamed chunk
+RUN_RESPONSE_EVENT_TYPES: Tuple[type, ...] = get_args(RunResponseEvent)
+
 
 # Map event string to dataclass
 RUN_EVENT_TYPE_REGISTRY = {
@@ -1,7 +1,7 @@
 from dataclasses import asdict, dataclass, field
 from enum import Enum
 from time import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args
 
 from pydantic import BaseModel
 
@@ -192,6 +192,9 @@ TeamRunResponseEvent = Union[
     ParserModelResponseCompletedEvent,
 ]
 
+# The event classes in TeamRunResponseEvent, for isinstance checks on every streamed chunk
+TEAM_RUN_RESPONSE_EVENT_TYPES: Tuple[type, ...] = get_args(TeamRunResponseEvent)
+
 # Map event string to dataclass for team events
 TEAM_RUN_EVENT_TYPE_REGISTRY = {
     TeamRunEvent.run_started.value: RunResponseStartedEvent,
@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
-from agno.storage.session import Session
+from agno.tracing.span import traced
+
+if TYPE_CHECKING:
+    from agno.storage.session import Session
+
+
+def _get_storage_span_attributes(storage: "Storage", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"storage": type(storage).__name__}
 
 
 class Storage(ABC):
@@ -23,7 +30,7 @@ class Storage(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional["Session"]:
         raise NotImplementedError
 
     @abstractmethod
@@ -31,7 +38,7 @@ class Storage(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+    def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List["Session"]:
         raise NotImplementedError
 
     @abstractmethod
@@ -40,13 +47,23 @@ class Storage(ABC):
         user_id: Optional[str] = None,
         entity_id: Optional[str] = None,
         limit: Optional[int] = 2,
-    ) -> List[Session]:
+    ) -> List["Session"]:
         raise NotImplementedError
 
     @abstractmethod
-    def upsert(self, session: Session) -> Optional[Session]:
+    def upsert(self, session: "Session") -> Optional["Session"]:
         raise NotImplementedError
 
+    @traced("storage.read", attributes=_get_storage_span_attributes)
+    def traced_read(self, session_id: str, user_id: Optional[str] = None) -> Optional["Session"]:
+        """Reads a session, recorded as a span of the current trace"""
+        return self.read(session_id=session_id, user_id=user_id)
+
+    @traced("storage.upsert", attributes=_get_storage_span_attributes)
+    def traced_upsert(self, session: "Session") -> Optional["Session"]:
+        """Upserts a session, recorded as a span of the current trace"""
+        return self.upsert(session=session)
+
     @abstractmethod
     def delete_session(self, session_id: Optional[str] = None):
         raise NotImplementedError
@@ -0,0 +1,9 @@
+from agno.storage.media.base import MediaStore, get_active_media_store, use_media_store
+from agno.storage.media.local import LocalMediaStore
+
+__all__ = [
+    "MediaStore",
+    "LocalMediaStore",
+    "get_active_media_store",
+    "use_media_store",
+]
@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import sha256
+from threading import Lock
+from typing import Iterator, Optional, Set
+
+from agno.utils.log import log_debug
+
+REFERENCE_PREFIX = "sha256:"
+
+_active_media_store: ContextVar[Optional["MediaStore"]] = ContextVar("active_media_store", default=None)
+
+
+def get_active_media_store() -> Optional["MediaStore"]:
+    """Return the media store that media is currently serialized to and loaded from, if any."""
+    return _active_media_store.get()
+
+
+@contextmanager
+def use_media_store(media_store: Optional["MediaStore"]) -> Iterator[None]:
+    """
+    Serialize media to `media_store` inside this block.
+
+    While a media store is active, media content is written to the store and serialized as a reference, and media
+    loaded from references remembers the store so its content can be fetched when a model needs it.
+    """
+    if media_store is None:
+        yield
+        return
+    token = _active_media_store.set(media_store)
+    try:
+        yield
+    finally:
+        _active_media_store.reset(token)
+
+
+class MediaStore(ABC):
+    """
+    Content-addressed blob store for media content.
+
+    Blobs are keyed by the SHA-256 of their content, so identical media is stored once, and referenced as
+    `sha256:<hex digest>`. Recently read blobs are kept in an in-process LRU cache.
+    """
+
+    def __init__(self, cache_size: int = 32):
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        # Digests known to exist in the store, to skip existence checks on repeated writes
+        self._known: Set[str] = set()
+        self._lock = Lock()
+
+    @abstractmethod
+    def _exists(self, digest: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write(self, digest: str, content: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _read(self, digest: str) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, digest: str) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def get_digest(reference: str) -> str:
+        if not reference.startswith(REFERENCE_PREFIX):
+            raise ValueError(f"Invalid media reference: {reference}")
+        return reference[len(REFERENCE_PREFIX) :]
+
+    def put(self, content: bytes) -> str:
+        """Store content, if not already stored, and return its reference."""
+        digest = sha256(content).hexdigest()
+        if digest not in self._known:
+            if not self._exists(digest):
+                log_debug(f"Storing media blob {digest} ({len(content)} bytes)")
+                self._write(digest, content)
+            self._known.add(digest)
+        return f"{REFERENCE_PREFIX}{digest}"
+
+    def get(self, reference: str) -> bytes:
+        """Return the content for a reference, from the cache if possible."""
+        digest = self.get_digest(reference)
+        with self._lock:
+            content = self._cache.get(digest)
+            if content is not None:
+                self._cache.move_to_end(digest)
+                return content
+
+        content = self._read(digest)
+        with self._lock:
+            self._cache[digest] = content
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        self._known.add(digest)
+        return content
+
+    def exists(self, reference: str) -> bool:
+        digest = self.get_digest(reference)
+        return digest in self._known or self._exists(digest)
+
+    def delete(self, reference: str) -> None:
+        digest = self.get_digest(reference)
+        self._delete(digest)
+        self._known.discard(digest)
+        with self._lock:
+            self._cache.pop(digest, None)
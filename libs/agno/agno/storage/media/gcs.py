@@ -0,0 +1,41 @@
+from typing import Any, Optional
+
+from agno.storage.media.base import MediaStore
+
+try:
+    from google.cloud import storage as gcs
+except ImportError:
+    raise ImportError("`google-cloud-storage` not installed. Please install it with `pip install google-cloud-storage`")
+
+
+class GCSMediaStore(MediaStore):
+    """Media store in a GCS bucket"""
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "media",
+        project: Optional[str] = None,
+        credentials: Optional[Any] = None,
+        cache_size: int = 32,
+    ):
+        super().__init__(cache_size=cache_size)
+        self.bucket_name = bucket_name
+        self.prefix = prefix.strip("/")
+        self.client = gcs.Client(project=project, credentials=credentials)
+        self.bucket = self.client.bucket(bucket_name)
+
+    def _get_blob(self, digest: str):
+        return self.bucket.blob(f"{self.prefix}/{digest}" if self.prefix else digest)
+
+    def _exists(self, digest: str) -> bool:
+        return self._get_blob(digest).exists()
+
+    def _write(self, digest: str, content: bytes) -> None:
+        self._get_blob(digest).upload_from_string(content)
+
+    def _read(self, digest: str) -> bytes:
+        return self._get_blob(digest).download_as_bytes()
+
+    def _delete(self, digest: str) -> None:
+        self._get_blob(digest).delete()
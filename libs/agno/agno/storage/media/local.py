@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Union
+
+from agno.storage.media.base import MediaStore
+
+
+class LocalMediaStore(MediaStore):
+    """Media store on the local filesystem, with blobs sharded by the first two characters of their digest."""
+
+    def __init__(self, base_dir: Union[str, Path] = "tmp/media", cache_size: int = 32):
+        super().__init__(cache_size=cache_size)
+        self.base_dir = Path(base_dir)
+
+    def _get_path(self, digest: str) -> Path:
+        return self.base_dir / digest[:2] / digest
+
+    def _exists(self, digest: str) -> bool:
+        return self._get_path(digest).exists()
+
+    def _write(self, digest: str, content: bytes) -> None:
+        path = self._get_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so readers never see a partial blob
+        with NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            f.write(content)
+        os.replace(f.name, path)
+
+    def _read(self, digest: str) -> bytes:
+        return self._get_path(digest).read_bytes()
+
+    def _delete(self, digest: str) -> None:
+        try:
+            self._get_path(digest).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,48 @@
+from typing import Any, Optional
+
+from agno.storage.media.base import MediaStore
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:
+    raise ImportError("`boto3` not installed. Please install it using `pip install boto3`")
+
+
+class S3MediaStore(MediaStore):
+    """Media store in an S3 bucket"""
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "media",
+        region_name: Optional[str] = None,
+        s3_client: Optional[Any] = None,
+        cache_size: int = 32,
+    ):
+        super().__init__(cache_size=cache_size)
+        self.bucket_name = bucket_name
+        self.prefix = prefix.strip("/")
+        self.s3_client = s3_client or boto3.client("s3", region_name=region_name)
+
+    def _get_key(self, digest: str) -> str:
+        return f"{self.prefix}/{digest}" if self.prefix else digest
+
+    def _exists(self, digest: str) -> bool:
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=self._get_key(digest))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def _write(self, digest: str, content: bytes) -> None:
+        self.s3_client.put_object(Bucket=self.bucket_name, Key=self._get_key(digest), Body=content)
+
+    def _read(self, digest: str) -> bytes:
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self._get_key(digest))
+        return response["Body"].read()
+
+    def _delete(self, digest: str) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket_name, Key=self._get_key(digest))
@@ -1,11 +1,37 @@
-from typing import Union
+from typing import TYPE_CHECKING, Any, Union
 
-from agno.storage.session.agent import AgentSession
-from agno.storage.session.team import TeamSession
-from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
-from agno.storage.session.workflow import WorkflowSession
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.storage.session.agent import AgentSession
+    from agno.storage.session.team import TeamSession
+    from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
+    from agno.storage.session.workflow import WorkflowSession
+
+    Session = Union[AgentSession, TeamSession, WorkflowSession, WorkflowSessionV2]
+
+# Sessions are imported on first use, so importing the agent session does not load the workflow run events
+_getattr, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgentSession": "agno.storage.session.agent",
+        "TeamSession": "agno.storage.session.team",
+        "WorkflowSession": "agno.storage.session.workflow",
+        "WorkflowSessionV2": "agno.storage.session.v2.workflow:WorkflowSession",
+    },
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "Session":
+        # Annotated so type checkers do not read the runtime Union as a type alias
+        session: Any = Union[
+            tuple(_getattr(cls) for cls in ("AgentSession", "TeamSession", "WorkflowSession", "WorkflowSessionV2"))
+        ]
+        globals()["Session"] = session
+        return session
+    return _getattr(name)
 
-Session = Union[AgentSession, TeamSession, WorkflowSession, WorkflowSessionV2]
 
 __all__ = [
     "AgentSession",
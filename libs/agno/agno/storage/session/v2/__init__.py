@@ -1,4 +1,11 @@
-from agno.storage.session.workflow import WorkflowSession
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.storage.session.workflow import WorkflowSession
+
+__getattr__, __dir__ = lazy_exports(__name__, {"WorkflowSession": "agno.storage.session.workflow"})
 
 __all__ = [
     "WorkflowSession",
@@ -1,21 +1,51 @@
-from agno.run.team import (
-    MemoryUpdateCompletedEvent,
-    MemoryUpdateStartedEvent,
-    ReasoningCompletedEvent,
-    ReasoningStartedEvent,
-    ReasoningStepEvent,
-    RunResponseCancelledEvent,
-    RunResponseCompletedEvent,
-    RunResponseContentEvent,
-    RunResponseErrorEvent,
-    RunResponseStartedEvent,
-    TeamRunEvent,
-    TeamRunResponse,
-    TeamRunResponseEvent,
-    ToolCallCompletedEvent,
-    ToolCallStartedEvent,
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.run.response import RunResponse
+    from agno.run.team import (
+        MemoryUpdateCompletedEvent,
+        MemoryUpdateStartedEvent,
+        ReasoningCompletedEvent,
+        ReasoningStartedEvent,
+        ReasoningStepEvent,
+        RunResponseCancelledEvent,
+        RunResponseCompletedEvent,
+        RunResponseContentEvent,
+        RunResponseErrorEvent,
+        RunResponseStartedEvent,
+        TeamRunEvent,
+        TeamRunResponse,
+        TeamRunResponseEvent,
+        ToolCallCompletedEvent,
+        ToolCallStartedEvent,
+    )
+    from agno.team.team import Team
+
+# Exports are imported on first access, so importing the team run events does not load the Team
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RunResponse": "agno.run.response",
+        "MemoryUpdateCompletedEvent": "agno.run.team",
+        "MemoryUpdateStartedEvent": "agno.run.team",
+        "ReasoningCompletedEvent": "agno.run.team",
+        "ReasoningStartedEvent": "agno.run.team",
+        "ReasoningStepEvent": "agno.run.team",
+        "RunResponseCancelledEvent": "agno.run.team",
+        "RunResponseCompletedEvent": "agno.run.team",
+        "RunResponseContentEvent": "agno.run.team",
+        "RunResponseErrorEvent": "agno.run.team",
+        "RunResponseStartedEvent": "agno.run.team",
+        "TeamRunEvent": "agno.run.team",
+        "TeamRunResponse": "agno.run.team",
+        "TeamRunResponseEvent": "agno.run.team",
+        "ToolCallCompletedEvent": "agno.run.team",
+        "ToolCallStartedEvent": "agno.run.team",
+        "Team": "agno.team.team",
+    },
 )
-from agno.team.team import RunResponse, Team
 
 __all__ = [
     "Team",
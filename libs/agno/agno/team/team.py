@@ -6,6 +6,7 @@ from dataclasses import asdict, dataclass, replace
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -20,20 +21,17 @@ from typing import (
     Type,
     Union,
     cast,
-    get_args,
     overload,
 )
 from uuid import uuid4
 
 from pydantic import BaseModel
+from typing_extensions import TypeGuard
 
 from agno.agent import Agent
 from agno.agent.metrics import SessionMetrics
 from agno.exceptions import ModelProviderError, RunCancelledException
-from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
-from agno.memory.agent import AgentMemory
-from agno.memory.team import TeamMemory, TeamRun
 from agno.memory.v2.memory import Memory, SessionSummary
 from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageReferences
@@ -41,12 +39,20 @@ from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecutio
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
 from agno.run.messages import RunMessages
-from agno.run.response import RunEvent, RunResponse, RunResponseEvent
-from agno.run.team import TeamRunEvent, TeamRunResponse, TeamRunResponseEvent, ToolCallCompletedEvent
+from agno.run.response import RUN_RESPONSE_EVENT_TYPES, RunEvent, RunResponse, RunResponseEvent
+from agno.run.team import (
+    TEAM_RUN_RESPONSE_EVENT_TYPES,
+    TeamRunEvent,
+    TeamRunResponse,
+    TeamRunResponseEvent,
+    ToolCallCompletedEvent,
+)
 from agno.storage.base import Storage
+from agno.storage.media.base import MediaStore, use_media_store
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
+from agno.tracing import Tracer, trace_run, traced
 from agno.utils.events import (
     create_team_memory_update_completed_event,
     create_team_memory_update_started_event,
@@ -63,6 +69,7 @@ from agno.utils.events import (
     create_team_tool_call_completed_event,
     create_team_tool_call_started_event,
 )
+from agno.utils.lazy import is_instance_of, lazy_exports
 from agno.utils.log import (
     log_debug,
     log_error,
@@ -89,6 +96,27 @@ from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import is_valid_uuid, parse_response_model_str, url_safe_string
 from agno.utils.timer import Timer
 
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
+    from agno.memory.team import TeamMemory
+
+
+# The legacy memory and knowledge classes used to be imported here, keep them importable from this module
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgentKnowledge": "agno.knowledge.agent",
+        "AgentMemory": "agno.memory.agent",
+        "TeamMemory": "agno.memory.team",
+        "TeamRun": "agno.memory.team",
+    },
+)
+
+
+def _is_team_memory(memory: Any) -> TypeGuard["TeamMemory"]:
+    """True for the legacy TeamMemory, which is only imported when it is used"""
+    return is_instance_of(memory, "agno.memory.team", "TeamMemory")
+
 
 @dataclass(init=False)
 class Team:
@@ -175,7 +203,7 @@ class Team:
     add_context: bool = False
 
     # --- Agent Knowledge ---
-    knowledge: Optional[AgentKnowledge] = None
+    knowledge: Optional["AgentKnowledge"] = None
     # Add knowledge_filters to the Agent class attributes
     knowledge_filters: Optional[Dict[str, Any]] = None
     # Let the agent choose the knowledge filters
@@ -237,7 +265,7 @@ class Team:
 
     # --- History ---
     # Memory for the team
-    memory: Optional[Union[TeamMemory, Memory]] = None
+    memory: Optional[Union["TeamMemory", Memory]] = None
     # Enable the agent to manage memories of the user
     enable_agentic_memory: bool = False
     # If True, the agent creates/updates user memories at the end of runs
@@ -261,6 +289,8 @@ class Team:
 
     # --- Team Storage ---
     storage: Optional[Storage] = None
+    # Store for media content. If set, sessions hold references to media instead of inline base64 content.
+    media_store: Optional[MediaStore] = None
     # Extra data stored with this team
     extra_data: Optional[Dict[str, Any]] = None
 
@@ -298,6 +328,8 @@ class Team:
     # telemetry=True logs minimal telemetry for analytics
     # This helps us improve the Teams implementation and provide better support
     telemetry: bool = True
+    # Records each run as a trace of spans (model calls, member runs, tool calls, storage, ...)
+    tracer: Optional[Tracer] = None
 
     def __init__(
         self,
@@ -327,7 +359,7 @@ class Team:
         system_message_role: str = "system",
         context: Optional[Dict[str, Any]] = None,
         add_context: bool = False,
-        knowledge: Optional[AgentKnowledge] = None,
+        knowledge: Optional["AgentKnowledge"] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         add_references: bool = False,
         enable_agentic_knowledge_filters: Optional[bool] = False,
@@ -348,7 +380,7 @@ class Team:
         parser_model_prompt: Optional[str] = None,
         use_json_mode: bool = False,
         parse_response: bool = True,
-        memory: Optional[Union[TeamMemory, Memory]] = None,
+        memory: Optional[Union["TeamMemory", Memory]] = None,
         enable_agentic_memory: bool = False,
         enable_user_memories: bool = False,
         add_memory_references: Optional[bool] = None,
@@ -359,6 +391,7 @@ class Team:
         num_of_interactions_from_history: Optional[int] = None,
         num_history_runs: int = 3,
         storage: Optional[Storage] = None,
+        media_store: Optional[MediaStore] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         reasoning: bool = False,
         reasoning_model: Optional[Model] = None,
@@ -375,6 +408,7 @@ class Team:
         show_members_responses: bool = False,
         monitoring: bool = False,
         telemetry: bool = True,
+        tracer: Optional[Tracer] = None,
     ):
         self.members = members
 
@@ -449,6 +483,7 @@ class Team:
         self.num_history_runs = num_history_runs
 
         self.storage = storage
+        self.media_store = media_store
         self.extra_data = extra_data
 
         self.reasoning = reasoning
@@ -478,6 +513,7 @@ class Team:
 
         self.monitoring = monitoring
         self.telemetry = telemetry
+        self.tracer = tracer
 
         # --- Params not to be set by user ---
         self.session_metrics: Optional[SessionMetrics] = None
@@ -508,6 +544,8 @@ class Team:
         self._formatter: Optional[SafeFormatter] = None
 
         self._memory_deepcopy_done: bool = False
+        # Memory updates waiting for their session to be written, by session id
+        self._memory_updates_to_queue: Dict[str, Dict[str, Any]] = {}
 
     @property
     def should_parse_structured_output(self) -> bool:
@@ -774,6 +812,7 @@ class Team:
         **kwargs: Any,
     ) -> Iterator[Union[RunResponseEvent, TeamRunResponseEvent]]: ...
 
+    @trace_run("team.run")
     def run(
         self,
         message: Union[str, List, Dict, Message, BaseModel],
@@ -801,6 +840,9 @@ class Team:
         # Initialize Team
         self.initialize_team(session_id=session_id)
 
+        # Wait for queued memory updates of this user, so the run reads its own writes
+        self._wait_for_memory_jobs(user_id=user_id)
+
         # Read existing session from storage
         self.read_from_storage(session_id=session_id)
 
@@ -1178,6 +1220,7 @@ class Team:
         **kwargs: Any,
     ) -> AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]]: ...
 
+    @trace_run("team.run")
     async def arun(
         self,
         message: Union[str, List, Dict, Message, BaseModel],
@@ -1204,6 +1247,9 @@ class Team:
         # Initialize Team
         self.initialize_team(session_id=session_id)
 
+        # Wait for queued memory updates of this user, so the run reads its own writes
+        await self._await_memory_jobs(user_id=user_id)
+
         # Read existing session from storage
         self.read_from_storage(session_id=session_id)
 
@@ -1599,12 +1645,12 @@ class Team:
         session_id: str,
         index_of_last_user_message: int = 0,
     ):
-        if isinstance(self.memory, TeamMemory):
-            self.memory = cast(TeamMemory, self.memory)
+        if _is_team_memory(self.memory):
+            self.memory = cast("TeamMemory", self.memory)
         else:
             self.memory = cast(Memory, self.memory)
 
-        if isinstance(self.memory, TeamMemory):
+        if _is_team_memory(self.memory):
             # Add the system message to the memory
             if run_messages.system_message is not None:
                 self.memory.add_system_message(
@@ -1622,6 +1668,8 @@ class Team:
             if len(messages_for_memory) > 0:
                 self.memory.add_messages(messages=messages_for_memory)
 
+            from agno.memory.team import TeamRun
+
             team_run = TeamRun(response=run_response)
             team_run.message = run_messages.user_message
 
@@ -1641,6 +1689,7 @@ class Team:
             # Add run to memory
             self.memory.add_run(session_id=session_id, run=run_response)
 
+    @traced("team.update_memory")
     def _update_memory(
         self,
         run_response: TeamRunResponse,
@@ -1648,7 +1697,7 @@ class Team:
         session_id: str,
         user_id: Optional[str] = None,
     ) -> Iterator[TeamRunResponseEvent]:
-        if isinstance(self.memory, TeamMemory):
+        if _is_team_memory(self.memory):
             # Update the memories with the user message if needed
             if (
                 self.memory is not None
@@ -1685,6 +1734,7 @@ class Team:
             self.session_metrics = self._calculate_session_metrics(session_messages)
             self.full_team_session_metrics = self._calculate_full_team_session_metrics(session_messages)
 
+    @traced("team.update_memory")
     async def _aupdate_memory(
         self,
         run_response: TeamRunResponse,
@@ -1692,7 +1742,7 @@ class Team:
         session_id: str,
         user_id: Optional[str] = None,
     ):
-        if isinstance(self.memory, TeamMemory):
+        if _is_team_memory(self.memory):
             # Update the memories with the user message if needed
             if (
                 self.memory is not None
@@ -1905,8 +1955,8 @@ class Team:
         stream_intermediate_steps: bool = False,
         parse_structured_output: bool = False,
     ) -> Iterator[Union[TeamRunResponseEvent, RunResponseEvent]]:
-        if isinstance(model_response_event, tuple(get_args(RunResponseEvent))) or isinstance(
-            model_response_event, tuple(get_args(TeamRunResponseEvent))
+        if isinstance(model_response_event, RUN_RESPONSE_EVENT_TYPES) or isinstance(
+            model_response_event, TEAM_RUN_RESPONSE_EVENT_TYPES
         ):
             if self.stream_member_events:
                 # We just bubble the event up
@@ -2136,6 +2186,10 @@ class Team:
         self.run_response = cast(TeamRunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
+        if self.memory.job_queue is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         # Create a thread pool with a reasonable number of workers
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
@@ -2177,6 +2231,11 @@ class Team:
     ) -> AsyncIterator[TeamRunResponseEvent]:
         self.memory = cast(Memory, self.memory)
         self.run_response = cast(TeamRunResponse, self.run_response)
+
+        if self.memory.job_queue is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         tasks = []
 
         user_message_str = (
@@ -2206,6 +2265,49 @@ class Team:
                     create_team_memory_update_completed_event(from_run_response=self.run_response), self.run_response
                 )
 
+    def _enqueue_memories_and_summaries(
+        self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """Hand the memory and summary updates of this run to the memory job queue, without waiting for them."""
+        self.memory = cast(Memory, self.memory)
+
+        user_message_str = (
+            run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+        )
+        messages = []
+        if self.enable_user_memories and user_message_str:
+            messages.append(Message(role="user", content=user_message_str))
+
+        if messages or self.enable_session_summaries:
+            update: Dict[str, Any] = {
+                "messages": messages,
+                "session_id": session_id if self.enable_session_summaries else None,
+                "user_id": user_id,
+                "storage": self.storage,
+            }
+            if self.storage is None:
+                log_debug("Queueing memory and summary updates.")
+                self.memory.enqueue_update(**update)
+            else:
+                # Queued once the session is written, so the background summary is stored on top of this run
+                self._memory_updates_to_queue[session_id] = update
+
+    def _queue_memory_update(self, session_id: str) -> None:
+        """Queue the memory update of a run, after its session was written to storage."""
+        update = self._memory_updates_to_queue.pop(session_id, None)
+        if update is not None and isinstance(self.memory, Memory):
+            log_debug("Queueing memory and summary updates.")
+            self.memory.enqueue_update(**update)
+
+    def _wait_for_memory_jobs(self, user_id: Optional[str] = None) -> None:
+        """Wait for queued memory updates of the user, so the run reads its own writes."""
+        if isinstance(self.memory, Memory) and self.memory.job_queue is not None:
+            self.memory.wait_for_jobs(user_id=user_id)
+
+    async def _await_memory_jobs(self, user_id: Optional[str] = None) -> None:
+        if isinstance(self.memory, Memory) and self.memory.job_queue is not None:
+            await asyncio.to_thread(self.memory.wait_for_jobs, user_id)
+
     def _get_response_format(self, model: Optional[Model] = None) -> Optional[Union[Dict, Type[BaseModel]]]:
         model = cast(Model, model or self.model)
         if self.response_model is None:
@@ -2402,8 +2504,9 @@ class Team:
 
     def _handle_event(self, event: Union[RunResponseEvent, TeamRunResponseEvent], run_response: TeamRunResponse):
         # We only store events that are not run_response_content events
-        events_to_skip = [event.value for event in self.events_to_skip] if self.events_to_skip else []
-        if self.store_events and event.event not in events_to_skip:
+        if self.store_events and not (
+            self.events_to_skip and any(event.event == skipped.value for skipped in self.events_to_skip)
+        ):
             if run_response.events is None:
                 run_response.events = []
             run_response.events.append(event)
@@ -2869,7 +2972,7 @@ class Team:
                     if self.response_model is not None:
                         team_markdown = False
 
-                if isinstance(resp, tuple(get_args(TeamRunResponseEvent))):
+                if isinstance(resp, TEAM_RUN_RESPONSE_EVENT_TYPES):
                     if resp.event == TeamRunEvent.run_response_content:
                         if isinstance(resp.content, str):
                             _response_content += resp.content
@@ -3735,7 +3838,7 @@ class Team:
                     if self.response_model is not None:
                         team_markdown = False
 
-                if isinstance(resp, tuple(get_args(TeamRunResponseEvent))):
+                if isinstance(resp, TEAM_RUN_RESPONSE_EVENT_TYPES):
                     if resp.event == TeamRunEvent.run_response_content:
                         if isinstance(resp.content, str):
                             _response_content += resp.content
@@ -4225,7 +4328,7 @@ class Team:
             # Only members with memory
             if member.memory is not None:
                 # Handle instances with AgentMemory
-                if isinstance(member.memory, AgentMemory):
+                if is_instance_of(member.memory, "agno.memory.agent", "AgentMemory"):
                     for m in member.memory.messages:
                         if m.role == assistant_message_role and m.metrics is not None:
                             current_session_metrics += m.metrics
@@ -5041,6 +5144,7 @@ class Team:
 
         return system_message_content
 
+    @traced("team.get_system_message")
     def get_system_message(
         self,
         session_id: str,
@@ -5321,6 +5425,7 @@ class Team:
 
         return Message(role=self.system_message_role, content=system_message_content.strip())
 
+    @traced("team.get_run_messages")
     def get_run_messages(
         self,
         *,
@@ -5361,7 +5466,7 @@ class Team:
             from copy import deepcopy
 
             history = []
-            if isinstance(self.memory, TeamMemory):
+            if _is_team_memory(self.memory):
                 history = self.memory.get_messages_from_last_n_runs(
                     last_n=self.num_history_runs, skip_role=self.system_message_role
                 )
@@ -5783,7 +5888,7 @@ class Team:
             import json
 
             history: List[Dict[str, Any]] = []
-            if isinstance(self.memory, TeamMemory):
+            if _is_team_memory(self.memory):
                 team_chats = self.memory.get_all_messages()
 
                 if len(team_chats) == 0:
@@ -5824,7 +5929,7 @@ class Team:
             Args:
                 state (str or dict): The state to set as the team context.
             """
-            if isinstance(self.memory, TeamMemory):
+            if _is_team_memory(self.memory):
                 if isinstance(state, str):
                     self.memory.set_team_context_text(state)  # type: ignore
                 elif isinstance(state, dict):
@@ -5899,7 +6004,7 @@ class Team:
             """
             # Make sure for the member agent, we are using the agent logger
             use_agent_logger()
-            self.memory = cast(TeamMemory, self.memory)
+            self.memory = cast("TeamMemory", self.memory)
 
             # 2. Determine team context to send
             team_context_str, team_member_interactions_str = self._determine_team_context(
@@ -5972,8 +6077,8 @@ class Team:
 
                 # Update the memory
                 member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                if isinstance(self.memory, TeamMemory):
-                    self.memory = cast(TeamMemory, self.memory)
+                if _is_team_memory(self.memory):
+                    self.memory = cast("TeamMemory", self.memory)
                     self.memory.add_interaction_to_team_context(
                         member_name=member_name,
                         task=task_description,
@@ -6018,7 +6123,7 @@ class Team:
             """
             # Make sure for the member agent, we are using the agent logger
             use_agent_logger()
-            self.memory = cast(TeamMemory, self.memory)
+            self.memory = cast("TeamMemory", self.memory)
 
             # 2. Determine team context to send
             team_context_str, team_member_interactions_str = self._determine_team_context(
@@ -6057,9 +6162,9 @@ class Team:
                     check_if_run_cancelled(response)
 
                     member_name = agent.name if agent.name else f"agent_{idx}"
-                    self.memory = cast(TeamMemory, self.memory)
-                    if isinstance(self.memory, TeamMemory):
-                        self.memory = cast(TeamMemory, self.memory)
+                    self.memory = cast("TeamMemory", self.memory)
+                    if _is_team_memory(self.memory):
+                        self.memory = cast("TeamMemory", self.memory)
                         self.memory.add_interaction_to_team_context(
                             member_name=member_name, task=task_description, run_response=agent.run_response
                         )
@@ -6129,8 +6234,8 @@ class Team:
     def _determine_team_context(
         self, session_id: str, images: List[Image], videos: List[Video], audio: List[Audio]
     ) -> Tuple[Optional[str], Optional[str]]:
-        if isinstance(self.memory, TeamMemory):
-            self.memory = cast(TeamMemory, self.memory)
+        if _is_team_memory(self.memory):
+            self.memory = cast("TeamMemory", self.memory)
             team_context_str = None
             if self.enable_agentic_context:
                 team_context_str = self.memory.get_team_context_str()
@@ -6297,8 +6402,8 @@ class Team:
             # Update the memory
             member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
 
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
+            if _is_team_memory(self.memory):
+                self.memory = cast("TeamMemory", self.memory)
                 self.memory.add_interaction_to_team_context(
                     member_name=member_name,
                     task=task_description,
@@ -6432,8 +6537,8 @@ class Team:
 
             # Update the memory
             member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
+            if _is_team_memory(self.memory):
+                self.memory = cast("TeamMemory", self.memory)
                 self.memory.add_interaction_to_team_context(
                     member_name=member_name,
                     task=task_description,
@@ -6673,8 +6778,8 @@ class Team:
 
             # Update the memory
             member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
+            if _is_team_memory(self.memory):
+                self.memory = cast("TeamMemory", self.memory)
                 self.memory.add_interaction_to_team_context(
                     member_name=member_name,
                     task=message.get_content_string(),
@@ -6805,8 +6910,8 @@ class Team:
 
             # Update the memory
             member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
+            if _is_team_memory(self.memory):
+                self.memory = cast("TeamMemory", self.memory)
                 self.memory.add_interaction_to_team_context(
                     member_name=member_name,
                     task=message.get_content_string(),
@@ -6849,6 +6954,7 @@ class Team:
     # Storage
     ###########################################################################
 
+    @traced("team.read_from_storage")
     def read_from_storage(self, session_id: str) -> Optional[TeamSession]:
         """Load the TeamSession from storage
 
@@ -6856,11 +6962,13 @@ class Team:
             Optional[TeamSession]: The loaded TeamSession or None if not found.
         """
         if self.storage is not None and session_id is not None:
-            self.team_session = cast(TeamSession, self.storage.read(session_id=session_id))
+            self.team_session = cast(TeamSession, self.storage.traced_read(session_id=session_id))
             if self.team_session is not None:
-                self.load_team_session(session=self.team_session)
+                with use_media_store(self.media_store):
+                    self.load_team_session(session=self.team_session)
         return self.team_session
 
+    @traced("team.write_to_storage")
     def write_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
         """Save the TeamSession to storage
 
@@ -6868,9 +6976,10 @@ class Team:
             Optional[TeamSession]: The saved TeamSession or None if not saved.
         """
         if self.storage is not None:
-            self.team_session = cast(
-                TeamSession, self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id))
-            )
+            with use_media_store(self.media_store):
+                team_session = self._get_team_session(session_id=session_id, user_id=user_id)
+            self.team_session = cast(TeamSession, self.storage.traced_upsert(session=team_session))
+            self._queue_memory_update(session_id)
 
         # Remove session from memory
         if not self.cache_session:
@@ -7003,9 +7112,11 @@ class Team:
         if self.memory is None:
             self.memory = session.memory  # type: ignore
 
-        if not (isinstance(self.memory, TeamMemory) or isinstance(self.memory, Memory)):
+        if not (_is_team_memory(self.memory) or isinstance(self.memory, Memory)):
             # Is it a dict of `TeamMemory`?
             if isinstance(self.memory, dict) and "create_user_memories" in self.memory:
+                from agno.memory.team import TeamMemory
+
                 # Convert dict to TeamMemory
                 self.memory = TeamMemory(**self.memory)
             else:
@@ -7013,10 +7124,12 @@ class Team:
                 self.memory = Memory()
 
         if session.memory is not None:
-            if isinstance(self.memory, TeamMemory):
+            if _is_team_memory(self.memory):
                 try:
                     if "runs" in session.memory:
                         try:
+                            from agno.memory.team import TeamRun
+
                             self.memory.runs = [TeamRun.from_dict(m) for m in session.memory["runs"]]
                         except Exception as e:
                             log_warning(f"Failed to load runs from memory: {e}")
@@ -7160,7 +7273,7 @@ class Team:
         if self.memory is None:
             return []
 
-        if isinstance(self.memory, AgentMemory):
+        if is_instance_of(self.memory, "agno.memory.agent", "AgentMemory"):
             return self.memory.messages
         elif isinstance(self.memory, Memory):
             return self.memory.get_messages_from_last_n_runs(
@@ -7185,7 +7298,7 @@ class Team:
             if user_id is None:
                 user_id = "default"
             return self.memory.get_session_summary(session_id=session_id, user_id=user_id)
-        elif isinstance(self.memory, TeamMemory):
+        elif _is_team_memory(self.memory):
             raise ValueError("TeamMemory does not support get_session_summary")
         else:
             raise ValueError(f"Memory type {type(self.memory)} not supported")
@@ -7200,7 +7313,7 @@ class Team:
 
         if isinstance(self.memory, Memory):
             return self.memory.get_user_memories(user_id=user_id)
-        elif isinstance(self.memory, TeamMemory):
+        elif _is_team_memory(self.memory):
             raise ValueError("TeamMemory does not support get_user_memories")
         else:
             raise ValueError(f"Memory type {type(self.memory)} not supported")
@@ -7379,6 +7492,7 @@ class Team:
     # Knowledge
     ###########################################################################
 
+    @traced("team.knowledge_search")
     def get_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -7436,6 +7550,7 @@ class Team:
             log_warning(f"Error searching knowledge base: {e}")
             raise e
 
+    @traced("team.knowledge_search")
     async def aget_relevant_docs_from_knowledge(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None, **kwargs
     ) -> Optional[List[Union[Dict[str, Any], str]]]:
@@ -7757,8 +7872,8 @@ class Team:
         """Get an TeamMemory object, which can be saved to the database"""
         memory_dict = None
         if self.memory is not None:
-            if isinstance(self.memory, TeamMemory):
-                self.memory = cast(TeamMemory, self.memory)
+            if _is_team_memory(self.memory):
+                self.memory = cast("TeamMemory", self.memory)
                 memory_dict = self.memory.to_dict()
             else:
                 self.memory = cast(Memory, self.memory)
@@ -7782,6 +7897,7 @@ class Team:
             created_at=int(time()),
         )
 
+    @traced("team.telemetry")
     def _log_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
         if not self.telemetry and not self.monitoring:
             return
@@ -7808,6 +7924,7 @@ class Team:
         except Exception as e:
             log_debug(f"Could not create team event: {e}")
 
+    @traced("team.telemetry")
     async def _alog_team_run(self, session_id: str, user_id: Optional[str] = None) -> None:
         if not self.telemetry and not self.monitoring:
             return
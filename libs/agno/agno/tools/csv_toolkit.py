@@ -1,10 +1,12 @@
 import csv
 import json
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.result_set import iter_fetchmany, read_result_set
 
 
 class CsvTools(Toolkit):
@@ -18,6 +20,10 @@ class CsvTools(Toolkit):
         read_column_names: bool = True,
         duckdb_connection: Optional[Any] = None,
         duckdb_kwargs: Optional[Dict[str, Any]] = None,
+        csv_import: Literal["table", "view"] = "table",
+        max_result_rows: Optional[int] = 1000,
+        max_result_chars: Optional[int] = 100_000,
+        fetch_chunk_size: int = 500,
         **kwargs,
     ):
         self.csvs: List[Path] = []
@@ -32,6 +38,15 @@ class CsvTools(Toolkit):
         self.row_limit = row_limit
         self.duckdb_connection: Optional[Any] = duckdb_connection
         self.duckdb_kwargs: Optional[Dict[str, Any]] = duckdb_kwargs
+        # How csv files are made queryable: "table" imports each file once, "view" scans the file on every query
+        # without loading it into memory
+        self.csv_import: Literal["table", "view"] = csv_import
+        # Modification time of each csv file when it was imported, so unchanged files are not imported again
+        self._imported_csvs: Dict[str, float] = {}
+        # Query results are streamed from DuckDB and cut off at these limits, so large results never reach the model
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.max_result_chars: Optional[int] = max_result_chars
+        self.fetch_chunk_size: int = fetch_chunk_size
 
         tools: List[Any] = []
         if read_csvs:
@@ -80,10 +95,7 @@ class CsvTools(Toolkit):
             _row_limit = row_limit or self.row_limit
             with open(str(file_path), newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
-                if _row_limit is not None:
-                    csv_data = [row for row in reader][:_row_limit]
-                else:
-                    csv_data = [row for row in reader]
+                csv_data = list(islice(reader, _row_limit))
             return json.dumps(csv_data)
         except Exception as e:
             logger.error(f"Error reading csv: {e}")
@@ -136,22 +148,15 @@ class CsvTools(Toolkit):
             if csv_name not in [_csv.stem for _csv in self.csvs]:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
-            # Load the csv file into duckdb
-            log_info(f"Loading csv file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Create duckdb connection
+            # Reuse the duckdb connection across queries
+            if self.duckdb_connection is None:
+                self.duckdb_connection = duckdb.connect(**(self.duckdb_kwargs or {}))
             con = self.duckdb_connection
-            if not self.duckdb_connection:
-                con = duckdb.connect(**(self.duckdb_kwargs or {}))
-            if con is None:
-                logger.error("Error connecting to DuckDB")
-                return "Error connecting to DuckDB, please check the connection."
 
-            # Create a table from the csv file
-            con.execute(
-                f"CREATE TABLE {csv_name} AS SELECT * FROM read_csv('{file_path}', ignore_errors=false, auto_detect=true)"
-            )
+            # Load the csv file into duckdb
+            self._import_csv(con, csv_name, file_path)
 
             # -*- Format the SQL Query
             # Remove backticks
@@ -164,16 +169,13 @@ class CsvTools(Toolkit):
             result_output = "No output"
             if query_result is not None:
                 try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
+                    result_set = read_result_set(
+                        query_result.columns,
+                        iter_fetchmany(query_result.fetchmany, self.fetch_chunk_size),
+                        max_rows=self.max_result_rows,
+                        max_chars=self.max_result_chars,
+                    )
+                    result_output = result_set.to_csv()
                 except AttributeError:
                     result_output = str(query_result)
 
@@ -182,3 +184,17 @@ class CsvTools(Toolkit):
         except Exception as e:
             logger.error(f"Error querying csv: {e}")
             return f"Error querying csv: {e}"
+
+    def _import_csv(self, con: Any, csv_name: str, file_path: Path) -> None:
+        """Make a csv file queryable as `csv_name`, unless it is already imported and unchanged."""
+        modified_at = file_path.stat().st_mtime
+        if self._imported_csvs.get(csv_name) == modified_at:
+            return
+
+        log_info(f"Loading csv file: {csv_name}")
+        relation = "VIEW" if self.csv_import == "view" else "TABLE"
+        con.execute(
+            f"CREATE OR REPLACE {relation} {csv_name} AS "
+            f"SELECT * FROM read_csv('{file_path}', ignore_errors=false, auto_detect=true)"
+        )
+        self._imported_csvs[csv_name] = modified_at
@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.result_set import iter_fetchmany, read_result_set
 
 try:
     import duckdb
@@ -22,6 +23,9 @@ class DuckDbTools(Toolkit):
         create_tables: bool = True,
         summarize_tables: bool = True,
         export_tables: bool = False,
+        max_result_rows: Optional[int] = 1000,
+        max_result_chars: Optional[int] = 100_000,
+        fetch_chunk_size: int = 500,
         **kwargs,
     ):
         self.db_path: Optional[str] = db_path
@@ -29,6 +33,10 @@ class DuckDbTools(Toolkit):
         self.config: Optional[dict] = config
         self._connection: Optional[duckdb.DuckDBPyConnection] = connection
         self.init_commands: Optional[List] = init_commands
+        # Query results are streamed from DuckDB and cut off at these limits, so large results never reach the model
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.max_result_chars: Optional[int] = max_result_chars
+        self.fetch_chunk_size: int = fetch_chunk_size
 
         tools: List[Any] = []
         tools.append(self.show_tables)
@@ -136,16 +144,13 @@ class DuckDbTools(Toolkit):
             result_output = "No output"
             if query_result is not None:
                 try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
+                    result_set = read_result_set(
+                        query_result.columns,
+                        iter_fetchmany(query_result.fetchmany, self.fetch_chunk_size),
+                        max_rows=self.max_result_rows,
+                        max_chars=self.max_result_chars,
+                    )
+                    result_output = result_set.to_csv()
                 except AttributeError:
                     result_output = str(query_result)
 
@@ -6,6 +6,7 @@ from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
 
 from agno.exceptions import AgentRunException
+from agno.tracing.span import traced
 from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
@@ -414,6 +415,10 @@ class FunctionExecutionResult(BaseModel):
     error: Optional[str] = None
 
 
+def _get_function_call_span_attributes(function_call: "FunctionCall") -> Dict[str, Any]:
+    return {"tool": function_call.function.name, "call_id": function_call.call_id}
+
+
 class FunctionCall(BaseModel):
     """Model for Function Calls"""
 
@@ -597,6 +602,7 @@ class FunctionCall(BaseModel):
         chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
         return chain
 
+    @traced("tool.execute", attributes=_get_function_call_span_attributes)
     def execute(self) -> FunctionExecutionResult:
         """Runs the function call."""
         from inspect import isgenerator
@@ -777,6 +783,7 @@ class FunctionCall(BaseModel):
             chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
         return chain
 
+    @traced("tool.execute", attributes=_get_function_call_span_attributes)
     async def aexecute(self) -> FunctionExecutionResult:
         """Runs the function call asynchronously."""
         from inspect import isasyncgen, isasyncgenfunction, iscoroutinefunction, isgenerator
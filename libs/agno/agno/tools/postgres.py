@@ -1,5 +1,7 @@
 import csv
+from itertools import chain
 from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
 try:
     import psycopg2
@@ -13,6 +15,7 @@ except ImportError:
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_error
+from agno.utils.result_set import is_select_statement, iter_fetchmany, read_result_set
 
 
 class PostgresTools(Toolkit):
@@ -29,6 +32,9 @@ class PostgresTools(Toolkit):
         summarize_tables: bool = True,
         export_tables: bool = False,
         table_schema: str = "public",
+        max_result_rows: Optional[int] = 1000,
+        max_result_chars: Optional[int] = 100_000,
+        fetch_chunk_size: int = 500,
         **kwargs,
     ):
         self._connection: Optional[PgConnection] = connection
@@ -38,6 +44,10 @@ class PostgresTools(Toolkit):
         self.host: Optional[str] = host
         self.port: Optional[int] = port
         self.table_schema: str = table_schema
+        # Query results are streamed from Postgres and cut off at these limits, so large results never reach the model
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.max_result_chars: Optional[int] = max_result_chars
+        self.fetch_chunk_size: int = fetch_chunk_size
 
         tools: List[Any] = [
             self.show_tables,
@@ -96,22 +106,33 @@ class PostgresTools(Toolkit):
 
     def _execute_query(self, query: str, params: Optional[tuple] = None) -> str:
         try:
-            with self.connection.cursor() as cursor:
+            streaming = is_select_statement(query)
+            # Named cursors are server-side: rows stay in Postgres until they are fetched
+            cursor_kwargs: Dict[str, Any] = {"name": f"agno_{uuid4().hex}"} if streaming else {}
+            with self.connection.cursor(**cursor_kwargs) as cursor:
                 log_debug(f"Running PostgreSQL Query: {query} with Params: {params}")
                 cursor.execute(query, params)
 
+                if not streaming and cursor.description is None:
+                    return cursor.statusmessage or "Query executed successfully with no output."
+
+                rows = iter_fetchmany(cursor.fetchmany, self.fetch_chunk_size)
+                # Server-side cursors only describe their columns after the first fetch
+                first_row = next(rows, None)
                 if cursor.description is None:
                     return cursor.statusmessage or "Query executed successfully with no output."
 
                 columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-
-                if not rows:
+                if first_row is None:
                     return f"Query returned no results.\nColumns: {', '.join(columns)}"
 
-                header = ",".join(columns)
-                data_rows = [",".join(map(str, row)) for row in rows]
-                return f"{header}\n" + "\n".join(data_rows)
+                result_set = read_result_set(
+                    columns,
+                    chain([first_row], rows),
+                    max_rows=self.max_result_rows,
+                    max_chars=self.max_result_chars,
+                )
+                return result_set.to_csv()
 
         except psycopg2.Error as e:
             log_error(f"Database error: {e}")
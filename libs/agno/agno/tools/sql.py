@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, logger
+from agno.utils.result_set import ResultSet, is_select_statement, iter_fetchmany, read_result_set
 
 try:
     from sqlalchemy import Engine, create_engine
@@ -28,6 +29,9 @@ class SQLTools(Toolkit):
         list_tables: bool = True,
         describe_table: bool = True,
         run_sql_query: bool = True,
+        max_result_rows: Optional[int] = 1000,
+        max_result_chars: Optional[int] = 100_000,
+        fetch_chunk_size: int = 500,
         **kwargs,
     ):
         # Get the database engine
@@ -52,6 +56,11 @@ class SQLTools(Toolkit):
         # Tables this toolkit can access
         self.tables: Optional[Dict[str, Any]] = tables
 
+        # Query results are streamed from the database and cut off at these limits before they reach the model
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.max_result_chars: Optional[int] = max_result_chars
+        self.fetch_chunk_size: int = fetch_chunk_size
+
         tools: List[Any] = []
         if list_tables:
             tools.append(self.list_tables)
@@ -113,15 +122,24 @@ class SQLTools(Toolkit):
 
         Args:
             query (str): The query to run.
-            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results.
+            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results, up to the toolkit's row limit.
         Returns:
             str: Result of the SQL query.
         Notes:
             - The result may be empty if the query does not return any data.
+            - Large results are truncated, and a note explains how to narrow the query.
         """
 
         try:
-            return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+            result_set = self._run_sql(
+                sql=query,
+                max_rows=limit if limit is not None else self.max_result_rows,
+                max_chars=self.max_result_chars,
+            )
+            result = json.dumps(result_set.to_records(), default=str)
+            if result_set.truncated:
+                result += "\n" + result_set.truncation_note()
+            return result
         except Exception as e:
             logger.error(f"Error running query: {e}")
             return f"Error running query: {e}"
@@ -136,18 +154,27 @@ class SQLTools(Toolkit):
         Returns:
             List[dict]: The result of the query.
         """
+        return self._run_sql(sql=sql, max_rows=limit or None).to_records()
+
+    def _run_sql(self, sql: str, max_rows: Optional[int] = None, max_chars: Optional[int] = None) -> ResultSet:
         log_debug(f"Running sql |\n{sql}")
 
+        statement = text(sql)
+        if is_select_statement(sql):
+            # Use a server-side cursor where the driver supports it, so rows are fetched in chunks
+            statement = statement.execution_options(stream_results=True)
+
         with self.Session() as sess, sess.begin():
-            result = sess.execute(text(sql))
+            result = sess.execute(statement)
 
             # Check if the operation has returned rows.
             try:
-                if limit:
-                    rows = result.fetchmany(limit)
-                else:
-                    rows = result.fetchall()
-                return [row._asdict() for row in rows]
+                return read_result_set(
+                    list(result.keys()),
+                    iter_fetchmany(result.fetchmany, self.fetch_chunk_size),
+                    max_rows=max_rows,
+                    max_chars=max_chars,
+                )
             except Exception as e:
                 logger.error(f"Error while executing SQL: {e}")
-                return []
+                return ResultSet(columns=[])
@@ -5,6 +5,7 @@ import httpx
 
 from agno.tools import Toolkit
 from agno.utils.log import logger
+from agno.utils.whatsapp import get_async_client
 
 
 class WhatsAppTools(Toolkit):
@@ -83,11 +84,11 @@ class WhatsAppTools(Toolkit):
 
         logger.debug(f"Sending WhatsApp request to URL: {url}")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=data)
+        # Connections are reused across messages through the shared client
+        response = await get_async_client().post(url, headers=headers, json=data)
 
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        return response.json()
 
     def _send_message_sync(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Send a message synchronously using the WhatsApp API.
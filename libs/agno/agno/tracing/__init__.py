@@ -0,0 +1,16 @@
+from agno.tracing.exporter import InMemorySpanExporter, OTLPSpanExporter, SpanExporter
+from agno.tracing.span import Span, get_current_span, start_span, trace_span, traced
+from agno.tracing.tracer import Tracer, trace_run
+
+__all__ = [
+    "InMemorySpanExporter",
+    "OTLPSpanExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "get_current_span",
+    "start_span",
+    "trace_run",
+    "trace_span",
+    "traced",
+]
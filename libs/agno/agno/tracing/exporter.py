@@ -0,0 +1,151 @@
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional
+
+from agno.tracing.span import Span
+from agno.utils.log import log_debug, log_warning
+
+
+class SpanExporter:
+    """Base class for exporters, which receive the spans of every finished trace"""
+
+    def export(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps exported spans in memory, used in tests and for debugging"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            self.spans.extend(spans)
+
+    def get_spans(self, name: Optional[str] = None) -> List[Span]:
+        with self._lock:
+            return [span for span in self.spans if name is None or span.name == name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+def _to_otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _to_otlp_span(span: Span) -> Dict[str, Any]:
+    otlp_span: Dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        # SPAN_KIND_INTERNAL
+        "kind": 1,
+        "startTimeUnixNano": str(int(span.start_time * 1e9)),
+        "endTimeUnixNano": str(int((span.end_time or span.start_time) * 1e9)),
+        "attributes": [{"key": key, "value": _to_otlp_value(value)} for key, value in span.attributes.items()],
+        # STATUS_CODE_OK or STATUS_CODE_ERROR
+        "status": {"code": 2, "message": span.error or ""} if span.status == "error" else {"code": 1},
+    }
+    if span.parent_id is not None:
+        otlp_span["parentSpanId"] = span.parent_id
+    return otlp_span
+
+
+class OTLPSpanExporter(SpanExporter):
+    """
+    Sends spans to an OpenTelemetry collector with the OTLP/HTTP JSON protocol.
+
+    Spans are sent from a background thread, so exporting does not add latency to runs.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        headers: Optional[Dict[str, str]] = None,
+        service_name: str = "agno",
+        timeout: float = 10.0,
+        max_batch_size: int = 512,
+    ):
+        self.endpoint = endpoint
+        self.headers = headers or {}
+        self.service_name = service_name
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+
+        self._queue: "Queue[Optional[Span]]" = Queue()
+        self._lock = Lock()
+        self._worker: Optional[Thread] = None
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = Thread(target=self._run_worker, name="agno-otlp-exporter", daemon=True)
+                self._worker.start()
+        for span in spans:
+            self._queue.put(span)
+
+    def to_otlp(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+                    "scopeSpans": [{"scope": {"name": "agno"}, "spans": [_to_otlp_span(span) for span in spans]}],
+                }
+            ]
+        }
+
+    def _send(self, spans: List[Span]) -> None:
+        import httpx
+
+        try:
+            response = httpx.post(
+                self.endpoint,
+                json=self.to_otlp(spans),
+                headers={"Content-Type": "application/json", **self.headers},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            log_debug(f"Exported {len(spans)} spans to {self.endpoint}")
+        except Exception as e:
+            log_warning(f"Could not export {len(spans)} spans to {self.endpoint}: {e}")
+
+    def _run_worker(self) -> None:
+        stopped = False
+        while not stopped:
+            span = self._queue.get()
+            if span is None:
+                break
+            batch = [span]
+            # Send the spans that are already queued together
+            while len(batch) < self.max_batch_size:
+                try:
+                    span = self._queue.get_nowait()
+                except Empty:
+                    break
+                if span is None:
+                    stopped = True
+                    break
+                batch.append(span)
+            self._send(batch)
+
+    def shutdown(self) -> None:
+        """Sends the queued spans and stops the background thread"""
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout=self.timeout)
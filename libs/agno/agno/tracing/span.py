@@ -0,0 +1,291 @@
+import os
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TypeVar
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from agno.tracing.tracer import Tracer
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The span of the operation running in the current context. Spans are only recorded inside a traced run.
+_current_span: ContextVar[Optional["Span"]] = ContextVar("agno_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation of a run. Spans of a run form a tree under the span of the run."""
+
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+    parent_id: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    # Wall clock time the span started at, in seconds since the epoch
+    start_time: float = field(default_factory=time)
+    # Time the span took, in seconds
+    duration: Optional[float] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    children: List["Span"] = field(default_factory=list)
+    # Tracer that exports the trace once its root span ends
+    tracer: Optional["Tracer"] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self._started_at = perf_counter()
+
+    @property
+    def end_time(self) -> Optional[float]:
+        return self.start_time + self.duration if self.duration is not None else None
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def start_child(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> "Span":
+        child = Span(
+            name=name,
+            trace_id=self.trace_id,
+            parent_id=self.span_id,
+            attributes=attributes or {},
+            tracer=self.tracer,
+        )
+        self.children.append(child)
+        return child
+
+    def end(self) -> None:
+        if self.duration is not None:
+            return
+        self.duration = perf_counter() - self._started_at
+        if self.is_root and self.tracer is not None:
+            self.tracer.export(self)
+
+    def iter_spans(self) -> Iterator["Span"]:
+        """This span and its descendants, parents first"""
+        yield self
+        for child in self.children:
+            yield from child.iter_spans()
+
+    def to_dict(self) -> Dict[str, Any]:
+        _dict: Dict[str, Any] = {
+            "name": self.name,
+            "span_id": self.span_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": self.status,
+        }
+        if self.parent_id is not None:
+            _dict["parent_id"] = self.parent_id
+        if self.attributes:
+            _dict["attributes"] = self.attributes
+        if self.error is not None:
+            _dict["error"] = self.error
+        if self.children:
+            _dict["children"] = [child.to_dict() for child in self.children]
+        return _dict
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def start_span(
+    name: str, tracer: Optional["Tracer"] = None, attributes: Optional[Dict[str, Any]] = None
+) -> Optional[Span]:
+    """
+    Starts a span under the current span. Without a current span, a new trace is started if `tracer` is given,
+    otherwise nothing is recorded and None is returned. The span is not made current.
+    """
+    parent = _current_span.get()
+    if parent is not None:
+        return parent.start_child(name, attributes)
+    if tracer is not None:
+        return Span(name=name, trace_id=uuid4().hex, attributes=attributes or {}, tracer=tracer)
+    return None
+
+
+class trace_span:
+    """
+    Context manager that records the enclosed block as a span, see `start_span`.
+
+    with trace_span("knowledge.search", attributes={"query": query}) as span:
+        ...
+    """
+
+    def __init__(self, name: str, tracer: Optional["Tracer"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.span = start_span(name, tracer=tracer, attributes=attributes)
+        self._token: Optional[Token[Optional[Span]]] = None
+
+    def __enter__(self) -> Optional[Span]:
+        if self.span is not None:
+            self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.span is None:
+            return
+        if exc_value is not None:
+            self.span.record_error(exc_value)
+        _reset_current_span(self._token)
+        self.span.end()
+
+    async def __aenter__(self) -> Optional[Span]:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.__exit__(exc_type, exc_value, traceback)
+
+
+def _reset_current_span(token: Any) -> None:
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # The token was created in another context (eg: a generator closed from another task)
+        pass
+
+
+def trace_iterator(iterator: Iterator[Any], span: Span, on_end: Optional[Callable[[Span], None]] = None) -> Iterator:
+    """
+    Makes `span` current while `iterator` produces each item, and ends it once the iterator is done. `on_end` is
+    called with the span before it ends.
+    """
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                _reset_current_span(token)
+            yield item
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            span.record_error(e)
+        raise
+    finally:
+        if hasattr(iterator, "close"):
+            iterator.close()  # type: ignore
+        if on_end is not None:
+            on_end(span)
+        span.end()
+
+
+async def atrace_iterator(
+    iterator: AsyncIterator[Any], span: Span, on_end: Optional[Callable[[Span], None]] = None
+) -> AsyncIterator:
+    """Async version of `trace_iterator`"""
+    try:
+        while True:
+            token = _current_span.set(span)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            finally:
+                _reset_current_span(token)
+            yield item
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            span.record_error(e)
+        raise
+    finally:
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()  # type: ignore
+        if on_end is not None:
+            on_end(span)
+        span.end()
+
+
+def traced(name: str, attributes: Optional[Callable[..., Dict[str, Any]]] = None) -> Callable[[F], F]:
+    """
+    Decorator that records each call of a function, coroutine or (async) generator as a span named `name`.
+
+    Calls are only recorded inside a traced run, otherwise the function is called directly. `attributes` is called
+    with the arguments of the call and returns the attributes of the span.
+    """
+
+    def decorator(func: F) -> F:
+        if getattr(func, "_traced", False):
+            return func
+
+        def _start(args: Any, kwargs: Any) -> Optional[Span]:
+            parent = _current_span.get()
+            if parent is None:
+                return None
+            return parent.start_child(name, attributes(*args, **kwargs) if attributes is not None else None)
+
+        if isasyncgenfunction(func):
+
+            @wraps(func)
+            def async_gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                span = _start(args, kwargs)
+                if span is None:
+                    return func(*args, **kwargs)
+                return atrace_iterator(func(*args, **kwargs), span)
+
+            async_gen_wrapper._traced = True  # type: ignore
+            return async_gen_wrapper  # type: ignore
+
+        if isgeneratorfunction(func):
+
+            @wraps(func)
+            def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                span = _start(args, kwargs)
+                if span is None:
+                    return func(*args, **kwargs)
+                return trace_iterator(func(*args, **kwargs), span)
+
+            gen_wrapper._traced = True  # type: ignore
+            return gen_wrapper  # type: ignore
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                span = _start(args, kwargs)
+                if span is None:
+                    return await func(*args, **kwargs)
+                token = _current_span.set(span)
+                try:
+                    return await func(*args, **kwargs)
+                except BaseException as e:
+                    span.record_error(e)
+                    raise
+                finally:
+                    _reset_current_span(token)
+                    span.end()
+
+            async_wrapper._traced = True  # type: ignore
+            return async_wrapper  # type: ignore
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            span = _start(args, kwargs)
+            if span is None:
+                return func(*args, **kwargs)
+            token = _current_span.set(span)
+            try:
+                return func(*args, **kwargs)
+            except BaseException as e:
+                span.record_error(e)
+                raise
+            finally:
+                _reset_current_span(token)
+                span.end()
+
+        wrapper._traced = True  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,138 @@
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Dict, List, Optional
+
+from agno.tracing.exporter import SpanExporter
+from agno.tracing.span import F, Span, _current_span, _reset_current_span, atrace_iterator, start_span, trace_iterator
+from agno.utils.log import log_debug, log_warning
+
+
+class Tracer:
+    """
+    Records runs as traces: trees of spans with the time taken by each step of the run (building messages, reading
+    and writing storage, knowledge search, model calls, tool calls, memory updates, ...).
+
+    agent = Agent(tracer=Tracer(exporters=[OTLPSpanExporter()]))
+
+    A trace is started by each run of an Agent, Team or Workflow that has a tracer and is not already part of a
+    traced run. Finished traces are sent to the exporters and, with `add_to_run_metrics`, the span tree of a run is
+    also added to the metrics of its response under "trace". It is off by default, as the tree is stored with the
+    run in the session.
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None, add_to_run_metrics: bool = False):
+        self.exporters: List[SpanExporter] = exporters or []
+        self.add_to_run_metrics = add_to_run_metrics
+
+    def export(self, root: Span) -> None:
+        spans = list(root.iter_spans())
+        log_debug(f"Exporting trace {root.trace_id} with {len(spans)} spans")
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                log_warning(f"Could not export trace {root.trace_id} with {type(exporter).__name__}: {e}")
+
+    def shutdown(self) -> None:
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+def _get_run_attributes(owner: Any) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {}
+    for key in ("agent_id", "team_id", "workflow_id", "name"):
+        value = getattr(owner, key, None)
+        if isinstance(value, str):
+            attributes[key] = value
+    return attributes
+
+
+def _end_run_span(owner: Any, result: Any, span: Span) -> None:
+    """Ends the span of a run and adds it to the metrics of the run response"""
+    # Ids are often only set once the run started
+    for key, value in _get_run_attributes(owner).items():
+        span.attributes.setdefault(key, value)
+    run_response = result if hasattr(result, "metrics") else getattr(owner, "run_response", None)
+    if run_response is not None:
+        for key in ("run_id", "session_id"):
+            value = getattr(run_response, key, None)
+            if value is not None:
+                span.set_attribute(key, value)
+    span.end()
+
+    if run_response is None or not hasattr(run_response, "metrics"):
+        return
+    if span.tracer is None or not span.tracer.add_to_run_metrics:
+        return
+    if run_response.metrics is None:
+        run_response.metrics = {}
+    run_response.metrics["trace"] = span.to_dict()
+
+
+def trace_run(name: str) -> Callable[[F], F]:
+    """
+    Decorator for the run methods of Agent, Team and Workflow. Records the run as a span, starting a trace if the
+    owner has a `tracer` and the run is not part of a traced run. Streaming runs are recorded until their iterator
+    is exhausted.
+    """
+
+    def decorator(func: F) -> F:
+        def _start(args: Any, kwargs: Any) -> Optional[Span]:
+            tracer = getattr(args[0], "tracer", None)
+            if tracer is None and _current_span.get() is None:
+                return None
+            return start_span(name, tracer=tracer, attributes=_get_run_attributes(args[0]))
+
+        def _on_end(owner: Any) -> Callable[[Span], None]:
+            return lambda span: _end_run_span(owner, None, span)
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                span = _start(args, kwargs)
+                if span is None:
+                    return await func(*args, **kwargs)
+                token = _current_span.set(span)
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    span.record_error(e)
+                    span.end()
+                    raise
+                finally:
+                    _reset_current_span(token)
+                if hasattr(result, "__anext__"):
+                    return atrace_iterator(result, span, on_end=_on_end(args[0]))
+                if hasattr(result, "__next__"):
+                    return trace_iterator(result, span, on_end=_on_end(args[0]))
+                _end_run_span(args[0], result, span)
+                return result
+
+            return async_wrapper  # type: ignore
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            span = _start(args, kwargs)
+            if span is None:
+                return func(*args, **kwargs)
+            token = _current_span.set(span)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                span.record_error(e)
+                span.end()
+                raise
+            finally:
+                _reset_current_span(token)
+            # Async generator functions are not coroutine functions, their iterator is returned directly
+            if hasattr(result, "__anext__"):
+                return atrace_iterator(result, span, on_end=_on_end(args[0]))
+            if hasattr(result, "__next__"):
+                return trace_iterator(result, span, on_end=_on_end(args[0]))
+            _end_run_span(args[0], result, span)
+            return result
+
+        return wrapper  # type: ignore
+
+    return decorator
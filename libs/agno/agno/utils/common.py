@@ -1,3 +1,4 @@
+import json
 from dataclasses import asdict
 from typing import Any, List, Optional, Type
 
@@ -59,3 +60,16 @@ def nested_model_dump(value):
     elif isinstance(value, list):
         return [nested_model_dump(item) for item in value]
     return value
+
+
+def to_json_value(value: Any) -> Any:
+    """Best effort conversion of a value to JSON: models are dumped and values json can't encode become strings"""
+    from pydantic import BaseModel
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return str(value)
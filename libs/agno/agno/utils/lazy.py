@@ -0,0 +1,43 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+from typing_extensions import TypeGuard
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Returns the module `__getattr__` and `__dir__` of a package whose exports are imported on first access.
+
+    `exports` maps each exported name to the module it is defined in, or to "module:attribute" when it is exported
+    under another name. Use it in the `__init__.py` of the package, with the same imports under TYPE_CHECKING:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"Agent": "agno.agent.agent"})
+    """
+    package_globals = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attribute = target.partition(":")
+        value = getattr(import_module(module_name), attribute or name)
+        # Cache the value, later lookups do not go through __getattr__
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def is_instance_of(obj: Any, module_name: str, class_name: str) -> TypeGuard[Any]:
+    """
+    isinstance check against a class that is not imported by the caller. Instances of a class only exist once its
+    module is loaded, so the module is not imported if it was not loaded yet.
+    The class is not known to type checkers, so `obj` is narrowed to Any. Wrap it in a function returning
+    `TypeGuard["<class>"]` to narrow to the class.
+    """
+    module = sys.modules.get(module_name)
+    return module is not None and isinstance(obj, getattr(module, class_name))
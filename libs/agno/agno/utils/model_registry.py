@@ -0,0 +1,191 @@
+import json
+from concurrent.futures import Future
+from queue import Empty, Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from agno.utils.log import log_debug
+
+
+def model_key(*parts: Any) -> Tuple[str, ...]:
+    """Build a hashable registry key, serialising unhashable parts like kwargs dicts."""
+    return tuple(json.dumps(part, sort_keys=True, default=str) for part in parts)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into single calls of a batch function.
+
+    Every request is a list of items. A worker thread takes the first pending request and drains every other
+    request that is already queued (or arrives within `max_wait_ms`), up to `max_batch_size` items, calls
+    `batch_fn` once on all of them and hands each caller back its own slice of the results.
+    While the model is busy with one batch, new requests pile up and form the next one, so a lone caller pays no
+    extra latency with the default `max_wait_ms=0`.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 0.0,
+        name: Optional[str] = None,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.name = name or "micro-batcher"
+
+        self._queue: Queue = Queue()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    def submit(self, items: Sequence[Any]) -> "Future[List[Any]]":
+        """Queue a request, returning a future for its results."""
+        future: Future = Future()
+        if not items:
+            future.set_result([])
+            return future
+        self._ensure_worker()
+        self._queue.put((list(items), future))
+        return future
+
+    def __call__(self, items: Sequence[Any]) -> List[Any]:
+        return self.submit(items).result()
+
+    def close(self) -> None:
+        """Stop the worker thread once the pending requests are processed."""
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread = None
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, args=(self._queue,), name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self, queue: Queue) -> None:
+        while True:
+            request = queue.get()
+            if request is None:
+                return
+
+            batch = [request]
+            batch_size = len(request[0])
+            deadline = monotonic() + self.max_wait_ms / 1000
+            stop = False
+            while batch_size < self.max_batch_size:
+                timeout = deadline - monotonic()
+                try:
+                    request = queue.get(timeout=timeout) if timeout > 0 else queue.get_nowait()
+                except Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+                batch_size += len(request[0])
+
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[Tuple[List[Any], Future]]) -> None:
+        items = [item for request_items, _ in batch for item in request_items]
+        if len(batch) > 1:
+            log_debug(f"{self.name}: processing {len(batch)} requests ({len(items)} items) in one batch")
+        try:
+            results = list(self.batch_fn(items))
+            if len(results) != len(items):
+                raise ValueError(f"Batch function returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        offset = 0
+        for request_items, future in batch:
+            future.set_result(results[offset : offset + len(request_items)])
+            offset += len(request_items)
+
+
+class LocalModelRegistry:
+    """
+    Process-wide registry of locally loaded models.
+
+    Each model is loaded once, on first use or eagerly via `preload`, and shared by every embedder and reranker
+    in the process. Loading is serialised per key, so concurrent first calls do not load the same model twice.
+    Keys are built with `model_key`; batchers are keyed by their model's key followed by the batch settings.
+    """
+
+    def __init__(self):
+        self._models: Dict[Tuple[str, ...], Any] = {}
+        self._batchers: Dict[Tuple[str, ...], MicroBatcher] = {}
+        self._load_locks: Dict[Tuple[str, ...], Lock] = {}
+        self._lock = Lock()
+
+    def __contains__(self, key: Tuple[str, ...]) -> bool:
+        return key in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get(self, key: Tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        """Return the model registered under `key`, loading it with `loader` the first time."""
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, Lock())
+        with load_lock:
+            model = self._models.get(key)
+            if model is None:
+                log_debug(f"Loading local model: {key}")
+                model = loader()
+                self._models[key] = model
+        return model
+
+    def get_batcher(
+        self,
+        key: Tuple[str, ...],
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 0.0,
+    ) -> MicroBatcher:
+        """Return the micro-batcher registered under `key`, creating it the first time."""
+        batcher = self._batchers.get(key)
+        if batcher is not None:
+            return batcher
+
+        with self._lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                batcher = MicroBatcher(
+                    batch_fn, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, name="local-model-batcher"
+                )
+                self._batchers[key] = batcher
+        return batcher
+
+    def remove(self, key: Tuple[str, ...]) -> None:
+        """Unload a model and stop the batchers that use it."""
+        with self._lock:
+            self._models.pop(key, None)
+            self._load_locks.pop(key, None)
+            for batcher_key in [k for k in self._batchers if k[: len(key)] == key]:
+                self._batchers.pop(batcher_key).close()
+
+    def clear(self) -> None:
+        with self._lock:
+            for batcher in self._batchers.values():
+                batcher.close()
+            self._models = {}
+            self._batchers = {}
+            self._load_locks = {}
+
+
+local_model_registry = LocalModelRegistry()
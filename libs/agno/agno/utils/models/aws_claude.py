@@ -108,10 +108,56 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _format_message(message: Message) -> Dict[str, Any]:
+    """Format a user, assistant or tool message for AWS Bedrock Claude."""
+    content = message.content or ""
+    if message.role == "user":
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+
+        if message.images is not None:
+            for image in message.images:
+                image_content = _format_image_for_message(image)
+                if image_content:
+                    content.append(image_content)
+
+        if message.files is not None and len(message.files) > 0:
+            log_warning("Files are not supported for AWS Bedrock Claude")
+
+        if message.audio is not None and len(message.audio) > 0:
+            log_warning("Audio is not supported for AWS Bedrock Claude")
+
+        if message.videos is not None and len(message.videos) > 0:
+            log_warning("Video is not supported for AWS Bedrock Claude")
+
+    # Handle tool calls from history
+    elif message.role == "assistant":
+        content = []
+
+        if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
+            content.append(TextBlock(text=message.content, type="text"))
+
+        if message.tool_calls:
+            for tool_call in message.tool_calls:
+                content.append(
+                    ToolUseBlock(
+                        id=tool_call["id"],
+                        input=json.loads(tool_call["function"]["arguments"])
+                        if "arguments" in tool_call["function"]
+                        else {},
+                        name=tool_call["function"]["name"],
+                        type="tool_use",
+                    )
+                )
+    return {"role": ROLE_MAP[message.role], "content": content}
+
+
 def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]:
     """
     Process the list of messages and separate them into API messages and system messages.
 
+    Messages are formatted once and the payload is reused on later requests, see `Message.get_formatted`.
+
     Args:
         messages (List[Message]): The list of messages to process.
 
@@ -123,48 +169,8 @@ def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]
     system_messages: List[str] = []
 
     for message in messages:
-        content = message.content or ""
         if message.role == "system":
-            if content is not None:
-                system_messages.append(content)  # type: ignore
+            system_messages.append(message.content or "")  # type: ignore
             continue
-        elif message.role == "user":
-            if isinstance(content, str):
-                content = [{"type": "text", "text": content}]
-
-            if message.images is not None:
-                for image in message.images:
-                    image_content = _format_image_for_message(image)
-                    if image_content:
-                        content.append(image_content)
-
-            if message.files is not None and len(message.files) > 0:
-                log_warning("Files are not supported for AWS Bedrock Claude")
-
-            if message.audio is not None and len(message.audio) > 0:
-                log_warning("Audio is not supported for AWS Bedrock Claude")
-
-            if message.videos is not None and len(message.videos) > 0:
-                log_warning("Video is not supported for AWS Bedrock Claude")
-
-        # Handle tool calls from history
-        elif message.role == "assistant":
-            content = []
-
-            if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
-                content.append(TextBlock(text=message.content, type="text"))
-
-            if message.tool_calls:
-                for tool_call in message.tool_calls:
-                    content.append(
-                        ToolUseBlock(
-                            id=tool_call["id"],
-                            input=json.loads(tool_call["function"]["arguments"])
-                            if "arguments" in tool_call["function"]
-                            else {},
-                            name=tool_call["function"]["name"],
-                            type="tool_use",
-                        )
-                    )
-        chat_messages.append({"role": ROLE_MAP[message.role], "content": content})  # type: ignore
+        chat_messages.append(message.get_formatted(_format_message, _format_message))
     return chat_messages, " ".join(system_messages)
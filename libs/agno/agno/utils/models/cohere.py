@@ -46,42 +46,45 @@ def _format_images_for_message(message: Message, images: Sequence[Image]) -> Lis
     return message_content_with_image
 
 
+def _format_message(message: Message) -> Dict[str, Any]:
+    """Format a message for the Cohere API."""
+    message_dict = {
+        "role": message.role,
+        "content": message.content,
+        "name": message.name,
+        "tool_call_id": message.tool_call_id,
+        "tool_calls": message.tool_calls,
+    }
+
+    if message.images is not None and len(message.images) > 0:
+        # Ignore non-string message content
+        if isinstance(message.content, str):
+            message_content_with_image = _format_images_for_message(message=message, images=message.images)
+            if len(message_content_with_image) > 1:
+                message_dict["content"] = message_content_with_image
+
+    if message.videos is not None and len(message.videos) > 0:
+        log_warning("Video input is currently unsupported.")
+
+    if message.audio is not None and len(message.audio) > 0:
+        log_warning("Audio input is currently unsupported.")
+
+    if message.files is not None and len(message.files) > 0:
+        log_warning("File input is currently unsupported.")
+
+    return {k: v for k, v in message_dict.items() if v is not None}
+
+
 def format_messages(messages: List[Message]) -> List[Dict[str, Any]]:
     """
     Format messages for the Cohere API.
 
+    Messages are formatted once and the payload is reused on later requests, see `Message.get_formatted`.
+
     Args:
         messages (List[Message]): The list of messages.
 
     Returns:
         List[Dict[str, Any]]: The formatted messages.
     """
-    formatted_messages = []
-    for message in messages:
-        message_dict = {
-            "role": message.role,
-            "content": message.content,
-            "name": message.name,
-            "tool_call_id": message.tool_call_id,
-            "tool_calls": message.tool_calls,
-        }
-
-        if message.images is not None and len(message.images) > 0:
-            # Ignore non-string message content
-            if isinstance(message.content, str):
-                message_content_with_image = _format_images_for_message(message=message, images=message.images)
-                if len(message_content_with_image) > 1:
-                    message_dict["content"] = message_content_with_image
-
-        if message.videos is not None and len(message.videos) > 0:
-            log_warning("Video input is currently unsupported.")
-
-        if message.audio is not None and len(message.audio) > 0:
-            log_warning("Audio input is currently unsupported.")
-
-        if message.files is not None and len(message.files) > 0:
-            log_warning("File input is currently unsupported.")
-
-        message_dict = {k: v for k, v in message_dict.items() if v is not None}
-        formatted_messages.append(message_dict)
-    return formatted_messages
+    return [message.get_formatted(_format_message, _format_message) for message in messages]
@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Statements that only read rows, and can run through a streaming (server-side) cursor
+_ROW_STATEMENTS = ("SELECT", "WITH", "VALUES", "TABLE")
+
+
+def is_select_statement(query: str) -> bool:
+    """Whether a SQL statement returns rows and can be streamed."""
+    statement = query.split(None, 1)
+    return bool(statement) and statement[0].upper() in _ROW_STATEMENTS
+
+
+def iter_fetchmany(fetchmany: Callable[[int], Sequence[Any]], chunk_size: int = 500) -> Iterator[Any]:
+    """Yield the rows of a DB-API style cursor, fetching `chunk_size` rows at a time."""
+    while True:
+        rows = fetchmany(chunk_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _row_size(row: Sequence[Any]) -> int:
+    return sum(len(str(value)) + 1 for value in row)
+
+
+@dataclass
+class ResultSet:
+    """A bounded slice of a query result."""
+
+    columns: List[str]
+    rows: List[Sequence[Any]] = field(default_factory=list)
+    # Why the result was cut short: "rows" or "size"
+    truncated_by: Optional[str] = None
+
+    @property
+    def truncated(self) -> bool:
+        return self.truncated_by is not None
+
+    def to_csv(self) -> str:
+        """Compact rendering: a header line, then one comma separated line per row."""
+        lines = [str(row[0]) if len(row) == 1 else ",".join(str(value) for value in row) for row in self.rows]
+        if self.truncated:
+            lines.append(self.truncation_note())
+        return ",".join(self.columns) + "\n" + "\n".join(lines)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+    def truncation_note(self) -> str:
+        limit = "row" if self.truncated_by == "rows" else "size"
+        return (
+            f"[Result truncated to the first {len(self.rows)} rows by the {limit} limit. "
+            "Use filters, aggregates or LIMIT to narrow the query.]"
+        )
+
+
+def read_result_set(
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> ResultSet:
+    """
+    Consume rows until `max_rows` rows or roughly `max_chars` characters of rendered output are collected.
+
+    Rows are pulled lazily, so a streaming cursor never fetches much past the limits.
+    The first row is always kept, so an oversized row still gives the model something to work with.
+    """
+    result = ResultSet(columns=list(columns))
+    size = _row_size(result.columns)
+    for row in rows:
+        if max_rows is not None and len(result.rows) >= max_rows:
+            result.truncated_by = "rows"
+            break
+        size += _row_size(row)
+        if max_chars is not None and size > max_chars and result.rows:
+            result.truncated_by = "size"
+            break
+        result.rows.append(tuple(row))
+    return result
@@ -1,11 +1,40 @@
+import asyncio
 import os
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import httpx
 import requests
 
 from agno.utils.log import log_debug, log_error
 
+# HTTP clients shared by all calls to the WhatsApp API, so connections are pooled and reused
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_session: Optional[requests.Session] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Shared async HTTP client for the running event loop"""
+    global _async_client, _async_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+def get_session() -> requests.Session:
+    """Shared session for synchronous calls"""
+    global _session
+
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
 
 def get_access_token() -> str:
     access_token = os.getenv("WHATSAPP_ACCESS_TOKEN")
@@ -34,7 +63,7 @@ def get_media(media_id: str) -> Union[dict, bytes]:
 
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers)
         response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
         data = response.json()
 
@@ -43,7 +72,7 @@ def get_media(media_id: str) -> Union[dict, bytes]:
         return {"error": str(e)}
 
     try:
-        response = requests.get(media_url, headers=headers)
+        response = get_session().get(media_url, headers=headers)
         response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
         data = response.content
         return data
@@ -64,20 +93,20 @@ async def get_media_async(media_id: str) -> Union[dict, bytes]:
 
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
-            data = response.json()
+        client = get_async_client()
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
+        data = response.json()
 
         media_url = data.get("url")
     except httpx.HTTPStatusError as e:
         return {"error": str(e)}
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(media_url, headers=headers)
-            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
-            data = response.content
+        client = get_async_client()
+        response = await client.get(media_url, headers=headers)
+        response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
+        data = response.content
         return data
     except httpx.HTTPStatusError as e:
         return {"error": str(e)}
@@ -107,7 +136,7 @@ def upload_media(media_data: bytes, mime_type: str, filename: str = "file"):
         file_data = BytesIO(media_data)
         files = {"file": (filename, file_data, mime_type)}
 
-        response = requests.post(url, headers=headers, data=data, files=files)
+        response = get_session().post(url, headers=headers, data=data, files=files)
         response.raise_for_status()  # Raise an error for bad responses
         json_resp = response.json()
         media_id = json_resp.get("id")
@@ -144,14 +173,14 @@ async def upload_media_async(media_data: bytes, mime_type: str, filename: str =
         file_data = BytesIO(media_data)
         files = {"file": (filename, file_data, mime_type)}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, data=data, files=files)
-            response.raise_for_status()  # Raise an error for bad responses
-            json_resp = response.json()
-            media_id = json_resp.get("id")
-            if not media_id:
-                return {"error": "Media ID not found in response", "response": json_resp}
-            return media_id
+        client = get_async_client()
+        response = await client.post(url, headers=headers, data=data, files=files)
+        response.raise_for_status()  # Raise an error for bad responses
+        json_resp = response.json()
+        media_id = json_resp.get("id")
+        if not media_id:
+            return {"error": "Media ID not found in response", "response": json_resp}
+        return media_id
     except httpx.HTTPStatusError as e:
         return {"error": str(e)}
     except Exception as e:
@@ -191,13 +220,13 @@ async def send_image_message_async(
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            import json
+        import json
 
-            log_debug(f"Request data: {json.dumps(data, indent=2)}")
-            response = await client.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            log_debug(f"Response: {response.text}")
+        log_debug(f"Request data: {json.dumps(data, indent=2)}")
+        client = get_async_client()
+        response = await client.post(url, headers=headers, json=data)
+        response.raise_for_status()
+        log_debug(f"Response: {response.text}")
 
     except httpx.HTTPStatusError as e:
         log_error(f"Failed to send WhatsApp image message: {e}")
@@ -232,7 +261,7 @@ def send_image_message(
 
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    data = {
+    data: Dict[str, Any] = {
         "messaging_product": "whatsapp",
         "recipient_type": "individual",
         "to": recipient,
@@ -244,7 +273,7 @@ def send_image_message(
         import json
 
         log_debug(f"Request data: {json.dumps(data, indent=2)}")
-        response = requests.post(url, headers=headers, json=data)
+        response = get_session().post(url, headers=headers, json=data)
         response.raise_for_status()
         log_debug(f"Response: {response.text}")
     except requests.exceptions.RequestException as e:
@@ -274,7 +303,7 @@ def typing_indicator(message_id: Optional[str] = None):
         "typing_indicator": {"type": "text"},
     }
     try:
-        response = requests.post(url, headers=headers, data=data)
+        response = get_session().post(url, headers=headers, data=data)
         response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
     except requests.exceptions.RequestException as e:
         return {"error": str(e)}
@@ -298,8 +327,8 @@ async def typing_indicator_async(message_id: Optional[str] = None):
         "typing_indicator": {"type": "text"},
     }
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, data=data)
-            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
+        client = get_async_client()
+        response = await client.post(url, headers=headers, data=data)
+        response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
     except httpx.HTTPStatusError as e:
         return {"error": str(e)}
@@ -2,6 +2,11 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from agno.document import Document
+from agno.tracing.span import traced
+
+
+def _get_vectordb_span_attributes(vector_db: "VectorDb", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"vectordb": type(vector_db).__name__}
 
 
 class VectorDb(ABC):
@@ -63,6 +68,18 @@ class VectorDb(ABC):
     ) -> List[Document]:
         raise NotImplementedError
 
+    @traced("vectordb.search", attributes=_get_vectordb_span_attributes)
+    def traced_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Searches the vector db, recorded as a span of the current trace"""
+        return self.search(query=query, limit=limit, filters=filters)
+
+    @traced("vectordb.search", attributes=_get_vectordb_span_attributes)
+    async def async_traced_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Searches the vector db asynchronously, recorded as a span of the current trace"""
+        return await self.async_search(query=query, limit=limit, filters=filters)
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         raise NotImplementedError
 
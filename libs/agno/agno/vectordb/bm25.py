@@ -0,0 +1,106 @@
+import re
+from heapq import nlargest
+from math import log
+from typing import Callable, Collection, Dict, Hashable, List, Optional, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokenizer used for keyword search."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """
+    In-memory inverted index with Okapi BM25 scoring.
+
+    Documents are identified by any hashable key. Scoring only visits the postings of the query terms,
+    so search cost grows with the number of matching documents rather than the size of the index.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Optional[Callable[[str], List[str]]] = None,
+    ):
+        self.k1: float = k1
+        self.b: float = b
+        self.tokenizer: Callable[[str], List[str]] = tokenizer or tokenize
+
+        # term -> {doc_key -> term frequency}
+        self.postings: Dict[str, Dict[Hashable, int]] = {}
+        # doc_key -> (document length, unique terms)
+        self.documents: Dict[Hashable, Tuple[int, Tuple[str, ...]]] = {}
+        self.total_length: int = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.documents
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index a document, replacing any previous document with the same key."""
+        if key in self.documents:
+            self.remove(key)
+
+        tokens = self.tokenizer(text)
+        frequencies: Dict[str, int] = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[key] = frequency
+
+        self.documents[key] = (len(tokens), tuple(frequencies))
+        self.total_length += len(tokens)
+
+    def remove(self, key: Hashable) -> None:
+        document = self.documents.pop(key, None)
+        if document is None:
+            return
+        length, terms = document
+        self.total_length -= length
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self.postings[term]
+
+    def clear(self) -> None:
+        self.postings = {}
+        self.documents = {}
+        self.total_length = 0
+
+    def search(
+        self, query: str, limit: int = 5, candidates: Optional[Collection[Hashable]] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Return the `limit` best matching (key, score) pairs, best first.
+
+        Args:
+            query (str): The keyword query.
+            limit (int): Maximum number of results to return.
+            candidates (Optional[Collection[Hashable]]): If provided, only these keys are scored.
+        """
+        num_documents = len(self.documents)
+        if num_documents == 0:
+            return []
+
+        average_length = self.total_length / num_documents or 1.0
+        scores: Dict[Hashable, float] = {}
+        for term in set(self.tokenizer(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = log(1 + (num_documents - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, frequency in postings.items():
+                if candidates is not None and key not in candidates:
+                    continue
+                length = self.documents[key][0]
+                norm = frequency + self.k1 * (1 - self.b + self.b * length / average_length)
+                scores[key] = scores.get(key, 0.0) + idf * frequency * (self.k1 + 1) / norm
+
+        return nlargest(limit, scores.items(), key=lambda item: item[1])
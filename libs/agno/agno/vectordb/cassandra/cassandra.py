@@ -140,7 +140,7 @@ class Cassandra(VectorDb):
 
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         """Vector similarity search implementation."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         hits = list(
             self.table.metric_ann_search(
                 vector=query_embedding,
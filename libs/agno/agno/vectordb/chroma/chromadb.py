@@ -236,7 +236,7 @@ class ChromaDb(VectorDb):
         Returns:
             List[Document]: List of search results.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -405,7 +405,7 @@ class Clickhouse(VectorDb):
         )
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -469,7 +469,7 @@ class Clickhouse(VectorDb):
         """Search for documents asynchronously."""
         async_client = await self._ensure_async_client()
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -435,7 +435,7 @@ class CouchbaseSearch(VectorDb):
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Search the Couchbase bucket for documents relevant to the query."""
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Failed to generate embedding for query: {query}")
             return []
@@ -945,7 +945,7 @@ class CouchbaseSearch(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"[async] Failed to generate embedding for query: {query}")
             return []
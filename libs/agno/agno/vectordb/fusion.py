@@ -0,0 +1,54 @@
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, TypeVar
+
+from agno.document import Document
+from agno.utils.string import safe_content_hash
+
+T = TypeVar("T")
+
+
+def document_key(document: Document) -> str:
+    """
+    Key used to identify the same document across result lists.
+
+    Uses the content hash rather than the id, as vector dbs assign their own ids (e.g. the content hash in
+    Chroma and Qdrant) which differ from the ids of the documents that were inserted.
+    """
+    return safe_content_hash(document.content)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[T]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+    key: Optional[Callable[[T], Hashable]] = None,
+    limit: Optional[int] = None,
+) -> List[T]:
+    """
+    Fuse ranked result lists with (weighted) reciprocal rank fusion.
+
+    Each item scores `weight / (k + rank)` for every list it appears in, and items are returned by total score.
+
+    Args:
+        rankings: Ranked result lists, best first.
+        k: Rank constant. Larger values flatten the contribution of the top ranks.
+        weights: Weight per result list. Defaults to equal weights.
+        key: Function returning the identity of an item. Defaults to the item itself.
+        limit: Maximum number of items to return.
+    """
+    if weights is not None and len(weights) != len(rankings):
+        raise ValueError("The number of weights must match the number of rankings")
+
+    scores: Dict[Hashable, float] = {}
+    items: Dict[Hashable, T] = {}
+    for i, ranking in enumerate(rankings):
+        weight = weights[i] if weights is not None else 1.0
+        for rank, item in enumerate(ranking, start=1):
+            item_key = key(item) if key is not None else item
+            scores[item_key] = scores.get(item_key, 0.0) + weight / (k + rank)  # type: ignore
+            # Keep the first occurrence, earlier rankings take precedence
+            items.setdefault(item_key, item)  # type: ignore
+
+    fused = sorted(scores, key=lambda item_key: scores[item_key], reverse=True)
+    if limit is not None:
+        fused = fused[:limit]
+    return [items[item_key] for item_key in fused]
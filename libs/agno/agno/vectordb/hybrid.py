@@ -0,0 +1,325 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+from agno.document import Document
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.bm25 import BM25Index
+from agno.vectordb.fusion import document_key, reciprocal_rank_fusion
+from agno.vectordb.search import SearchType
+
+
+def _implements(vector_db: VectorDb, method: str) -> bool:
+    """Check if a vector db overrides an optional VectorDb method."""
+    return getattr(type(vector_db), method, None) is not getattr(VectorDb, method, None)
+
+
+def _accepts_filters(func: Callable) -> bool:
+    try:
+        return "filters" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _matches_filters(meta_data: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    for key, value in filters.items():
+        if key not in meta_data:
+            return False
+        expected = value if isinstance(value, (list, tuple, set)) else [value]
+        actual = meta_data[key] if isinstance(meta_data[key], (list, tuple, set)) else [meta_data[key]]
+        if not any(v in expected for v in actual):
+            return False
+    return True
+
+
+class HybridVectorDb(VectorDb):
+    """
+    Adds hybrid search to any VectorDb.
+
+    Searches run the vector query against the wrapped vector db and a keyword query concurrently, fuse both
+    rankings with reciprocal rank fusion and apply the reranker once on the fused results.
+
+    The keyword query uses the vector db's native `keyword_search` when it has one (and supports the requested
+    filters). Otherwise a local BM25 index is used, which is kept up to date with the documents written through
+    this class and with the documents checked via `doc_exists` when a knowledge base is reloaded.
+
+    Writes and collection management are delegated to the wrapped vector db. Configure the reranker on this class
+    rather than on the wrapped vector db, so results are only reranked once.
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDb,
+        search_type: SearchType = SearchType.hybrid,
+        fusion: Literal["rrf", "weighted"] = "rrf",
+        vector_score_weight: float = 0.5,
+        rrf_k: int = 60,
+        candidate_multiplier: int = 4,
+        use_native_keyword_search: bool = True,
+        reranker: Optional[Reranker] = None,
+    ):
+        """
+        Initialize the HybridVectorDb instance.
+
+        Args:
+            vector_db (VectorDb): The vector db to add hybrid search to.
+            search_type (SearchType): Type of search to perform.
+            fusion (Literal["rrf", "weighted"]): Fuse rankings with equal weights ("rrf") or weigh them
+                with `vector_score_weight` ("weighted").
+            vector_score_weight (float): Weight of the vector ranking in weighted fusion, between 0 and 1.
+            rrf_k (int): Rank constant for reciprocal rank fusion.
+            candidate_multiplier (int): Each ranking fetches `limit * candidate_multiplier` candidates.
+            use_native_keyword_search (bool): Use the vector db's keyword search when available.
+            reranker (Optional[Reranker]): Reranker applied once to the fused results.
+        """
+        if not 0 <= vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+
+        self.vector_db: VectorDb = vector_db
+        self.search_type: SearchType = search_type
+        self.fusion: Literal["rrf", "weighted"] = fusion
+        self.vector_score_weight: float = vector_score_weight
+        self.rrf_k: int = rrf_k
+        self.candidate_multiplier: int = max(candidate_multiplier, 1)
+        self.use_native_keyword_search: bool = use_native_keyword_search
+        self.reranker: Optional[Reranker] = reranker
+
+        # Local keyword index, used when the vector db has no native keyword search
+        self.keyword_index: BM25Index = BM25Index()
+        self._keyword_documents: Dict[str, Document] = {}
+        self._lock = RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # -*- Local keyword index
+    def _index_documents(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            for document in documents:
+                content_hash = safe_content_hash(document.content)
+                meta_data = dict(document.meta_data or {})
+                if filters:
+                    meta_data.update(filters)
+                self._keyword_documents[content_hash] = Document(
+                    id=document.id, name=document.name, content=document.content, meta_data=meta_data
+                )
+                self.keyword_index.add(content_hash, document.content)
+
+    def _clear_keyword_index(self) -> None:
+        with self._lock:
+            self.keyword_index.clear()
+            self._keyword_documents = {}
+
+    def load_keyword_index(self, documents: List[Document]) -> None:
+        """Add documents that are already in the vector db to the local keyword index."""
+        self._index_documents(documents)
+
+    # -*- Delegated collection management
+    def create(self) -> None:
+        self.vector_db.create()
+
+    async def async_create(self) -> None:
+        await self.vector_db.async_create()
+
+    def doc_exists(self, document: Document) -> bool:
+        exists = self.vector_db.doc_exists(document)
+        if exists:
+            # Existing documents are skipped on insert, index them here so keyword search can find them
+            self._index_documents([document])
+        return exists
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        exists = await self.vector_db.async_doc_exists(document)
+        if exists:
+            self._index_documents([document])
+        return exists
+
+    def name_exists(self, name: str) -> bool:
+        return self.vector_db.name_exists(name)
+
+    async def async_name_exists(self, name: str) -> bool:  # type: ignore
+        return await self.vector_db.async_name_exists(name)  # type: ignore
+
+    def id_exists(self, id: str) -> bool:
+        return self.vector_db.id_exists(id)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.vector_db.insert(documents, filters)
+        self._index_documents(documents, filters)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.vector_db.async_insert(documents, filters)
+        self._index_documents(documents, filters)
+
+    def upsert_available(self) -> bool:
+        return self.vector_db.upsert_available()
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.vector_db.upsert(documents, filters)
+        self._index_documents(documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.vector_db.async_upsert(documents, filters)
+        self._index_documents(documents, filters)
+
+    def drop(self) -> None:
+        self.vector_db.drop()
+        self._clear_keyword_index()
+
+    async def async_drop(self) -> None:
+        await self.vector_db.async_drop()
+        self._clear_keyword_index()
+
+    def exists(self) -> bool:
+        return self.vector_db.exists()
+
+    async def async_exists(self) -> bool:
+        return await self.vector_db.async_exists()
+
+    def optimize(self) -> None:
+        self.vector_db.optimize()
+
+    def delete(self) -> bool:
+        deleted = self.vector_db.delete()
+        if deleted:
+            self._clear_keyword_index()
+        return deleted
+
+    # -*- Search
+    def _uses_native_keyword_search(self, filters: Optional[Dict[str, Any]]) -> bool:
+        if not self.use_native_keyword_search or not _implements(self.vector_db, "keyword_search"):
+            return False
+        return not filters or _accepts_filters(self.vector_db.keyword_search)
+
+    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a vector similarity search on the wrapped vector db.
+
+        Uses the native `vector_search` when available (and it supports the requested filters), otherwise `search`.
+        """
+        if _implements(self.vector_db, "vector_search"):
+            if _accepts_filters(self.vector_db.vector_search):
+                return self.vector_db.vector_search(query=query, limit=limit, filters=filters)  # type: ignore
+            if not filters:
+                return self.vector_db.vector_search(query=query, limit=limit)
+        return self.vector_db.search(query=query, limit=limit, filters=filters)
+
+    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Perform a keyword search, natively or on the local BM25 index."""
+        if self._uses_native_keyword_search(filters):
+            if filters:
+                return self.vector_db.keyword_search(query=query, limit=limit, filters=filters)  # type: ignore
+            return self.vector_db.keyword_search(query=query, limit=limit)
+
+        with self._lock:
+            candidates = None
+            if filters:
+                candidates = {
+                    content_hash
+                    for content_hash, document in self._keyword_documents.items()
+                    if _matches_filters(document.meta_data, filters)
+                }
+            results = self.keyword_index.search(query, limit=limit, candidates=candidates)
+            return [self._keyword_documents[content_hash] for content_hash, _ in results]  # type: ignore
+
+    def _fuse(self, vector_results: List[Document], keyword_results: List[Document], limit: int) -> List[Document]:
+        weights = None
+        if self.fusion == "weighted":
+            weights = [self.vector_score_weight, 1 - self.vector_score_weight]
+        return reciprocal_rank_fusion(
+            [vector_results, keyword_results], k=self.rrf_k, weights=weights, key=document_key, limit=limit
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agno-hybrid")
+        return self._executor
+
+    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Run the vector and keyword searches concurrently and fuse the results.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to both searches.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        num_candidates = limit * self.candidate_multiplier
+        executor = self._get_executor()
+        vector_future = executor.submit(self.vector_search, query, num_candidates, filters)
+        keyword_future = executor.submit(self.keyword_search, query, num_candidates, filters)
+
+        vector_results: List[Document] = []
+        keyword_results: List[Document] = []
+        try:
+            vector_results = vector_future.result()
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+        try:
+            keyword_results = keyword_future.result()
+        except Exception as e:
+            logger.error(f"Error during keyword search: {e}")
+
+        log_debug(f"Fusing {len(vector_results)} vector and {len(keyword_results)} keyword results")
+        return self._fuse(vector_results, keyword_results, limit)
+
+    async def async_hybrid_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Run the vector and keyword searches concurrently in threads and fuse the results."""
+        num_candidates = limit * self.candidate_multiplier
+        vector_results, keyword_results = await asyncio.gather(
+            asyncio.to_thread(self.vector_search, query, num_candidates, filters),
+            asyncio.to_thread(self.keyword_search, query, num_candidates, filters),
+            return_exceptions=True,
+        )
+        if isinstance(vector_results, BaseException):
+            logger.error(f"Error during vector search: {vector_results}")
+            vector_results = []
+        if isinstance(keyword_results, BaseException):
+            logger.error(f"Error during keyword search: {keyword_results}")
+            keyword_results = []
+        return self._fuse(vector_results, keyword_results, limit)  # type: ignore
+
+    def _rerank(self, query: str, search_results: List[Document]) -> List[Document]:
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a search based on the configured search type.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if self.search_type == SearchType.vector:
+            search_results = self.vector_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.keyword:
+            search_results = self.keyword_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.hybrid:
+            search_results = self.hybrid_search(query=query, limit=limit, filters=filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+        return self._rerank(query, search_results)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        if self.search_type == SearchType.hybrid:
+            search_results = await self.async_hybrid_search(query=query, limit=limit, filters=filters)
+            return await asyncio.to_thread(self._rerank, query, search_results)
+        return await asyncio.to_thread(self.search, query, limit, filters)
@@ -0,0 +1,9 @@
+from agno.vectordb.distance import Distance
+from agno.vectordb.inmemory.inmemory import InMemoryVectorDb
+from agno.vectordb.search import SearchType
+
+__all__ = [
+    "Distance",
+    "InMemoryVectorDb",
+    "SearchType",
+]
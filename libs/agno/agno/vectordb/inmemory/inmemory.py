@@ -0,0 +1,625 @@
+import asyncio
+import atexit
+import json
+import os
+import weakref
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, cast
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, log_warning, logger
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.bm25 import BM25Index
+from agno.vectordb.distance import Distance
+from agno.vectordb.fusion import reciprocal_rank_fusion
+from agno.vectordb.search import SearchType
+
+# Collections with writes that have not been saved yet, saved when the interpreter exits
+_unsaved_collections: "weakref.WeakSet[InMemoryVectorDb]" = weakref.WeakSet()
+
+
+@atexit.register
+def _save_unsaved_collections() -> None:
+    for vector_db in list(_unsaved_collections):
+        try:
+            vector_db.flush()
+        except Exception as e:
+            logger.error(f"Error saving collection '{vector_db.collection}': {e}")
+
+
+class InMemoryVectorDb(VectorDb):
+    """
+    In-process vector database backed by numpy.
+
+    Embeddings are stored in a contiguous float32 matrix and searched with a single matrix product
+    followed by an `argpartition` top-k. Keyword search uses a BM25 inverted index and metadata filters
+    are resolved through inverted indexes before scoring, so only matching rows are searched.
+
+    If `path` is provided, the collection is persisted to `<path>/<collection>.npy` (embeddings) and
+    `<path>/<collection>.json` (documents). The embeddings file is memory-mapped when loaded with `mmap=True`.
+    Writes are saved every `save_batch_size` documents and on `flush()` or `close()`; unsaved writes are also
+    saved when the interpreter exits.
+    """
+
+    def __init__(
+        self,
+        collection: str = "documents",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        search_type: SearchType = SearchType.vector,
+        path: Optional[str] = None,
+        mmap: bool = True,
+        rrf_k: int = 60,
+        reranker: Optional[Reranker] = None,
+        initial_capacity: int = 1024,
+        save_batch_size: int = 1000,
+    ):
+        """
+        Initialize the InMemoryVectorDb instance.
+
+        Args:
+            collection (str): Name of the collection.
+            embedder (Optional[Embedder]): Embedder instance for creating embeddings.
+            distance (Distance): Distance metric for vector comparisons.
+            search_type (SearchType): Type of search to perform.
+            path (Optional[str]): Directory to persist the collection to. Not persisted if None.
+            mmap (bool): Memory-map the persisted embeddings when loading.
+            rrf_k (int): Rank constant for reciprocal rank fusion in hybrid search.
+            reranker (Optional[Reranker]): Reranker to apply to search results.
+            initial_capacity (int): Initial number of rows allocated in the embedding matrix.
+            save_batch_size (int): Number of written documents after which the collection is saved to `path`.
+                If 0, the collection is only saved on `flush()` or `close()`.
+        """
+        if not collection:
+            raise ValueError("Collection name must be provided.")
+
+        self.collection: str = collection
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+
+        self.distance: Distance = distance
+        self.search_type: SearchType = search_type
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.mmap: bool = mmap
+        self.rrf_k: int = rrf_k
+        self.reranker: Optional[Reranker] = reranker
+        self.initial_capacity: int = max(initial_capacity, 1)
+        self.save_batch_size: int = save_batch_size
+
+        self._lock = RLock()
+        self._created: bool = False
+        # Embedding matrix, only the first self._size rows are in use
+        self._embeddings: Optional[np.ndarray] = None
+        # Squared L2 norm of each embedding
+        self._norms_squared: Optional[np.ndarray] = None
+        self._size: int = 0
+        # Number of documents written since the collection was last saved
+        self._unsaved_rows: int = 0
+        # Row data
+        self._documents: List[Dict[str, Any]] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._content_hashes: Dict[str, int] = {}
+        self._name_counts: Dict[str, int] = {}
+        # Inverted indexes: metadata key -> value -> rows
+        self._metadata_index: Dict[str, Dict[Hashable, Set[int]]] = {}
+        # Keyword index over the document contents
+        self._keyword_index: BM25Index = BM25Index()
+
+    # -*- Collection management
+    @property
+    def embeddings_file(self) -> Optional[Path]:
+        return self.path / f"{self.collection}.npy" if self.path is not None else None
+
+    @property
+    def documents_file(self) -> Optional[Path]:
+        return self.path / f"{self.collection}.json" if self.path is not None else None
+
+    def _persisted(self) -> bool:
+        return self.documents_file is not None and self.documents_file.exists()
+
+    def create(self) -> None:
+        """Create the collection, loading it from `path` if it was persisted."""
+        with self._lock:
+            if self._created:
+                return
+            self._reset()
+            if self._persisted():
+                self._load()
+            self._created = True
+            log_debug(f"Created in-memory collection: {self.collection}")
+
+    async def async_create(self) -> None:
+        """Create the collection asynchronously by running in a thread."""
+        await asyncio.to_thread(self.create)
+
+    def exists(self) -> bool:
+        return self._created or self._persisted()
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def drop(self) -> None:
+        """Delete the collection and its persisted files."""
+        with self._lock:
+            self._reset()
+            self._created = False
+            self._unsaved_rows = 0
+            _unsaved_collections.discard(self)
+            for file in (self.embeddings_file, self.documents_file):
+                if file is not None and file.exists():
+                    file.unlink()
+            log_debug(f"Dropped in-memory collection: {self.collection}")
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def delete(self) -> bool:
+        """Remove all documents from the collection."""
+        with self._lock:
+            self._reset()
+            self._created = True
+            if self.path is not None:
+                self.save()
+        return True
+
+    def optimize(self) -> None:
+        """Shrink the embedding matrix to the number of stored documents."""
+        with self._lock:
+            if self._embeddings is not None and len(self._embeddings) > self._size:
+                self._embeddings = np.array(self._embeddings[: max(self._size, 1)], dtype=np.float32)
+                self._norms_squared = np.array(self._norms_squared[: max(self._size, 1)], dtype=np.float32)  # type: ignore
+
+    def get_count(self) -> int:
+        self._ensure_created()
+        return self._size
+
+    def _reset(self) -> None:
+        self._embeddings = None
+        self._norms_squared = None
+        self._size = 0
+        self._documents = []
+        self._id_to_row = {}
+        self._content_hashes = {}
+        self._name_counts = {}
+        self._metadata_index = {}
+        self._keyword_index.clear()
+
+    def _ensure_created(self) -> None:
+        if not self._created:
+            self.create()
+
+    # -*- Persistence
+    def save(self) -> None:
+        """Persist the collection to `path`. Files are replaced atomically."""
+        if self.path is None or self.embeddings_file is None or self.documents_file is None:
+            raise ValueError("A path is required to save the collection.")
+
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            embeddings = (
+                self._embeddings[: self._size] if self._embeddings is not None else np.zeros((0, 0), dtype=np.float32)
+            )
+
+            tmp_embeddings_file = self.embeddings_file.with_suffix(".npy.tmp")
+            with open(tmp_embeddings_file, "wb") as f:
+                np.save(f, embeddings)
+            os.replace(tmp_embeddings_file, self.embeddings_file)
+
+            tmp_documents_file = self.documents_file.with_suffix(".json.tmp")
+            with open(tmp_documents_file, "w", encoding="utf-8") as f:
+                json.dump(self._documents, f, default=str)
+            os.replace(tmp_documents_file, self.documents_file)
+            self._unsaved_rows = 0
+            _unsaved_collections.discard(self)
+            log_debug(f"Saved {self._size} documents to {self.path}")
+
+    def flush(self) -> None:
+        """Save the collection to `path` if it has unsaved writes."""
+        with self._lock:
+            if self.path is not None and self._unsaved_rows > 0:
+                self.save()
+
+    def close(self) -> None:
+        """Save any unsaved writes. The collection can still be used after closing."""
+        self.flush()
+
+    def _mark_unsaved(self, num_rows: int) -> None:
+        # Saving rewrites the whole collection, so writes are saved in batches instead of one by one
+        if self.path is None or num_rows == 0:
+            return
+        self._unsaved_rows += num_rows
+        if self.save_batch_size > 0 and self._unsaved_rows >= self.save_batch_size:
+            self.save()
+        else:
+            _unsaved_collections.add(self)
+
+    def _load(self) -> None:
+        if self.embeddings_file is None or self.documents_file is None:
+            return
+
+        with open(self.documents_file, encoding="utf-8") as f:
+            documents: List[Dict[str, Any]] = json.load(f)
+        embeddings = np.load(self.embeddings_file, mmap_mode="r" if self.mmap else None)
+
+        self._embeddings = embeddings if len(embeddings) > 0 else None
+        self._norms_squared = (
+            np.einsum("ij,ij->i", embeddings, embeddings).astype(np.float32) if len(embeddings) > 0 else None
+        )
+        self._size = len(documents)
+        self._documents = documents
+        for row, document in enumerate(documents):
+            self._index_row(row, document)
+        log_debug(f"Loaded {self._size} documents from {self.path}")
+
+    # -*- Indexing
+    @staticmethod
+    def _index_keys(value: Any) -> List[Hashable]:
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        keys: List[Hashable] = []
+        for v in values:
+            try:
+                hash(v)
+                keys.append(v)
+            except TypeError:
+                keys.append(json.dumps(v, sort_keys=True, default=str))
+        return keys
+
+    def _index_row(self, row: int, document: Dict[str, Any]) -> None:
+        self._id_to_row[document["id"]] = row
+        self._content_hashes[document["content_hash"]] = row
+        if document.get("name") is not None:
+            self._name_counts[document["name"]] = self._name_counts.get(document["name"], 0) + 1
+        for key, value in (document.get("meta_data") or {}).items():
+            values_index = self._metadata_index.setdefault(key, {})
+            for index_key in self._index_keys(value):
+                values_index.setdefault(index_key, set()).add(row)
+        self._keyword_index.add(row, document["content"])
+
+    def _unindex_row(self, row: int, document: Dict[str, Any]) -> None:
+        self._id_to_row.pop(document["id"], None)
+        if self._content_hashes.get(document["content_hash"]) == row:
+            del self._content_hashes[document["content_hash"]]
+        name = document.get("name")
+        if name is not None and name in self._name_counts:
+            self._name_counts[name] -= 1
+            if self._name_counts[name] <= 0:
+                del self._name_counts[name]
+        for key, value in (document.get("meta_data") or {}).items():
+            values_index = self._metadata_index.get(key, {})
+            for index_key in self._index_keys(value):
+                values_index.get(index_key, set()).discard(row)
+        self._keyword_index.remove(row)
+
+    def _ensure_capacity(self, dimensions: int, num_rows: int) -> None:
+        if self._embeddings is None:
+            capacity = max(self.initial_capacity, num_rows)
+            self._embeddings = np.zeros((capacity, dimensions), dtype=np.float32)
+            self._norms_squared = np.zeros(capacity, dtype=np.float32)
+            return
+
+        if self._embeddings.shape[1] != dimensions:
+            raise ValueError(
+                f"Embedding dimensions {dimensions} do not match the collection ({self._embeddings.shape[1]})"
+            )
+
+        if not self._embeddings.flags.writeable or len(self._embeddings) < num_rows:
+            # Grow geometrically (and copy memory-mapped data into memory before writing)
+            capacity = len(self._embeddings)
+            while capacity < num_rows:
+                capacity *= 2
+            embeddings = np.zeros((capacity, dimensions), dtype=np.float32)
+            embeddings[: self._size] = self._embeddings[: self._size]
+            norms_squared = np.zeros(capacity, dtype=np.float32)
+            norms_squared[: self._size] = self._norms_squared[: self._size]  # type: ignore
+            self._embeddings, self._norms_squared = embeddings, norms_squared
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]], replace: bool) -> None:
+        self._ensure_created()
+
+        records: List[Tuple[Dict[str, Any], List[float]]] = []
+        for document in documents:
+            try:
+                document.embed(embedder=self.embedder)
+            except Exception as e:
+                logger.error(f"Error embedding document '{document.name}': {e}")
+                continue
+            if document.embedding is None:
+                logger.error(f"No embedding for document '{document.name}'")
+                continue
+
+            content_hash = safe_content_hash(document.content)
+            meta_data = dict(document.meta_data or {})
+            if filters:
+                meta_data.update(filters)
+            record: Dict[str, Any] = {
+                # Upserts use the content hash as a reproducible id to avoid duplicates
+                "id": content_hash if replace else (document.id or content_hash),
+                "name": document.name,
+                "meta_data": meta_data,
+                "content": document.content,
+                "usage": document.usage,
+                "content_hash": content_hash,
+            }
+            records.append((record, document.embedding))
+
+        if not records:
+            return
+
+        with self._lock:
+            dimensions = len(records[0][1])
+            self._ensure_capacity(dimensions, self._size + len(records))
+            num_written = 0
+            for record, embedding in records:
+                row = self._id_to_row.get(record["id"])
+                if row is not None:
+                    if not replace:
+                        log_warning(f"Skipping document '{record['name']}', id already exists: {record['id']}")
+                        continue
+                    self._unindex_row(row, self._documents[row])
+                    self._documents[row] = record
+                else:
+                    row = self._size
+                    self._documents.append(record)
+                    self._size += 1
+                vector = np.asarray(embedding, dtype=np.float32)
+                self._embeddings[row] = vector  # type: ignore
+                self._norms_squared[row] = float(vector @ vector)  # type: ignore
+                self._index_row(row, record)
+                num_written += 1
+
+            log_debug(f"{'Upserted' if replace else 'Inserted'} {num_written} documents")
+            self._mark_unsaved(num_written)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the collection. Documents with an id that already exists are skipped.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Metadata to add to the documents.
+        """
+        self._write(documents, filters, replace=False)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents asynchronously by running in a thread."""
+        await asyncio.to_thread(self.insert, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Upsert documents into the collection, using the content hash as the document id.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Metadata to add to the documents.
+        """
+        self._write(documents, filters, replace=True)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Upsert documents asynchronously by running in a thread."""
+        await asyncio.to_thread(self.upsert, documents, filters)
+
+    def doc_exists(self, document: Document) -> bool:
+        self._ensure_created()
+        return safe_content_hash(document.content) in self._content_hashes
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        self._ensure_created()
+        return name in self._name_counts
+
+    async def async_name_exists(self, name: str) -> bool:  # type: ignore
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._ensure_created()
+        return id in self._id_to_row
+
+    # -*- Search
+    def _filter_rows(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Resolve metadata filters to candidate rows. A list value matches any of its elements."""
+        if not filters:
+            return None
+
+        rows: Optional[Set[int]] = None
+        for key, value in filters.items():
+            values_index = self._metadata_index.get(key, {})
+            matches: Set[int] = set()
+            for index_key in self._index_keys(value):
+                matches |= values_index.get(index_key, set())
+            rows = matches if rows is None else rows & matches
+            if not rows:
+                break
+        return np.fromiter(sorted(rows or ()), dtype=np.int64)
+
+    def _scores(self, query_embeddings: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Similarity scores (higher is better) of each query against each candidate row."""
+        embeddings = self._embeddings[: self._size] if rows is None else self._embeddings[rows]  # type: ignore
+        norms_squared = self._norms_squared[: self._size] if rows is None else self._norms_squared[rows]  # type: ignore
+        dot_products = query_embeddings @ embeddings.T
+
+        if self.distance == Distance.cosine:
+            query_norms = np.linalg.norm(query_embeddings, axis=1, keepdims=True)
+            denominators = query_norms * np.sqrt(norms_squared)[np.newaxis, :]
+            return dot_products / np.maximum(denominators, np.finfo(np.float32).tiny)
+        elif self.distance == Distance.l2:
+            query_norms_squared = np.einsum("ij,ij->i", query_embeddings, query_embeddings)[:, np.newaxis]
+            return -(query_norms_squared - 2 * dot_products + norms_squared[np.newaxis, :])
+        return dot_products
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores per row, best first."""
+        if k >= scores.shape[1]:
+            return np.argsort(-scores, axis=1)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        return np.take_along_axis(top, order, axis=1)
+
+    def _get_document(self, row: int) -> Document:
+        record = self._documents[row]
+        return Document(
+            id=record["id"],
+            name=record.get("name"),
+            meta_data=dict(record.get("meta_data") or {}),
+            content=record["content"],
+            embedder=self.embedder,
+            embedding=self._embeddings[row].tolist(),  # type: ignore
+            usage=record.get("usage"),
+        )
+
+    def _vector_search_rows(
+        self, query_embeddings: List[List[float]], limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[List[int]]:
+        with self._lock:
+            if self._size == 0 or self._embeddings is None or limit <= 0:
+                return [[] for _ in query_embeddings]
+            rows = self._filter_rows(filters)
+            if rows is not None and len(rows) == 0:
+                return [[] for _ in query_embeddings]
+
+            scores = self._scores(np.asarray(query_embeddings, dtype=np.float32), rows)
+            top = self._top_k(scores, min(limit, scores.shape[1]))
+            if rows is not None:
+                top = rows[top]
+            return top.tolist()
+
+    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a vector similarity search.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata filters to apply before scoring.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        return self.vector_search_batch(queries=[query], limit=limit, filters=filters)[0]
+
+    def vector_search_batch(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Perform a vector similarity search for several queries with one matrix product.
+
+        Returns:
+            List[List[Document]]: Matching documents for each query, in the order of the queries.
+        """
+        self._ensure_created()
+        query_embeddings = []
+        for query in queries:
+            query_embedding = self.embedder.get_cached_embedding(query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return [[] for _ in queries]
+            query_embeddings.append(query_embedding)
+
+        results = self._vector_search_rows(query_embeddings, limit=limit, filters=filters)
+        with self._lock:
+            return [[self._get_document(row) for row in rows] for rows in results]
+
+    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a BM25 keyword search.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata filters to apply before scoring.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        self._ensure_created()
+        with self._lock:
+            rows = self._filter_rows(filters)
+            candidates = set(rows.tolist()) if rows is not None else None
+            results = self._keyword_index.search(query, limit=limit, candidates=candidates)
+            return [self._get_document(row) for row, _ in results]  # type: ignore
+
+    def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a hybrid search, fusing the vector and keyword rankings with reciprocal rank fusion.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata filters to apply before scoring.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        self._ensure_created()
+        query_embedding = self.embedder.get_cached_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        num_candidates = max(limit * 4, 20)
+        vector_rows = self._vector_search_rows([query_embedding], limit=num_candidates, filters=filters)[0]
+        with self._lock:
+            rows = self._filter_rows(filters)
+            candidates = set(rows.tolist()) if rows is not None else None
+            keyword_rows = [
+                cast(int, row)
+                for row, _ in self._keyword_index.search(query, limit=num_candidates, candidates=candidates)
+            ]
+
+            top_rows: List[int] = reciprocal_rank_fusion([vector_rows, keyword_rows], k=self.rrf_k, limit=limit)
+            return [self._get_document(row) for row in top_rows]
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a search based on the configured search type.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata filters to apply. A list value matches any of its elements.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        self._ensure_created()
+        if self.search_type == SearchType.vector:
+            search_results = self.vector_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.keyword:
+            search_results = self.keyword_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.hybrid:
+            search_results = self.hybrid_search(query=query, limit=limit, filters=filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Search asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.search, query, limit, filters)
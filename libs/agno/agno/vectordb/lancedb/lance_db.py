@@ -454,7 +454,7 @@ class LanceDb(VectorDb):
         return search_results
 
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return None
@@ -474,7 +474,7 @@ class LanceDb(VectorDb):
         return results.to_pandas()
 
     def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -533,7 +533,7 @@ class Milvus(VectorDb):
         if self.search_type == SearchType.hybrid:
             return self.hybrid_search(query, limit)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -570,7 +570,7 @@ class Milvus(VectorDb):
         if self.search_type == SearchType.hybrid:
             return self.hybrid_search(query, limit, filters)
 
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -616,7 +616,7 @@ class Milvus(VectorDb):
         from pymilvus import AnnSearchRequest, RRFRanker
 
         # Get query embeddings
-        dense_vector = self.embedder.get_embedding(query)
+        dense_vector = self.embedder.get_cached_embedding(query)
         sparse_vector = self._get_sparse_vector(query)
 
         if dense_vector is None:
@@ -1,14 +1,15 @@
 import asyncio
+import weakref
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import URL, Engine, Row, create_engine, make_url
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
+    from sqlalchemy.sql.expression import Select, TextClause, bindparam, desc, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
@@ -18,16 +19,33 @@ try:
 except ImportError:
     raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 from agno.document import Document
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
-from agno.utils.log import log_debug, log_info, logger
+from agno.utils.log import log_debug, log_info, log_warning, logger
 from agno.utils.string import safe_content_hash
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
 from agno.vectordb.search import SearchType
 
+# Drivers that SQLAlchemy can use with an async engine
+ASYNC_DRIVERS = {"psycopg", "psycopg_async", "asyncpg"}
+
+
+def _get_async_db_url(db_url: Union[str, URL]) -> URL:
+    """
+    Returns the URL for the async engine of a database. Sync only drivers (psycopg2, pg8000, ...) are replaced by
+    psycopg 3, which supports both.
+    """
+    url = make_url(db_url)
+    if url.get_driver_name() in ASYNC_DRIVERS:
+        return url
+    return url.set(drivername="postgresql+psycopg")
+
 
 class PgVector(VectorDb):
     """
@@ -53,6 +71,9 @@ class PgVector(VectorDb):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
+        include_embeddings: bool = False,
     ):
         """
         Initialize the PgVector instance.
@@ -71,6 +92,13 @@ class PgVector(VectorDb):
             content_language (str): Language for full-text search.
             schema_version (int): Version of the database schema.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
+            reranker (Optional[Reranker]): Reranker for the results of vector search.
+            async_db_url (Optional[str]): Database connection URL for async methods, e.g. with the asyncpg driver.
+                Defaults to db_url with an async driver.
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async database engine used by async methods. It is
+                used on every event loop, so use a NullPool if the async methods run in more than one event loop.
+            include_embeddings (bool): Fetch the embeddings of search results. Off by default, as search results
+                are only used for their content.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -127,8 +155,19 @@ class PgVector(VectorDb):
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
 
+        # Fetch the embeddings of search results
+        self.include_embeddings: bool = include_embeddings
+
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database engine and session, created on first use by the async methods
+        self.async_db_url: Optional[str] = async_db_url
+        self.async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self.AsyncSession: Optional["async_sessionmaker[AsyncSession]"] = None
+        self._async_unavailable: bool = False
+        # Event loop the async engine was created on. Pooled connections belong to it, so the engine is
+        # replaced when async methods run on another loop (eg: each asyncio.run() of a script).
+        self._async_engine_loop: Optional["weakref.ref[asyncio.AbstractEventLoop]"] = None
         # Database table
         self.table: Table = self.get_table()
         log_debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
@@ -177,6 +216,55 @@ class PgVector(VectorDb):
         else:
             raise NotImplementedError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_async_session(self) -> Optional["async_sessionmaker[AsyncSession]"]:
+        """
+        Get the async session factory, creating the async engine on first use and again for each new event loop.
+
+        Returns:
+            Optional[async_sessionmaker]: The async session factory, or None if SQLAlchemy asyncio or an async
+                driver is not installed. Async methods then run the sync methods in a thread.
+        """
+        if self._async_unavailable:
+            return None
+
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if self.AsyncSession is not None:
+            if self._async_engine_loop is None or self._async_engine_loop() is loop:
+                return self.AsyncSession
+            # The connections of the engine belong to a previous event loop, drop them without closing them there
+            log_debug("Event loop changed, creating a new async engine for PgVector")
+            if self.async_db_engine is not None:
+                self.async_db_engine.sync_engine.dispose(close=False)
+            self.async_db_engine = None
+            self.AsyncSession = None
+            self._async_engine_loop = None
+
+        try:
+            # Required by SQLAlchemy asyncio, which only raises an ImportError without it on the first import
+            import greenlet  # noqa: F401
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+            if self.async_db_engine is None:
+                async_db_url = self.async_db_url or _get_async_db_url(self.db_url or self.db_engine.url)
+                self.async_db_engine = create_async_engine(async_db_url)
+                # Engines given by the user are kept for every loop
+                self._async_engine_loop = weakref.ref(loop) if loop is not None else None
+        except ImportError as e:
+            log_warning(
+                f"Async PostgreSQL driver not available, async methods will run in a thread: {e}. "
+                "Please install using `pip install 'sqlalchemy[asyncio]' psycopg` or `pip install asyncpg`"
+            )
+            self._async_unavailable = True
+            return None
+
+        self.AsyncSession = async_sessionmaker(bind=self.async_db_engine, expire_on_commit=False)
+        log_debug(f"Created async engine for PgVector with driver '{self.async_db_engine.url.get_driver_name()}'")
+        return self.AsyncSession
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -191,6 +279,26 @@ class PgVector(VectorDb):
             logger.error(f"Error checking if table exists: {e}")
             return False
 
+    async def async_table_exists(self) -> bool:
+        """
+        Check if the table exists in the database, using the async engine.
+
+        Returns:
+            bool: True if the table exists, False otherwise.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.table_exists)
+
+        log_debug(f"Checking if table '{self.table.fullname}' exists.")
+        try:
+            async with self.async_db_engine.connect() as conn:  # type: ignore
+                return await conn.run_sync(
+                    lambda sync_conn: inspect(sync_conn).has_table(self.table_name, schema=self.schema)
+                )
+        except Exception as e:
+            logger.error(f"Error checking if table exists: {e}")
+            return False
+
     def create(self) -> None:
         """
         Create the table if it does not exist.
@@ -206,8 +314,22 @@ class PgVector(VectorDb):
             self.table.create(self.db_engine)
 
     async def async_create(self) -> None:
-        """Create the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.create)
+        """
+        Create the table if it does not exist, using the async engine.
+        """
+        if self.get_async_session() is None:
+            await asyncio.to_thread(self.create)
+            return
+
+        if not await self.async_table_exists():
+            async with self.async_db_engine.begin() as conn:  # type: ignore
+                log_debug("Creating extension: vector")
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+                if self.schema is not None:
+                    log_debug(f"Creating schema: {self.schema}")
+                    await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+                log_debug(f"Creating table: {self.table_name}")
+                await conn.run_sync(self.table.create)
 
     def _record_exists(self, column, value) -> bool:
         """
@@ -229,6 +351,26 @@ class PgVector(VectorDb):
             logger.error(f"Error checking if record exists: {e}")
             return False
 
+    async def _async_record_exists(self, column, value) -> bool:
+        """
+        Check if a record with the given column value exists in the table, using the async engine.
+
+        Args:
+            column: The column to check.
+            value: The value to search for.
+
+        Returns:
+            bool: True if the record exists, False otherwise.
+        """
+        try:
+            async with self.AsyncSession() as sess, sess.begin():  # type: ignore
+                stmt = select(1).where(column == value).limit(1)
+                result = (await sess.execute(stmt)).first()
+                return result is not None
+        except Exception as e:
+            logger.error(f"Error checking if record exists: {e}")
+            return False
+
     def doc_exists(self, document: Document) -> bool:
         """
         Check if a document with the same content hash exists in the table.
@@ -243,8 +385,19 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.content_hash, content_hash)
 
     async def async_doc_exists(self, document: Document) -> bool:
-        """Check if document exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.doc_exists, document)
+        """
+        Check if a document with the same content hash exists in the table, using the async engine.
+
+        Args:
+            document (Document): The document to check.
+
+        Returns:
+            bool: True if the document exists, False otherwise.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.doc_exists, document)
+        content_hash = safe_content_hash(document.content)
+        return await self._async_record_exists(self.table.c.content_hash, content_hash)
 
     def name_exists(self, name: str) -> bool:
         """
@@ -259,8 +412,18 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.name, name)
 
     async def async_name_exists(self, name: str) -> bool:
-        """Check if name exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.name_exists, name)
+        """
+        Check if a document with the given name exists in the table, using the async engine.
+
+        Args:
+            name (str): The name to check.
+
+        Returns:
+            bool: True if a document with the name exists, False otherwise.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.name_exists, name)
+        return await self._async_record_exists(self.table.c.name, name)
 
     def id_exists(self, id: str) -> bool:
         """
@@ -286,6 +449,47 @@ class PgVector(VectorDb):
         """
         return content.replace("\x00", "\ufffd")
 
+    def _get_batch_records(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, id_from_content_hash: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Embed documents and prepare their records for insertion.
+
+        Args:
+            documents (List[Document]): List of documents to prepare.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            id_from_content_hash (bool): Use the content hash as id, instead of the document id.
+
+        Returns:
+            List[Dict[str, Any]]: The records of the documents that were embedded.
+        """
+        batch_records = []
+        for doc in documents:
+            try:
+                doc.embed(embedder=self.embedder)
+                cleaned_content = self._clean_content(doc.content)
+                content_hash = safe_content_hash(doc.content)
+                _id = content_hash if id_from_content_hash else (doc.id or content_hash)
+
+                meta_data = doc.meta_data or {}
+                if filters:
+                    meta_data.update(filters)
+
+                record = {
+                    "id": _id,
+                    "name": doc.name,
+                    "meta_data": doc.meta_data,
+                    "filters": filters,
+                    "content": cleaned_content,
+                    "embedding": doc.embedding,
+                    "usage": doc.usage,
+                    "content_hash": content_hash,
+                }
+                batch_records.append(record)
+            except Exception as e:
+                logger.error(f"Error processing document '{doc.name}': {e}")
+        return batch_records
+
     def insert(
         self,
         documents: List[Document],
@@ -307,31 +511,7 @@ class PgVector(VectorDb):
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
                         # Prepare documents for insertion
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = safe_content_hash(doc.content)
-                                _id = doc.id or content_hash
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": _id,
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        batch_records = self._get_batch_records(batch_docs, filters)
 
                         # Insert the batch of records
                         insert_stmt = postgresql.insert(self.table)
@@ -346,9 +526,45 @@ class PgVector(VectorDb):
             logger.error(f"Error inserting documents: {e}")
             raise
 
-    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+    async def async_insert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Insert documents into the database, using the async engine.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to insert in each batch.
+        """
+        if self.get_async_session() is None:
+            await asyncio.to_thread(self.insert, documents, filters, batch_size)
+            return
+
+        try:
+            async with self.AsyncSession() as sess:  # type: ignore
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        # Embedders are sync, embed the batch in a thread to not block the event loop
+                        batch_records = await asyncio.to_thread(self._get_batch_records, batch_docs, filters)
+
+                        # Insert the batch of records
+                        insert_stmt = postgresql.insert(self.table)
+                        await sess.execute(insert_stmt, batch_records)
+                        await sess.commit()  # Commit batch independently
+                        log_info(f"Inserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()  # Rollback the current batch if there's an error
+                        raise
+        except Exception as e:
+            logger.error(f"Error inserting documents: {e}")
+            raise
 
     def upsert_available(self) -> bool:
         """
@@ -359,6 +575,27 @@ class PgVector(VectorDb):
         """
         return True
 
+    def _get_upsert_statement(self, batch_records: List[Dict[str, Any]]):
+        """
+        Get the statement that upserts a batch of records, updating the records with the same id.
+
+        Args:
+            batch_records (List[Dict[str, Any]]): The records to upsert.
+        """
+        insert_stmt = postgresql.insert(self.table).values(batch_records)
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                "name": insert_stmt.excluded.name,
+                "meta_data": insert_stmt.excluded.meta_data,
+                "filters": insert_stmt.excluded.filters,
+                "content": insert_stmt.excluded.content,
+                "embedding": insert_stmt.excluded.embedding,
+                "usage": insert_stmt.excluded.usage,
+                "content_hash": insert_stmt.excluded.content_hash,
+            },
+        )
+
     def upsert(
         self,
         documents: List[Document],
@@ -379,47 +616,11 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
-                        # Prepare documents for upserting
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = safe_content_hash(doc.content)
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": content_hash,  # use content_hash as a reproducible id to avoid duplicates while upsert
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        # Prepare documents for upserting, using content_hash as a reproducible id to avoid duplicates
+                        batch_records = self._get_batch_records(batch_docs, filters, id_from_content_hash=True)
 
                         # Upsert the batch of records
-                        insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={
-                                "name": insert_stmt.excluded.name,
-                                "meta_data": insert_stmt.excluded.meta_data,
-                                "filters": insert_stmt.excluded.filters,
-                                "content": insert_stmt.excluded.content,
-                                "embedding": insert_stmt.excluded.embedding,
-                                "usage": insert_stmt.excluded.usage,
-                                "content_hash": insert_stmt.excluded.content_hash,
-                            },
-                        )
-                        sess.execute(upsert_stmt)
+                        sess.execute(self._get_upsert_statement(batch_records))
                         sess.commit()  # Commit batch independently
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
@@ -430,9 +631,46 @@ class PgVector(VectorDb):
             logger.error(f"Error upserting documents: {e}")
             raise
 
-    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+    async def async_upsert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Upsert (insert or update) documents in the database, using the async engine.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to upsert in each batch.
+        """
+        if self.get_async_session() is None:
+            await asyncio.to_thread(self.upsert, documents, filters, batch_size)
+            return
+
+        try:
+            async with self.AsyncSession() as sess:  # type: ignore
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        # Embedders are sync, embed the batch in a thread to not block the event loop
+                        batch_records = await asyncio.to_thread(
+                            self._get_batch_records, batch_docs, filters, id_from_content_hash=True
+                        )
+
+                        # Upsert the batch of records
+                        await sess.execute(self._get_upsert_statement(batch_records))
+                        await sess.commit()  # Commit batch independently
+                        log_info(f"Upserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()  # Rollback the current batch if there's an error
+                        raise
+        except Exception as e:
+            logger.error(f"Error upserting documents: {e}")
+            raise
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -459,10 +697,160 @@ class PgVector(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """
+        Perform a search based on the configured search type, using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if self.search_type == SearchType.vector:
+            return await self.async_vector_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.keyword:
+            return await self.async_keyword_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.hybrid:
+            return await self.async_hybrid_search(query=query, limit=limit, filters=filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+
+    def _get_search_columns(self, include_embeddings: Optional[bool] = None) -> List[Column]:
+        """
+        Get the columns selected by searches. The embedding column is the largest by far, so it is only selected
+        when the embeddings are requested.
+
+        Args:
+            include_embeddings (Optional[bool]): Select the embeddings, defaults to self.include_embeddings.
+
+        Returns:
+            List[Column]: The columns to select.
+        """
+        columns = [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.usage,
+        ]
+        if self.include_embeddings if include_embeddings is None else include_embeddings:
+            columns.append(self.table.c.embedding)
+        return columns
+
+    def _get_index_settings(self) -> Optional[TextClause]:
+        """
+        Get the statement that sets the search parameters of the vector index for the current transaction.
+
+        Returns:
+            Optional[TextClause]: The statement, or None if there is no vector index.
+        """
+        if isinstance(self.vector_index, Ivfflat):
+            return text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}")
+        elif isinstance(self.vector_index, HNSW):
+            return text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}")
+        return None
+
+    def _fetch(self, stmt: Select, use_vector_index: bool = True) -> Sequence[Row]:
+        """
+        Execute a search query and fetch the results.
+
+        Args:
+            stmt (Select): The search query.
+            use_vector_index (bool): Set the search parameters of the vector index.
+
+        Returns:
+            Sequence[Row]: The results.
+        """
+        with self.Session() as sess, sess.begin():
+            index_settings = self._get_index_settings() if use_vector_index else None
+            if index_settings is not None:
+                sess.execute(index_settings)
+            return sess.execute(stmt).fetchall()
+
+    async def _async_fetch(self, stmt: Select, use_vector_index: bool = True) -> Sequence[Row]:
+        """
+        Execute a search query and fetch the results, using the async engine.
+
+        Args:
+            stmt (Select): The search query.
+            use_vector_index (bool): Set the search parameters of the vector index.
+
+        Returns:
+            Sequence[Row]: The results.
+        """
+        async with self.AsyncSession() as sess, sess.begin():  # type: ignore
+            index_settings = self._get_index_settings() if use_vector_index else None
+            if index_settings is not None:
+                await sess.execute(index_settings)
+            return (await sess.execute(stmt)).fetchall()
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def _to_documents(self, results: Sequence[Row]) -> List[Document]:
+        """
+        Convert search results to Document objects.
+
+        Args:
+            results (Sequence[Row]): The search results.
+
+        Returns:
+            List[Document]: The documents, with their embedding if it was selected.
+        """
+        return [
+            Document(
+                id=result.id,
+                name=result.name,
+                meta_data=result.meta_data,
+                content=result.content,
+                embedder=self.embedder,
+                embedding=result._mapping.get("embedding"),
+                usage=result.usage,
+            )
+            for result in results
+        ]
+
+    def _get_vector_search_statement(
+        self,
+        query_embedding: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        include_embeddings: Optional[bool],
+    ) -> Optional[Select]:
+        """
+        Build the vector similarity search query.
+
+        Returns:
+            Optional[Select]: The query, or None if the distance metric is unknown.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns(include_embeddings))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results based on the distance metric
+        if self.distance == Distance.l2:
+            stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
+        elif self.distance == Distance.cosine:
+            stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+        elif self.distance == Distance.max_inner_product:
+            stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: Optional[bool] = None,
+    ) -> List[Document]:
         """
         Perform a vector similarity search.
 
@@ -470,60 +858,29 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (Optional[bool]): Fetch the embeddings of the results, defaults to
+                self.include_embeddings.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_cached_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_vector_search_statement(query_embedding, limit, filters, include_embeddings)
+            if stmt is None:
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
             # Log the query for debugging
             log_debug(f"Vector search query: {stmt}")
 
             # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
-                    results = sess.execute(stmt).fetchall()
+                results = self._fetch(stmt)
             except Exception as e:
                 logger.error(f"Error performing semantic search: {e}")
                 logger.error("Table might not exist, creating for future use")
@@ -531,19 +888,7 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._to_documents(results)
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -554,6 +899,64 @@ class PgVector(VectorDb):
             logger.error(f"Error during vector search: {e}")
             return []
 
+    async def async_vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: Optional[bool] = None,
+    ) -> List[Document]:
+        """
+        Perform a vector similarity search, using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (Optional[bool]): Fetch the embeddings of the results, defaults to
+                self.include_embeddings.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.vector_search, query, limit, filters, include_embeddings)
+
+        try:
+            # Get the embedding for the query string. Embedders are sync, so in a thread to not block the event loop
+            query_embedding = await asyncio.to_thread(self.embedder.get_cached_embedding, query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
+
+            stmt = self._get_vector_search_statement(query_embedding, limit, filters, include_embeddings)
+            if stmt is None:
+                return []
+
+            # Log the query for debugging
+            log_debug(f"Vector search query: {stmt}")
+
+            # Execute the query
+            try:
+                results = await self._async_fetch(stmt)
+            except Exception as e:
+                logger.error(f"Error performing semantic search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            # Process the results and convert to Document objects
+            search_results = self._to_documents(results)
+
+            if self.reranker:
+                search_results = await asyncio.to_thread(self.reranker.rerank, query=query, documents=search_results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return []
+
     def enable_prefix_matching(self, query: str) -> str:
         """
         Preprocess the query for prefix matching.
@@ -569,7 +972,48 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def _get_keyword_search_statement(
+        self,
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        include_embeddings: Optional[bool],
+    ) -> Select:
+        """
+        Build the keyword search query on the 'content' column.
+
+        Returns:
+            Select: The query.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns(include_embeddings))
+
+        # Build the text search vector
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+
+        # Apply filters if provided
+        if filters is not None:
+            # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order by the relevance rank
+        stmt = stmt.order_by(text_rank.desc())
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: Optional[bool] = None,
+    ) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
 
@@ -577,50 +1021,21 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (Optional[bool]): Fetch the embeddings of the results, defaults to
+                self.include_embeddings.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order by the relevance rank
-            stmt = stmt.order_by(text_rank.desc())
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            stmt = self._get_keyword_search_statement(query, limit, filters, include_embeddings)
 
             # Log the query for debugging
             log_debug(f"Keyword search query: {stmt}")
 
             # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    results = sess.execute(stmt).fetchall()
+                results = self._fetch(stmt, use_vector_index=False)
             except Exception as e:
                 logger.error(f"Error performing keyword search: {e}")
                 logger.error("Table might not exist, creating for future use")
@@ -628,19 +1043,7 @@ class PgVector(VectorDb):
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._to_documents(results)
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -648,11 +1051,126 @@ class PgVector(VectorDb):
             logger.error(f"Error during keyword search: {e}")
             return []
 
+    async def async_keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: Optional[bool] = None,
+    ) -> List[Document]:
+        """
+        Perform a keyword search on the 'content' column, using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (Optional[bool]): Fetch the embeddings of the results, defaults to
+                self.include_embeddings.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.keyword_search, query, limit, filters, include_embeddings)
+
+        try:
+            stmt = self._get_keyword_search_statement(query, limit, filters, include_embeddings)
+
+            # Log the query for debugging
+            log_debug(f"Keyword search query: {stmt}")
+
+            # Execute the query
+            try:
+                results = await self._async_fetch(stmt, use_vector_index=False)
+            except Exception as e:
+                logger.error(f"Error performing keyword search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            # Process the results and convert to Document objects
+            search_results = self._to_documents(results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during keyword search: {e}")
+            return []
+
+    def _get_hybrid_search_statement(
+        self,
+        query: str,
+        query_embedding: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        include_embeddings: Optional[bool],
+    ) -> Optional[Select]:
+        """
+        Build the hybrid search query, combining vector similarity and full-text search.
+
+        Returns:
+            Optional[Select]: The query, or None if the distance metric is unknown.
+        """
+        # Build the text search vector
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+
+        # Compute the vector similarity score
+        if self.distance == Distance.l2:
+            # For L2 distance, smaller distances are better
+            vector_distance = self.table.c.embedding.l2_distance(query_embedding)
+            # Invert and normalize the distance to get a similarity score between 0 and 1
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.cosine:
+            # For cosine distance, smaller distances are better
+            vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.max_inner_product:
+            # For inner product, higher values are better
+            # Assume embeddings are normalized, so inner product ranges from -1 to 1
+            raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
+            # Normalize to range [0, 1]
+            vector_score = (raw_vector_score + 1) / 2
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Apply weights to control the influence of each score
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        # Combine the scores into a hybrid score
+        hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+
+        # Build the base statement, including the hybrid score
+        stmt = select(*self._get_search_columns(include_embeddings), hybrid_score.label("hybrid_score"))
+
+        # Add the full-text search condition
+        # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results by the hybrid score in descending order
+        stmt = stmt.order_by(desc("hybrid_score"))
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
     def hybrid_search(
         self,
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: Optional[bool] = None,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector similarity and full-text search.
@@ -661,110 +1179,88 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (Optional[bool]): Fetch the embeddings of the results, defaults to
+                self.include_embeddings.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_cached_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_hybrid_search_statement(query, query_embedding, limit, filters, include_embeddings)
+            if stmt is None:
+                return []
+
+            # Log the query for debugging
+            log_debug(f"Hybrid search query: {stmt}")
+
+            # Execute the query
+            try:
+                results = self._fetch(stmt)
+            except Exception as e:
+                logger.error(f"Error performing hybrid search: {e}")
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+            # Process the results and convert to Document objects
+            search_results = self._to_documents(results)
 
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during hybrid search: {e}")
+            return []
 
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
+    async def async_hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        include_embeddings: Optional[bool] = None,
+    ) -> List[Document]:
+        """
+        Perform a hybrid search combining vector similarity and full-text search, using the async engine.
 
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            include_embeddings (Optional[bool]): Fetch the embeddings of the results, defaults to
+                self.include_embeddings.
 
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.hybrid_search, query, limit, filters, include_embeddings)
 
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
+        try:
+            # Get the embedding for the query string. Embedders are sync, so in a thread to not block the event loop
+            query_embedding = await asyncio.to_thread(self.embedder.get_cached_embedding, query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            stmt = self._get_hybrid_search_statement(query, query_embedding, limit, filters, include_embeddings)
+            if stmt is None:
+                return []
 
             # Log the query for debugging
             log_debug(f"Hybrid search query: {stmt}")
 
             # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
-                    results = sess.execute(stmt).fetchall()
+                results = await self._async_fetch(stmt)
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._to_documents(results)
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -788,8 +1284,24 @@ class PgVector(VectorDb):
             log_info(f"Table '{self.table.fullname}' does not exist.")
 
     async def async_drop(self) -> None:
-        """Drop the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.drop)
+        """
+        Drop the table from the database, using the async engine.
+        """
+        if self.get_async_session() is None:
+            await asyncio.to_thread(self.drop)
+            return
+
+        if await self.async_table_exists():
+            try:
+                log_debug(f"Dropping table '{self.table.fullname}'.")
+                async with self.async_db_engine.begin() as conn:  # type: ignore
+                    await conn.run_sync(self.table.drop)
+                log_info(f"Table '{self.table.fullname}' dropped successfully.")
+            except Exception as e:
+                logger.error(f"Error dropping table '{self.table.fullname}': {e}")
+                raise
+        else:
+            log_info(f"Table '{self.table.fullname}' does not exist.")
 
     def exists(self) -> bool:
         """
@@ -801,8 +1313,13 @@ class PgVector(VectorDb):
         return self.table_exists()
 
     async def async_exists(self) -> bool:
-        """Check if table exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.exists)
+        """
+        Check if the table exists in the database, using the async engine.
+
+        Returns:
+            bool: True if the table exists, False otherwise.
+        """
+        return await self.async_table_exists()
 
     def get_count(self) -> int:
         """
@@ -1059,8 +1576,8 @@ class PgVector(VectorDb):
         for k, v in self.__dict__.items():
             if k in {"metadata", "table"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session", "embedder"}:
+            # Reuse the engines and sessions without copying
+            elif k in {"db_engine", "Session", "async_db_engine", "AsyncSession", "_async_engine_loop", "embedder"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
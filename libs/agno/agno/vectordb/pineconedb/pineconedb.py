@@ -401,7 +401,7 @@ class PineconeDb(VectorDb):
             List[Document]: The list of matching documents.
 
         """
-        dense_embedding = self.embedder.get_embedding(query)
+        dense_embedding = self.embedder.get_cached_embedding(query)
 
         if self.use_hybrid_search:
             sparse_embedding = self.sparse_encoder.encode_queries(query)
@@ -265,7 +265,7 @@ class SingleStore(VectorDb):
         Returns:
             List[Document]: List of documents that match the query.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
@@ -258,7 +258,7 @@ class SurrealDb(VectorDb):
             A list of documents that are similar to the query.
 
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             log_error(f"Error getting embedding for Query: {query}")
             return []
@@ -432,7 +432,7 @@ class SurrealDb(VectorDb):
             A list of documents that are similar to the query.
 
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             log_error(f"Error getting embedding for Query: {query}")
             return []
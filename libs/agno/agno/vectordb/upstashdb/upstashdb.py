@@ -258,7 +258,7 @@ class UpstashVectorDb(VectorDb):
         # filter_str = "" if filters is None else str(filters)
 
         if not self.use_upstash_embeddings and self.embedder is not None:
-            dense_embedding = self.embedder.get_embedding(query)
+            dense_embedding = self.embedder.get_cached_embedding(query)
 
             if dense_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
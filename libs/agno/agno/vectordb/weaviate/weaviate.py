@@ -432,7 +432,7 @@ class Weaviate(VectorDb):
 
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_cached_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -477,7 +477,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
@@ -584,7 +584,7 @@ class Weaviate(VectorDb):
 
     def hybrid_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         try:
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self.embedder.get_cached_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for query: {query}")
                 return []
@@ -632,7 +632,7 @@ class Weaviate(VectorDb):
         Returns:
             List[Document]: List of matching documents.
         """
-        query_embedding = self.embedder.get_embedding(query)
+        query_embedding = self.embedder.get_cached_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for query: {query}")
             return []
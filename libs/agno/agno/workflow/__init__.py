@@ -1,10 +1,31 @@
-from agno.run.workflow import (
-    RunEvent,
-    WorkflowCompletedEvent,
-    WorkflowRunResponseEvent,
-    WorkflowRunResponseStartedEvent,
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.run.response import RunResponse
+    from agno.run.workflow import (
+        RunEvent,
+        WorkflowCompletedEvent,
+        WorkflowRunResponseEvent,
+        WorkflowRunResponseStartedEvent,
+    )
+    from agno.storage.session.workflow import WorkflowSession
+    from agno.workflow.workflow import Workflow
+
+# Exports are imported on first access, so importing agno.workflow.v2 does not load the legacy Workflow
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RunEvent": "agno.run.workflow",
+        "RunResponse": "agno.run.response",
+        "Workflow": "agno.workflow.workflow",
+        "WorkflowSession": "agno.storage.session.workflow",
+        "WorkflowRunResponseEvent": "agno.run.workflow",
+        "WorkflowRunResponseStartedEvent": "agno.run.workflow",
+        "WorkflowCompletedEvent": "agno.run.workflow",
+    },
 )
-from agno.workflow.workflow import RunResponse, Workflow, WorkflowSession
 
 __all__ = [
     "RunEvent",
@@ -1,11 +1,49 @@
-from agno.workflow.v2.condition import Condition
-from agno.workflow.v2.loop import Loop
-from agno.workflow.v2.parallel import Parallel
-from agno.workflow.v2.router import Router
-from agno.workflow.v2.step import Step
-from agno.workflow.v2.steps import Steps
-from agno.workflow.v2.types import StepInput, StepOutput, WorkflowExecutionInput
-from agno.workflow.v2.workflow import Workflow
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.workflow.v2.background import (
+        BackgroundWorkflowExecutor,
+        InMemoryWorkflowRunStore,
+        SqliteWorkflowRunStore,
+        WorkflowRunRecord,
+        WorkflowRunStore,
+    )
+    from agno.workflow.v2.cache import InMemoryStepCache, SqliteStepCache, StepCache
+    from agno.workflow.v2.condition import Condition
+    from agno.workflow.v2.loop import Loop
+    from agno.workflow.v2.parallel import Parallel
+    from agno.workflow.v2.router import Router
+    from agno.workflow.v2.step import Step
+    from agno.workflow.v2.steps import Steps
+    from agno.workflow.v2.types import StepInput, StepOutput, WorkflowExecutionInput
+    from agno.workflow.v2.workflow import Workflow
+
+# Exports are imported on first access, so using one part of workflows does not load the others
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BackgroundWorkflowExecutor": "agno.workflow.v2.background",
+        "InMemoryWorkflowRunStore": "agno.workflow.v2.background",
+        "SqliteWorkflowRunStore": "agno.workflow.v2.background",
+        "WorkflowRunRecord": "agno.workflow.v2.background",
+        "WorkflowRunStore": "agno.workflow.v2.background",
+        "InMemoryStepCache": "agno.workflow.v2.cache",
+        "SqliteStepCache": "agno.workflow.v2.cache",
+        "StepCache": "agno.workflow.v2.cache",
+        "Condition": "agno.workflow.v2.condition",
+        "Loop": "agno.workflow.v2.loop",
+        "Parallel": "agno.workflow.v2.parallel",
+        "Router": "agno.workflow.v2.router",
+        "Step": "agno.workflow.v2.step",
+        "Steps": "agno.workflow.v2.steps",
+        "StepInput": "agno.workflow.v2.types",
+        "StepOutput": "agno.workflow.v2.types",
+        "WorkflowExecutionInput": "agno.workflow.v2.types",
+        "Workflow": "agno.workflow.v2.workflow",
+    },
+)
 
 __all__ = [
     "Workflow",
@@ -18,4 +56,12 @@ __all__ = [
     "WorkflowExecutionInput",
     "StepInput",
     "StepOutput",
+    "BackgroundWorkflowExecutor",
+    "WorkflowRunRecord",
+    "WorkflowRunStore",
+    "InMemoryWorkflowRunStore",
+    "SqliteWorkflowRunStore",
+    "StepCache",
+    "InMemoryStepCache",
+    "SqliteStepCache",
 ]
@@ -0,0 +1,683 @@
+import asyncio
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import RLock
+from typing import TYPE_CHECKING, Any, AsyncIterator, ContextManager, Dict, Iterator, List, Optional, Sequence, Set
+from uuid import uuid4
+
+from agno.media import Audio, Image, Video
+from agno.run.base import RunStatus
+from agno.run.v2.workflow import BaseWorkflowRunResponseEvent, WorkflowRunResponse
+from agno.utils.common import to_json_value
+from agno.utils.log import log_debug, log_warning, logger
+from agno.workflow.v2.types import WorkflowExecutionInput
+
+if TYPE_CHECKING:
+    from agno.workflow.v2.workflow import Workflow
+
+FINISHED_STATUSES = (RunStatus.completed.value, RunStatus.cancelled.value, RunStatus.error.value)
+
+
+@dataclass
+class WorkflowRunRecord:
+    """Status of one background workflow run, stored as a single row"""
+
+    run_id: str
+    workflow_id: str
+    session_id: Optional[str] = None
+    user_id: Optional[str] = None
+    status: str = RunStatus.pending.value
+    # The message, additional data and keyword arguments the run was submitted with
+    input: Dict[str, Any] = field(default_factory=dict)
+    # Last workflow event of the run, eg: {"event": "StepStarted", "step_name": "research", "step_index": 0}
+    progress: Optional[Dict[str, Any]] = None
+    # The WorkflowRunResponse as a dict, once the run is finished
+    response: Optional[Dict[str, Any]] = None
+    # Worker executing the run and when its lease expires. Runs with an expired lease are claimed again.
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    attempts: int = 0
+    cancel_requested: bool = False
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    # Incremented on every change, used to detect updates
+    version: int = 0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowRunRecord":
+        return cls(**data)
+
+    def to_run_response(self) -> WorkflowRunResponse:
+        if self.response is not None:
+            response = WorkflowRunResponse.from_dict(json.loads(json.dumps(self.response, default=str)))
+            response.status = RunStatus(self.status)
+            return response
+        return WorkflowRunResponse(
+            run_id=self.run_id,
+            session_id=self.session_id,
+            workflow_id=self.workflow_id,
+            created_at=int(self.created_at),
+            status=RunStatus(self.status),
+        )
+
+
+class WorkflowRunStore(ABC):
+    """
+    Base class for background workflow run stores, with one record per run.
+
+    Subclasses implement `_transaction()`, which must be exclusive across every worker using the store, and
+    row-level reads and writes. Claims, lease renewals and updates are done inside a transaction.
+    Store methods may block, so the executor calls them from a worker thread.
+    """
+
+    @abstractmethod
+    def _transaction(self) -> ContextManager[None]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _read(self, run_id: str) -> Optional[WorkflowRunRecord]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write(self, record: WorkflowRunRecord) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _claimable(self, now: float, workflow_ids: Optional[Sequence[str]]) -> List[WorkflowRunRecord]:
+        """Pending runs and runs with an expired lease, oldest first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_runs(
+        self,
+        workflow_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[WorkflowRunRecord]:
+        raise NotImplementedError
+
+    def _save(self, record: WorkflowRunRecord, changed: bool = True) -> None:
+        record.updated_at = time.time()
+        if changed:
+            record.version += 1
+        self._write(record)
+
+    def create(self, record: WorkflowRunRecord) -> None:
+        with self._transaction():
+            self._write(record)
+
+    def get(self, run_id: str) -> Optional[WorkflowRunRecord]:
+        with self._transaction():
+            return self._read(run_id)
+
+    def update(self, run_id: str, owner: Optional[str] = None, **fields: Any) -> Optional[WorkflowRunRecord]:
+        """
+        Update fields of a run. With `owner`, the run is only updated if that worker still holds it, so a worker
+        whose lease expired cannot overwrite the run after another worker claimed it.
+        """
+        with self._transaction():
+            record = self._read(run_id)
+            if record is None or (owner is not None and record.worker_id != owner):
+                return None
+            for key, value in fields.items():
+                setattr(record, key, value)
+            self._save(record)
+            return record
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        workflow_ids: Optional[Sequence[str]] = None,
+        max_attempts: int = 3,
+    ) -> Optional[WorkflowRunRecord]:
+        """Atomically claim the oldest runnable run for `worker_id`. Returns None if there is nothing to run."""
+        now = time.time()
+        with self._transaction():
+            for record in self._claimable(now, workflow_ids):
+                if record.cancel_requested:
+                    record.status = RunStatus.cancelled.value
+                elif record.attempts >= max_attempts:
+                    log_warning(f"Workflow run {record.run_id} abandoned after {record.attempts} attempts")
+                    record.status = RunStatus.error.value
+                else:
+                    if record.worker_id is not None:
+                        log_debug(f"Recovering workflow run {record.run_id} from worker {record.worker_id}")
+                    record.status = RunStatus.running.value
+                    record.worker_id = worker_id
+                    record.lease_expires_at = now + lease_seconds
+                    record.attempts += 1
+                    self._save(record)
+                    return record
+                record.worker_id = None
+                record.lease_expires_at = None
+                self._save(record)
+        return None
+
+    def renew_lease(self, run_id: str, worker_id: str, lease_seconds: float) -> Optional[WorkflowRunRecord]:
+        """Extend the lease of a running run. Returns None if `worker_id` no longer holds the run."""
+        with self._transaction():
+            record = self._read(run_id)
+            if record is None or record.worker_id != worker_id or record.status != RunStatus.running.value:
+                return None
+            record.lease_expires_at = time.time() + lease_seconds
+            self._save(record, changed=False)
+            return record
+
+    def request_cancel(self, run_id: str) -> Optional[WorkflowRunRecord]:
+        """
+        Cancel a run. Pending runs are cancelled right away, running runs are stopped by the worker holding them.
+        Returns None if the run does not exist or is already finished.
+        """
+        with self._transaction():
+            record = self._read(run_id)
+            if record is None or record.is_finished:
+                return None
+            if record.status == RunStatus.pending.value:
+                record.status = RunStatus.cancelled.value
+            record.cancel_requested = True
+            self._save(record)
+            return record
+
+
+class InMemoryWorkflowRunStore(WorkflowRunStore):
+    """Run store for a single process"""
+
+    def __init__(self):
+        self._lock = RLock()
+        self._records: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        with self._lock:
+            yield
+
+    def _read(self, run_id: str) -> Optional[WorkflowRunRecord]:
+        data = self._records.get(run_id)
+        return WorkflowRunRecord.from_dict(dict(data)) if data is not None else None
+
+    def _write(self, record: WorkflowRunRecord) -> None:
+        self._records[record.run_id] = record.to_dict()
+
+    def _claimable(self, now: float, workflow_ids: Optional[Sequence[str]]) -> List[WorkflowRunRecord]:
+        records = [
+            WorkflowRunRecord.from_dict(dict(data))
+            for data in self._records.values()
+            if (workflow_ids is None or data["workflow_id"] in workflow_ids)
+            and (
+                data["status"] == RunStatus.pending.value
+                or (data["status"] == RunStatus.running.value and (data["lease_expires_at"] or 0) < now)
+            )
+        ]
+        return sorted(records, key=lambda record: record.created_at)
+
+    def list_runs(
+        self,
+        workflow_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[WorkflowRunRecord]:
+        with self._lock:
+            records = [
+                WorkflowRunRecord.from_dict(dict(data))
+                for data in self._records.values()
+                if (workflow_id is None or data["workflow_id"] == workflow_id)
+                and (session_id is None or data["session_id"] == session_id)
+                and (status is None or data["status"] == status)
+            ]
+        records.sort(key=lambda record: record.created_at, reverse=True)
+        return records[:limit] if limit is not None else records
+
+
+class SqliteWorkflowRunStore(WorkflowRunStore):
+    """Run store in a SQLite file, shared by worker processes on the same host"""
+
+    def __init__(self, db_file: str = "tmp/workflow_runs.db", table_name: str = "workflow_runs"):
+        self.db_file = db_file
+        self.table_name = table_name
+
+        if db_file != ":memory:":
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed explicitly, with BEGIN IMMEDIATE to lock the database across processes
+        self._connection = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None, timeout=30)
+        self._lock = RLock()
+        self._depth = 0
+        with self._transaction():
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "run_id TEXT PRIMARY KEY, workflow_id TEXT NOT NULL, session_id TEXT, status TEXT NOT NULL, "
+                "lease_expires_at REAL, created_at REAL NOT NULL, data TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_status ON {self.table_name} (status, created_at)"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        with self._lock:
+            # Nested transactions join the outer one
+            if self._depth > 0:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+            finally:
+                self._depth = 0
+
+    def _read(self, run_id: str) -> Optional[WorkflowRunRecord]:
+        row = self._connection.execute(f"SELECT data FROM {self.table_name} WHERE run_id = ?", (run_id,)).fetchone()
+        return WorkflowRunRecord.from_dict(json.loads(row[0])) if row is not None else None
+
+    def _write(self, record: WorkflowRunRecord) -> None:
+        self._connection.execute(
+            f"INSERT OR REPLACE INTO {self.table_name} "
+            "(run_id, workflow_id, session_id, status, lease_expires_at, created_at, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                record.run_id,
+                record.workflow_id,
+                record.session_id,
+                record.status,
+                record.lease_expires_at,
+                record.created_at,
+                json.dumps(record.to_dict(), default=str),
+            ),
+        )
+
+    def _claimable(self, now: float, workflow_ids: Optional[Sequence[str]]) -> List[WorkflowRunRecord]:
+        query = (
+            f"SELECT data FROM {self.table_name} "
+            "WHERE (status = ? OR (status = ? AND (lease_expires_at IS NULL OR lease_expires_at < ?)))"
+        )
+        params: List[Any] = [RunStatus.pending.value, RunStatus.running.value, now]
+        if workflow_ids is not None:
+            query += f" AND workflow_id IN ({', '.join('?' for _ in workflow_ids)})"
+            params.extend(workflow_ids)
+        query += " ORDER BY created_at LIMIT 16"
+        rows = self._connection.execute(query, params).fetchall()
+        return [WorkflowRunRecord.from_dict(json.loads(row[0])) for row in rows]
+
+    def list_runs(
+        self,
+        workflow_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[WorkflowRunRecord]:
+        conditions, params = [], []
+        for column, value in (("workflow_id", workflow_id), ("session_id", session_id), ("status", status)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        query = f"SELECT data FROM {self.table_name}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [WorkflowRunRecord.from_dict(json.loads(row[0])) for row in rows]
+
+
+class BackgroundWorkflowExecutor:
+    """
+    Runs workflows in the background, tracking each run in a `WorkflowRunStore`.
+
+    `submit()` stores a pending run and returns right away. Workers claim pending runs from the store with a lease
+    they renew while the run executes; if a worker dies, its runs are claimed again by another worker once the lease
+    expires. Workers run on the event loop of the process that submits runs (`start()`), or in separate processes
+    sharing the store that call `run_worker()` with the same workflows (matched by `workflow_id`).
+
+    Progress is written to the run record on every workflow event, and the workflow session is only written when
+    the run finishes. `get_run()` reads one record, and `subscribe()` / `stream_events()` push updates as they happen.
+    """
+
+    def __init__(
+        self,
+        store: Optional[WorkflowRunStore] = None,
+        workflows: Optional[List["Workflow"]] = None,
+        max_concurrent_runs: int = 4,
+        lease_seconds: float = 60.0,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+        worker_id: Optional[str] = None,
+    ):
+        self.store: WorkflowRunStore = store or InMemoryWorkflowRunStore()
+        self.max_concurrent_runs = max_concurrent_runs
+        # A run is claimed again if its worker does not renew the lease within `lease_seconds`
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or lease_seconds / 3
+        # How often the store is checked for runs submitted by other processes and for remote updates
+        self.poll_interval = poll_interval
+        # Number of times a run is started before it is marked as failed
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or str(uuid4())
+
+        self.workflows: Dict[str, "Workflow"] = {}
+        for workflow in workflows or []:
+            self.register(workflow)
+
+        # Runs executing on this worker, and the runs among them cancelled by a request
+        self._tasks: Dict[str, "asyncio.Task"] = {}
+        self._cancelled: Set[str] = set()
+        # A workflow holds the state of the run it executes, so each workflow runs one run at a time
+        self._busy_workflows: Set[str] = set()
+        # Inputs and responses of runs submitted in this process. Media inputs are only available here.
+        self._inputs: Dict[str, WorkflowExecutionInput] = {}
+        self._kwargs: Dict[str, Dict[str, Any]] = {}
+        self._responses: Dict[str, WorkflowRunResponse] = {}
+
+        self._worker: Optional["asyncio.Task"] = None
+        self._stopping = False
+        self._changed: Optional[asyncio.Event] = None
+
+    def register(self, workflow: "Workflow") -> str:
+        if workflow.workflow_id is None:
+            workflow.workflow_id = str(uuid4())
+        self.workflows[workflow.workflow_id] = workflow
+        return workflow.workflow_id
+
+    async def submit(
+        self,
+        workflow: "Workflow",
+        message: Optional[Any] = None,
+        additional_data: Optional[Dict[str, Any]] = None,
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        audio: Optional[List[Audio]] = None,
+        images: Optional[List[Image]] = None,
+        videos: Optional[List[Video]] = None,
+        start: bool = True,
+        **kwargs: Any,
+    ) -> WorkflowRunResponse:
+        """
+        Queue a workflow run and return its pending response. The response is updated in place as the run executes
+        in this process. With `start=False`, the run is left for other worker processes.
+        """
+        workflow_id = self.register(workflow)
+        session_id = session_id or workflow.session_id or str(uuid4())
+        run_id = str(uuid4())
+
+        record = WorkflowRunRecord(
+            run_id=run_id,
+            workflow_id=workflow_id,
+            session_id=session_id,
+            user_id=user_id or workflow.user_id,
+            input={
+                "message": to_json_value(message),
+                "additional_data": to_json_value(additional_data),
+                "kwargs": {key: to_json_value(value) for key, value in kwargs.items()},
+            },
+        )
+        if audio or images or videos:
+            log_debug("Media inputs of background runs are only available to workers in this process")
+
+        response = WorkflowRunResponse(
+            run_id=run_id,
+            session_id=session_id,
+            workflow_id=workflow_id,
+            workflow_name=workflow.name,
+            created_at=int(record.created_at),
+            status=RunStatus.pending,
+        )
+        self._responses[run_id] = response
+        self._inputs[run_id] = WorkflowExecutionInput(
+            message=message,
+            additional_data=additional_data,
+            audio=audio,  # type: ignore
+            images=images,  # type: ignore
+            videos=videos,  # type: ignore
+        )
+        self._kwargs[run_id] = kwargs
+        await asyncio.to_thread(self.store.create, record)
+        log_debug(f"Queued background workflow run: {run_id}")
+
+        if start:
+            self.start()
+        self._notify()
+        return response
+
+    def start(self) -> None:
+        """Start executing runs on the running event loop"""
+        if self._worker is None or self._worker.done():
+            self._stopping = False
+            self._worker = asyncio.get_running_loop().create_task(self.run_worker())
+
+    async def stop(self) -> None:
+        """Stop claiming runs. Runs still executing are released so another worker picks them up."""
+        self._stopping = True
+        self._notify()
+        if self._worker is not None and self._worker is not asyncio.current_task():
+            await self._worker
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_worker(self) -> None:
+        """Claim and execute runs until `stop()` is called. Worker processes run this with their own executor."""
+        log_debug(f"Workflow worker {self.worker_id} started")
+        while not self._stopping:
+            if len(self._tasks) < self.max_concurrent_runs:
+                idle_workflows = [
+                    workflow_id for workflow_id in self.workflows if workflow_id not in self._busy_workflows
+                ]
+                record = None
+                if idle_workflows:
+                    record = await asyncio.to_thread(
+                        self.store.claim, self.worker_id, self.lease_seconds, idle_workflows, self.max_attempts
+                    )
+                if record is not None:
+                    self._busy_workflows.add(record.workflow_id)
+                    self._tasks[record.run_id] = asyncio.get_running_loop().create_task(self._execute(record))
+                    continue
+            await self._wait_for_change(self.poll_interval)
+        log_debug(f"Workflow worker {self.worker_id} stopped")
+
+    def cancel(self, run_id: str) -> bool:
+        """Cancel a run. Returns False if the run does not exist or is already finished."""
+        record = self.store.request_cancel(run_id)
+        if record is None:
+            return False
+        task = self._tasks.get(run_id)
+        if task is not None:
+            self._cancelled.add(run_id)
+            task.cancel()
+        elif record.status == RunStatus.cancelled.value:
+            self._inputs.pop(run_id, None)
+            self._kwargs.pop(run_id, None)
+            response = self._responses.pop(run_id, None)
+            if response is not None:
+                response.status = RunStatus.cancelled
+        # Runs executing in other processes are stopped by their next heartbeat
+        self._notify()
+        return True
+
+    def get_run(self, run_id: str) -> Optional[WorkflowRunResponse]:
+        """The response of a run: live if it executes in this process, otherwise read from its record"""
+        if run_id in self._tasks and run_id in self._responses:
+            return self._responses[run_id]
+        record = self.store.get(run_id)
+        if record is None:
+            return None
+        if record.is_finished:
+            # The run finished in another process
+            self._inputs.pop(run_id, None)
+            self._kwargs.pop(run_id, None)
+            self._responses.pop(run_id, None)
+        return record.to_run_response()
+
+    async def subscribe(self, run_id: str) -> AsyncIterator[WorkflowRunRecord]:
+        """
+        Yield the record of a run when it changes, until the run is finished. Changes made while the subscriber is
+        busy are coalesced, so the latest record is yielded.
+        """
+        version = -1
+        while True:
+            record = await asyncio.to_thread(self.store.get, run_id)
+            if record is None:
+                return
+            if record.version != version:
+                version = record.version
+                yield record
+            if record.is_finished:
+                return
+            # Changes made in this process wake subscribers up, changes made by other processes are polled
+            await self._wait_for_change(self.poll_interval)
+
+    async def stream_events(self, run_id: str) -> AsyncIterator[str]:
+        """Progress of a run as Server-Sent Events, eg: for a `text/event-stream` StreamingResponse"""
+        async for record in self.subscribe(run_id):
+            data = {
+                "run_id": record.run_id,
+                "status": record.status,
+                "progress": record.progress,
+                "response": record.response,
+            }
+            event = record.status.lower() if record.is_finished else "progress"
+            yield f"id: {record.version}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+    def _get_change_event(self) -> asyncio.Event:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    async def _wait_for_change(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._get_change_event().wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _heartbeat(self, run_id: str, task: "asyncio.Task") -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            record = await asyncio.to_thread(self.store.renew_lease, run_id, self.worker_id, self.lease_seconds)
+            if record is None:
+                log_warning(f"Lost the lease on workflow run {run_id}, stopping it")
+                task.cancel()
+                return
+            if record.cancel_requested:
+                self._cancelled.add(run_id)
+                task.cancel()
+                return
+
+    async def _execute(self, record: WorkflowRunRecord) -> None:
+        run_id = record.run_id
+        workflow = self.workflows[record.workflow_id]
+        response = self._responses.get(run_id) or WorkflowRunResponse(
+            run_id=run_id,
+            session_id=record.session_id,
+            workflow_id=record.workflow_id,
+            workflow_name=workflow.name,
+            created_at=int(record.created_at),
+        )
+        response.status = RunStatus.running
+        self._notify()
+
+        heartbeat = asyncio.ensure_future(self._heartbeat(run_id, asyncio.current_task()))  # type: ignore
+        try:
+            try:
+                await self._run_workflow(workflow, record, response)
+            except asyncio.CancelledError:
+                if run_id not in self._cancelled:
+                    # Stopped or lost the lease: leave the run to another worker
+                    await asyncio.to_thread(
+                        self.store.update,
+                        run_id,
+                        owner=self.worker_id,
+                        status=RunStatus.pending.value,
+                        worker_id=None,
+                        lease_expires_at=None,
+                    )
+                    return
+                log_debug(f"Background workflow run cancelled: {run_id}")
+                response.status = RunStatus.cancelled
+                response.content = "Run cancelled"
+                workflow._save_run_to_storage(response)
+            except Exception as e:
+                logger.error(f"Background workflow execution failed: {e}")
+                response.status = RunStatus.error
+                response.content = f"Background execution failed: {str(e)}"
+                workflow._save_run_to_storage(response)
+
+            await asyncio.to_thread(
+                self.store.update,
+                run_id,
+                owner=self.worker_id,
+                status=response.status.value,
+                response=response.to_dict(),
+                worker_id=None,
+                lease_expires_at=None,
+            )
+            log_debug(f"Background execution completed with status: {response.status}")
+        finally:
+            heartbeat.cancel()
+            self._tasks.pop(run_id, None)
+            self._cancelled.discard(run_id)
+            self._busy_workflows.discard(record.workflow_id)
+            self._responses.pop(run_id, None)
+            self._notify()
+
+    async def _run_workflow(self, workflow: "Workflow", record: WorkflowRunRecord, response: WorkflowRunResponse):
+        workflow.user_id = record.user_id
+        workflow.session_id = record.session_id
+        workflow.run_id = record.run_id
+
+        workflow.initialize_workflow()
+        workflow.load_session()
+        workflow._prepare_steps()
+        workflow.run_response = response
+
+        execution_input = self._inputs.pop(record.run_id, None) or WorkflowExecutionInput(
+            message=record.input.get("message"), additional_data=record.input.get("additional_data")
+        )
+        kwargs = self._kwargs.pop(record.run_id, None)
+        if kwargs is None:
+            kwargs = record.input.get("kwargs") or {}
+        workflow.update_agents_and_teams_session_info()
+
+        async for event in workflow._aexecute_stream(
+            execution_input=execution_input,
+            workflow_run_response=response,
+            stream_intermediate_steps=True,
+            **kwargs,
+        ):
+            # Only workflow events are recorded, not the content of the agents and teams in the steps
+            if isinstance(event, BaseWorkflowRunResponseEvent):
+                progress = {"event": event.event, "created_at": event.created_at}
+                for key in ("step_name", "step_index", "error"):
+                    if getattr(event, key, None) is not None:
+                        progress[key] = getattr(event, key)
+                await asyncio.to_thread(self.store.update, record.run_id, owner=self.worker_id, progress=progress)
+                self._notify()
@@ -0,0 +1,195 @@
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from agno.utils.common import to_json_value
+from agno.utils.log import log_debug
+from agno.workflow.v2.types import StepInput, StepOutput, WorkflowExecutionInput
+
+
+def hash_step_input(step_input: StepInput) -> str:
+    """
+    Hash of the parts of a StepInput a step can read: the message, additional data, media and the content of the
+    previous steps. Responses of previous steps are left out, as they contain run ids and timestamps.
+    """
+    previous_steps: Dict[str, Any] = {}
+    for step_name in step_input.previous_step_outputs or {}:
+        previous_steps[step_name] = to_json_value(step_input.get_step_content(step_name))
+    fingerprint = {
+        "message": to_json_value(step_input.message),
+        "previous_step_content": to_json_value(step_input.previous_step_content),
+        "previous_steps": previous_steps,
+        "additional_data": step_input.additional_data,
+        "images": [image.to_dict() for image in step_input.images or []],
+        "videos": [video.to_dict() for video in step_input.videos or []],
+        "audio": [audio.to_dict() for audio in step_input.audio or []],
+    }
+    return sha256(json.dumps(fingerprint, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class StepCache(ABC):
+    """
+    Base class for stores of step outputs, used to cache the outputs of deterministic steps and to checkpoint runs.
+    Values are JSON-serializable dicts. With `ttl_seconds`, entries expire that many seconds after they are set.
+    """
+
+    ttl_seconds: Optional[float] = None
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def _expires_at(self) -> Optional[float]:
+        return time.time() + self.ttl_seconds if self.ttl_seconds is not None else None
+
+
+class InMemoryStepCache(StepCache):
+    """Step cache for a single process"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        # key -> (value, expires_at)
+        self._entries: Dict[str, Tuple[Dict[str, Any], Optional[float]]] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] < time.time():
+                del self._entries[key]
+                return None
+            return entry[0]
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._expires_at())
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteStepCache(StepCache):
+    """Step cache in a local SQLite file, kept across runs and processes"""
+
+    def __init__(
+        self, db_file: str = "tmp/step_cache.db", table_name: str = "step_cache", ttl_seconds: Optional[float] = None
+    ):
+        self.db_file = db_file
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+
+        if db_file != ":memory:":
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_file, check_same_thread=False, timeout=30)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} (key TEXT PRIMARY KEY, expires_at REAL, data TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data FROM {self.table_name} WHERE key = ? AND (expires_at IS NULL OR expires_at >= ?)",
+                (key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, expires_at, data) VALUES (?, ?, ?)",
+                (key, self._expires_at(), json.dumps(value, default=str)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+
+
+class RunCheckpoint:
+    """
+    Outputs of the completed top-level steps of a workflow run, saved after every step.
+
+    A run started again with the same run id reuses the outputs of its completed steps, in order, and executes the
+    remaining steps. Failed and skipped steps are not checkpointed, so they run again.
+    """
+
+    def __init__(self, cache: StepCache, run_id: str):
+        self.cache = cache
+        self.run_id = run_id
+        self.key = f"checkpoint:{run_id}"
+
+        data = cache.get(self.key) or {}
+        # The input and session of the run, so it can be resumed with its run id only
+        self.input: Optional[Dict[str, Any]] = data.get("input")
+        self.session_id: Optional[str] = data.get("session_id")
+        # One entry per completed top-level step: {"name": ..., "outputs": [...], "is_list": ...}
+        self.steps: List[Dict[str, Any]] = data.get("steps", [])
+        # Steps are reused while every step before them was reused, as later steps depend on earlier outputs
+        self._resuming = True
+
+    def set_input(self, execution_input: WorkflowExecutionInput, session_id: Optional[str]) -> None:
+        if self.input is None:
+            self.input = {
+                "message": to_json_value(execution_input.message),
+                "additional_data": execution_input.additional_data,
+            }
+            self.session_id = session_id
+
+    def get(self, index: int, step_name: str) -> Optional[Union[StepOutput, List[StepOutput]]]:
+        """Outputs of step `index`, if it completed in a previous attempt of the run"""
+        if not self._resuming or index >= len(self.steps) or self.steps[index]["name"] != step_name:
+            self._resuming = False
+            return None
+        entry = self.steps[index]
+        outputs = [StepOutput.from_dict(output) for output in entry["outputs"]]
+        log_debug(f"Resuming step {step_name} of run {self.run_id} from its checkpoint")
+        return outputs if entry["is_list"] else outputs[0]
+
+    def save(self, index: int, step_name: str, output: Union[StepOutput, List[StepOutput]]) -> None:
+        outputs = output if isinstance(output, list) else [output]
+        # Only the outputs of consecutive successful steps are saved, so a resumed run replays them in order
+        if index > len(self.steps) or not all(step_output.success for step_output in outputs):
+            return
+        self.steps = self.steps[:index] + [
+            {
+                "name": step_name,
+                "outputs": [step_output.to_dict() for step_output in outputs],
+                "is_list": isinstance(output, list),
+            }
+        ]
+        self.cache.set(self.key, {"input": self.input, "session_id": self.session_id, "steps": self.steps})
+
+    def clear(self) -> None:
+        if self.steps:
+            self.cache.delete(self.key)
+        self.steps = []
@@ -15,7 +15,9 @@ from agno.run.v2.workflow import (
     WorkflowRunResponseEvent,
 )
 from agno.team import Team
-from agno.utils.log import log_debug, logger, use_agent_logger, use_team_logger, use_workflow_logger
+from agno.tracing.span import traced
+from agno.utils.log import log_debug, log_warning, logger, use_agent_logger, use_team_logger, use_workflow_logger
+from agno.workflow.v2.cache import StepCache, hash_step_input
 from agno.workflow.v2.types import StepInput, StepOutput
 
 StepExecutor = Callable[
@@ -32,6 +34,10 @@ StepExecutor = Callable[
 ]
 
 
+def _get_step_span_attributes(step: "Step", *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    return {"step": step.name or step.executor_name, "executor_type": step.executor_type}
+
+
 @dataclass
 class Step:
     """A single unit of work in a workflow pipeline"""
@@ -56,6 +62,12 @@ class Step:
     # If False, only warn about missing inputs
     strict_input_validation: bool = False
 
+    # Cache the outputs of the step, keyed by the step, `cache_version` and the StepInput.
+    # Only for deterministic steps: a cached step is not executed again for the same input.
+    cache: Optional[StepCache] = None
+    # Change the version to invalidate the cached outputs, eg: when the executor changes
+    cache_version: Optional[str] = None
+
     _retry_count: int = 0
 
     def __init__(
@@ -70,6 +82,8 @@ class Step:
         timeout_seconds: Optional[int] = None,
         skip_on_failure: bool = False,
         strict_input_validation: bool = False,
+        cache: Optional[StepCache] = None,
+        cache_version: Optional[str] = None,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -89,6 +103,8 @@ class Step:
         self.timeout_seconds = timeout_seconds
         self.skip_on_failure = skip_on_failure
         self.strict_input_validation = strict_input_validation
+        self.cache = cache
+        self.cache_version = cache_version
 
         # Set the active executor
         self._set_active_executor()
@@ -161,6 +177,7 @@ class Step:
             }
         return None
 
+    @traced("workflow.step", attributes=_get_step_span_attributes)
     def execute(
         self, step_input: StepInput, session_id: Optional[str] = None, user_id: Optional[str] = None
     ) -> StepOutput:
@@ -170,6 +187,11 @@ class Step:
         if step_input.previous_step_outputs:
             step_input.previous_step_content = step_input.get_last_step_content()
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
         for attempt in range(self.max_retries + 1):
             try:
@@ -250,6 +272,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._cache_output(cache_key, step_output)
 
                 return step_output
 
@@ -267,6 +290,7 @@ class Step:
 
         return StepOutput(content=f"Step {self.name} failed but skipped", success=False)
 
+    @traced("workflow.step", attributes=_get_step_span_attributes)
     def execute_stream(
         self,
         step_input: StepInput,
@@ -292,6 +316,15 @@ class Step:
                 step_index=step_index,
             )
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            for cached_event in self._get_cached_output_events(
+                cached_output, stream_intermediate_steps, workflow_run_response, step_index
+            ):
+                yield cached_event
+            return
+
         # Execute with retries and streaming
         for attempt in range(self.max_retries + 1):
             try:
@@ -384,6 +417,8 @@ class Step:
                 # Switch back to workflow logger after execution
                 use_workflow_logger()
 
+                self._cache_output(cache_key, final_response)
+
                 # Yield the step output
                 yield final_response
 
@@ -419,6 +454,7 @@ class Step:
 
         return
 
+    @traced("workflow.step", attributes=_get_step_span_attributes)
     async def aexecute(
         self, step_input: StepInput, session_id: Optional[str] = None, user_id: Optional[str] = None
     ) -> StepOutput:
@@ -429,6 +465,11 @@ class Step:
         if step_input.previous_step_outputs:
             step_input.previous_step_content = step_input.get_last_step_content()
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
         for attempt in range(self.max_retries + 1):
             try:
@@ -525,6 +566,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._cache_output(cache_key, step_output)
 
                 return step_output
 
@@ -542,6 +584,7 @@ class Step:
 
         return StepOutput(content=f"Step {self.name} failed but skipped", success=False)
 
+    @traced("workflow.step", attributes=_get_step_span_attributes)
     async def aexecute_stream(
         self,
         step_input: StepInput,
@@ -567,6 +610,15 @@ class Step:
                 step_index=step_index,
             )
 
+        cache_key = self._get_cache_key(step_input)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            for cached_event in self._get_cached_output_events(
+                cached_output, stream_intermediate_steps, workflow_run_response, step_index
+            ):
+                yield cached_event
+            return
+
         # Execute with retries and streaming
         for attempt in range(self.max_retries + 1):
             try:
@@ -676,6 +728,8 @@ class Step:
                 # Switch back to workflow logger after execution
                 use_workflow_logger()
 
+                self._cache_output(cache_key, final_response)
+
                 # Yield the final response
                 yield final_response
 
@@ -710,6 +764,57 @@ class Step:
 
         return
 
+    def _get_cache_key(self, step_input: StepInput) -> Optional[str]:
+        if self.cache is None:
+            return None
+        identity = self.step_id or self.name or self.executor_name
+        return f"step:{identity}:{self.cache_version or ''}:{hash_step_input(step_input)}"
+
+    def _get_cached_output(self, cache_key: Optional[str]) -> Optional[StepOutput]:
+        if cache_key is None or self.cache is None:
+            return None
+        try:
+            cached = self.cache.get(cache_key)
+        except Exception as e:
+            log_warning(f"Could not read the cache of step {self.name}: {e}")
+            return None
+        if cached is None:
+            return None
+        log_debug(f"Using cached output for step: {self.name}")
+        return self._process_step_output(StepOutput.from_dict(cached))
+
+    def _cache_output(self, cache_key: Optional[str], step_output: StepOutput) -> None:
+        if cache_key is None or self.cache is None or not step_output.success:
+            return
+        try:
+            self.cache.set(cache_key, step_output.to_dict())
+        except Exception as e:
+            log_warning(f"Could not cache the output of step {self.name}: {e}")
+
+    def _get_cached_output_events(
+        self,
+        step_output: StepOutput,
+        stream_intermediate_steps: bool,
+        workflow_run_response: Optional["WorkflowRunResponse"],
+        step_index: Optional[Union[int, tuple]],
+    ) -> List[Union[WorkflowRunResponseEvent, StepOutput]]:
+        """The events a streaming step emits after it executed, for a cached output"""
+        events: List[Union[WorkflowRunResponseEvent, StepOutput]] = [step_output]
+        if stream_intermediate_steps and workflow_run_response:
+            events.append(
+                StepCompletedEvent(
+                    run_id=workflow_run_response.run_id or "",
+                    workflow_name=workflow_run_response.workflow_name or "",
+                    workflow_id=workflow_run_response.workflow_id or "",
+                    session_id=workflow_run_response.session_id or "",
+                    step_name=self.name,
+                    step_index=step_index,
+                    content=step_output.content,
+                    step_response=step_output,
+                )
+            )
+        return events
+
     def _prepare_message(
         self,
         message: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]],
@@ -220,7 +220,14 @@ class StepOutput:
                 content_dict = str(self.content)
 
         return {
+            "step_name": self.step_name,
+            "step_id": self.step_id,
+            "executor_type": self.executor_type,
+            "executor_name": self.executor_name,
             "content": content_dict,
+            "parallel_step_outputs": {name: output.to_dict() for name, output in self.parallel_step_outputs.items()}
+            if self.parallel_step_outputs
+            else None,
             "response": self.response.to_dict() if self.response else None,
             "images": [img.to_dict() for img in self.images] if self.images else None,
             "videos": [vid.to_dict() for vid in self.videos] if self.videos else None,
@@ -260,8 +267,17 @@ class StepOutput:
         if audio:
             audio = [AudioArtifact.model_validate(aud) for aud in audio]
 
+        parallel_step_outputs = data.get("parallel_step_outputs")
+        if parallel_step_outputs:
+            parallel_step_outputs = {name: cls.from_dict(output) for name, output in parallel_step_outputs.items()}
+
         return cls(
+            step_name=data.get("step_name"),
+            step_id=data.get("step_id"),
+            executor_type=data.get("executor_type"),
+            executor_name=data.get("executor_name"),
             content=data.get("content"),
+            parallel_step_outputs=parallel_step_outputs,
             response=response,
             images=images,
             videos=videos,
@@ -1,8 +1,8 @@
-import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from os import getenv
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Awaitable,
@@ -12,6 +12,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
     overload,
 )
@@ -22,6 +23,8 @@ from pydantic import BaseModel
 from agno.agent.agent import Agent
 from agno.media import Audio, AudioArtifact, Image, ImageArtifact, Video, VideoArtifact
 from agno.run.base import RunStatus
+from agno.run.response import RunResponseEvent
+from agno.run.team import TeamRunResponseEvent
 from agno.run.v2.workflow import (
     ConditionExecutionCompletedEvent,
     ConditionExecutionStartedEvent,
@@ -47,13 +50,16 @@ from agno.run.v2.workflow import (
 from agno.storage.base import Storage
 from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.team.team import Team
+from agno.tracing import Tracer, trace_run, traced
 from agno.utils.log import (
     log_debug,
+    log_warning,
     logger,
     set_log_level_to_debug,
     set_log_level_to_info,
     use_workflow_logger,
 )
+from agno.workflow.v2.cache import RunCheckpoint, StepCache
 from agno.workflow.v2.condition import Condition
 from agno.workflow.v2.loop import Loop
 from agno.workflow.v2.parallel import Parallel
@@ -68,6 +74,9 @@ from agno.workflow.v2.types import (
     WorkflowMetrics,
 )
 
+if TYPE_CHECKING:
+    from agno.workflow.v2.background import BackgroundWorkflowExecutor
+
 WorkflowSteps = Union[
     Callable[
         ["Workflow", WorkflowExecutionInput],
@@ -128,6 +137,16 @@ class Workflow:
     store_events: bool = False
     events_to_skip: Optional[List[WorkflowRunEvent]] = None
 
+    # Executor for background runs (arun(background=True)). Defaults to an in-process executor.
+    background_executor: Optional["BackgroundWorkflowExecutor"] = None
+
+    # Store for run checkpoints: the outputs of completed steps are saved after each step,
+    # so a failed run can be resumed with run(resume_run_id=...) and only runs the remaining steps
+    checkpoint_store: Optional[StepCache] = None
+
+    # Records each run as a trace of spans (steps, agent and team runs, model calls, tool calls, ...)
+    tracer: Optional[Tracer] = None
+
     def __init__(
         self,
         workflow_id: Optional[str] = None,
@@ -144,6 +163,9 @@ class Workflow:
         stream_intermediate_steps: bool = False,
         store_events: bool = False,
         events_to_skip: Optional[List[WorkflowRunEvent]] = None,
+        background_executor: Optional["BackgroundWorkflowExecutor"] = None,
+        checkpoint_store: Optional[StepCache] = None,
+        tracer: Optional[Tracer] = None,
     ):
         self.workflow_id = workflow_id
         self.name = name
@@ -159,6 +181,9 @@ class Workflow:
         self.events_to_skip = events_to_skip or []
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
+        self.background_executor = background_executor
+        self.checkpoint_store = checkpoint_store
+        self.tracer = tracer
 
     @property
     def run_parameters(self) -> Dict[str, Any]:
@@ -463,6 +488,8 @@ class Workflow:
             workflow_run_response.status = RunStatus.completed
         else:
             try:
+                checkpoint = self._get_checkpoint(execution_input, workflow_run_response)
+
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
                 previous_step_outputs: Dict[str, StepOutput] = {}
@@ -487,7 +514,11 @@ class Workflow:
                         shared_audio=shared_audio,
                     )
 
-                    step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                    # Reuse the output of the step if it completed in a previous attempt of the run
+                    step_output = checkpoint.get(i, step_name) if checkpoint is not None else None  # type: ignore[assignment]
+                    if step_output is None:
+                        step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                        self._save_checkpoint(checkpoint, i, step_name, step_output)
 
                     # Update the workflow-level previous_step_outputs dictionary
                     if isinstance(step_output, list):
@@ -544,6 +575,7 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                self._clear_checkpoint(checkpoint)
 
             except Exception as e:
                 import traceback
@@ -598,6 +630,8 @@ class Workflow:
 
         else:
             try:
+                checkpoint = self._get_checkpoint(execution_input, workflow_run_response)
+
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
                 previous_step_outputs: Dict[str, StepOutput] = {}
@@ -624,15 +658,24 @@ class Workflow:
                         shared_audio=shared_audio,
                     )
 
+                    # Replay the outputs of the step if it completed in a previous attempt of the run
+                    restored_outputs = self._get_checkpointed_step_outputs(checkpoint, i, step_name)
+                    num_collected_outputs = len(collected_step_outputs)
+
                     # Execute step with streaming and yield all events
-                    for event in step.execute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=self.session_id,
-                        user_id=self.user_id,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_run_response=workflow_run_response,
-                        step_index=i,
-                    ):
+                    step_events = (
+                        restored_outputs
+                        if restored_outputs is not None
+                        else step.execute_stream(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=self.session_id,
+                            user_id=self.user_id,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            workflow_run_response=workflow_run_response,
+                            step_index=i,
+                        )
+                    )
+                    for event in step_events:
                         # Handle events
                         if isinstance(event, StepOutput):
                             step_output = event
@@ -682,6 +725,14 @@ class Workflow:
                         else:
                             # Yield other internal events
                             yield event  # type: ignore
+                    if restored_outputs is None:
+                        self._save_checkpoint(
+                            checkpoint,
+                            i,
+                            step_name,
+                            collected_step_outputs[num_collected_outputs:],  # type: ignore[arg-type]
+                        )
+
                     # Break out of main step loop if early termination was requested
                     if "early_termination" in locals() and early_termination:
                         break
@@ -706,6 +757,7 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                self._clear_checkpoint(checkpoint)
 
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
@@ -826,6 +878,8 @@ class Workflow:
 
         else:
             try:
+                checkpoint = self._get_checkpoint(execution_input, workflow_run_response)
+
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
                 previous_step_outputs: Dict[str, StepOutput] = {}
@@ -850,7 +904,11 @@ class Workflow:
                         shared_audio=shared_audio,
                     )
 
-                    step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                    # Reuse the output of the step if it completed in a previous attempt of the run
+                    step_output = checkpoint.get(i, step_name) if checkpoint is not None else None  # type: ignore[assignment]
+                    if step_output is None:
+                        step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                        self._save_checkpoint(checkpoint, i, step_name, step_output)
 
                     # Update the workflow-level previous_step_outputs dictionary
                     if isinstance(step_output, list):
@@ -906,6 +964,7 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                self._clear_checkpoint(checkpoint)
 
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
@@ -966,6 +1025,8 @@ class Workflow:
 
         else:
             try:
+                checkpoint = self._get_checkpoint(execution_input, workflow_run_response)
+
                 # Track outputs from each step for enhanced data flow
                 collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
                 previous_step_outputs: Dict[str, StepOutput] = {}
@@ -992,15 +1053,26 @@ class Workflow:
                         shared_audio=shared_audio,
                     )
 
+                    # Replay the outputs of the step if it completed in a previous attempt of the run
+                    restored_outputs = self._get_checkpointed_step_outputs(checkpoint, i, step_name)
+                    num_collected_outputs = len(collected_step_outputs)
+
                     # Execute step with streaming and yield all events
-                    async for event in step.aexecute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=self.session_id,
-                        user_id=self.user_id,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_run_response=workflow_run_response,
-                        step_index=i,
-                    ):
+                    step_events: AsyncIterator[
+                        Union[WorkflowRunResponseEvent, RunResponseEvent, TeamRunResponseEvent, StepOutput]
+                    ]
+                    if restored_outputs is not None:
+                        step_events = self._aiter_step_outputs(restored_outputs)
+                    else:
+                        step_events = step.aexecute_stream(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=self.session_id,
+                            user_id=self.user_id,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            workflow_run_response=workflow_run_response,
+                            step_index=i,
+                        )
+                    async for event in step_events:
                         if isinstance(event, StepOutput):
                             step_output = event
                             collected_step_outputs.append(step_output)
@@ -1049,6 +1121,14 @@ class Workflow:
                             # Yield other internal events
                             yield event  # type: ignore
 
+                    if restored_outputs is None:
+                        self._save_checkpoint(
+                            checkpoint,
+                            i,
+                            step_name,
+                            collected_step_outputs[num_collected_outputs:],  # type: ignore[arg-type]
+                        )
+
                     # Break out of main step loop if early termination was requested
                     if "early_termination" in locals() and early_termination:
                         break
@@ -1073,6 +1153,7 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                self._clear_checkpoint(checkpoint)
 
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
@@ -1136,77 +1217,33 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         **kwargs: Any,
     ) -> WorkflowRunResponse:
-        """Execute workflow in background using asyncio.create_task()"""
-
-        if user_id is not None:
-            self.user_id = user_id
-        if session_id is not None:
-            self.session_id = session_id
-
-        if self.session_id is None:
-            self.session_id = str(uuid4())
-
-        if self.run_id is None:
-            self.run_id = str(uuid4())
+        """Queue the workflow run on the background executor and return its pending response"""
+        if self.background_executor is None:
+            from agno.workflow.v2.background import BackgroundWorkflowExecutor
 
-        self.initialize_workflow()
-        self.load_session()
-        self._prepare_steps()
-
-        # Create workflow run response with PENDING status
-        workflow_run_response = WorkflowRunResponse(
-            run_id=self.run_id,
-            session_id=self.session_id,
-            workflow_id=self.workflow_id,
-            workflow_name=self.name,
-            created_at=int(datetime.now().timestamp()),
-            status=RunStatus.pending,
-        )
+            self.background_executor = BackgroundWorkflowExecutor()
 
-        # Store PENDING response immediately
-        self._save_run_to_storage(workflow_run_response)
-
-        # Prepare execution input
-        inputs = WorkflowExecutionInput(
+        return await self.background_executor.submit(
+            self,
             message=message,
             additional_data=additional_data,
-            audio=audio,  # type: ignore
-            images=images,  # type: ignore
-            videos=videos,  # type: ignore
+            user_id=user_id,
+            session_id=session_id,
+            audio=audio,
+            images=images,
+            videos=videos,
+            **kwargs,
         )
 
-        self.update_agents_and_teams_session_info()
-
-        async def execute_workflow_background():
-            """Simple background execution"""
-            try:
-                # Update status to RUNNING and save
-                workflow_run_response.status = RunStatus.running
-                self._save_run_to_storage(workflow_run_response)
-
-                await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
-
-                self._save_run_to_storage(workflow_run_response)
-
-                log_debug(f"Background execution completed with status: {workflow_run_response.status}")
-
-            except Exception as e:
-                logger.error(f"Background workflow execution failed: {e}")
-                workflow_run_response.status = RunStatus.error
-                workflow_run_response.content = f"Background execution failed: {str(e)}"
-                self._save_run_to_storage(workflow_run_response)
-
-        # Create and start asyncio task
-        loop = asyncio.get_running_loop()
-        loop.create_task(execute_workflow_background())
-
-        # Return SAME object that will be updated by background execution
-        return workflow_run_response
-
     def get_run(self, run_id: str) -> Optional[WorkflowRunResponse]:
-        """Get the status and details of a background workflow run - SIMPLIFIED"""
+        """Get the status and details of a background workflow run"""
+        if self.background_executor is not None:
+            run = self.background_executor.get_run(run_id)
+            if run is not None:
+                return run
+
         if self.storage is not None and self.session_id is not None:
-            session = self.storage.read(session_id=self.session_id)
+            session = self.storage.traced_read(session_id=self.session_id)
             if session and isinstance(session, WorkflowSessionV2) and session.runs:
                 # Find the run by ID
                 for run in session.runs:
@@ -1228,6 +1265,7 @@ class Workflow:
         stream: Literal[False] = False,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
     ) -> WorkflowRunResponse: ...
 
     @overload
@@ -1243,8 +1281,10 @@ class Workflow:
         stream: Literal[True] = True,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
     ) -> Iterator[WorkflowRunResponseEvent]: ...
 
+    @trace_run("workflow.run")
     def run(
         self,
         message: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]] = None,
@@ -1257,6 +1297,7 @@ class Workflow:
         stream: bool = False,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunResponse, Iterator[WorkflowRunResponseEvent]]:
         """Execute the workflow synchronously with optional streaming"""
@@ -1279,6 +1320,11 @@ class Workflow:
         log_debug(f"Stream: {stream}")
         log_debug(f"Total steps: {self._get_step_count()}")
 
+        if resume_run_id is not None:
+            message, additional_data, session_id = self._get_resume_input(
+                resume_run_id, message, additional_data, session_id
+            )
+
         if user_id is not None:
             self.user_id = user_id
             log_debug(f"User ID: {user_id}")
@@ -1289,7 +1335,7 @@ class Workflow:
         if self.session_id is None:
             self.session_id = str(uuid4())
 
-        self.run_id = str(uuid4())
+        self.run_id = resume_run_id or str(uuid4())
 
         self.initialize_workflow()
 
@@ -1345,6 +1391,7 @@ class Workflow:
         stream: Literal[False] = False,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
     ) -> WorkflowRunResponse: ...
 
     @overload
@@ -1360,8 +1407,10 @@ class Workflow:
         stream: Literal[True] = True,
         stream_intermediate_steps: Optional[bool] = None,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
     ) -> AsyncIterator[WorkflowRunResponseEvent]: ...
 
+    @trace_run("workflow.run")
     async def arun(
         self,
         message: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]] = None,
@@ -1374,10 +1423,13 @@ class Workflow:
         stream: bool = False,
         stream_intermediate_steps: Optional[bool] = False,
         background: Optional[bool] = False,
+        resume_run_id: Optional[str] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunResponse, AsyncIterator[WorkflowRunResponseEvent]]:
         """Execute the workflow synchronously with optional streaming"""
         if background:
+            if resume_run_id is not None:
+                raise ValueError("resume_run_id is not supported for background runs, they resume on their own")
             return await self._arun_background(
                 message=message,
                 additional_data=additional_data,
@@ -1403,6 +1455,11 @@ class Workflow:
 
         log_debug(f"Stream: {stream}")
 
+        if resume_run_id is not None:
+            message, additional_data, session_id = self._get_resume_input(
+                resume_run_id, message, additional_data, session_id
+            )
+
         # Set user_id and session_id if provided
         if user_id is not None:
             self.user_id = user_id
@@ -1414,7 +1471,7 @@ class Workflow:
         if self.session_id is None:
             self.session_id = str(uuid4())
 
-        self.run_id = str(uuid4())
+        self.run_id = resume_run_id or str(uuid4())
 
         self.initialize_workflow()
 
@@ -1531,20 +1588,22 @@ class Workflow:
         self.workflow_session = session
         log_debug(f"Loaded WorkflowSessionV2: {session.session_id}")
 
+    @traced("workflow.read_from_storage")
     def read_from_storage(self) -> Optional[WorkflowSessionV2]:
         """Load the WorkflowSessionV2 from storage"""
         if self.storage is not None and self.session_id is not None:
-            session = self.storage.read(session_id=self.session_id)
+            session = self.storage.traced_read(session_id=self.session_id)
             if session and isinstance(session, WorkflowSessionV2):
                 self.load_workflow_session(session)
                 return session
         return None
 
+    @traced("workflow.write_to_storage")
     def write_to_storage(self) -> Optional[WorkflowSessionV2]:
         """Save the WorkflowSessionV2 to storage"""
         if self.storage is not None:
             session_to_save = self.get_workflow_session()
-            saved_session = self.storage.upsert(session=session_to_save)
+            saved_session = self.storage.traced_upsert(session=session_to_save)
             if saved_session and isinstance(saved_session, WorkflowSessionV2):
                 self.workflow_session = saved_session
                 return saved_session
@@ -3222,6 +3281,81 @@ class Workflow:
             # Update session_state with workflow_session_state
             executor.workflow_session_state = self.workflow_session_state
 
+    def _get_resume_input(
+        self,
+        resume_run_id: str,
+        message: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]],
+        additional_data: Optional[Dict[str, Any]],
+        session_id: Optional[str],
+    ) -> Tuple[Optional[Union[str, Dict[str, Any], List[Any], BaseModel]], Optional[Dict[str, Any]], Optional[str]]:
+        """The input of a run to resume, read from its checkpoint when it is not given"""
+        if self.checkpoint_store is None:
+            raise ValueError("resume_run_id requires a checkpoint_store on the workflow")
+        checkpoint = RunCheckpoint(self.checkpoint_store, resume_run_id)
+        if checkpoint.input is None:
+            log_warning(f"No checkpoint found for run {resume_run_id}, running all steps")
+            return message, additional_data, session_id
+        if message is None:
+            message = checkpoint.input.get("message")
+        if additional_data is None:
+            additional_data = checkpoint.input.get("additional_data")
+        if session_id is None:
+            session_id = checkpoint.session_id
+        return message, additional_data, session_id
+
+    def _get_checkpoint(
+        self, execution_input: WorkflowExecutionInput, workflow_run_response: WorkflowRunResponse
+    ) -> Optional[RunCheckpoint]:
+        """Load the checkpoint of the run, with the outputs of the steps completed by previous attempts"""
+        if self.checkpoint_store is None or workflow_run_response.run_id is None:
+            return None
+        try:
+            checkpoint = RunCheckpoint(self.checkpoint_store, workflow_run_response.run_id)
+        except Exception as e:
+            log_warning(f"Could not load the checkpoint of run {workflow_run_response.run_id}: {e}")
+            return None
+        if checkpoint.steps:
+            log_debug(f"Resuming run {checkpoint.run_id}: {len(checkpoint.steps)} steps completed")
+        checkpoint.set_input(execution_input, self.session_id)
+        return checkpoint
+
+    def _get_checkpointed_step_outputs(
+        self, checkpoint: Optional[RunCheckpoint], index: int, step_name: str
+    ) -> Optional[List[StepOutput]]:
+        if checkpoint is None:
+            return None
+        step_output = checkpoint.get(index, step_name)
+        if step_output is None:
+            return None
+        return step_output if isinstance(step_output, list) else [step_output]
+
+    async def _aiter_step_outputs(self, step_outputs: List[StepOutput]) -> AsyncIterator[StepOutput]:
+        for step_output in step_outputs:
+            yield step_output
+
+    def _save_checkpoint(
+        self,
+        checkpoint: Optional[RunCheckpoint],
+        index: int,
+        step_name: str,
+        step_output: Union[StepOutput, List[StepOutput]],
+    ) -> None:
+        if checkpoint is None:
+            return
+        try:
+            checkpoint.save(index, step_name, step_output)
+        except Exception as e:
+            log_warning(f"Could not checkpoint step {step_name} of run {checkpoint.run_id}: {e}")
+
+    def _clear_checkpoint(self, checkpoint: Optional[RunCheckpoint]) -> None:
+        """Completed runs have nothing to resume"""
+        if checkpoint is None:
+            return
+        try:
+            checkpoint.clear()
+        except Exception as e:
+            log_warning(f"Could not clear the checkpoint of run {checkpoint.run_id}: {e}")
+
     def _save_run_to_storage(self, workflow_run_response: WorkflowRunResponse) -> None:
         """Helper method to save workflow run response to storage"""
         if self.workflow_session:
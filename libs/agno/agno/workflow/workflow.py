@@ -19,6 +19,7 @@ from agno.run.team import TeamRunResponseEvent
 from agno.run.workflow import WorkflowRunResponseEvent
 from agno.storage.base import Storage
 from agno.storage.session.workflow import WorkflowSession
+from agno.tracing import Tracer, trace_run
 from agno.utils.common import nested_model_dump
 from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
 from agno.utils.merge_dict import merge_dictionaries
@@ -64,6 +65,8 @@ class Workflow:
     # telemetry=True logs minimal telemetry for analytics
     # This helps us improve the Workflow and provide better support
     telemetry: bool = field(default_factory=lambda: getenv("AGNO_TELEMETRY", "true").lower() == "true")
+    # Records each run as a trace of spans (agent and team runs, model calls, tool calls, ...)
+    tracer: Optional[Tracer] = None
 
     # --- Run Info: DO NOT SET ---
     run_id: Optional[str] = None
@@ -93,6 +96,7 @@ class Workflow:
         monitoring: bool = False,
         telemetry: bool = True,
         app_id: Optional[str] = None,
+        tracer: Optional[Tracer] = None,
     ):
         self.name = name or self.__class__.__name__
         self.workflow_id = workflow_id
@@ -112,6 +116,7 @@ class Workflow:
         self.debug_mode = debug_mode
         self.monitoring = monitoring
         self.telemetry = telemetry
+        self.tracer = tracer
 
         self.run_id = None
         self.run_input = None
@@ -145,6 +150,7 @@ class Workflow:
         logger.error(f"{self.__class__.__name__}.run() method not implemented.")
         return
 
+    @trace_run("workflow.run")
     def run_workflow(self, **kwargs: Any):
         """Run the Workflow"""
 
@@ -244,6 +250,7 @@ class Workflow:
             return None
 
     # Add to workflow.py after the run_workflow method
+    @trace_run("workflow.run")
     async def arun_workflow(self, **kwargs: Any):
         """Run the Workflow asynchronously"""
 
@@ -300,6 +307,7 @@ class Workflow:
             logger.warning(f"Workflow.arun() should only return RunResponse objects, got: {type(result)}")
             return None
 
+    @trace_run("workflow.run")
     async def arun_workflow_generator(self, **kwargs: Any) -> AsyncIterator[RunResponse]:
         """Run the Workflow asynchronously for async generators"""
 
@@ -648,7 +656,7 @@ class Workflow:
             Optional[WorkflowSession]: The loaded WorkflowSession or None if not found.
         """
         if self.storage is not None and self.session_id is not None:
-            self.workflow_session = cast(WorkflowSession, self.storage.read(session_id=self.session_id))
+            self.workflow_session = cast(WorkflowSession, self.storage.traced_read(session_id=self.session_id))
             if self.workflow_session is not None:
                 self.load_workflow_session(session=self.workflow_session)
         return self.workflow_session
@@ -660,7 +668,9 @@ class Workflow:
             Optional[WorkflowSession]: The saved WorkflowSession or None if not saved.
         """
         if self.storage is not None:
-            self.workflow_session = cast(WorkflowSession, self.storage.upsert(session=self.get_workflow_session()))
+            self.workflow_session = cast(
+                WorkflowSession, self.storage.traced_upsert(session=self.get_workflow_session())
+            )
         return self.workflow_session
 
     def load_session(self, force: bool = False) -> Optional[str]:
@@ -64,6 +64,9 @@ class WorkspaceSettings(BaseSettings):
     # Set to True if Agno should continue patching
     # resources after a resource patch has failed
     continue_on_patch_failure: bool = False
+    # Maximum number of resources created, updated or deleted at the same time.
+    # Independent resources run concurrently, set to 1 to process resources one at a time
+    max_concurrent_resources: int = 8
 
     # AWS settings
     # Region for AWS resources
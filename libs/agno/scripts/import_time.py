@@ -0,0 +1,96 @@
+"""
+Measures the import time of agno modules, each in a fresh interpreter.
+
+Usage:
+    python scripts/import_time.py
+    python scripts/import_time.py --runs 10 --json import_time.json
+    python scripts/import_time.py --budget agno.agent:Agent=800 --budget agno.app.fastapi:FastAPIApp=2000
+
+Modules are given as `module` or `module:name`, which measures `from module import name`. Package exports are
+imported on first access, so `module:name` is what users pay for.
+
+Prints a markdown table of the median import time of each module. With --budget, exits with an error when a module
+takes longer than its budget (in milliseconds). Use `python -X importtime -c "import <module>"` to see what a slow
+import spends its time on.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+DEFAULT_MODULES = [
+    "agno",
+    "agno.agent:Agent",
+    "agno.team:Team",
+    "agno.workflow.v2:Workflow",
+    "agno.app.fastapi:FastAPIApp",
+]
+
+MEASURE = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def get_import_statement(module: str) -> str:
+    module_name, _, name = module.partition(":")
+    return f"from {module_name} import {name}" if name else f"import {module_name}"
+
+
+def measure(module: str, runs: int) -> List[float]:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE.format(statement=get_import_statement(module))],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]) * 1000)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="Modules to import, as module[:name]")
+    parser.add_argument("--runs", type=int, default=5, help="Imports per module, the median is reported")
+    parser.add_argument("--json", dest="json_file", help="Also write the results to this file")
+    parser.add_argument(
+        "--budget", action="append", default=[], metavar="MODULE=MS", help="Maximum median import time of a module"
+    )
+    args = parser.parse_args()
+
+    budgets: Dict[str, float] = {}
+    for budget in args.budget:
+        module, _, ms = budget.rpartition("=")
+        budgets[module] = float(ms)
+
+    # Import every module once first, so compiling the bytecode is not measured
+    for module in set(args.modules) | set(budgets):
+        measure(module, runs=1)
+
+    results: Dict[str, Dict[str, float]] = {}
+    print("| Module | Median (ms) | Min (ms) | Max (ms) |")
+    print("| --- | ---: | ---: | ---: |")
+    for module in list(dict.fromkeys(args.modules + list(budgets))):
+        timings = measure(module, runs=args.runs)
+        results[module] = {"median": statistics.median(timings), "min": min(timings), "max": max(timings)}
+        print(f"| {module} | {results[module]['median']:.0f} | {min(timings):.0f} | {max(timings):.0f} |")
+
+    if args.json_file:
+        with open(args.json_file, "w") as f:
+            json.dump(results, f, indent=2)
+
+    over_budget = [module for module, ms in budgets.items() if results[module]["median"] > ms]
+    for module in over_budget:
+        print(f"{module} took {results[module]['median']:.0f}ms to import, over its budget of {budgets[module]:.0f}ms")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
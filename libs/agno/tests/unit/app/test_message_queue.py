@@ -0,0 +1,106 @@
+import asyncio
+
+from agno.app.message_queue import SessionMessageQueue
+
+
+def _handler(log, session_id, message, delay=0.01):
+    async def handle():
+        log.append(("start", session_id, message))
+        await asyncio.sleep(delay)
+        log.append(("end", session_id, message))
+
+    return handle
+
+
+async def test_messages_of_a_session_are_processed_in_order():
+    queue = SessionMessageQueue()
+    log = []
+    for i in range(5):
+        assert queue.submit("session-1", _handler(log, "session-1", i))
+    await queue.join()
+
+    assert [entry[2] for entry in log if entry[0] == "start"] == [0, 1, 2, 3, 4]
+    # A message only starts once the previous one ended
+    for i in range(0, len(log), 2):
+        assert log[i][0] == "start" and log[i + 1] == ("end", "session-1", log[i][2])
+    assert queue.get_metrics()["processed"] == 5
+    assert queue.get_metrics()["sessions"] == 0
+
+
+async def test_sessions_are_processed_in_parallel():
+    queue = SessionMessageQueue(max_workers=4)
+    log = []
+    for session_id in ["a", "b", "c"]:
+        queue.submit(session_id, _handler(log, session_id, 0, delay=0.05))
+    await queue.join()
+
+    # Every session started before any of them ended
+    assert [entry[0] for entry in log[:3]] == ["start", "start", "start"]
+
+
+async def test_max_workers_limits_concurrency():
+    queue = SessionMessageQueue(max_workers=2)
+    active = 0
+    max_active = 0
+
+    async def handle():
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    for i in range(6):
+        queue.submit(f"session-{i}", handle)
+    await queue.join()
+
+    assert max_active == 2
+    assert queue.get_metrics()["processed"] == 6
+
+
+async def test_duplicate_messages_are_dropped():
+    queue = SessionMessageQueue()
+    log = []
+    assert queue.submit("session-1", _handler(log, "session-1", "first"), idempotency_key="event-1")
+    # Duplicates are accepted, so the platform does not retry them, but not processed
+    assert queue.submit("session-1", _handler(log, "session-1", "retry"), idempotency_key="event-1")
+    await queue.join()
+
+    assert [entry[2] for entry in log] == ["first", "first"]
+    assert queue.get_metrics()["duplicates"] == 1
+
+
+async def test_full_queue_rejects_messages_and_failures_are_counted():
+    queue = SessionMessageQueue(max_queue_size=2)
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    assert queue.submit("session-1", fail)
+    assert queue.submit("session-1", fail)
+    assert not queue.submit("session-1", fail)
+    await queue.join()
+
+    metrics = queue.get_metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["failed"] == 2
+    assert metrics["pending"] == 0
+    # The queue accepts messages again once it drained
+    assert queue.submit("session-1", fail)
+    await queue.join()
+
+
+async def test_rejected_message_is_queued_when_retried():
+    queue = SessionMessageQueue(max_queue_size=1)
+    log = []
+    assert queue.submit("session-1", _handler(log, "session-1", "first"), idempotency_key="event-1")
+    assert not queue.submit("session-1", _handler(log, "session-1", "second"), idempotency_key="event-2")
+    await queue.join()
+
+    # The platform retries the rejected event once the queue has room
+    assert queue.submit("session-1", _handler(log, "session-1", "second"), idempotency_key="event-2")
+    await queue.join()
+
+    assert [entry[2] for entry in log if entry[0] == "start"] == ["first", "second"]
+    assert queue.get_metrics()["rejected"] == 1
+    assert queue.get_metrics()["duplicates"] == 0
@@ -0,0 +1,69 @@
+from typing import List, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from agno.agent import Agent
+from agno.app.message_queue import SessionMessageQueue
+
+
+class RecordingQueue(SessionMessageQueue):
+    """Records accepted messages without processing them, and rejects them while `full` is set"""
+
+    def __init__(self):
+        super().__init__()
+        self.full = True
+        self.accepted: List[Optional[str]] = []
+
+    def submit(self, session_id, handler, idempotency_key=None):
+        if self.full:
+            self.num_rejected += 1
+            return False
+        self.accepted.append(idempotency_key)
+        return True
+
+
+def _client(router) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_whatsapp_webhook_asks_for_a_retry_when_the_queue_is_full(monkeypatch):
+    from agno.app.whatsapp.async_router import get_async_router
+
+    monkeypatch.setenv("APP_ENV", "development")
+    queue = RecordingQueue()
+    client = _client(get_async_router(agent=Agent(telemetry=False), message_queue=queue))
+    payload = {
+        "object": "whatsapp_business_account",
+        "entry": [{"changes": [{"value": {"messages": [{"id": "wamid-1", "from": "123", "type": "text"}]}}]}],
+    }
+
+    response = client.post("/webhook", json=payload)
+    assert response.status_code == 503
+
+    queue.full = False
+    response = client.post("/webhook", json=payload)
+    assert response.status_code == 200
+    assert queue.accepted == ["wamid-1"]
+
+
+def test_slack_events_ask_for_a_retry_when_the_queue_is_full(monkeypatch):
+    pytest.importorskip("slack_sdk")
+    from agno.app.slack import async_router
+
+    monkeypatch.setattr(async_router, "verify_slack_signature", lambda *args: True)
+    queue = RecordingQueue()
+    client = _client(async_router.get_async_router(agent=Agent(telemetry=False), message_queue=queue))
+    payload = {"event_id": "Ev1", "event": {"type": "message", "text": "Hi", "ts": "1.0", "channel": "C1"}}
+    headers = {"X-Slack-Request-Timestamp": "1", "X-Slack-Signature": "v0=test"}
+
+    response = client.post("/slack/events", json=payload, headers=headers)
+    assert response.status_code == 503
+
+    queue.full = False
+    response = client.post("/slack/events", json=payload, headers=headers)
+    assert response.status_code == 200
+    assert queue.accepted == ["Ev1"]
@@ -0,0 +1,96 @@
+import re
+from typing import List
+
+import pytest
+
+from agno.document.base import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+
+
+def legacy_clean_text(text: str) -> str:
+    text = re.sub(r"\n+", "\n", text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\t+", "\t", text)
+    text = re.sub(r"\r+", "\r", text)
+    text = re.sub(r"\f+", "\f", text)
+    return re.sub(r"\v+", "\v", text)
+
+
+def legacy_fixed_chunks(content: str, chunk_size: int, overlap: int) -> List[str]:
+    chunks = []
+    start = 0
+    while start + overlap < len(content):
+        end = min(start + chunk_size, len(content))
+        if end < len(content):
+            while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
+                end -= 1
+        if end == start:
+            end = start + chunk_size
+        chunks.append(content[start:end])
+        start = end - overlap
+    return chunks
+
+
+def legacy_recursive_chunks(content: str, chunk_size: int, overlap: int) -> List[str]:
+    chunks = []
+    start = 0
+    while start < len(content):
+        end = min(start + chunk_size, len(content))
+        if end < len(content):
+            for sep in ["\n", "."]:
+                last_sep = content[start:end].rfind(sep)
+                if last_sep != -1:
+                    end = start + last_sep + 1
+                    break
+        chunks.append(content[start:end])
+        new_start = end - overlap
+        if new_start <= start:
+            new_start = min(len(content), start + max(1, chunk_size // 10))
+        start = new_start
+    return chunks
+
+
+TEXT = (
+    "First line.\n\n\nSecond   line with  spaces.\t\tTabbed.\r\n\fForm feed.\v\vEnd. "
+    "Averyveryverylongwordwithoutanybreaksatallthatgoesonforever. Short. " * 20
+)
+
+
+def test_clean_text_matches_legacy():
+    assert FixedSizeChunking().clean_text(TEXT) == legacy_clean_text(TEXT)
+
+
+@pytest.mark.parametrize("chunk_size,overlap", [(10, 0), (64, 0), (500, 20), (1000, 100)])
+def test_fixed_size_chunking_matches_legacy(chunk_size, overlap):
+    document = Document(name="doc", content=TEXT, meta_data={"source": "test"})
+    chunks = FixedSizeChunking(chunk_size=chunk_size, overlap=overlap).chunk(document)
+
+    assert [chunk.content for chunk in chunks] == legacy_fixed_chunks(legacy_clean_text(TEXT), chunk_size, overlap)
+    assert [chunk.id for chunk in chunks] == [f"doc_{i}" for i in range(1, len(chunks) + 1)]
+    assert all(chunk.meta_data["source"] == "test" for chunk in chunks)
+
+
+@pytest.mark.parametrize("chunk_size,overlap", [(10, 0), (25, 5), (64, 16), (500, 0)])
+def test_recursive_chunking_matches_legacy(chunk_size, overlap):
+    document = Document(id="doc", content=TEXT)
+    chunks = RecursiveChunking(chunk_size=chunk_size, overlap=overlap).chunk(document)
+
+    assert [chunk.content for chunk in chunks] == legacy_recursive_chunks(legacy_clean_text(TEXT), chunk_size, overlap)
+    assert [chunk.meta_data["chunk"] for chunk in chunks] == list(range(1, len(chunks) + 1))
+
+
+def test_fixed_size_chunking_always_makes_progress():
+    # A break point inside the overlap used to move the window backwards forever
+    document = Document(name="doc", content=TEXT)
+    chunks = FixedSizeChunking(chunk_size=25, overlap=5).chunk(document)
+    assert legacy_clean_text(TEXT).endswith(chunks[-1].content)
+    assert all(len(chunk.content) <= 25 for chunk in chunks)
+
+
+def test_iter_chunks_is_lazy():
+    document = Document(name="doc", content=TEXT)
+    chunks = FixedSizeChunking(chunk_size=25).iter_chunks(document)
+    first = next(chunks)
+    assert first.meta_data["chunk"] == 1
+    assert next(chunks).meta_data["chunk"] == 2
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.embedder.cache import EmbeddingCache, SqliteEmbeddingCacheBackend
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting"
+    dimensions: int = 2
+    input_type: str = "search_query"
+    api_key: Optional[str] = None
+    fail: bool = False
+
+    def __post_init__(self):
+        self.calls: List[str] = []
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return [] if self.fail else [float(len(text)), 0.5]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), {"total_tokens": len(text)}
+
+
+def test_no_cache_by_default():
+    embedder = CountingEmbedder()
+    embedder.get_cached_embedding("hello")
+    embedder.get_cached_embedding("hello")
+    assert embedder.calls == ["hello", "hello"]
+
+
+def test_memory_cache_hits_normalized_text():
+    cache = EmbeddingCache(max_size=10)
+    embedder = CountingEmbedder(embedding_cache=cache)
+
+    assert embedder.get_cached_embedding("hello  world") == [12.0, 0.5]
+    assert embedder.get_cached_embedding(" hello\nworld ") == [12.0, 0.5]
+    assert embedder.calls == ["hello  world"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_usage_is_only_reported_for_api_calls():
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache())
+
+    assert embedder.get_cached_embedding_and_usage("hello") == ([5.0, 0.5], {"total_tokens": 5})
+    assert embedder.get_cached_embedding_and_usage("hello") == ([5.0, 0.5], None)
+    assert embedder.get_cached_embedding("hello") == [5.0, 0.5]
+    assert embedder.calls == ["hello"]
+
+
+def test_cache_is_namespaced_by_embedder():
+    cache = EmbeddingCache()
+    CountingEmbedder(id="a", embedding_cache=cache).get_cached_embedding("hello")
+    other = CountingEmbedder(id="b", embedding_cache=cache)
+    other.get_cached_embedding("hello")
+    assert other.calls == ["hello"]
+
+
+def test_cache_key_includes_fields_that_change_the_output():
+    cache = EmbeddingCache()
+    CountingEmbedder(embedding_cache=cache, input_type="search_document").get_cached_embedding("hello")
+    query_embedder = CountingEmbedder(embedding_cache=cache, input_type="search_query")
+    query_embedder.get_cached_embedding("hello")
+    assert query_embedder.calls == ["hello"]
+
+    # Credentials do not change the embeddings
+    assert CountingEmbedder(api_key="a").embedding_cache_key == CountingEmbedder(api_key="b").embedding_cache_key
+
+
+def test_failed_embeddings_are_not_cached():
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache(), fail=True)
+    embedder.get_cached_embedding("hello")
+    embedder.get_cached_embedding("hello")
+    assert embedder.calls == ["hello", "hello"]
+
+
+def test_batches_only_embed_cache_misses():
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache())
+    embedder.get_cached_embedding("a")
+
+    assert embedder.get_cached_embeddings(["a", "bb"]) == [[1.0, 0.5], [2.0, 0.5]]
+    assert embedder.get_cached_embeddings(["bb"]) == [[2.0, 0.5]]
+    assert embedder.calls == ["a", "bb"]
+
+
+def test_lru_eviction():
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache(max_size=2))
+    for text in ["a", "b", "a", "c", "a", "b"]:
+        embedder.get_cached_embedding(text)
+    # "b" is evicted by "c" because "a" was used more recently
+    assert embedder.calls == ["a", "b", "c", "b"]
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    db_file = str(tmp_path / "cache.db")
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache(backend=SqliteEmbeddingCacheBackend(db_file=db_file)))
+    document = Document(content="unchanged chunk")
+    document.embed(embedder)
+
+    restarted = CountingEmbedder(embedding_cache=EmbeddingCache(backend=SqliteEmbeddingCacheBackend(db_file=db_file)))
+    reingested = Document(content="unchanged chunk")
+    reingested.embed(restarted)
+
+    assert reingested.embedding == document.embedding
+    assert reingested.usage is None
+    assert restarted.calls == []
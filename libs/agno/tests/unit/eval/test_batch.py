@@ -0,0 +1,114 @@
+import json
+
+from agno.agent import Agent
+from agno.eval.accuracy import AccuracyAgentResponse
+from agno.eval.batch import BatchEval, EvalCase, load_eval_cases
+from agno.models.scripted import ScriptedModel, ScriptedToolCall, ScriptedTurn
+
+
+def get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"It is sunny in {city}"
+
+
+def get_agent() -> Agent:
+    model = ScriptedModel(
+        script=[
+            ScriptedTurn(tool_calls=[ScriptedToolCall(name="get_weather", arguments={"city": "Paris"})]),
+            "It is sunny in Paris.",
+        ],
+        latency=0.01,
+    )
+    return Agent(model=model, tools=[get_weather], telemetry=False, monitoring=False)
+
+
+def get_evaluator() -> Agent:
+    return Agent(
+        model=ScriptedModel(script=[json.dumps({"accuracy_score": 8, "accuracy_reason": "Close enough"})]),
+        response_model=AccuracyAgentResponse,
+        telemetry=False,
+        monitoring=False,
+    )
+
+
+def test_load_eval_cases(tmp_path):
+    jsonl_file = tmp_path / "cases.jsonl"
+    jsonl_file.write_text(
+        json.dumps({"id": "a", "input": "Weather?", "expected_output": "Sunny", "difficulty": "easy"})
+        + "\n"
+        + json.dumps({"input": "Tools?", "expected_tool_calls": ["get_weather"]})
+        + "\n"
+    )
+    csv_file = tmp_path / "cases.csv"
+    csv_file.write_text("input,expected_output,expected_tool_calls\nWeather?,,get_weather;get_time\n")
+
+    jsonl_cases = load_eval_cases(jsonl_file)
+    assert jsonl_cases[0].id == "a"
+    assert jsonl_cases[0].metadata == {"difficulty": "easy"}
+    assert jsonl_cases[1].expected_tool_calls == ["get_weather"]
+    # Case ids are stable when not provided
+    assert jsonl_cases[1].id == load_eval_cases(jsonl_file)[1].id
+
+    csv_cases = load_eval_cases(csv_file)
+    assert csv_cases[0].expected_output is None
+    assert csv_cases[0].expected_tool_calls == ["get_weather", "get_time"]
+
+
+def test_batch_eval():
+    cases = [
+        EvalCase(
+            input=f"What is the weather in Paris? #{i}", expected_output="Sunny", expected_tool_calls=["get_weather"]
+        )
+        for i in range(6)
+    ] + [EvalCase(input="Wrong tools", expected_tool_calls=["get_time"])]
+
+    result = BatchEval(cases=cases, agent=get_agent(), evaluator_agent=get_evaluator(), concurrency=3).run()
+
+    assert result is not None
+    assert result.num_cases == 7
+    assert result.num_errors == 0
+    assert result.avg_score == 8
+    assert result.results[0].output == "It is sunny in Paris."
+    assert result.results[0].latency >= 0.01
+    assert result.results[-1].reliability_status == "FAILED"
+    assert result.reliability_pass_rate == 6 / 7
+
+
+def test_batch_eval_with_team():
+    from agno.team import Team
+
+    member = Agent(name="member", model=ScriptedModel(script=["member"]), telemetry=False, monitoring=False)
+    team = Team(
+        members=[member], model=ScriptedModel(script=["It is sunny in Paris."]), telemetry=False, monitoring=False
+    )
+    cases = [EvalCase(input=f"What is the weather in Paris? #{i}", expected_output="Sunny") for i in range(3)]
+
+    result = BatchEval(cases=cases, team=team, evaluator_agent=get_evaluator(), concurrency=3).run()
+
+    assert result is not None
+    assert result.num_errors == 0
+    assert result.avg_score == 8
+    assert [r.output for r in result.results] == ["It is sunny in Paris."] * 3
+
+
+def test_batch_eval_resumes_from_checkpoint(tmp_path):
+    checkpoint_file = tmp_path / "checkpoint.jsonl"
+    cases = [EvalCase(input=f"Question {i}", expected_tool_calls=["get_weather"]) for i in range(4)]
+
+    BatchEval(cases=cases[:2], agent=get_agent(), checkpoint_file=str(checkpoint_file)).run()
+    assert len(checkpoint_file.read_text().splitlines()) == 2
+
+    evaluated = []
+    batch_eval = BatchEval(cases=cases, agent=get_agent(), checkpoint_file=str(checkpoint_file))
+    evaluate_case = batch_eval.evaluate_case
+
+    async def tracking_evaluate_case(case):
+        evaluated.append(case.id)
+        return await evaluate_case(case)
+
+    batch_eval.evaluate_case = tracking_evaluate_case  # type: ignore
+    result = batch_eval.run()
+
+    assert evaluated == [cases[2].id, cases[3].id]
+    assert [r.case_id for r in result.results] == [case.id for case in cases]
+    assert len(checkpoint_file.read_text().splitlines()) == 4
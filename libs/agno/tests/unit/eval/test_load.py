@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+from agno.agent import Agent
+from agno.eval.load import LoadTest, LoadTestResult, agent_request, app_request, workflow_request
+from agno.models.scripted import ScriptedModel
+
+
+def test_result_stats():
+    result = LoadTestResult(latencies=[0.1, 0.2, 0.3, 0.4], num_errors=1, duration=2.0, cpu_time=1.0)
+    assert result.num_requests == 5
+    assert result.requests_per_second == 2.0
+    assert result.cpu_utilization == 0.5
+    assert result.p50_latency == 0.25
+    assert result.p99_latency >= result.p95_latency >= result.p50_latency
+
+
+def test_requests_run_concurrently():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request(index: int):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    result = LoadTest(func=request, num_requests=20, concurrency=5, measure_memory=False).run()
+
+    assert max_in_flight == 5
+    assert len(result.latencies) == 20
+    # 4 waves of 5 concurrent requests
+    assert result.duration < 0.15
+
+
+def test_errors_are_counted():
+    def request(index: int):
+        if index % 2:
+            raise ValueError("boom")
+
+    result = LoadTest(func=request, num_requests=10, concurrency=2, measure_memory=False).run()
+    assert result.num_errors == 5
+    assert result.error_counts == {"ValueError: boom": 5}
+    assert len(result.latencies) == 5
+
+
+def test_time_to_first_token_for_sync_generators():
+    def request(index: int):
+        time.sleep(0.01)
+        yield ""
+        yield "token"
+
+    result = LoadTest(func=request, num_requests=4, concurrency=2).run()
+    assert len(result.times_to_first_token) == 4
+    assert result.p50_time_to_first_token >= 0.01
+    assert result.peak_memory >= 0
+
+
+def test_agent_load_test():
+    agent = Agent(model=ScriptedModel(script=["a b c d"], latency=0.01), telemetry=False, monitoring=False)
+    load_test = LoadTest(func=agent_request(agent, "Hi", stream=True), num_requests=8, concurrency=4, warmup_requests=2)
+
+    result = load_test.run()
+
+    assert result.num_errors == 0
+    assert len(result.latencies) == 8
+    assert len(result.times_to_first_token) == 8
+    assert result.requests_per_second > 0
+
+
+def test_team_load_test():
+    from agno.team import Team
+
+    member = Agent(name="member", model=ScriptedModel(script=["member"]), telemetry=False, monitoring=False)
+    team = Team(members=[member], model=ScriptedModel(script=["a b c"]), telemetry=False, monitoring=False)
+
+    result = LoadTest(func=agent_request(team, "Hi"), num_requests=4, concurrency=2).run()
+
+    assert result.num_errors == 0, result.error_counts
+    assert len(result.latencies) == 4
+    # Every request ran on its own copy
+    assert team.session_id is None
+
+
+def test_workflow_v2_load_test():
+    from agno.workflow.v2 import Workflow
+
+    agent = Agent(name="step", model=ScriptedModel(script=["a b c"]), telemetry=False, monitoring=False)
+    workflow = Workflow(name="scripted-workflow", steps=[agent])
+
+    result = LoadTest(func=workflow_request(workflow, message="Hi"), num_requests=4, concurrency=2).run()
+
+    assert result.num_errors == 0, result.error_counts
+    assert len(result.latencies) == 4
+    assert workflow.session_id is None
+
+
+def test_app_load_test():
+    from agno.app.fastapi.app import FastAPIApp
+
+    agent = Agent(agent_id="scripted-agent", model=ScriptedModel(script=["a b c"]), telemetry=False, monitoring=False)
+    api_app = FastAPIApp(agents=[agent], monitoring=False).get_app()
+
+    result = LoadTest(
+        func=app_request(api_app, "Hi", agent_id="scripted-agent", stream=True), num_requests=4, concurrency=2
+    ).run()
+
+    assert result.num_errors == 0
+    assert len(result.times_to_first_token) == 4
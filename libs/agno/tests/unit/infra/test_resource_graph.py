@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Any, List, Optional
+
+from agno.infra.graph import ResourceGraph
+from agno.infra.resource import InfraResource
+
+
+class Network(InfraResource):
+    pass
+
+
+class Image(InfraResource):
+    pass
+
+
+class Container(InfraResource):
+    pass
+
+
+class Reference:
+    def __init__(self, reference):
+        self.reference = reference
+
+
+class Rule(InfraResource):
+    source_id: Optional[Any] = None
+
+
+class SecurityGroup(InfraResource):
+    rules: Optional[List[Rule]] = None
+
+    def get_security_group_id(self) -> str:
+        return self.name
+
+
+INSTALL_ORDER = {"Network": 100, "Image": 200, "Container": 300}
+TYPE_DEPENDENCIES = {"Network": [], "Image": [], "Container": ["Network", "Image"]}
+
+
+def _names(waves: List[List[InfraResource]]) -> List[List[str]]:
+    return [[resource.name for resource in wave] for wave in waves]
+
+
+def test_independent_resource_types_share_a_wave():
+    resources = [Container(name="app"), Image(name="img"), Network(name="net")]
+
+    graph = ResourceGraph(resources, install_order=INSTALL_ORDER, type_dependencies=TYPE_DEPENDENCIES)
+
+    assert _names(graph.waves) == [["net", "img"], ["app"]]
+
+
+def test_types_missing_from_the_map_follow_the_install_order():
+    resources = [Container(name="app"), Image(name="img"), Network(name="net")]
+
+    graph = ResourceGraph(resources, install_order=INSTALL_ORDER)
+
+    assert _names(graph.waves) == [["net"], ["img"], ["app"]]
+
+
+def test_reverse_graph_deletes_dependents_first():
+    resources = [Container(name="app"), Image(name="img"), Network(name="net")]
+
+    graph = ResourceGraph(resources, install_order=INSTALL_ORDER, type_dependencies=TYPE_DEPENDENCIES, reverse=True)
+
+    assert _names(graph.waves) == [["app"], ["img", "net"]]
+
+
+def test_explicit_dependencies_are_added_and_ordered():
+    db = Container(name="db")
+    app = Container(name="app", depends_on=[db])
+
+    graph = ResourceGraph([app], install_order=INSTALL_ORDER, type_dependencies=TYPE_DEPENDENCIES)
+
+    assert len(graph) == 2
+    assert _names(graph.waves) == [["db"], ["app"]]
+
+
+def test_referenced_resources_are_ordered_first():
+    lb_sg = SecurityGroup(name="lb-sg")
+    app_sg = SecurityGroup(name="app-sg", rules=[Rule(name="rule", source_id=Reference(lb_sg.get_security_group_id))])
+    other_sg = SecurityGroup(name="other-sg")
+
+    graph = ResourceGraph([app_sg, lb_sg, other_sg], install_order=INSTALL_ORDER)
+
+    assert _names(graph.waves) == [["lb-sg", "other-sg"], ["app-sg"]]
+
+    graph = ResourceGraph([app_sg, lb_sg, other_sg], install_order=INSTALL_ORDER, reverse=True)
+
+    assert _names(graph.waves) == [["app-sg", "other-sg"], ["lb-sg"]]
+
+
+def test_run_provisions_independent_resources_concurrently():
+    resources = [Container(name=f"app-{i}") for i in range(4)] + [Network(name="net")]
+    graph = ResourceGraph(resources, install_order=INSTALL_ORDER, type_dependencies=TYPE_DEPENDENCIES)
+    lock = threading.Lock()
+    running: List[int] = [0, 0]
+    order: List[str] = []
+
+    def action(resource: InfraResource) -> bool:
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            order.append(resource.name)
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return True
+
+    assert graph.run(action, max_workers=4) == 5
+    assert order[0] == "net"
+    assert running[1] == 4
+
+
+def test_run_stops_after_a_failure():
+    resources = [Network(name="net"), Image(name="img"), Container(name="app")]
+    graph = ResourceGraph(resources, install_order=INSTALL_ORDER, type_dependencies=TYPE_DEPENDENCIES)
+    started: List[str] = []
+
+    def action(resource: InfraResource) -> bool:
+        started.append(resource.name)
+        if resource.name == "img":
+            raise RuntimeError("pull failed")
+        return True
+
+    assert graph.run(action, max_workers=2, stop_on_failure=True) == 1
+    assert "app" not in started
+
+    # Without stop_on_failure the remaining resources are still processed
+    started.clear()
+    assert graph.run(action, max_workers=2) == 2
+    assert "app" in started
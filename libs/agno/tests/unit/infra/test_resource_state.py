@@ -0,0 +1,85 @@
+import threading
+from typing import Dict, List
+
+from agno.infra.state import ResourceStateCache
+
+
+class FakeApi:
+    """Counts describe calls, returns the state of the resources that exist"""
+
+    def __init__(self, existing: Dict[str, str]):
+        self.existing = existing
+        self.batch_calls: List[List[str]] = []
+        self.single_calls: List[str] = []
+
+    def describe(self, keys: List[str]) -> Dict[str, str]:
+        self.batch_calls.append(keys)
+        return {key: self.existing[key] for key in keys if key in self.existing}
+
+    def describe_one(self, key: str) -> str:
+        self.single_calls.append(key)
+        return self.existing.get(key)
+
+
+def test_registered_resources_are_read_in_one_batch():
+    api = FakeApi({"svc-1": "ACTIVE", "svc-2": "ACTIVE"})
+    cache = ResourceStateCache()
+    for key in ["svc-1", "svc-2", "svc-3"]:
+        cache.register("EcsService:prod", key)
+
+    states = [cache.get("EcsService:prod", key, api.describe) for key in ["svc-1", "svc-2", "svc-3"]]
+
+    assert states == ["ACTIVE", "ACTIVE", None]
+    assert api.batch_calls == [["svc-1", "svc-2", "svc-3"]]
+    assert cache.num_batch_reads == 1
+
+
+def test_concurrent_reads_share_one_batch():
+    api = FakeApi({f"c{i}": "running" for i in range(20)})
+    cache = ResourceStateCache()
+    for i in range(20):
+        cache.register("Container", f"c{i}")
+
+    threads = [threading.Thread(target=cache.get, args=("Container", f"c{i}", api.describe)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(api.batch_calls) == 1
+
+
+def test_invalidated_resources_are_read_again():
+    api = FakeApi({"sg": "old"})
+    cache = ResourceStateCache()
+    assert cache.get("SecurityGroup", "sg", api.describe, lambda: api.describe_one("sg")) == "old"
+
+    api.existing["sg"] = "new"
+    cache.invalidate("SecurityGroup", "sg")
+
+    assert cache.get("SecurityGroup", "sg", api.describe, lambda: api.describe_one("sg")) == "new"
+    assert api.single_calls == ["sg"]
+    assert len(api.batch_calls) == 1
+
+
+def test_failed_batch_falls_back_to_single_reads():
+    api = FakeApi({"lb": "active"})
+    cache = ResourceStateCache()
+
+    def fail(keys: List[str]) -> Dict[str, str]:
+        raise RuntimeError("throttled")
+
+    assert cache.get("LoadBalancer", "lb", fail, lambda: api.describe_one("lb")) == "active"
+    assert api.single_calls == ["lb"]
+
+
+def test_group_without_batch_reads_is_read_one_by_one():
+    api = FakeApi({"bucket": "exists"})
+    cache = ResourceStateCache()
+    cache.register("Bucket", "other")
+
+    assert cache.get("Bucket", "bucket", lambda keys: None, lambda: api.describe_one("bucket")) == "exists"
+    assert cache.num_batch_reads == 0
+    # Nothing is cached, so registered resources of the group are not reported missing
+    assert cache.get("Bucket", "other", lambda keys: None, lambda: api.describe_one("other")) is None
+    assert api.single_calls == ["bucket", "other"]
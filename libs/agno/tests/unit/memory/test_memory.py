@@ -7,6 +7,7 @@ from agno.memory.v2 import MemoryManager, SessionSummarizer
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.memory import Memory
 from agno.memory.v2.schema import SessionSummary, UserMemory
+from agno.memory.v2.summarizer import SessionSummaryResponse
 from agno.models.message import Message
 from agno.models.openai.chat import OpenAIChat
 from agno.run.response import RunResponse
@@ -322,6 +323,75 @@ def test_create_session_summary(memory_with_managers):
     assert memory_with_managers.summaries[user_id][session_id] == summary
 
 
+def _add_exchange(memory, session_id, run_id, question, answer):
+    memory.add_run(
+        session_id,
+        RunResponse(
+            run_id=run_id,
+            content=answer,
+            messages=[Message(role="user", content=question), Message(role="assistant", content=answer)],
+        ),
+    )
+
+
+def test_create_session_summary_incremental(mock_model, mock_db):
+    summarizer = SessionSummarizer(model=mock_model, incremental=True)
+    memory = Memory(model=mock_model, db=mock_db, summarizer=summarizer)
+    session_id, user_id = "test_session", "test_user"
+
+    _add_exchange(memory, session_id, "run_1", "Hello", "Hi there!")
+    _add_exchange(memory, session_id, "run_2", "I live in Paris", "Nice city!")
+
+    with patch.object(summarizer, "run", return_value=SessionSummaryResponse(summary="User lives in Paris")) as run:
+        summary = memory.create_session_summary(session_id, user_id)
+        assert len(run.call_args.kwargs["conversation"]) == 4
+        assert run.call_args.kwargs["previous_summary"] is None
+    assert summary.last_run_id == "run_2"
+
+    _add_exchange(memory, session_id, "run_3", "I like jazz", "Great taste!")
+
+    with patch.object(summarizer, "run", return_value=SessionSummaryResponse(summary="Parisian jazz fan")) as run:
+        summary = memory.create_session_summary(session_id, user_id)
+        # Only the new run is sent, with the previous summary
+        assert [m.content for m in run.call_args.kwargs["conversation"]] == ["I like jazz", "Great taste!"]
+        assert run.call_args.kwargs["previous_summary"].summary == "User lives in Paris"
+    assert summary.summary == "Parisian jazz fan"
+    assert summary.last_run_id == "run_3"
+    assert SessionSummary.from_dict(summary.to_dict()).last_run_id == "run_3"
+
+
+def test_create_session_summary_incremental_cadence(mock_model, mock_db):
+    summarizer = SessionSummarizer(model=mock_model, incremental=True, update_every_n_runs=2)
+    memory = Memory(model=mock_model, db=mock_db, summarizer=summarizer)
+    session_id, user_id = "test_session", "test_user"
+
+    with patch.object(summarizer, "run", return_value=SessionSummaryResponse(summary="Summary")) as run:
+        _add_exchange(memory, session_id, "run_1", "Hello", "Hi there!")
+        assert memory.create_session_summary(session_id, user_id) is None
+        assert run.call_count == 0
+
+        _add_exchange(memory, session_id, "run_2", "How are you?", "Fine, thanks!")
+        assert memory.create_session_summary(session_id, user_id).last_run_id == "run_2"
+        assert run.call_count == 1
+
+        # Not enough new runs, the summary is kept as is
+        _add_exchange(memory, session_id, "run_3", "Bye", "Goodbye!")
+        assert memory.create_session_summary(session_id, user_id).last_run_id == "run_2"
+        assert run.call_count == 1
+
+
+def test_incremental_summary_system_message(mock_model):
+    summarizer = SessionSummarizer(model=mock_model, incremental=True)
+    previous_summary = SessionSummary(summary="User lives in Paris", topics=["travel"])
+
+    system_message = summarizer.get_system_message(
+        [Message(role="user", content="I like jazz")], {"type": "json_object"}, previous_summary=previous_summary
+    )
+
+    assert "<previous_summary>\nUser lives in Paris\nTopics: travel\n</previous_summary>" in system_message.content
+    assert "User: I like jazz" in system_message.content
+
+
 def test_get_session_summary(memory_with_model, sample_session_summary):
     # Add a summary
     session_id = "test_session"
@@ -447,6 +517,69 @@ def test_add_run(memory_with_model, sample_run_response):
     assert memory_with_model.runs[session_id][0] == sample_run_response
 
 
+def test_add_run_replaces_existing_run(memory_with_model):
+    session_id = "test_session"
+    memory_with_model.add_run(session_id, RunResponse(run_id="run-1", content="first"))
+    memory_with_model.add_run(session_id, RunResponse(run_id="run-2", content="second"))
+    memory_with_model.add_run(session_id, RunResponse(run_id="run-1", content="updated"))
+
+    assert [run.content for run in memory_with_model.runs[session_id]] == ["updated", "second"]
+    assert memory_with_model.get_run_position(session_id, "run-2") == 1
+
+    # The index is rebuilt when the runs list is modified directly
+    memory_with_model.runs[session_id].insert(0, RunResponse(run_id="run-0"))
+    assert memory_with_model.get_run_position(session_id, "run-2") == 2
+    assert memory_with_model.has_run(session_id, "run-0")
+    assert not memory_with_model.has_run(session_id, "run-3")
+
+
+def test_run_index_detects_in_place_changes(memory_with_model):
+    session_id = "test_session"
+    for i in range(3):
+        memory_with_model.add_run(session_id, RunResponse(run_id=f"run-{i}"))
+    assert memory_with_model.get_run_position(session_id, "run-2") == 2
+
+    # Same list and length as the indexed one, but with other runs
+    runs = memory_with_model.runs[session_id]
+    runs.pop(0)
+    runs.append(RunResponse(run_id="run-3"))
+    assert memory_with_model.get_run_position(session_id, "run-2") == 1
+    assert memory_with_model.get_run_position(session_id, "run-3") == 2
+    assert not memory_with_model.has_run(session_id, "run-0")
+
+    # A run appended directly is found instead of being added twice
+    runs.append(RunResponse(run_id="run-4", content="direct"))
+    memory_with_model.add_run(session_id, RunResponse(run_id="run-4", content="replaced"))
+    assert [run.run_id for run in runs] == ["run-1", "run-2", "run-3", "run-4"]
+    assert runs[-1].content == "replaced"
+
+
+def test_run_index_skips_runs_without_run_id(memory_with_model):
+    session_id = "test_session"
+    memory_with_model.add_run(session_id, RunResponse(run_id=None))
+    memory_with_model.add_run(session_id, RunResponse(run_id="run-1"))
+
+    assert len(memory_with_model.runs[session_id]) == 2
+    assert memory_with_model.get_run_position(session_id, "run-1") == 1
+
+
+def test_merge_runs_from_storage(memory_with_model):
+    session_id = "test_session"
+    existing_run = RunResponse(run_id="run-1", session_id=session_id, content="in memory")
+    memory_with_model.add_run(session_id, existing_run)
+
+    stored_runs = [
+        RunResponse(run_id="run-1", session_id=session_id, content="stored").to_dict(),
+        RunResponse(run_id="run-2", session_id=session_id, content="new").to_dict(),
+    ]
+    assert memory_with_model.merge_runs_from_storage(session_id, stored_runs) == 1
+    assert memory_with_model.merge_runs_from_storage(session_id, stored_runs) == 0
+
+    runs = memory_with_model.runs[session_id]
+    assert runs[0] is existing_run
+    assert [run.run_id for run in runs] == ["run-1", "run-2"]
+
+
 def test_get_messages_for_session(memory_with_model):
     """Test retrieving messages for a session."""
     # Add a run with messages
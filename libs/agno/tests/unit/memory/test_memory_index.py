@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+from agno.memory.v2.index import MemoryIndex, estimate_memory_tokens, select_memories
+from agno.memory.v2.manager import MemoryManager
+
+VOCABULARY = ["tea", "coffee", "paris", "london", "dog", "cat", "jazz", "rock"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds text as keyword counts, and counts the texts it embeds."""
+
+    dimensions: Optional[int] = len(VOCABULARY)
+    calls: List[str] = field(default_factory=list)
+    batches: List[List[str]] = field(default_factory=list)
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(texts)
+        return [self.get_embedding(text) for text in texts]
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        words = text.lower().replace(".", "").split()
+        return [float(words.count(word)) for word in VOCABULARY]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def _memories() -> List[Dict]:
+    texts = ["User drinks tea", "User lives in Paris", "User has a dog", "User likes jazz", "User likes rock"]
+    return [
+        {"memory_id": f"m{i}", "memory": text, "last_updated": f"2024-01-0{i + 1}T00:00:00"}
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_select_memories_picks_relevant_and_recent():
+    index = MemoryIndex(KeywordEmbedder())
+
+    selected = select_memories(
+        _memories(), "Do I prefer tea or coffee?", "alice", index=index, num_relevant=1, num_recent=1
+    )
+
+    # The tea memory is the most relevant, the rock memory the most recently updated
+    assert [memory["memory_id"] for memory in selected] == ["m0", "m4"]
+
+
+def test_select_memories_returns_all_when_they_fit():
+    embedder = KeywordEmbedder()
+
+    selected = select_memories(_memories(), "tea", "alice", index=MemoryIndex(embedder), num_relevant=3, num_recent=2)
+
+    assert len(selected) == 5
+    assert embedder.calls == []
+
+
+def test_select_memories_respects_token_budget():
+    memories = _memories()
+    budget = estimate_memory_tokens(memories[0]) + estimate_memory_tokens(memories[1])
+
+    # Without an index, the budget is filled with the most recent memories
+    selected = select_memories(memories, "tea", "alice", max_tokens=budget)
+
+    assert [memory["memory_id"] for memory in selected] == ["m3", "m4"]
+
+
+def test_memory_index_embeds_only_new_or_changed_memories():
+    embedder = KeywordEmbedder()
+    index = MemoryIndex(embedder)
+    memories = _memories()
+
+    index.search("alice", "tea", memories)
+    assert len(embedder.calls) == 6
+    # A cold index embeds every memory in one batch
+    assert embedder.batches == [[memory["memory"] for memory in memories]]
+
+    memories[1] = {**memories[1], "memory": "User lives in London"}
+    index.search("alice", "london", memories)
+    assert embedder.calls[6:] == ["london", "User lives in London"]
+    assert embedder.batches[1:] == [["User lives in London"]]
+
+
+def test_memory_manager_prompt_only_contains_selected_memories():
+    manager = MemoryManager(embedder=KeywordEmbedder(), num_relevant_memories=1, num_recent_memories=0)
+
+    existing_memories = manager.get_relevant_memories(_memories(), query="I adopted a cat and a dog", user_id="alice")
+    system_message = manager.get_system_message(existing_memories=existing_memories)
+
+    assert "User has a dog" in system_message.content
+    assert "User lives in Paris" not in system_message.content
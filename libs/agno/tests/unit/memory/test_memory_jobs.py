@@ -0,0 +1,170 @@
+import json
+import threading
+import time
+from typing import List
+
+import pytest
+
+from agno.agent import Agent
+from agno.memory.v2.jobs import MemoryJob, MemoryJobBackend, MemoryJobQueue, SqliteMemoryJobBackend
+from agno.memory.v2.memory import Memory
+from agno.models.message import Message
+from agno.models.scripted import ScriptedModel
+
+
+class RecordingMemory:
+    """Stands in for Memory, records the jobs it runs and can hold them until released."""
+
+    def __init__(self, fail_times: int = 0):
+        self.jobs: List[MemoryJob] = []
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+        self.fail_times = fail_times
+
+    def process_job(self, job: MemoryJob, storage=None) -> None:
+        self.started.set()
+        self.release.wait(timeout=5)
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("model unavailable")
+        self.jobs.append(MemoryJob.from_dict(job.to_dict()))
+
+
+def test_updates_for_a_user_are_coalesced():
+    queue = MemoryJobQueue()
+    memory = RecordingMemory()
+    memory.release.clear()
+
+    queue.submit(memory, user_id="alice", messages=[Message(role="user", content="first")], session_id="s1")
+    assert memory.started.wait(timeout=5)
+    # The first job is running, the burst that follows is merged into one pending job
+    queue.submit(memory, user_id="alice", messages=[Message(role="user", content="second")], session_id="s1")
+    queue.submit(memory, user_id="alice", messages=[Message(role="user", content="third")], session_id="s2")
+    assert queue.has_pending("alice")
+    memory.release.set()
+
+    assert queue.wait("alice", timeout=5)
+    assert not queue.has_pending("alice")
+    assert [[m.content for m in job.messages] for job in memory.jobs] == [["first"], ["second", "third"]]
+    assert memory.jobs[1].session_ids == ["s1", "s2"]
+    queue.shutdown()
+
+
+def test_failed_jobs_are_retried_with_backoff():
+    queue = MemoryJobQueue(max_retries=2, retry_delay=0.05)
+    memory = RecordingMemory(fail_times=2)
+
+    start = time.perf_counter()
+    queue.submit(memory, user_id="bob", messages=[Message(role="user", content="hi")])
+
+    assert queue.wait(timeout=5)
+    assert len(memory.jobs) == 1
+    assert memory.jobs[0].attempts == 3
+    # Retries wait 0.05s, then 0.1s
+    assert time.perf_counter() - start >= 0.15
+    queue.shutdown()
+
+
+def test_job_backends_must_implement_every_method():
+    class IncompleteBackend(MemoryJobBackend):
+        def save(self, job: MemoryJob) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()  # type: ignore
+
+
+def test_persisted_jobs_are_recovered(tmp_path):
+    db_file = str(tmp_path / "jobs.db")
+    backend = SqliteMemoryJobBackend(db_file=db_file)
+    backend.save(MemoryJob(user_id="carol", messages=[Message(role="user", content="I like tea")], session_ids=["s1"]))
+
+    queue = MemoryJobQueue(backend=SqliteMemoryJobBackend(db_file=db_file))
+    memory = RecordingMemory()
+
+    assert queue.recover(memory) == 1
+    assert queue.wait(timeout=5)
+    assert memory.jobs[0].messages[0].content == "I like tea"
+    assert memory.jobs[0].session_ids == ["s1"]
+    # Finished jobs are removed from the store
+    assert backend.load() == []
+    queue.shutdown()
+
+
+def test_agent_run_does_not_wait_for_memory_updates():
+    queue = MemoryJobQueue()
+    memory = Memory(model=ScriptedModel(), job_queue=queue)
+    processed: List[MemoryJob] = []
+    release = threading.Event()
+
+    def process_job(job: MemoryJob, storage=None) -> None:
+        release.wait(timeout=5)
+        processed.append(job)
+
+    memory.process_job = process_job  # type: ignore
+    agent = Agent(
+        model=ScriptedModel(script=["Noted."]),
+        memory=memory,
+        enable_user_memories=True,
+        enable_session_summaries=True,
+    )
+
+    response = agent.run("My name is Dana", user_id="dana", session_id="s1")
+
+    assert response.content == "Noted."
+    assert processed == []
+    assert queue.has_pending("dana")
+
+    # The next run for the user waits for the queued update
+    threading.Timer(0.05, release.set).start()
+    agent.run("What is my name?", user_id="dana", session_id="s1")
+
+    assert len(processed) >= 1
+    assert processed[0].messages[0].content == "My name is Dana"
+    assert processed[0].session_ids == ["s1"]
+    queue.shutdown()
+
+
+def test_background_summaries_are_stored(tmp_path):
+    from agno.storage.sqlite import SqliteStorage
+
+    summary = json.dumps({"summary": "Dana introduced themselves.", "topics": ["introductions"]})
+    queue = MemoryJobQueue()
+    memory = Memory(model=ScriptedModel(script=[summary]), job_queue=queue)
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "agent.db"))
+    agent = Agent(model=ScriptedModel(script=["Noted."]), memory=memory, storage=storage, enable_session_summaries=True)
+
+    agent.run("My name is Dana", user_id="dana", session_id="s1")
+    assert queue.wait(timeout=5)
+
+    session = storage.read(session_id="s1")
+    assert session is not None
+    assert session.memory["summaries"]["dana"]["s1"]["summary"] == "Dana introduced themselves."
+    queue.shutdown()
+
+
+def test_background_summaries_are_stored_without_cached_sessions(tmp_path):
+    from agno.storage.sqlite import SqliteStorage
+
+    summary = json.dumps({"summary": "Dana introduced themselves.", "topics": ["introductions"]})
+    queue = MemoryJobQueue()
+    memory = Memory(model=ScriptedModel(script=[summary]), job_queue=queue)
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "agent.db"))
+    agent = Agent(
+        model=ScriptedModel(script=["Noted."]),
+        memory=memory,
+        storage=storage,
+        enable_session_summaries=True,
+        cache_session=False,
+    )
+
+    agent.run("My name is Dana", user_id="dana", session_id="s1")
+    assert queue.wait(timeout=5)
+
+    # The runs were dropped from memory after the run, the summary is created from the stored session
+    assert "s1" not in (memory.runs or {})
+    session = storage.read(session_id="s1")
+    assert session is not None
+    assert session.memory["summaries"]["dana"]["s1"]["summary"] == "Dana introduced themselves."
+    queue.shutdown()
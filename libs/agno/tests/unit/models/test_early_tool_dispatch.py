@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.base import StreamingToolDispatcher, _tool_call_arguments_complete
+from agno.models.scripted import ScriptedModel, ScriptedToolCall, ScriptedTurn
+from agno.tools.function import Function
+
+started: List[str] = []
+
+
+def lookup(key: str, delay: float) -> str:
+    """Look up a key."""
+    started.append(key)
+    time.sleep(delay)
+    return f"value of {key}"
+
+
+def _model(**kwargs) -> ScriptedModel:
+    return ScriptedModel(
+        script=[
+            ScriptedTurn(
+                tool_calls=[
+                    ScriptedToolCall(name="lookup", arguments={"key": "a", "delay": 0.2}),
+                    ScriptedToolCall(name="lookup", arguments={"key": "b", "delay": 0.1}),
+                    ScriptedToolCall(name="lookup", arguments={"key": "c", "delay": 0.0}),
+                ]
+            ),
+            "Done.",
+        ],
+        token_latency=0.1,
+        **kwargs,
+    )
+
+
+def test_arguments_complete():
+    assert _tool_call_arguments_complete({"function": {"name": "f", "arguments": '{"a": 1}'}})
+    assert not _tool_call_arguments_complete({"function": {"name": "f", "arguments": '{"a": {"b": 1}'}})
+    assert not _tool_call_arguments_complete({"function": {"name": "f", "arguments": ""}})
+
+
+def test_tools_start_while_streaming_and_results_stay_in_order():
+    started.clear()
+    agent = Agent(model=_model(early_tool_dispatch=True), tools=[lookup], telemetry=False, monitoring=False)
+
+    start = time.perf_counter()
+    events = list(agent.run("Look up a, b and c", stream=True, stream_intermediate_steps=True))
+    elapsed = time.perf_counter() - start
+
+    # Streaming the three tool calls takes 0.3s and the tools 0.3s, they overlap with early dispatch
+    assert elapsed < 0.55
+    assert started == ["a", "b", "c"]
+    completed = [event.tool.result for event in events if event.event == "ToolCallCompleted"]
+    assert completed == ["value of a", "value of b", "value of c"]
+    assert agent.run_response.content == "Done."
+
+
+def test_tools_start_while_streaming_async():
+    started.clear()
+    agent = Agent(model=_model(early_tool_dispatch=True), tools=[lookup], telemetry=False, monitoring=False)
+
+    async def run():
+        return [event async for event in await agent.arun("Look up a, b and c", stream=True)]
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.55
+    assert [tool.result for tool in agent.run_response.tools] == ["value of a", "value of b", "value of c"]
+
+
+def test_tools_needing_confirmation_are_not_started_early():
+    ran = threading.Event()
+
+    def delete_file(path: str) -> str:
+        """Delete a file."""
+        ran.set()
+        return "deleted"
+
+    function = Function.from_callable(delete_file)
+    function.requires_confirmation = True
+    dispatcher = StreamingToolDispatcher(ScriptedModel(), {"delete_file": function})
+    dispatcher.dispatch(
+        [{"id": "call_1", "type": "function", "function": {"name": "delete_file", "arguments": '{"path": "x"}'}}]
+    )
+
+    assert dispatcher.executions == {}
+    assert not ran.is_set()
+
+
+def test_tool_call_limit_is_respected():
+    calls = []
+
+    def record(key: str) -> str:
+        calls.append(key)
+        return key
+
+    dispatcher = StreamingToolDispatcher(ScriptedModel(), {"record": Function.from_callable(record)}, max_calls=1)
+    dispatcher.dispatch(
+        [
+            {
+                "id": f"call_{key}",
+                "type": "function",
+                "function": {"name": "record", "arguments": f'{{"key": "{key}"}}'},
+            }
+            for key in ["a", "b"]
+        ]
+    )
+    for execution in list(dispatcher.executions.values()):
+        execution.result()
+    dispatcher.close()
+
+    assert calls == ["a"]
+
+
+def test_started_tools_are_cancelled_when_the_stream_fails(monkeypatch):
+    closed: List[StreamingToolDispatcher] = []
+    close = StreamingToolDispatcher.close
+
+    def record_close(self):
+        closed.append(self)
+        close(self)
+
+    monkeypatch.setattr(StreamingToolDispatcher, "close", record_close)
+    model = _model(early_tool_dispatch=True)
+    process_response_stream = model.process_response_stream
+
+    def failing_stream(**kwargs):
+        for delta in process_response_stream(**kwargs):
+            yield delta
+            if delta.tool_calls:
+                raise ConnectionError("stream dropped")
+
+    monkeypatch.setattr(model, "process_response_stream", failing_stream)
+    agent = Agent(model=model, tools=[lookup], telemetry=False, monitoring=False)
+
+    with pytest.raises(ConnectionError):
+        list(agent.run("Look up a, b and c", stream=True))
+
+    assert len(closed) == 1
+    assert closed[0].executions == {}
+
+
+async def test_started_tasks_are_cancelled_when_the_stream_fails(monkeypatch):
+    started_tasks: List[asyncio.Future] = []
+    close = StreamingToolDispatcher.close
+
+    def record_close(self):
+        started_tasks.extend(self.executions.values())
+        close(self)
+
+    monkeypatch.setattr(StreamingToolDispatcher, "close", record_close)
+    model = _model(early_tool_dispatch=True)
+    aprocess_response_stream = model.aprocess_response_stream
+
+    async def failing_stream(**kwargs):
+        async for delta in aprocess_response_stream(**kwargs):
+            yield delta
+            if delta.tool_calls:
+                raise ConnectionError("stream dropped")
+
+    monkeypatch.setattr(model, "aprocess_response_stream", failing_stream)
+    agent = Agent(model=model, tools=[lookup], telemetry=False, monitoring=False)
+
+    with pytest.raises(ConnectionError):
+        [event async for event in await agent.arun("Look up a, b and c", stream=True)]
+
+    assert len(started_tasks) == 1
+    await asyncio.sleep(0)
+    assert started_tasks[0].cancelled()
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+import pytest
+
+from agno.exceptions import ModelProviderError
+from agno.models.base import Model
+from agno.models.fallback import FallbackModel
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class DelayedModel(Model):
+    id: str = "delayed"
+    delay: float = 0.0
+    fail: bool = False
+    chunks: Optional[List[str]] = None
+
+    def invoke(self, *args, **kwargs) -> Any:
+        time.sleep(self.delay)
+        if self.fail:
+            raise ModelProviderError("boom", model_id=self.id)
+        return self.id
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ModelProviderError("boom", model_id=self.id)
+        return self.id
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        time.sleep(self.delay)
+        if self.fail:
+            raise ModelProviderError("boom", model_id=self.id)
+        yield from self.chunks or [self.id]
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[Any]:  # type: ignore
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ModelProviderError("boom", model_id=self.id)
+        for chunk in self.chunks or [self.id]:
+            yield chunk
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+def _messages() -> List[Message]:
+    return [Message(role="user", content="Hello")]
+
+
+def test_requires_models():
+    with pytest.raises(ValueError):
+        FallbackModel()
+
+
+def test_inherits_primary_identity():
+    model = FallbackModel(models=[DelayedModel(id="a"), DelayedModel(id="b")])
+    assert model.id == "a"
+    assert model.to_dict()["models"][1]["id"] == "b"
+
+
+def test_fallback_on_error():
+    model = FallbackModel(models=[DelayedModel(id="a", fail=True), DelayedModel(id="b")])
+    assert model.response(messages=_messages()).content == "b"
+
+
+def test_all_models_fail():
+    model = FallbackModel(models=[DelayedModel(id="a", fail=True), DelayedModel(id="b", fail=True)])
+    with pytest.raises(ModelProviderError):
+        model.response(messages=_messages())
+
+
+def test_fallback_on_timeout():
+    model = FallbackModel(models=[DelayedModel(id="a", delay=1.0), DelayedModel(id="b")], timeout=0.1)
+    assert model.response(messages=_messages()).content == "b"
+
+
+def test_hedge_takes_fastest():
+    model = FallbackModel(
+        models=[DelayedModel(id="a", delay=1.0), DelayedModel(id="b", delay=0.05)], hedge=True, hedge_delay=0.05
+    )
+    start = time.perf_counter()
+    assert model.response(messages=_messages()).content == "b"
+    assert time.perf_counter() - start < 0.9
+
+
+def test_hedge_not_sent_for_fast_primary():
+    model = FallbackModel(models=[DelayedModel(id="a"), DelayedModel(id="b")], hedge=True, hedge_delay=0.5)
+    assert model.response(messages=_messages()).content == "a"
+    assert model.get_latency_percentile(1) is None
+
+
+def test_hedge_delay_from_latency_percentile():
+    model = FallbackModel(models=[DelayedModel(id="a")], hedge_delay=5.0, min_latency_samples=10)
+    for i in range(1, 101):
+        model.record_latency(0, i / 100)
+        if i == 9:
+            assert model.get_hedge_delay(0) == 5.0
+    assert model.get_hedge_delay(0) == pytest.approx(0.95)
+    assert model.get_latency_percentile(0, 50) == pytest.approx(0.5)
+
+
+def test_stream_fallback():
+    model = FallbackModel(models=[DelayedModel(id="a", fail=True), DelayedModel(id="b", chunks=["Hel", "lo"])])
+    chunks = [r.content for r in model.response_stream(messages=_messages()) if isinstance(r, ModelResponse)]
+    assert "".join(chunks) == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_takes_fastest():
+    model = FallbackModel(
+        models=[DelayedModel(id="a", delay=1.0), DelayedModel(id="b", delay=0.05)], hedge=True, hedge_delay=0.05
+    )
+    start = time.perf_counter()
+    response = await model.aresponse(messages=_messages())
+    assert response.content == "b"
+    assert time.perf_counter() - start < 0.9
+
+
+@pytest.mark.asyncio
+async def test_async_fallback_on_timeout():
+    model = FallbackModel(models=[DelayedModel(id="a", delay=1.0), DelayedModel(id="b")], timeout=0.1)
+    response = await model.aresponse(messages=_messages())
+    assert response.content == "b"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_hedge():
+    model = FallbackModel(
+        models=[DelayedModel(id="a", delay=1.0), DelayedModel(id="b", chunks=["Hel", "lo"])],
+        hedge=True,
+        hedge_delay=0.05,
+    )
+    chunks = []
+    async for response in model.aresponse_stream(messages=_messages()):
+        if isinstance(response, ModelResponse):
+            chunks.append(response.content)
+    assert "".join(chunks) == "Hello"
+
+
+def test_deep_copy_has_own_lock_and_executor():
+    from copy import deepcopy
+
+    model = FallbackModel(models=[DelayedModel(id="a", delay=0.2), DelayedModel(id="b")], hedge=True, hedge_delay=0.01)
+    model.response(messages=_messages())
+    assert model._executor is not None
+
+    copied = deepcopy(model)
+    assert copied._lock is not model._lock
+    assert copied._executor is None
+    assert [m.id for m in copied.models] == ["a", "b"]
+    assert copied.response(messages=_messages()).content == "b"
+    assert copied._executor is not model._executor
+
+    copied.close()
+    model.close()
+    assert model._executor is None
@@ -0,0 +1,97 @@
+from typing import Any, Dict
+from unittest.mock import patch
+
+from agno.media import Image
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.utils.models import claude as claude_utils
+
+
+def test_formatted_payload_is_cached():
+    message = Message(role="user", content="Hello")
+    calls = []
+
+    def formatter(m: Message) -> dict:
+        calls.append(m)
+        return {"content": m.content}
+
+    assert message.get_formatted("provider", formatter) == {"content": "Hello"}
+    assert message.get_formatted("provider", formatter) == {"content": "Hello"}
+    assert len(calls) == 1
+
+    # Different providers have separate entries
+    message.get_formatted("other-provider", formatter)
+    assert len(calls) == 2
+
+
+def test_cache_is_reset_when_message_changes():
+    message = Message(role="assistant", content="Hello")
+    formatter = lambda m: {"content": m.content}  # noqa: E731
+
+    assert message.get_formatted("provider", formatter) == {"content": "Hello"}
+    message.content = "Hello world"
+    assert message.get_formatted("provider", formatter) == {"content": "Hello world"}
+
+    # Updating metrics does not change the payload
+    message.metrics = message.metrics
+    assert message._formatted
+
+
+def test_copies_do_not_share_updates():
+    message = Message(role="user", content="Hello")
+    formatter = lambda m: {"content": m.content}  # noqa: E731
+    message.get_formatted("provider", formatter)
+
+    copy = message.model_copy()
+    copy.content = "Bye"
+
+    assert copy.get_formatted("provider", formatter) == {"content": "Bye"}
+    assert message.get_formatted("provider", formatter) == {"content": "Hello"}
+
+
+def test_openai_formats_history_once():
+    calls = []
+
+    class CountingOpenAIChat(OpenAIChat):
+        def _format_message(self, message: Message) -> Dict[str, Any]:
+            calls.append(message)
+            return super()._format_message(message)
+
+    model = CountingOpenAIChat(id="gpt-4o")
+    messages = [
+        Message(role="system", content="You are helpful"),
+        Message(role="user", content="Describe this", images=[Image(url="https://example.com/image.png")]),
+    ]
+
+    first = model._format_messages(messages)
+    messages.append(Message(role="assistant", content="A cat"))
+    second = model._format_messages(messages)
+
+    assert len(calls) == 3
+    assert second[:2] == first
+    assert second[1]["content"][1]["type"] == "image_url"
+
+
+def test_openai_role_map_is_part_of_the_key():
+    message = Message(role="system", content="You are helpful")
+
+    assert OpenAIChat(id="gpt-4o")._format_messages([message])[0]["role"] == "developer"
+    custom_role_map = {"system": "system", "user": "user", "assistant": "assistant", "tool": "tool"}
+    assert OpenAIChat(id="gpt-4o", role_map=custom_role_map)._format_messages([message])[0]["role"] == "system"
+
+
+def test_claude_formats_history_once():
+    messages = [
+        Message(role="system", content="You are helpful"),
+        Message(role="user", content="Hello"),
+        Message(role="assistant", content=""),
+    ]
+
+    with patch.object(claude_utils, "_format_message", wraps=claude_utils._format_message) as format_message:
+        claude_utils.format_messages(messages)
+        chat_messages, system_message = claude_utils.format_messages(messages)
+
+    assert system_message == "You are helpful"
+    assert chat_messages == [{"role": "user", "content": [{"type": "text", "text": "Hello"}]}]
+    # The user message is formatted once. The empty assistant message is skipped, and checked again on each call.
+    assert format_message.call_count == 3
@@ -0,0 +1,59 @@
+import asyncio
+
+from agno.agent import Agent
+from agno.models.message import Message
+from agno.models.scripted import ScriptedModel, ScriptedToolCall, ScriptedTurn
+
+
+def get_weather(city: str) -> str:
+    """Get the weather for a city."""
+    return f"It is sunny in {city}"
+
+
+def test_default_response():
+    model = ScriptedModel(default_response="Hello there")
+    response = model.response(messages=[Message(role="user", content="Hi")])
+    assert response.content == "Hello there"
+
+
+def test_stream_tokens():
+    model = ScriptedModel(script=["one two three four"], tokens_per_chunk=2)
+    chunks = [r.content for r in model.response_stream(messages=[Message(role="user", content="Hi")]) if r.content]
+    assert chunks == ["one two", " three four"]
+
+
+def test_script_restarts_every_run():
+    model = ScriptedModel(script=["first"], default_response="fallback")
+    messages = [Message(role="user", content="Hi")]
+    assert model.response(messages=messages).content == "first"
+    assert model.response(messages=[Message(role="user", content="Again")]).content == "first"
+
+
+def test_agent_tool_call():
+    model = ScriptedModel(
+        script=[
+            ScriptedTurn(tool_calls=[ScriptedToolCall(name="get_weather", arguments={"city": "Paris"})]),
+            "The weather is sunny.",
+        ]
+    )
+    agent = Agent(model=model, tools=[get_weather], telemetry=False, monitoring=False)
+
+    response = agent.run("What is the weather in Paris?")
+
+    assert response.content == "The weather is sunny."
+    assert response.tools is not None and response.tools[0].result == "It is sunny in Paris"
+    assert response.metrics["output_tokens"] == [0, 4]
+
+
+def test_agent_stream_with_latency():
+    model = ScriptedModel(script=["a b c"], latency=0.01, token_latency=0.01)
+    agent = Agent(model=model, telemetry=False, monitoring=False)
+
+    async def run():
+        chunks = []
+        async for chunk in await agent.arun("Hi", stream=True):
+            if chunk.content:
+                chunks.append(chunk.content)
+        return chunks
+
+    assert "".join(asyncio.run(run())) == "a b c"
@@ -0,0 +1,58 @@
+import json
+from dataclasses import asdict
+
+from agno.media import ImageArtifact
+from agno.models.message import Citations, UrlCitation
+from agno.models.response import ToolExecution
+from agno.run.base import RunResponseExtraData
+from agno.run.response import (
+    RUN_RESPONSE_EVENT_TYPES,
+    RunResponseContentEvent,
+    RunResponseEvent,
+    ToolCallCompletedEvent,
+)
+from agno.run.team import TEAM_RUN_RESPONSE_EVENT_TYPES, TeamRunResponseEvent
+
+
+def test_event_types():
+    assert RunResponseContentEvent in RUN_RESPONSE_EVENT_TYPES
+    assert len(RUN_RESPONSE_EVENT_TYPES) == len(RunResponseEvent.__args__)  # type: ignore
+    assert len(TEAM_RUN_RESPONSE_EVENT_TYPES) == len(TeamRunResponseEvent.__args__)  # type: ignore
+
+
+def test_content_event_to_dict():
+    event = RunResponseContentEvent(
+        agent_id="agent",
+        run_id="run",
+        content={"answer": [1, 2, {"nested": True}]},
+        thinking="",
+        citations=Citations(urls=[UrlCitation(url="https://agno.com")]),
+        image=ImageArtifact(id="image", url="https://agno.com/image.png"),
+        extra_data=RunResponseExtraData(references=[]),
+    )
+
+    event_dict = event.to_dict()
+
+    assert event_dict["content"] == {"answer": [1, 2, {"nested": True}]}
+    # Nested values are copies, as with dataclasses.asdict
+    assert event_dict["content"] is not event.content
+    assert event_dict["citations"] == {"urls": [{"url": "https://agno.com"}]}
+    assert event_dict["image"]["id"] == "image"
+    assert "response_audio" not in event_dict
+    assert json.loads(event.to_json())["event"] == "RunResponseContent"
+
+    # Plain fields match the previous asdict based serialization
+    legacy = asdict(event)
+    for key in ["created_at", "event", "agent_id", "run_id", "content", "content_type", "thinking"]:
+        assert event_dict[key] == legacy[key]
+
+
+def test_tool_event_to_dict():
+    tool = ToolExecution(tool_name="get_weather", tool_args={"city": "Paris"}, result="Sunny")
+    event = ToolCallCompletedEvent(agent_id="agent", tool=tool, content="Sunny")
+
+    event_dict = event.to_dict()
+
+    assert event_dict["tool"]["tool_name"] == "get_weather"
+    assert event_dict["tool"]["tool_args"] == {"city": "Paris"}
+    assert event_dict["content"] == "Sunny"
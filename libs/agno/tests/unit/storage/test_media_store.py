@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+import pytest
+
+from agno.media import Audio, Image
+from agno.models.base import _load_media_content
+from agno.models.message import Message
+from agno.storage.media import LocalMediaStore, use_media_store
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024
+
+
+def test_local_media_store_deduplicates(tmp_path):
+    store = LocalMediaStore(base_dir=tmp_path)
+    reference = store.put(PNG_BYTES)
+
+    assert reference.startswith("sha256:")
+    assert store.put(PNG_BYTES) == reference
+    assert len([path for path in tmp_path.rglob("*") if path.is_file()]) == 1
+    assert store.get(reference) == PNG_BYTES
+    assert store.exists(reference)
+
+    store.delete(reference)
+    assert not store.exists(reference)
+
+
+def test_media_is_inline_without_media_store():
+    image_dict = Image(content=PNG_BYTES).to_dict()
+    assert "content" in image_dict
+    assert "content_ref" not in image_dict
+    assert Image(**image_dict).content == PNG_BYTES
+
+
+def test_media_is_serialized_as_reference(tmp_path):
+    store = LocalMediaStore(base_dir=tmp_path)
+    message = Message(
+        role="user", content="Describe these", images=[Image(content=PNG_BYTES)], audio=[Audio(content=b"RIFF")]
+    )
+
+    with use_media_store(store):
+        message_dict = message.to_dict()
+
+    assert "content" not in message_dict["images"][0]
+    assert message_dict["images"][0]["content_ref"] == store.put(PNG_BYTES)
+    assert message_dict["audio"][0]["content_ref"] == store.put(b"RIFF")
+
+
+def test_referenced_media_is_loaded_lazily(tmp_path):
+    store = LocalMediaStore(base_dir=tmp_path)
+    with use_media_store(store):
+        message_dict = Message(role="user", content="Describe this", images=[Image(content=PNG_BYTES)]).to_dict()
+        restored = Message.model_validate(message_dict)
+
+    # Only the reference is held until a model needs the content
+    assert restored.images[0].content is None
+    # Serializing again does not need the content
+    assert restored.to_dict()["images"][0]["content_ref"] == message_dict["images"][0]["content_ref"]
+
+    _load_media_content([restored])
+    assert restored.images[0].content == PNG_BYTES
+
+
+def test_url_downloads_are_cached_only_on_success():
+    import httpx
+
+    from agno.media import _download_cache
+
+    _download_cache.clear()
+    url = "https://example.com/image.png"
+    request = httpx.Request("GET", url)
+    error = httpx.Response(503, content=b"unavailable", request=request)
+    ok = httpx.Response(200, content=b"image", headers={"Content-Type": "image/png"}, request=request)
+
+    with patch("httpx.get", side_effect=[error, ok]) as mock_get:
+        with pytest.raises(httpx.HTTPStatusError):
+            Image(url=url).image_url_content
+        assert Image(url=url).image_url_content == b"image"
+        assert Image(url=url).image_url_content == b"image"
+    assert mock_get.call_count == 2
+    _download_cache.clear()
+
+
+def test_download_cache_is_bounded_by_size():
+    from agno.media import _DownloadCache
+
+    cache = _DownloadCache(max_bytes=10, max_item_bytes=6)
+    cache.set("a", (b"12345", ""))
+    cache.set("b", (b"1234567", ""))
+    cache.set("c", (b"12345", ""))
+    cache.set("d", (b"1", ""))
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == (b"12345", "")
+    assert cache.get("d") == (b"1", "")
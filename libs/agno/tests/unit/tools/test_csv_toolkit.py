@@ -0,0 +1,51 @@
+import csv
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.tools.csv_toolkit import CsvTools
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    path = tmp_path / "sales.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "region", "amount"])
+        for i in range(100):
+            writer.writerow([i, "north" if i % 2 == 0 else "south", i])
+    return path
+
+
+def test_query_csv_file_imports_once(sales_csv):
+    duckdb = pytest.importorskip("duckdb")
+    connection = duckdb.connect()
+    spy = MagicMock(wraps=connection)
+    tools = CsvTools(csvs=[sales_csv], duckdb_connection=spy)
+
+    first = tools.query_csv_file("sales", "SELECT region, SUM(amount) FROM sales GROUP BY region ORDER BY region")
+    second = tools.query_csv_file("sales", "SELECT COUNT(*) FROM sales")
+
+    assert first.splitlines()[1:] == ["north,2450", "south,2500"]
+    assert second.splitlines()[1] == "100"
+    import_calls = [call for call in spy.execute.call_args_list if "read_csv" in call.args[0]]
+    assert len(import_calls) == 1
+
+
+def test_query_csv_file_truncates_large_results(sales_csv):
+    pytest.importorskip("duckdb")
+    tools = CsvTools(csvs=[sales_csv], csv_import="view", max_result_rows=5)
+
+    result = tools.query_csv_file("sales", "SELECT * FROM sales")
+    lines = result.splitlines()
+
+    assert lines[0] == "id,region,amount"
+    assert len(lines) == 7
+    assert lines[-1].startswith("[Result truncated to the first 5 rows")
+
+
+def test_read_csv_file_row_limit(sales_csv):
+    tools = CsvTools(csvs=[sales_csv])
+    assert tools.read_csv_file("sales", row_limit=2) == (
+        '[{"id": "0", "region": "north", "amount": "0"}, {"id": "1", "region": "south", "amount": "1"}]'
+    )
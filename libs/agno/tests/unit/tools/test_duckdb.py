@@ -5,6 +5,17 @@ import pytest
 from agno.tools.duckdb import DuckDbTools
 
 
+def mock_rows(mock_result, rows):
+    """Serve `rows` from the streamed fetchmany calls of each query on a mocked result."""
+    served = {"done": False}
+
+    def fetchmany(size):
+        served["done"] = not served["done"]
+        return rows if served["done"] else []
+
+    mock_result.fetchmany.side_effect = fetchmany
+
+
 @pytest.fixture
 def mock_duckdb_connection():
     """Mock DuckDB connection used by DuckDbTools."""
@@ -14,7 +25,7 @@ def mock_duckdb_connection():
 
         # Mock the query result
         mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("test_table",)]
+        mock_rows(mock_result, [("test_table",)])
         mock_result.columns = ["name"]
         mock_connection.sql.return_value = mock_result
 
@@ -174,7 +185,7 @@ def test_run_query_success(duckdb_tools_instance, mock_duckdb_connection):
     """Test successful query execution."""
     # Setup mock result
     mock_result = MagicMock()
-    mock_result.fetchall.return_value = [(1, "issue-1", "High"), (2, "issue-2", "Medium")]
+    mock_rows(mock_result, [(1, "issue-1", "High"), (2, "issue-2", "Medium")])
     mock_result.columns = ["id", "issue_id", "priority"]
     mock_duckdb_connection.sql.return_value = mock_result
 
@@ -189,7 +200,7 @@ def test_run_query_success(duckdb_tools_instance, mock_duckdb_connection):
 def test_run_query_removes_backticks(duckdb_tools_instance, mock_duckdb_connection):
     """Test that run_query removes backticks from queries."""
     mock_result = MagicMock()
-    mock_result.fetchall.return_value = [("test",)]
+    mock_rows(mock_result, [("test",)])
     mock_result.columns = ["col"]
     mock_duckdb_connection.sql.return_value = mock_result
 
@@ -205,11 +216,14 @@ def test_describe_table_success(duckdb_tools_instance, mock_duckdb_connection):
     """Test successful table description."""
     # Setup mock result for DESCRIBE query
     mock_result = MagicMock()
-    mock_result.fetchall.return_value = [
-        ("issue_id", "VARCHAR", "YES", None, None, None),
-        ("priority", "VARCHAR", "YES", None, None, None),
-        ("status", "VARCHAR", "YES", None, None, None),
-    ]
+    mock_rows(
+        mock_result,
+        [
+            ("issue_id", "VARCHAR", "YES", None, None, None),
+            ("priority", "VARCHAR", "YES", None, None, None),
+            ("status", "VARCHAR", "YES", None, None, None),
+        ],
+    )
     mock_result.columns = ["column_name", "column_type", "null", "key", "default", "extra"]
     mock_duckdb_connection.sql.return_value = mock_result
 
@@ -243,7 +257,7 @@ def test_integration_create_and_query_table(duckdb_tools_instance, mock_duckdb_c
 
     # Step 2: Setup mock for query execution
     mock_result = MagicMock()
-    mock_result.fetchall.return_value = [(1, "ISSUE-1", "High"), (2, "ISSUE-2", "Medium")]
+    mock_rows(mock_result, [(1, "ISSUE-1", "High"), (2, "ISSUE-2", "Medium")])
     mock_result.columns = ["rownum", "issue_id", "priority"]
     mock_duckdb_connection.sql.return_value = mock_result
 
@@ -309,7 +323,7 @@ def test_run_query_programming_error(duckdb_tools_instance, mock_duckdb_connecti
 def test_run_query_single_column_result(duckdb_tools_instance, mock_duckdb_connection):
     """Test run_query with single column results."""
     mock_result = MagicMock()
-    mock_result.fetchall.return_value = [("value1",), ("value2",), ("value3",)]
+    mock_rows(mock_result, [("value1",), ("value2",), ("value3",)])
     mock_result.columns = ["single_col"]
     mock_duckdb_connection.sql.return_value = mock_result
 
@@ -323,7 +337,7 @@ def test_run_query_single_column_result(duckdb_tools_instance, mock_duckdb_conne
 def test_run_query_no_results(duckdb_tools_instance, mock_duckdb_connection):
     """Test run_query with no results."""
     mock_result = MagicMock()
-    mock_result.fetchall.return_value = []
+    mock_rows(mock_result, [])
     mock_result.columns = ["col1", "col2"]
     mock_duckdb_connection.sql.return_value = mock_result
 
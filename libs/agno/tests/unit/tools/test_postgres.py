@@ -38,6 +38,7 @@ class TestPostgresTools:
         cursor = Mock()
         cursor.description = None
         cursor.fetchall.return_value = []
+        cursor.fetchmany.return_value = []
         cursor.fetchone.return_value = {}
         cursor.statusmessage = "Command completed successfully"
         cursor.__enter__ = Mock(return_value=cursor)
@@ -77,7 +78,7 @@ class TestPostgresTools:
         """Test show_tables returns expected table list."""
         # Setup mock responses
         mock_cursor.description = [("table_name",)]
-        mock_cursor.fetchall.return_value = MOCK_TABLES_RESULT
+        mock_cursor.fetchmany.side_effect = [MOCK_TABLES_RESULT, []]
 
         result = postgres_tools.show_tables()
 
@@ -96,7 +97,7 @@ class TestPostgresTools:
         """Test describe_table returns expected schema information."""
         # Setup mock responses
         mock_cursor.description = [("column_name",), ("data_type",), ("is_nullable",)]
-        mock_cursor.fetchall.return_value = MOCK_DESCRIBE_RESULT
+        mock_cursor.fetchmany.side_effect = [MOCK_DESCRIBE_RESULT, []]
 
         result = postgres_tools.describe_table("employees")
 
@@ -114,7 +115,7 @@ class TestPostgresTools:
         """Test run_query executes SQL and returns formatted results."""
         # Setup mock responses
         mock_cursor.description = [("count",)]
-        mock_cursor.fetchall.return_value = MOCK_COUNT_RESULT
+        mock_cursor.fetchmany.side_effect = [MOCK_COUNT_RESULT, []]
 
         result = postgres_tools.run_query("SELECT COUNT(*) FROM employees;")
 
@@ -153,7 +154,7 @@ class TestPostgresTools:
         """Test inspect_query returns execution plan."""
         # Setup mock responses
         mock_cursor.description = [("QUERY PLAN",)]
-        mock_cursor.fetchall.return_value = MOCK_EXPLAIN_RESULT
+        mock_cursor.fetchmany.side_effect = [MOCK_EXPLAIN_RESULT, []]
 
         result = postgres_tools.inspect_query("SELECT name FROM employees WHERE salary > 10000;")
 
@@ -216,7 +217,7 @@ class TestPostgresTools:
         """Test that SQL injection attempts are safely handled."""
         # Setup mock
         mock_cursor.description = [("column_name",), ("data_type",), ("is_nullable",)]
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchmany.side_effect = [[], []]
 
         # Attempt SQL injection
         malicious_table = "users'; DROP TABLE employees; --"
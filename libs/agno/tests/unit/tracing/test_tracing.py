@@ -0,0 +1,234 @@
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+
+from agno.agent import Agent
+from agno.embedder.base import Embedder
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.run.response import RunResponse
+from agno.storage.sqlite import SqliteStorage
+from agno.tracing import InMemorySpanExporter, OTLPSpanExporter, Tracer, get_current_span, trace_span, traced
+from agno.workflow import Workflow
+
+
+@dataclass
+class ToolCallingModel(Model):
+    """Calls the `add` tool in its first response and answers in the second"""
+
+    id: str = "tool-calling"
+
+    def _respond(self, messages) -> str:
+        return "done" if any(m.role == "tool" for m in messages) else "tool"
+
+    def invoke(self, messages, **kwargs) -> Any:
+        return self._respond(messages)
+
+    async def ainvoke(self, messages, **kwargs) -> Any:
+        return self._respond(messages)
+
+    def invoke_stream(self, messages, **kwargs) -> Iterator[Any]:
+        yield self._respond(messages)
+
+    async def ainvoke_stream(self, messages, **kwargs) -> AsyncIterator[Any]:  # type: ignore
+        yield self._respond(messages)
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        if response == "tool":
+            return ModelResponse(
+                role="assistant",
+                tool_calls=[
+                    {"id": "call-1", "type": "function", "function": {"name": "add", "arguments": '{"a": 1, "b": 2}'}}
+                ],
+            )
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return self.parse_provider_response(response)
+
+
+def add(a: int, b: int) -> int:
+    """Adds two numbers"""
+    return a + b
+
+
+def _create_agent(exporter: InMemorySpanExporter) -> Agent:
+    return Agent(
+        model=ToolCallingModel(),
+        tools=[add],
+        tracer=Tracer(exporters=[exporter], add_to_run_metrics=True),
+        telemetry=False,
+    )
+
+
+def _names(span: dict) -> list:
+    return [span["name"]] + [name for child in span.get("children", []) for name in _names(child)]
+
+
+def test_agent_run_is_traced():
+    exporter = InMemorySpanExporter()
+    agent = _create_agent(exporter)
+
+    response = agent.run("What is 1 + 2?")
+
+    assert response.content == "done"
+    trace = response.metrics["trace"]
+    assert trace["name"] == "agent.run"
+    assert trace["attributes"]["run_id"] == response.run_id
+    names = _names(trace)
+    for name in ("agent.read_from_storage", "agent.get_run_messages", "model.response", "tool.execute"):
+        assert name in names
+    assert names.count("model.invoke") == 2
+
+    # Every span of the run was exported once, in one trace
+    spans = exporter.get_spans()
+    assert len(spans) == len(names)
+    assert len({span.trace_id for span in spans}) == 1
+    assert all(span.duration is not None for span in spans)
+    tool_span = exporter.get_spans("tool.execute")[0]
+    assert tool_span.attributes["tool"] == "add"
+
+
+def test_trace_is_only_added_to_run_metrics_on_request():
+    exporter = InMemorySpanExporter()
+    agent = Agent(model=ToolCallingModel(), tools=[add], tracer=Tracer(exporters=[exporter]), telemetry=False)
+
+    response = agent.run("What is 1 + 2?")
+
+    assert "trace" not in (response.metrics or {})
+    assert len(exporter.get_spans("agent.run")) == 1
+
+
+def test_streaming_run_is_traced_until_exhausted():
+    exporter = InMemorySpanExporter()
+    agent = _create_agent(exporter)
+
+    stream = agent.run("What is 1 + 2?", stream=True)
+    assert exporter.get_spans() == []
+    list(stream)
+
+    root = exporter.get_spans("agent.run")[0]
+    assert root.is_root
+    assert "tool.execute" in [span.name for span in root.iter_spans()]
+    assert agent.run_response.metrics["trace"]["span_id"] == root.span_id
+
+
+async def test_async_run_is_traced():
+    exporter = InMemorySpanExporter()
+    agent = _create_agent(exporter)
+
+    response = await agent.arun("What is 1 + 2?")
+
+    assert response.content == "done"
+    assert "tool.execute" in _names(response.metrics["trace"])
+    assert get_current_span() is None
+
+
+def test_storage_reads_and_writes_are_traced(tmp_path):
+    exporter = InMemorySpanExporter()
+    agent = _create_agent(exporter)
+    agent.storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "agents.db"))
+
+    agent.run("What is 1 + 2?", session_id="session-1")
+
+    upsert_span = exporter.get_spans("storage.upsert")[0]
+    assert upsert_span.attributes["storage"] == "SqliteStorage"
+    num_reads = len(exporter.get_spans("storage.read"))
+    assert num_reads > 0
+    # Storage calls outside of a traced run are not recorded
+    assert agent.storage.traced_read(session_id="session-1") is not None
+    assert len(exporter.get_spans("storage.read")) == num_reads
+
+
+@dataclass
+class StaticEmbedder(Embedder):
+    dimensions: int = 2
+
+    def get_embedding(self, text: str) -> list:
+        return [1.0, 0.0]
+
+
+class EmbeddingWorkflow(Workflow):
+    embedder = StaticEmbedder()
+
+    def run(self, text: str) -> RunResponse:  # type: ignore
+        return RunResponse(content=str(self.embedder.get_cached_embedding(text)))
+
+
+class StreamingEmbeddingWorkflow(Workflow):
+    embedder = StaticEmbedder()
+
+    async def arun(self, text: str) -> AsyncIterator[RunResponse]:  # type: ignore
+        yield RunResponse(content=str(self.embedder.get_cached_embeddings([text])))
+
+
+def test_legacy_workflow_run_and_embeddings_are_traced():
+    exporter = InMemorySpanExporter()
+    workflow = EmbeddingWorkflow(tracer=Tracer(exporters=[exporter]), telemetry=False)
+
+    workflow.run(text="hello")
+
+    root = exporter.get_spans("workflow.run")[0]
+    assert root.is_root
+    assert root.attributes["workflow_id"] == workflow.workflow_id
+    embed_span = exporter.get_spans("embedder.embed")[0]
+    assert embed_span.parent_id == root.span_id
+    assert embed_span.attributes["embedder"] == "StaticEmbedder"
+
+
+async def test_legacy_async_streaming_workflow_is_traced_until_exhausted():
+    exporter = InMemorySpanExporter()
+    workflow = StreamingEmbeddingWorkflow(tracer=Tracer(exporters=[exporter]), telemetry=False)
+
+    stream = workflow.arun(text="hello")
+    assert exporter.get_spans() == []
+    assert [response.content async for response in stream] == ["[[1.0, 0.0]]"]
+
+    root = exporter.get_spans("workflow.run")[0]
+    assert exporter.get_spans("embedder.embed")[0].parent_id == root.span_id
+    assert get_current_span() is None
+
+
+def test_nothing_is_recorded_without_a_tracer():
+    calls = []
+
+    @traced("work")
+    def work():
+        calls.append(get_current_span())
+
+    work()
+    assert calls == [None]
+
+
+def test_spans_nest_and_record_errors():
+    exporter = InMemorySpanExporter()
+
+    @traced("child")
+    def child():
+        raise ValueError("boom")
+
+    with trace_span("root", tracer=Tracer(exporters=[exporter])) as root:
+        with pytest.raises(ValueError):
+            child()
+        assert get_current_span() is root
+
+    assert [span.name for span in exporter.get_spans()] == ["root", "child"]
+    child_span = exporter.get_spans("child")[0]
+    assert child_span.parent_id == root.span_id
+    assert child_span.status == "error" and "boom" in child_span.error
+
+
+def test_otlp_format():
+    exporter = InMemorySpanExporter()
+    with trace_span("root", tracer=Tracer(exporters=[exporter]), attributes={"count": 2, "ok": True}):
+        pass
+
+    payload = OTLPSpanExporter(service_name="test").to_otlp(exporter.get_spans())
+    resource_spans = payload["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "test"}
+    span = resource_spans["scopeSpans"][0]["spans"][0]
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+    assert {"key": "count", "value": {"intValue": "2"}} in span["attributes"]
+    assert {"key": "ok", "value": {"boolValue": True}} in span["attributes"]
@@ -0,0 +1,96 @@
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+
+def _get_loaded_modules(statement: str, modules: List[str]) -> List[str]:
+    """Runs `statement` in a fresh interpreter and returns which of `modules` it loaded"""
+    code = f"import sys\n{statement}\nprint(','.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return [m for m in output.strip().split(",") if m]
+
+
+def test_importing_packages_does_not_load_their_exports():
+    loaded = _get_loaded_modules(
+        "import agno.agent, agno.team, agno.workflow, agno.workflow.v2, agno.memory, agno.storage.session",
+        ["agno.agent.agent", "agno.team.team", "agno.workflow.workflow", "agno.workflow.v2.workflow"],
+    )
+    assert loaded == []
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["from agno.agent import Agent", "from agno.team import Team", "from agno.workflow.v2 import Workflow"],
+)
+def test_optional_subsystems_are_not_loaded(statement):
+    loaded = _get_loaded_modules(
+        statement,
+        [
+            # Legacy memory, knowledge and workflow v1 are only loaded when used
+            "agno.memory.agent",
+            "agno.memory.team",
+            "agno.knowledge.agent",
+            "agno.workflow.workflow",
+            "agno.storage.session.workflow",
+            # Web frameworks and servers
+            "fastapi",
+            "uvicorn",
+        ],
+    )
+    assert loaded == []
+
+
+def test_app_does_not_load_the_server():
+    assert _get_loaded_modules("from agno.app.fastapi import FastAPIApp", ["uvicorn"]) == []
+
+
+def test_lazy_exports():
+    import agno.agent
+    import agno.memory
+    from agno.agent.agent import Agent
+    from agno.memory.agent import AgentMemory
+    from agno.storage.session import Session, WorkflowSessionV2
+    from agno.storage.session.v2.workflow import WorkflowSession
+
+    assert agno.agent.Agent is Agent
+    assert agno.memory.AgentMemory is AgentMemory
+    assert WorkflowSessionV2 is WorkflowSession
+    assert WorkflowSession in Session.__args__
+    assert "Agent" in dir(agno.agent)
+    with pytest.raises(AttributeError):
+        agno.agent.DoesNotExist  # noqa: B018
+
+
+def test_is_instance_of():
+    from agno.memory.agent import AgentMemory
+    from agno.memory.v2.memory import Memory
+    from agno.utils.lazy import is_instance_of
+
+    assert is_instance_of(AgentMemory(), "agno.memory.agent", "AgentMemory")
+    assert not is_instance_of(Memory(), "agno.memory.agent", "AgentMemory")
+    # A module that is not loaded is not imported
+    assert not is_instance_of(object(), "agno.not_a_module", "AgentMemory")
+
+
+def test_legacy_memory_still_works():
+    from agno.agent import Agent
+    from agno.memory.agent import AgentMemory
+    from agno.models.message import Message
+
+    memory = AgentMemory()
+    memory.add_messages([Message(role="user", content="Hello")])
+    agent = Agent(memory=memory, session_id="session-1", telemetry=False)
+    assert [message.content for message in agent.get_messages_for_session()] == ["Hello"]
+
+
+def test_legacy_names_importable_from_modules():
+    from agno.agent.agent import AgentMemory, AgentRun
+    from agno.memory.agent import AgentMemory as LegacyAgentMemory
+    from agno.memory.team import TeamRun as LegacyTeamRun
+    from agno.team.team import TeamRun
+
+    assert AgentMemory is LegacyAgentMemory
+    assert TeamRun is LegacyTeamRun
+    assert AgentRun.__module__ == "agno.memory.agent"
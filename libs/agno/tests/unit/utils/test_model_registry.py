@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agno.utils.model_registry import LocalModelRegistry, MicroBatcher, model_key
+
+
+def test_registry_loads_each_model_once():
+    registry = LocalModelRegistry()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return object()
+
+    key = model_key("sentence-transformer", "all-MiniLM-L6-v2", None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        models = list(executor.map(lambda _: registry.get(key, loader), range(16)))
+
+    assert len(loads) == 1
+    assert all(model is models[0] for model in models)
+    assert key in registry
+
+    registry.remove(key)
+    assert key not in registry
+    registry.get(key, loader)
+    assert len(loads) == 2
+
+
+def test_model_key_handles_unhashable_parts():
+    assert model_key("cross-encoder", {"b": 1, "a": 2}) == model_key("cross-encoder", {"a": 2, "b": 1})
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def batch_fn(items):
+        calls.append(list(items))
+        started.set()
+        release.wait(timeout=5)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=100)
+    # The first request occupies the worker, the rest queue up behind it and share one call
+    first = batcher.submit([0])
+    assert started.wait(timeout=5)
+    futures = [batcher.submit([i, i + 100]) for i in range(1, 6)]
+    release.set()
+
+    assert first.result(timeout=5) == [0]
+    assert [future.result(timeout=5) for future in futures] == [[i * 2, (i + 100) * 2] for i in range(1, 6)]
+    assert len(calls) == 2
+    assert len(calls[1]) == 10
+    batcher.close()
+
+
+def test_micro_batcher_respects_max_batch_size():
+    calls = []
+    release = threading.Event()
+
+    def batch_fn(items):
+        calls.append(len(items))
+        release.wait(timeout=5)
+        return items
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=4)
+    futures = [batcher.submit([i]) for i in range(9)]
+    release.set()
+
+    assert [future.result(timeout=5) for future in futures] == [[i] for i in range(9)]
+    assert max(calls) <= 4
+    batcher.close()
+
+
+def test_micro_batcher_propagates_errors():
+    def batch_fn(items):
+        raise RuntimeError("model failed")
+
+    batcher = MicroBatcher(batch_fn)
+    with pytest.raises(RuntimeError, match="model failed"):
+        batcher(["text"])
+    assert batcher([]) == []
+    batcher.close()
@@ -0,0 +1,50 @@
+from agno.utils.result_set import is_select_statement, iter_fetchmany, read_result_set
+
+
+def test_iter_fetchmany_streams_chunks():
+    rows = [(i,) for i in range(7)]
+    calls = []
+
+    def fetchmany(size):
+        calls.append(size)
+        start = sum(calls[:-1])
+        return rows[start : start + size]
+
+    assert list(iter_fetchmany(fetchmany, chunk_size=3)) == rows
+    assert calls == [3, 3, 3, 3]
+
+
+def test_read_result_set_row_limit_stops_pulling_rows():
+    pulled = []
+
+    def rows():
+        for i in range(1_000_000):
+            pulled.append(i)
+            yield (i, f"row-{i}")
+
+    result = read_result_set(["id", "name"], rows(), max_rows=2)
+    assert result.rows == [(0, "row-0"), (1, "row-1")]
+    assert result.truncated_by == "rows"
+    assert len(pulled) == 3
+    assert result.to_csv().startswith("id,name\n0,row-0\n1,row-1\n[Result truncated to the first 2 rows")
+
+
+def test_read_result_set_size_limit_keeps_first_row():
+    result = read_result_set(["text"], [("x" * 100,), ("y" * 100,)], max_chars=50)
+    assert result.rows == [("x" * 100,)]
+    assert result.truncated_by == "size"
+
+
+def test_read_result_set_renders_untruncated_results():
+    result = read_result_set(["a", "b"], [(1, None), (2, "z")])
+    assert not result.truncated
+    assert result.to_csv() == "a,b\n1,None\n2,z"
+    assert result.to_records() == [{"a": 1, "b": None}, {"a": 2, "b": "z"}]
+
+
+def test_is_select_statement():
+    assert is_select_statement("  select * from t")
+    assert is_select_statement("WITH x AS (SELECT 1) SELECT * FROM x")
+    assert not is_select_statement("EXPLAIN SELECT 1")
+    assert not is_select_statement("INSERT INTO t VALUES (1)")
+    assert not is_select_statement("")
@@ -22,4 +22,8 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # No embedding cache, the cached methods call the embedder directly
+    mock.get_cached_embedding = mock.get_embedding
+    mock.get_cached_embedding_and_usage = mock.get_embedding_and_usage
+
     return mock
@@ -0,0 +1,134 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.utils.string import safe_content_hash
+from agno.vectordb.fusion import document_key, reciprocal_rank_fusion
+from agno.vectordb.hybrid import HybridVectorDb
+from agno.vectordb.inmemory import InMemoryVectorDb
+from agno.vectordb.search import SearchType
+
+EMBEDDINGS = {
+    "Tom Kha Gai is a Thai coconut soup with chicken": [1.0, 0.0, 0.0],
+    "Pad Thai is a stir-fried rice noodle dish": [0.0, 1.0, 0.0],
+    "Green curry is a spicy Thai curry with coconut milk": [0.7, 0.0, 0.7],
+    "spicy curry": [0.0, 1.0, 0.0],
+}
+
+
+@pytest.fixture
+def embedder():
+    mock = MagicMock()
+    mock.dimensions = 3
+    mock.get_embedding.side_effect = lambda text: EMBEDDINGS.get(text, [0.5, 0.5, 0.5])
+    mock.get_embedding_and_usage.side_effect = lambda text: (EMBEDDINGS.get(text, [0.5, 0.5, 0.5]), None)
+    mock.get_cached_embedding = mock.get_embedding
+    mock.get_cached_embedding_and_usage = mock.get_embedding_and_usage
+    return mock
+
+
+@pytest.fixture
+def sample_documents():
+    return [
+        Document(content="Tom Kha Gai is a Thai coconut soup with chicken", name="tom_kha", meta_data={"type": "soup"}),
+        Document(content="Pad Thai is a stir-fried rice noodle dish", name="pad_thai", meta_data={"type": "noodles"}),
+        Document(
+            content="Green curry is a spicy Thai curry with coconut milk",
+            name="green_curry",
+            meta_data={"type": "curry"},
+        ),
+    ]
+
+
+def test_reciprocal_rank_fusion():
+    assert reciprocal_rank_fusion([["a", "b", "c"], ["c", "b"]], k=1) == ["c", "b", "a"]
+    assert reciprocal_rank_fusion([["a", "b"], ["b", "a"]], weights=[1.0, 0.0]) == ["a", "b"]
+    assert reciprocal_rank_fusion([["a", "b", "c"]], limit=2) == ["a", "b"]
+    with pytest.raises(ValueError):
+        reciprocal_rank_fusion([["a"]], weights=[0.5, 0.5])
+
+
+def test_fusion_deduplicates_documents():
+    first = Document(content="same content")
+    second = Document(content="same content")
+    fused = reciprocal_rank_fusion([[first], [second]], key=document_key)
+    assert fused == [first]
+
+
+def test_fusion_boosts_documents_with_different_ids():
+    other = Document(id="other", content="other content")
+    chunk = Document(id="recipes_1", content="same content")
+    dense = Document(id=safe_content_hash("same content"), content="same content")
+    fused = reciprocal_rank_fusion([[other, dense], [chunk]], key=document_key)
+    assert fused == [dense, other]
+
+
+def test_hybrid_search_fuses_local_keyword_results(embedder, sample_documents):
+    # Upserts store the content hash as the id, the local keyword index keeps the chunk ids
+    vector_db = HybridVectorDb(
+        vector_db=InMemoryVectorDb(collection="recipes", embedder=embedder), use_native_keyword_search=False
+    )
+    for i, document in enumerate(sample_documents):
+        document.id = f"{document.name}_{i}"
+    vector_db.upsert(sample_documents)
+
+    results = vector_db.search("coconut soup", limit=3)
+    assert len(results) == 3
+    assert len({document.content for document in results}) == 3
+
+
+@pytest.mark.parametrize("use_native_keyword_search", [True, False])
+def test_hybrid_search(embedder, sample_documents, use_native_keyword_search):
+    vector_db = HybridVectorDb(
+        vector_db=InMemoryVectorDb(collection="recipes", embedder=embedder),
+        use_native_keyword_search=use_native_keyword_search,
+    )
+    vector_db.create()
+    vector_db.insert(sample_documents)
+
+    # The vector ranking alone prefers the noodle dish, the keyword ranking brings up the curry
+    assert vector_db.vector_search("spicy curry", limit=1)[0].name == "pad_thai"
+    assert vector_db.keyword_search("spicy curry", limit=1)[0].name == "green_curry"
+    results = vector_db.search("spicy curry", limit=2)
+    assert {doc.name for doc in results} == {"pad_thai", "green_curry"}
+
+    filtered = vector_db.search("spicy curry", limit=2, filters={"type": "soup"})
+    assert [doc.name for doc in filtered] == ["tom_kha"]
+
+
+def test_weighted_fusion(embedder, sample_documents):
+    vector_db = HybridVectorDb(
+        vector_db=InMemoryVectorDb(collection="recipes", embedder=embedder),
+        fusion="weighted",
+        vector_score_weight=0.0,
+    )
+    vector_db.insert(sample_documents)
+    assert vector_db.search("spicy curry", limit=1)[0].name == "green_curry"
+
+
+def test_existing_documents_are_indexed(embedder, sample_documents):
+    inner = InMemoryVectorDb(collection="recipes", embedder=embedder)
+    inner.insert(sample_documents)
+
+    vector_db = HybridVectorDb(vector_db=inner, search_type=SearchType.keyword, use_native_keyword_search=False)
+    assert vector_db.keyword_search("curry") == []
+    assert all(vector_db.doc_exists(doc) for doc in sample_documents)
+    assert vector_db.search("curry", limit=1)[0].name == "green_curry"
+
+
+def test_reranker_applied_once(embedder, sample_documents):
+    reranker = MagicMock()
+    reranker.rerank.side_effect = lambda query, documents: list(reversed(documents))
+    vector_db = HybridVectorDb(vector_db=InMemoryVectorDb(collection="recipes", embedder=embedder), reranker=reranker)
+    vector_db.insert(sample_documents)
+    vector_db.search("spicy curry", limit=2)
+    assert reranker.rerank.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_hybrid_search(embedder, sample_documents):
+    vector_db = HybridVectorDb(vector_db=InMemoryVectorDb(collection="recipes", embedder=embedder))
+    await vector_db.async_insert(sample_documents)
+    results = await vector_db.async_search("spicy curry", limit=2)
+    assert {doc.name for doc in results} == {"pad_thai", "green_curry"}
@@ -0,0 +1,195 @@
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.vectordb.bm25 import BM25Index
+from agno.vectordb.distance import Distance
+from agno.vectordb.inmemory import InMemoryVectorDb
+from agno.vectordb.search import SearchType
+
+EMBEDDINGS: Dict[str, List[float]] = {
+    "Tom Kha Gai is a Thai coconut soup with chicken": [1.0, 0.0, 0.0],
+    "Pad Thai is a stir-fried rice noodle dish": [0.0, 1.0, 0.0],
+    "Green curry is a spicy Thai curry with coconut milk": [0.7, 0.0, 0.7],
+    "coconut soup": [0.9, 0.1, 0.0],
+    "noodles": [0.0, 1.0, 0.1],
+}
+
+
+@pytest.fixture
+def embedder():
+    mock = MagicMock()
+    mock.dimensions = 3
+    mock.get_embedding.side_effect = lambda text: EMBEDDINGS.get(text, [0.5, 0.5, 0.5])
+    mock.get_embedding_and_usage.side_effect = lambda text: (EMBEDDINGS.get(text, [0.5, 0.5, 0.5]), None)
+    mock.get_cached_embedding = mock.get_embedding
+    mock.get_cached_embedding_and_usage = mock.get_embedding_and_usage
+    return mock
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken",
+            name="tom_kha",
+            meta_data={"cuisine": "Thai", "type": "soup"},
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodle dish",
+            name="pad_thai",
+            meta_data={"cuisine": "Thai", "type": "noodles"},
+        ),
+        Document(
+            content="Green curry is a spicy Thai curry with coconut milk",
+            name="green_curry",
+            meta_data={"cuisine": "Thai", "type": "curry", "tags": ["spicy", "coconut"]},
+        ),
+    ]
+
+
+@pytest.fixture
+def vector_db(embedder):
+    db = InMemoryVectorDb(collection="recipes", embedder=embedder, initial_capacity=2)
+    db.create()
+    return db
+
+
+def test_insert_and_exists(vector_db, sample_documents):
+    vector_db.insert(sample_documents)
+    assert vector_db.get_count() == 3
+    assert vector_db.doc_exists(sample_documents[0])
+    assert vector_db.name_exists("pad_thai")
+    assert not vector_db.name_exists("massaman")
+
+
+def test_vector_search(vector_db, sample_documents):
+    vector_db.insert(sample_documents)
+    results = vector_db.search("coconut soup", limit=2)
+    assert [doc.name for doc in results] == ["tom_kha", "green_curry"]
+    assert len(results[0].embedding) == 3
+
+
+def test_vector_search_batch(vector_db, sample_documents):
+    vector_db.insert(sample_documents)
+    results = vector_db.vector_search_batch(["coconut soup", "noodles"], limit=1)
+    assert [[doc.name for doc in docs] for docs in results] == [["tom_kha"], ["pad_thai"]]
+
+
+def test_search_with_filters(vector_db, sample_documents):
+    vector_db.insert(sample_documents)
+    assert [doc.name for doc in vector_db.search("coconut soup", filters={"type": "curry"})] == ["green_curry"]
+    assert [doc.name for doc in vector_db.search("coconut soup", filters={"tags": "spicy"})] == ["green_curry"]
+    results = vector_db.search("coconut soup", filters={"type": ["noodles", "curry"]})
+    assert {doc.name for doc in results} == {"pad_thai", "green_curry"}
+    assert vector_db.search("coconut soup", filters={"cuisine": "Indian"}) == []
+
+
+def test_l2_distance(embedder, sample_documents):
+    db = InMemoryVectorDb(collection="recipes", embedder=embedder, distance=Distance.l2)
+    db.insert(sample_documents)
+    assert db.search("noodles", limit=1)[0].name == "pad_thai"
+
+
+def test_keyword_and_hybrid_search(embedder, sample_documents):
+    db = InMemoryVectorDb(collection="recipes", embedder=embedder, search_type=SearchType.keyword)
+    db.insert(sample_documents)
+    assert db.search("spicy curry", limit=1)[0].name == "green_curry"
+
+    db.search_type = SearchType.hybrid
+    results = db.search("coconut soup", limit=3)
+    assert results[0].name == "tom_kha"
+    assert len(results) == 3
+
+
+def test_upsert_replaces_documents(vector_db, sample_documents):
+    vector_db.upsert(sample_documents)
+    updated = Document(content=sample_documents[0].content, name="tom_kha", meta_data={"type": "starter"})
+    vector_db.upsert([updated])
+    assert vector_db.get_count() == 3
+    assert [doc.name for doc in vector_db.search("coconut soup", filters={"type": "starter"})] == ["tom_kha"]
+    assert vector_db.search("coconut soup", filters={"type": "soup"}) == []
+
+
+def test_insert_skips_existing_ids(vector_db, sample_documents):
+    vector_db.insert(sample_documents)
+    duplicate = Document(id=vector_db.search("noodles", limit=1)[0].id, content="noodles", name="noodles")
+    vector_db.insert([duplicate])
+    assert vector_db.get_count() == 3
+    assert len(vector_db._documents) == 3
+    assert [doc.name for doc in vector_db.search("noodles", limit=5)].count("pad_thai") == 1
+
+
+def test_persistence(tmp_path, embedder, sample_documents):
+    db = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    db.insert(sample_documents)
+    db.close()
+
+    loaded = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    assert loaded.exists()
+    loaded.create()
+    assert isinstance(loaded._embeddings, np.memmap)
+    assert loaded.get_count() == 3
+    assert loaded.search("noodles", limit=1)[0].name == "pad_thai"
+
+    # Writing to a memory-mapped collection copies it into memory first
+    loaded.insert([Document(content="noodles", name="noodles")])
+    assert loaded.get_count() == 4
+
+    loaded.drop()
+    assert not loaded.exists()
+
+
+def test_persisted_collection_loads_on_existence_checks(tmp_path, embedder, sample_documents):
+    db = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    db.insert(sample_documents)
+    db.close()
+
+    loaded = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    assert loaded.doc_exists(sample_documents[0])
+    assert loaded.name_exists("pad_thai")
+    assert loaded.get_count() == 3
+
+    reopened = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    assert reopened.keyword_search("noodle", limit=1)[0].name == "pad_thai"
+
+
+def test_persistence_saves_in_batches(tmp_path, embedder, sample_documents):
+    db = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path), save_batch_size=2)
+    db.insert(sample_documents[:1])
+    assert not db._persisted()
+
+    db.insert(sample_documents[1:2])
+    loaded = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    loaded.create()
+    assert loaded.get_count() == 2
+
+    db.insert(sample_documents[2:])
+    db.flush()
+    loaded = InMemoryVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    loaded.create()
+    assert loaded.get_count() == 3
+
+
+def test_delete(vector_db, sample_documents):
+    vector_db.insert(sample_documents)
+    assert vector_db.delete()
+    assert vector_db.get_count() == 0
+    assert vector_db.search("coconut soup") == []
+
+
+def test_bm25_index():
+    index = BM25Index()
+    index.add(1, "the quick brown fox")
+    index.add(2, "the lazy dog")
+    index.add(3, "quick quick dog")
+
+    assert [key for key, _ in index.search("quick dog", limit=3)] == [3, 2, 1]
+    assert [key for key, _ in index.search("quick", candidates={1})] == [1]
+
+    index.remove(3)
+    assert 3 not in index
+    assert [key for key, _ in index.search("dog")] == [2]
@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.engine import URL, Engine
@@ -275,10 +275,17 @@ def test_delete(mock_pgvector):
 
 
 # Asynchronous Tests
+@pytest.fixture
+def no_async_driver(mock_pgvector):
+    """Run the async methods without an async driver, so they fall back to the sync methods in a thread."""
+    with patch.object(mock_pgvector, "get_async_session", return_value=None):
+        yield mock_pgvector
+
+
 @pytest.mark.asyncio
-@pytest.mark.asyncio
-async def test_async_create(mock_pgvector):
+async def test_async_create(no_async_driver):
     """Test async_create method."""
+    mock_pgvector = no_async_driver
     with patch.object(mock_pgvector, "create"), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = None
 
@@ -289,8 +296,9 @@ async def test_async_create(mock_pgvector):
 
 
 @pytest.mark.asyncio
-async def test_async_doc_exists(mock_pgvector):
+async def test_async_doc_exists(no_async_driver):
     """Test async_doc_exists method."""
+    mock_pgvector = no_async_driver
     doc = create_test_documents(1)[0]
 
     with patch.object(mock_pgvector, "doc_exists", return_value=True), patch("asyncio.to_thread") as mock_to_thread:
@@ -304,8 +312,9 @@ async def test_async_doc_exists(mock_pgvector):
 
 
 @pytest.mark.asyncio
-async def test_async_name_exists(mock_pgvector):
+async def test_async_name_exists(no_async_driver):
     """Test async_name_exists method."""
+    mock_pgvector = no_async_driver
     with patch.object(mock_pgvector, "name_exists", return_value=True), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = True
 
@@ -317,8 +326,9 @@ async def test_async_name_exists(mock_pgvector):
 
 
 @pytest.mark.asyncio
-async def test_async_insert(mock_pgvector):
+async def test_async_insert(no_async_driver):
     """Test async_insert method."""
+    mock_pgvector = no_async_driver
     docs = create_test_documents()
 
     with patch.object(mock_pgvector, "insert"), patch("asyncio.to_thread") as mock_to_thread:
@@ -327,12 +337,13 @@ async def test_async_insert(mock_pgvector):
         await mock_pgvector.async_insert(docs)
 
         # Check that insert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.insert, docs, None)
+        mock_to_thread.assert_called_once_with(mock_pgvector.insert, docs, None, 100)
 
 
 @pytest.mark.asyncio
-async def test_async_upsert(mock_pgvector):
+async def test_async_upsert(no_async_driver):
     """Test async_upsert method."""
+    mock_pgvector = no_async_driver
     docs = create_test_documents()
 
     with patch.object(mock_pgvector, "upsert"), patch("asyncio.to_thread") as mock_to_thread:
@@ -341,30 +352,32 @@ async def test_async_upsert(mock_pgvector):
         await mock_pgvector.async_upsert(docs)
 
         # Check that upsert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.upsert, docs, None)
+        mock_to_thread.assert_called_once_with(mock_pgvector.upsert, docs, None, 100)
 
 
 @pytest.mark.asyncio
-async def test_async_search(mock_pgvector):
+async def test_async_search(no_async_driver):
     """Test async_search method."""
+    mock_pgvector = no_async_driver
     expected_results = [Document(id="test", content="Test document")]
 
     with (
-        patch.object(mock_pgvector, "search", return_value=expected_results),
+        patch.object(mock_pgvector, "vector_search", return_value=expected_results),
         patch("asyncio.to_thread") as mock_to_thread,
     ):
         mock_to_thread.return_value = expected_results
 
         results = await mock_pgvector.async_search("test query")
 
-        # Check results and that search was called via to_thread
+        # Check results and that vector_search was called via to_thread
         assert results == expected_results
-        mock_to_thread.assert_called_once_with(mock_pgvector.search, "test query", 5, None)
+        mock_to_thread.assert_called_once_with(mock_pgvector.vector_search, "test query", 5, None, None)
 
 
 @pytest.mark.asyncio
-async def test_async_drop(mock_pgvector):
+async def test_async_drop(no_async_driver):
     """Test async_drop method."""
+    mock_pgvector = no_async_driver
     with patch.object(mock_pgvector, "drop"), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = None
 
@@ -375,13 +388,165 @@ async def test_async_drop(mock_pgvector):
 
 
 @pytest.mark.asyncio
-async def test_async_exists(mock_pgvector):
+async def test_async_exists(no_async_driver):
     """Test async_exists method."""
-    with patch.object(mock_pgvector, "exists", return_value=True), patch("asyncio.to_thread") as mock_to_thread:
+    mock_pgvector = no_async_driver
+    with patch.object(mock_pgvector, "table_exists", return_value=True), patch("asyncio.to_thread") as mock_to_thread:
         mock_to_thread.return_value = True
 
         result = await mock_pgvector.async_exists()
 
-        # Check result and that exists was called via to_thread
+        # Check result and that table_exists was called via to_thread
         assert result is True
-        mock_to_thread.assert_called_once_with(mock_pgvector.exists)
+        mock_to_thread.assert_called_once_with(mock_pgvector.table_exists)
+
+
+# Native async engine tests
+@pytest.fixture
+def mock_async_session():
+    """Create a mock SQLAlchemy async session."""
+    result = MagicMock()
+    result.fetchall.return_value = []
+    result.first.return_value = None
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def async_pgvector(mock_engine, mock_embedder, mock_async_session):
+    """Create a PgVector instance with a real table and a mocked async session."""
+    db = PgVector(table_name=TEST_TABLE, schema=TEST_SCHEMA, db_engine=mock_engine, embedder=mock_embedder)
+    async_session_factory = MagicMock()
+    async_session_factory.return_value.__aenter__.return_value = mock_async_session
+    db.AsyncSession = async_session_factory
+    return db
+
+
+def test_get_async_db_url():
+    """Test the async URL is derived from the sync URL."""
+    from agno.vectordb.pgvector.pgvector import ASYNC_DRIVERS, _get_async_db_url
+
+    url = "postgresql+psycopg://ai:ai@localhost:5532/ai"
+    assert _get_async_db_url(url).render_as_string(hide_password=False) == url
+    assert _get_async_db_url("postgresql+asyncpg://ai:ai@localhost:5532/ai").drivername == "postgresql+asyncpg"
+    assert _get_async_db_url("postgresql+psycopg2://ai:ai@localhost:5532/ai").drivername == "postgresql+psycopg"
+    # Without a driver, the default driver of the dialect is used if it supports async
+    assert _get_async_db_url("postgresql://ai:ai@localhost:5532/ai").get_driver_name() in ASYNC_DRIVERS
+
+
+@pytest.mark.asyncio
+async def test_native_async_doc_exists(async_pgvector, mock_async_session):
+    """Test async_doc_exists queries with the async session."""
+    doc = create_test_documents(1)[0]
+
+    with patch("asyncio.to_thread") as mock_to_thread:
+        mock_async_session.execute.return_value.first.return_value = (1,)
+        assert await async_pgvector.async_doc_exists(doc) is True
+
+        mock_async_session.execute.return_value.first.return_value = None
+        assert await async_pgvector.async_doc_exists(doc) is False
+
+        mock_to_thread.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_native_async_upsert(async_pgvector, mock_async_session, mock_embedder):
+    """Test async_upsert executes one upsert per batch with the async session."""
+    docs = create_test_documents(5)
+
+    await async_pgvector.async_upsert(docs, batch_size=2)
+
+    assert mock_async_session.execute.await_count == 3
+    assert mock_async_session.commit.await_count == 3
+    mock_async_session.rollback.assert_not_awaited()
+    assert all(doc.embedding == mock_embedder.get_embedding.return_value for doc in docs)
+
+
+@pytest.mark.asyncio
+async def test_native_async_vector_search(async_pgvector, mock_async_session):
+    """Test async_search does not select the embeddings unless requested."""
+    row = MagicMock()
+    row.id, row.name, row.meta_data, row.content, row.usage = "doc_1", "test_doc_1", {"type": "test"}, "Test", None
+    row._mapping = {"id": "doc_1"}
+    mock_async_session.execute.return_value.fetchall.return_value = [row]
+
+    results = await async_pgvector.async_search("test query")
+
+    assert [doc.id for doc in results] == ["doc_1"]
+    assert results[0].embedding is None
+    # Index settings, then the search query
+    search_stmt = mock_async_session.execute.await_args_list[-1].args[0]
+    assert "embedding" not in search_stmt.selected_columns.keys()
+
+    await async_pgvector.async_vector_search("test query", include_embeddings=True)
+    search_stmt = mock_async_session.execute.await_args_list[-1].args[0]
+    assert "embedding" in search_stmt.selected_columns.keys()
+
+
+def test_search_columns(async_pgvector):
+    """Test search queries only select the embeddings when requested."""
+    query_embedding = [0.1] * 1024
+
+    stmt = async_pgvector._get_vector_search_statement(query_embedding, 5, None, include_embeddings=None)
+    assert list(stmt.selected_columns.keys()) == ["id", "name", "meta_data", "content", "usage"]
+
+    stmt = async_pgvector._get_keyword_search_statement("test", 5, None, include_embeddings=True)
+    assert "embedding" in stmt.selected_columns.keys()
+
+    async_pgvector.include_embeddings = True
+    stmt = async_pgvector._get_hybrid_search_statement("test", query_embedding, 5, None, include_embeddings=None)
+    assert list(stmt.selected_columns.keys()) == [
+        "id",
+        "name",
+        "meta_data",
+        "content",
+        "usage",
+        "embedding",
+        "hybrid_score",
+    ]
+
+
+def test_async_engine_is_recreated_for_each_event_loop(mock_engine, mock_embedder):
+    """Test each asyncio.run() gets its own async engine, as pooled connections belong to one event loop."""
+    import asyncio
+
+    pytest.importorskip("greenlet")
+    db = PgVector(table_name=TEST_TABLE, schema=TEST_SCHEMA, db_engine=mock_engine, embedder=mock_embedder)
+
+    async def get_engine():
+        assert db.get_async_session() is db.get_async_session()
+        return db.async_db_engine
+
+    with patch("sqlalchemy.ext.asyncio.create_async_engine", side_effect=lambda url: MagicMock()) as create_engine:
+        first_engine = asyncio.run(get_engine())
+        second_engine = asyncio.run(get_engine())
+
+    assert create_engine.call_count == 2
+    assert first_engine is not second_engine
+    first_engine.sync_engine.dispose.assert_called_once_with(close=False)
+
+
+def test_user_async_engine_is_kept_across_event_loops(mock_engine, mock_embedder):
+    """Test an async engine given by the user is used on every event loop."""
+    import asyncio
+
+    pytest.importorskip("greenlet")
+    async_engine = MagicMock()
+    db = PgVector(
+        table_name=TEST_TABLE,
+        schema=TEST_SCHEMA,
+        db_engine=mock_engine,
+        embedder=mock_embedder,
+        async_db_engine=async_engine,
+    )
+
+    async def get_engine():
+        db.get_async_session()
+        return db.async_db_engine
+
+    assert asyncio.run(get_engine()) is async_engine
+    assert asyncio.run(get_engine()) is async_engine
+    async_engine.sync_engine.dispose.assert_not_called()
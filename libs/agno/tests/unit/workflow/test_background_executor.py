@@ -0,0 +1,189 @@
+import asyncio
+import time
+
+import pytest
+
+from agno.run.base import RunStatus
+from agno.workflow.v2 import (
+    BackgroundWorkflowExecutor,
+    InMemoryWorkflowRunStore,
+    SqliteWorkflowRunStore,
+    Step,
+    StepInput,
+    StepOutput,
+    Workflow,
+    WorkflowRunStore,
+)
+
+
+def research(step_input: StepInput) -> StepOutput:
+    return StepOutput(content=f"Research on {step_input.message}")
+
+
+def write(step_input: StepInput) -> StepOutput:
+    return StepOutput(content=f"Article from {step_input.previous_step_content}")
+
+
+async def step_with_io(step_input: StepInput) -> StepOutput:
+    await asyncio.sleep(0.05)
+    return StepOutput(content=f"Research on {step_input.message}")
+
+
+async def slow_step(step_input: StepInput) -> StepOutput:
+    await asyncio.sleep(5)
+    return StepOutput(content="done")
+
+
+def _workflow(workflow_id: str = "articles") -> Workflow:
+    return Workflow(
+        workflow_id=workflow_id,
+        name="Articles",
+        steps=[Step(name="research", executor=research), Step(name="write", executor=write)],
+    )
+
+
+async def _wait_until_finished(executor: BackgroundWorkflowExecutor, run_id: str, timeout: float = 5.0):
+    async def _wait():
+        async for record in executor.subscribe(run_id):
+            if record.is_finished:
+                return record
+
+    return await asyncio.wait_for(_wait(), timeout)
+
+
+async def test_background_run_completes_and_is_read_from_its_record():
+    workflow = _workflow()
+
+    response = await workflow.arun(message="AI", background=True)
+    assert response.status == RunStatus.pending
+
+    record = await _wait_until_finished(workflow.background_executor, response.run_id)
+
+    assert record.status == RunStatus.completed.value
+    assert record.progress["event"] == "WorkflowCompleted"
+    # The pending response is updated in place, and the run can be read back from its record
+    assert response.status == RunStatus.completed
+    assert response.content == "Article from Research on AI"
+    run = workflow.get_run(response.run_id)
+    assert run.status == RunStatus.completed
+    assert run.content == "Article from Research on AI"
+    assert len(run.step_responses) == 2
+
+
+async def test_stream_events_pushes_progress_as_server_sent_events():
+    executor = BackgroundWorkflowExecutor(poll_interval=5.0)
+    workflow = Workflow(workflow_id="io", steps=[Step(name="research", executor=step_with_io)])
+    response = await executor.submit(workflow, message="AI")
+
+    events = await asyncio.wait_for(_collect(executor.stream_events(response.run_id)), 2.0)
+
+    assert events[0].startswith("id: ")
+    assert any("event: progress" in event and '"step_name": "research"' in event for event in events)
+    assert "event: completed" in events[-1]
+    assert all(event.endswith("\n\n") for event in events)
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+async def test_cancel_running_run():
+    workflow = Workflow(workflow_id="slow", steps=[Step(name="slow", executor=slow_step)])
+    executor = BackgroundWorkflowExecutor()
+    response = await executor.submit(workflow, message="AI")
+    await asyncio.sleep(0.1)
+
+    assert executor.cancel(response.run_id)
+
+    record = await _wait_until_finished(executor, response.run_id)
+    assert record.status == RunStatus.cancelled.value
+    assert response.status == RunStatus.cancelled
+    assert not executor.cancel(response.run_id)
+
+
+async def test_run_with_expired_lease_is_recovered_by_another_worker(tmp_path):
+    store = SqliteWorkflowRunStore(db_file=str(tmp_path / "runs.db"))
+    submitter = BackgroundWorkflowExecutor(store=store)
+    response = await submitter.submit(_workflow(), message="AI", start=False)
+
+    # A worker claims the run and dies without renewing its lease
+    claimed = store.claim("dead-worker", lease_seconds=0.1)
+    assert claimed.run_id == response.run_id
+    assert store.claim("other-worker", lease_seconds=0.1) is None
+    await asyncio.sleep(0.2)
+
+    worker = BackgroundWorkflowExecutor(store=SqliteWorkflowRunStore(db_file=str(tmp_path / "runs.db")))
+    worker.register(_workflow())
+    worker.start()
+    try:
+        record = await _wait_until_finished(submitter, response.run_id)
+    finally:
+        await worker.stop()
+
+    assert record.status == RunStatus.completed.value
+    assert record.attempts == 2
+    # Only the JSON input is shared between processes
+    assert submitter.get_run(response.run_id).content == "Article from Research on AI"
+
+
+def test_claim_gives_up_after_max_attempts():
+    executor = BackgroundWorkflowExecutor()
+    loop = asyncio.new_event_loop()
+    try:
+        response = loop.run_until_complete(executor.submit(_workflow(), message="AI", start=False))
+    finally:
+        loop.close()
+
+    for _ in range(2):
+        assert executor.store.claim("worker", lease_seconds=0, max_attempts=2) is not None
+    assert executor.store.claim("worker", lease_seconds=0, max_attempts=2) is None
+
+    assert executor.store.get(response.run_id).status == RunStatus.error.value
+
+
+def test_pending_run_is_cancelled_without_a_worker():
+    executor = BackgroundWorkflowExecutor()
+    loop = asyncio.new_event_loop()
+    try:
+        response = loop.run_until_complete(executor.submit(_workflow(), message="AI", start=False))
+    finally:
+        loop.close()
+    assert response.status == RunStatus.pending
+
+    assert executor.cancel(response.run_id)
+
+    assert response.status == RunStatus.cancelled
+    assert executor.store.claim("worker", lease_seconds=10) is None
+
+
+class SlowStore(InMemoryWorkflowRunStore):
+    """A store whose writes block, like a locked SQLite database"""
+
+    def update(self, run_id, owner=None, **fields):
+        time.sleep(0.05)
+        return super().update(run_id, owner=owner, **fields)
+
+
+async def test_store_calls_do_not_block_the_event_loop():
+    executor = BackgroundWorkflowExecutor(store=SlowStore())
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.ensure_future(tick())
+    response = await executor.submit(_workflow(), message="AI")
+    record = await _wait_until_finished(executor, response.run_id)
+    ticker.cancel()
+
+    assert record.status == RunStatus.completed.value
+    # Every workflow event blocks the store for 0.05s, the loop keeps running meanwhile
+    assert ticks >= 20
+
+
+def test_run_store_base_is_abstract():
+    with pytest.raises(TypeError):
+        WorkflowRunStore()
@@ -0,0 +1,147 @@
+from typing import List
+
+import pytest
+
+from agno.run.base import RunStatus
+from agno.workflow.v2 import (
+    InMemoryStepCache,
+    Parallel,
+    SqliteStepCache,
+    Step,
+    StepCache,
+    StepInput,
+    StepOutput,
+    Workflow,
+)
+
+
+class Counter:
+    """Step executors that count their calls, and can fail on demand"""
+
+    def __init__(self):
+        self.calls: List[str] = []
+        self.fail = False
+
+        # Plain functions, as the workflow sets attributes on step executors
+        def fetch(step_input: StepInput) -> StepOutput:
+            self.calls.append("fetch")
+            return StepOutput(content=f"Data for {step_input.message}")
+
+        def parse(step_input: StepInput) -> StepOutput:
+            self.calls.append("parse")
+            if self.fail:
+                raise RuntimeError("parser crashed")
+            return StepOutput(content=f"Parsed {step_input.previous_step_content}")
+
+        def summarize(step_input: StepInput) -> StepOutput:
+            self.calls.append("summarize")
+            return StepOutput(content=f"Summary of {step_input.previous_step_content}")
+
+        self.fetch = fetch
+        self.parse = parse
+        self.summarize = summarize
+
+
+def _workflow(counter: Counter, **kwargs) -> Workflow:
+    return Workflow(
+        name="ETL",
+        steps=[
+            Step(name="fetch", executor=counter.fetch, max_retries=0),
+            Step(name="parse", executor=counter.parse, max_retries=0),
+            Step(name="summarize", executor=counter.summarize, max_retries=0),
+        ],
+        **kwargs,
+    )
+
+
+def test_cached_step_runs_once_per_input_and_version():
+    counter = Counter()
+    cache = InMemoryStepCache()
+    workflow = Workflow(steps=[Step(name="fetch", executor=counter.fetch, cache=cache)])
+
+    first = workflow.run(message="AI")
+    second = workflow.run(message="AI")
+    workflow.run(message="Databases")
+
+    assert counter.calls == ["fetch", "fetch"]
+    assert second.content == first.content == "Data for AI"
+    assert second.step_responses[0].step_name == "fetch"
+
+    workflow.steps[0].cache_version = "2"
+    workflow.run(message="AI")
+    assert counter.calls == ["fetch", "fetch", "fetch"]
+
+
+def test_cached_outputs_are_shared_through_sqlite(tmp_path):
+    counter = Counter()
+    db_file = str(tmp_path / "cache.db")
+    step = Step(name="fetch", executor=counter.fetch, cache=SqliteStepCache(db_file=db_file))
+    Workflow(steps=[step]).run(message="AI")
+
+    step = Step(name="fetch", executor=counter.fetch, cache=SqliteStepCache(db_file=db_file))
+    response = Workflow(steps=[step]).run(message="AI")
+
+    assert counter.calls == ["fetch"]
+    assert response.content == "Data for AI"
+
+
+def test_resume_skips_completed_steps():
+    counter = Counter()
+    counter.fail = True
+    workflow = _workflow(counter, checkpoint_store=InMemoryStepCache())
+
+    failed = workflow.run(message="AI")
+    assert failed.status == RunStatus.error
+    assert counter.calls == ["fetch", "parse"]
+
+    counter.fail = False
+    resumed = workflow.run(resume_run_id=failed.run_id)
+
+    assert resumed.status == RunStatus.completed
+    assert resumed.run_id == failed.run_id
+    assert counter.calls == ["fetch", "parse", "parse", "summarize"]
+    assert resumed.content == "Summary of Parsed Data for AI"
+    assert len(resumed.step_responses) == 3
+    # The checkpoint of a completed run is cleared
+    assert workflow.checkpoint_store.get(f"checkpoint:{failed.run_id}") is None
+
+
+async def test_resume_streaming_run():
+    counter = Counter()
+    counter.fail = True
+    workflow = _workflow(counter, checkpoint_store=InMemoryStepCache())
+
+    events = [event async for event in await workflow.arun(message="AI", stream=True)]
+    run_id = events[0].run_id
+    assert counter.calls == ["fetch", "parse"]
+
+    counter.fail = False
+    events = [event async for event in await workflow.arun(resume_run_id=run_id, stream=True)]
+
+    assert counter.calls == ["fetch", "parse", "parse", "summarize"]
+    assert events[-1].content == "Summary of Parsed Data for AI"
+
+
+def test_parallel_outputs_are_checkpointed():
+    counter = Counter()
+    store = InMemoryStepCache()
+    workflow = Workflow(
+        steps=[
+            Parallel(Step(name="a", executor=counter.fetch), Step(name="b", executor=counter.fetch), name="both"),
+            Step(name="parse", executor=counter.parse, max_retries=0),
+        ],
+        checkpoint_store=store,
+    )
+    counter.fail = True
+    failed = workflow.run(message="AI")
+
+    counter.fail = False
+    resumed = workflow.run(resume_run_id=failed.run_id)
+
+    assert counter.calls.count("fetch") == 2
+    assert resumed.step_responses[0].parallel_step_outputs.keys() == {"a", "b"}
+
+
+def test_step_cache_base_is_abstract():
+    with pytest.raises(TypeError):
+        StepCache()
@@ -1,5 +1,7 @@
+from threading import RLock
 from typing import Any, Optional
 
+from agno.infra.state import ResourceStateCache
 from agno.utils.log import logger
 
 
@@ -15,6 +17,10 @@ class AwsApiClient:
 
         # aws boto3 session
         self._boto3_session: Optional[Any] = None
+        # boto3 sessions are not thread safe, clients and resources are created under this lock
+        self.lock = RLock()
+        # State of the resources read during the current operation
+        self.state_cache = ResourceStateCache()
         logger.debug("**-+-** AwsApiClient created")
 
     def create_boto3_session(self) -> Optional[Any]:
@@ -39,5 +45,7 @@ class AwsApiClient:
     @property
     def boto3_session(self) -> Optional[Any]:
         if self._boto3_session is None:
-            self._boto3_session = self.create_boto3_session()
+            with self.lock:
+                if self._boto3_session is None:
+                    self._boto3_session = self.create_boto3_session()
         return self._boto3_session
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.aws.api_client import AwsApiClient
 from agno.cli.console import print_info
@@ -65,7 +65,8 @@ class AwsResource(InfraResource):
 
         if self.service_client is None:
             boto3_session: session = aws_client.boto3_session
-            self.service_client = boto3_session.client(service_name=self.service_name)
+            with aws_client.lock:
+                self.service_client = boto3_session.client(service_name=self.service_name)
         return self.service_client
 
     def get_service_resource(self, aws_client: AwsApiClient):
@@ -73,7 +74,8 @@ class AwsResource(InfraResource):
 
         if self.service_resource is None:
             boto3_session: session = aws_client.boto3_session
-            self.service_resource = boto3_session.resource(service_name=self.service_name)
+            with aws_client.lock:
+                self.service_resource = boto3_session.resource(service_name=self.service_name)
         return self.service_resource
 
     def get_aws_client(self) -> AwsApiClient:
@@ -82,10 +84,51 @@ class AwsResource(InfraResource):
         self.aws_client = AwsApiClient(aws_region=self.get_aws_region(), aws_profile=self.get_aws_profile())
         return self.aws_client
 
+    def get_state_key(self) -> Optional[Tuple[str, str]]:
+        """
+        Group and key of the resource in the state cache, resources in a group are described with one batched call.
+        Resources that return None are always read on their own.
+        """
+        return None
+
+    def _read_batch(self, aws_client: AwsApiClient, keys: List[str]) -> Optional[Dict[str, Any]]:
+        """Describes the resources in the group with `keys` in as few calls as possible, by state key"""
+        logger.warning(f"@_read_batch method not defined for {self.get_resource_name()}")
+        return None
+
     def _read(self, aws_client: AwsApiClient) -> Any:
         logger.warning(f"@_read method not defined for {self.get_resource_name()}")
         return True
 
+    def _read_state(self, aws_client: AwsApiClient) -> Any:
+        """Reads the resource using the state cache of the aws_client"""
+        state_key = self.get_state_key()
+        if not self.use_cache or state_key is None:
+            return self._read(aws_client)
+
+        group, key = state_key
+        state = aws_client.state_cache.get(
+            group,
+            key,
+            load_group=lambda keys: self._read_batch(aws_client, keys),
+            load_one=lambda: self._read(aws_client),
+        )
+        if state is not None:
+            self.active_resource = state
+        return self.active_resource
+
+    def register_state(self, aws_client: AwsApiClient) -> None:
+        """Registers the resource with the state cache, so it is described in the same batch as its group"""
+        state_key = self.get_state_key()
+        if self.use_cache and state_key is not None:
+            aws_client.state_cache.register(*state_key)
+
+    def _invalidate_state(self, aws_client: AwsApiClient) -> None:
+        """Drops the cached state of the resource, called when the resource is changed"""
+        state_key = self.get_state_key()
+        if state_key is not None:
+            aws_client.state_cache.invalidate(*state_key)
+
     def read(self, aws_client: Optional[AwsApiClient] = None) -> Any:
         """Reads the resource from Aws"""
         # Step 1: Use cached value if available
@@ -99,7 +142,7 @@ class AwsResource(InfraResource):
 
         # Step 3: Read resource
         client: AwsApiClient = aws_client or self.get_aws_client()
-        return self._read(client)
+        return self._read_state(client)
 
     def is_active(self, aws_client: AwsApiClient) -> bool:
         """Returns True if the resource is active on Aws"""
@@ -125,7 +168,10 @@ class AwsResource(InfraResource):
             print_info(f"{self.get_resource_type()}: {self.get_resource_name()} already exists")
         # Step 3: Create the resource
         else:
-            self.resource_created = self._create(client)
+            try:
+                self.resource_created = self._create(client)
+            finally:
+                self._invalidate_state(client)
             if self.resource_created:
                 print_info(f"{self.get_resource_type()}: {self.get_resource_name()} created")
 
@@ -156,7 +202,10 @@ class AwsResource(InfraResource):
         # Step 2: Update the resource
         client: AwsApiClient = aws_client or self.get_aws_client()
         if self.is_active(client):
-            self.resource_updated = self._update(client)
+            try:
+                self.resource_updated = self._update(client)
+            finally:
+                self._invalidate_state(client)
         else:
             print_info(f"{self.get_resource_type()}: {self.get_resource_name()} does not exist")
             return True
@@ -189,7 +238,10 @@ class AwsResource(InfraResource):
         # Step 2: Delete the resource
         client: AwsApiClient = aws_client or self.get_aws_client()
         if self.is_active(client):
-            self.resource_deleted = self._delete(client)
+            try:
+                self.resource_deleted = self._delete(client)
+            finally:
+                self._invalidate_state(client)
         else:
             print_info(f"{self.get_resource_type()}: {self.get_resource_name()} does not exist")
             return True
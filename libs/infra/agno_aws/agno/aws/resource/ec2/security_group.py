@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from agno.aws.api_client import AwsApiClient
 from agno.aws.resource.base import AwsResource
@@ -226,6 +226,19 @@ class SecurityGroup(AwsResource):
                 return False
         return True
 
+    def get_state_key(self) -> Optional[Tuple[str, str]]:
+        return "SecurityGroup", self.name
+
+    def _read_batch(self, aws_client: AwsApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Describes the SecurityGroups with one call"""
+        service_client = self.get_service_client(aws_client)
+        describe_response = service_client.describe_security_groups(Filters=[{"Name": "group-name", "Values": keys}])
+        return {
+            resource.get("GroupName"): resource
+            for resource in describe_response.get("SecurityGroups", None) or []
+            if resource.get("GroupName", None) in keys
+        }
+
     def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
         """Reads the SecurityGroup
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.aws.api_client import AwsApiClient
 from agno.aws.resource.base import AwsResource
@@ -86,6 +86,20 @@ class EcsCluster(AwsResource):
             logger.error(e)
         return False
 
+    def get_state_key(self) -> Optional[Tuple[str, str]]:
+        return "EcsCluster", self.get_ecs_cluster_name()
+
+    def _read_batch(self, aws_client: AwsApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Describes the EcsClusters, 100 per call"""
+        service_client = self.get_service_client(aws_client)
+        clusters: Dict[str, Any] = {}
+        for i in range(0, len(keys), 100):
+            describe_response = service_client.describe_clusters(clusters=keys[i : i + 100])
+            for resource in describe_response.get("clusters", None) or []:
+                if resource.get("status", None) == "ACTIVE":
+                    clusters[resource.get("clusterName")] = resource
+        return clusters
+
     def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
         """Returns the EcsCluster
 
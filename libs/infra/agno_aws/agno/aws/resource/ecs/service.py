@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -246,6 +246,25 @@ class EcsService(AwsResource):
                 logger.error(e)
         return True
 
+    def get_state_key(self) -> Optional[Tuple[str, str]]:
+        return f"EcsService:{self.get_ecs_cluster_name() or ''}", self.get_ecs_service_name()
+
+    def _read_batch(self, aws_client: AwsApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Describes the EcsServices in the cluster, 10 per call"""
+        not_null_args: Dict[str, Any] = {}
+        cluster_name = self.get_ecs_cluster_name()
+        if cluster_name is not None:
+            not_null_args["cluster"] = cluster_name
+
+        service_client = self.get_service_client(aws_client)
+        services: Dict[str, Any] = {}
+        for i in range(0, len(keys), 10):
+            describe_response = service_client.describe_services(services=keys[i : i + 10], **not_null_args)
+            for resource in describe_response.get("services", None) or []:
+                if resource.get("status", None) == "ACTIVE":
+                    services[resource.get("serviceName")] = resource
+        return services
+
     def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
         """Read EcsService"""
         from botocore.exceptions import ClientError
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.aws.api_client import AwsApiClient
 from agno.aws.resource.base import AwsResource
@@ -118,6 +118,19 @@ class LoadBalancer(AwsResource):
             print_info(f"LoadBalancer DNS: {self.protocol.lower()}://{dns_name}")
         return True
 
+    def get_state_key(self) -> Optional[Tuple[str, str]]:
+        return "LoadBalancer", self.name
+
+    def _read_batch(self, aws_client: AwsApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Lists the LoadBalancers in the region, as describing a missing name fails the whole call"""
+        service_client = self.get_service_client(aws_client)
+        load_balancers: Dict[str, Any] = {}
+        for page in service_client.get_paginator("describe_load_balancers").paginate():
+            for resource in page.get("LoadBalancers", None) or []:
+                if resource.get("LoadBalancerName") in keys:
+                    load_balancers[resource.get("LoadBalancerName")] = resource
+        return load_balancers
+
     def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
         """Returns the LoadBalancer
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.aws.api_client import AwsApiClient
 from agno.aws.resource.base import AwsResource
@@ -112,6 +112,19 @@ class TargetGroup(AwsResource):
             logger.error(e)
         return False
 
+    def get_state_key(self) -> Optional[Tuple[str, str]]:
+        return "TargetGroup", self.name
+
+    def _read_batch(self, aws_client: AwsApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Lists the TargetGroups in the region, as describing a missing name fails the whole call"""
+        service_client = self.get_service_client(aws_client)
+        target_groups: Dict[str, Any] = {}
+        for page in service_client.get_paginator("describe_target_groups").paginate():
+            for resource in page.get("TargetGroups", None) or []:
+                if resource.get("TargetGroupName") in keys:
+                    target_groups[resource.get("TargetGroupName")] = resource
+        return target_groups
+
     def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
         """Returns the TargetGroup
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from typing_extensions import Literal
 
@@ -124,6 +124,19 @@ class S3Bucket(AwsResource):
                 logger.error(e)
         return True
 
+    def get_state_key(self) -> Optional[Tuple[str, str]]:
+        return "S3Bucket", self.name
+
+    def _read_batch(self, aws_client: AwsApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Lists the buckets with one call"""
+        service_client = self.get_service_client(aws_client)
+        list_response = service_client.list_buckets()
+        return {
+            bucket["Name"]: {"name": bucket["Name"], "creation_date": bucket.get("CreationDate")}
+            for bucket in list_response.get("Buckets", None) or []
+            if bucket.get("Name") in keys
+        }
+
     def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
         """Returns the s3.Bucket
 
@@ -94,3 +94,43 @@ AwsResourceAliasToTypeMap: Dict[str, Type[AwsResource]] = dict(**_aws_resource_t
 AwsResourceInstallOrder: Dict[str, int] = OrderedDict(
     {resource_type.__name__: idx for idx, resource_type in enumerate(AwsResourceTypeList, start=1)}
 )
+
+# Maps each AwsResource to the resource types it needs, used to provision independent resources concurrently.
+# Resources not listed here wait for every resource earlier in the install order.
+AwsResourceDependencies: Dict[str, List[str]] = {
+    "Subnet": [],
+    "SecurityGroup": ["Subnet"],
+    "IamRole": [],
+    "IamPolicy": ["IamRole"],
+    "S3Bucket": [],
+    "SecretsManager": [],
+    "EbsVolume": [],
+    "AcmCertificate": [],
+    "GlueCrawler": ["IamRole", "IamPolicy", "S3Bucket"],
+    "DbSubnetGroup": ["Subnet"],
+    "DbCluster": ["DbSubnetGroup", "SecurityGroup", "SecretsManager", "IamRole", "IamPolicy"],
+    "DbInstance": ["DbSubnetGroup", "DbCluster", "SecurityGroup", "SecretsManager", "IamRole", "IamPolicy"],
+    "CacheSubnetGroup": ["Subnet"],
+    "CacheCluster": ["CacheSubnetGroup", "SecurityGroup"],
+    "LoadBalancer": ["Subnet", "SecurityGroup", "AcmCertificate"],
+    "TargetGroup": ["Subnet", "LoadBalancer"],
+    "Listener": ["LoadBalancer", "TargetGroup", "AcmCertificate"],
+    "EcsCluster": [],
+    "EcsTaskDefinition": ["IamRole", "IamPolicy", "SecretsManager", "EbsVolume"],
+    # Services start containers that connect to the databases, caches and buckets of the workspace
+    "EcsService": [
+        "Subnet",
+        "SecurityGroup",
+        "S3Bucket",
+        "SecretsManager",
+        "DbCluster",
+        "DbInstance",
+        "CacheCluster",
+        "LoadBalancer",
+        "TargetGroup",
+        "Listener",
+        "EcsCluster",
+        "EcsTaskDefinition",
+    ],
+    "EmrCluster": ["Subnet", "SecurityGroup", "IamRole", "IamPolicy", "S3Bucket"],
+}
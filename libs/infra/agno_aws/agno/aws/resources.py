@@ -4,6 +4,7 @@ from agno.aws.api_client import AwsApiClient
 from agno.aws.app.base import AwsApp
 from agno.aws.context import AwsBuildContext
 from agno.aws.resource.base import AwsResource
+from agno.infra.graph import ResourceGraph
 from agno.infra.resources import InfraResources
 from agno.utils.log import logger
 
@@ -78,7 +79,7 @@ class AwsResources(InfraResources):
         force: Optional[bool] = None,
         pull: Optional[bool] = None,
     ) -> Tuple[int, int]:
-        from agno.aws.resource.types import AwsResourceInstallOrder
+        from agno.aws.resource.types import AwsResourceDependencies, AwsResourceInstallOrder
         from agno.cli.console import confirm_yes_no, print_heading, print_info
 
         logger.debug("-*- Creating AwsResources")
@@ -139,41 +140,17 @@ class AwsResources(InfraResources):
                         ):
                             resources_to_create.append(app_resource)
 
-        # Sort the AwsResources in install order
-        resources_to_create.sort(key=lambda x: AwsResourceInstallOrder.get(x.__class__.__name__, 5000))
-
-        # Deduplicate AwsResources
-        deduped_resources_to_create: List[AwsResource] = []
-        for r in resources_to_create:
-            if r not in deduped_resources_to_create:
-                deduped_resources_to_create.append(r)
-
-        # Implement dependency sorting
-        final_aws_resources: List[AwsResource] = []
+        # Build the dependency graph of AwsResources
         logger.debug("-*- Building AwsResources dependency graph")
-        for aws_resource in deduped_resources_to_create:
-            # Logic to follow if resource has dependencies
-            if aws_resource.depends_on is not None and len(aws_resource.depends_on) > 0:
-                # Add the dependencies before the resource itself
-                for dep in aws_resource.depends_on:
-                    if isinstance(dep, AwsResource):
-                        if dep not in final_aws_resources:
-                            logger.debug(f"-*- Adding {dep.name}, dependency of {aws_resource.name}")
-                            final_aws_resources.append(dep)
-
-                # Add the resource to be created after its dependencies
-                if aws_resource not in final_aws_resources:
-                    logger.debug(f"-*- Adding {aws_resource.name}")
-                    final_aws_resources.append(aws_resource)
-            else:
-                # Add the resource to be created if it has no dependencies
-                if aws_resource not in final_aws_resources:
-                    logger.debug(f"-*- Adding {aws_resource.name}")
-                    final_aws_resources.append(aws_resource)
+        resource_graph = ResourceGraph(
+            resources_to_create,
+            install_order=AwsResourceInstallOrder,
+            type_dependencies=AwsResourceDependencies,
+        )
+        final_aws_resources: List[AwsResource] = resource_graph.ordered()  # type: ignore
 
         # Track the total number of AwsResources to create for validation
         num_resources_to_create: int = len(final_aws_resources)
-        num_resources_created: int = 0
         if num_resources_to_create == 0:
             return 0, 0
 
@@ -207,22 +184,33 @@ class AwsResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_aws_resources:
+        def _create(resource: AwsResource) -> bool:
             print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
             if force is True:
                 resource.force = True
-            # logger.debug(resource)
             try:
-                _resource_created = resource.create(aws_client=self.aws_client)
-                if _resource_created:
-                    num_resources_created += 1
-                else:
-                    if self.workspace_settings is not None and not self.workspace_settings.continue_on_create_failure:
-                        return num_resources_created, num_resources_to_create
+                return resource.create(aws_client=self.aws_client)
             except Exception as e:
                 logger.error(f"Failed to create {resource.get_resource_type()}: {resource.get_resource_name()}")
                 logger.error(e)
                 logger.error("Please fix and try again...")
+                return False
+
+        # Create the boto3 session before resources are created concurrently
+        self.aws_client.boto3_session
+
+        # State is read with one batched call per resource type and cached for this operation
+        self.aws_client.state_cache.clear()
+        for resource in final_aws_resources:
+            resource.register_state(self.aws_client)
+
+        # Independent resources are created concurrently, each after the resources it depends on
+        num_resources_created = resource_graph.run(
+            _create,
+            max_workers=self.get_max_concurrent_resources(),
+            stop_on_failure=self.workspace_settings is not None
+            and not self.workspace_settings.continue_on_create_failure,
+        )
 
         print_heading(f"\n--**-- Resources created: {num_resources_created}/{num_resources_to_create}")
         if num_resources_to_create != num_resources_created:
@@ -240,7 +228,7 @@ class AwsResources(InfraResources):
         auto_confirm: Optional[bool] = False,
         force: Optional[bool] = None,
     ) -> Tuple[int, int]:
-        from agno.aws.resource.types import AwsResourceInstallOrder
+        from agno.aws.resource.types import AwsResourceDependencies, AwsResourceInstallOrder
         from agno.cli.console import confirm_yes_no, print_heading, print_info
 
         logger.debug("-*- Deleting AwsResources")
@@ -285,50 +273,18 @@ class AwsResources(InfraResources):
                         ):
                             resources_to_delete.append(app_resource)
 
-        # Sort the AwsResources in install order
-        resources_to_delete.sort(key=lambda x: AwsResourceInstallOrder.get(x.__class__.__name__, 5000), reverse=True)
-
-        # Deduplicate AwsResources
-        deduped_resources_to_delete: List[AwsResource] = []
-        for r in resources_to_delete:
-            if r not in deduped_resources_to_delete:
-                deduped_resources_to_delete.append(r)
-
-        # Implement dependency sorting
-        final_aws_resources: List[AwsResource] = []
+        # Build the dependency graph of AwsResources
         logger.debug("-*- Building AwsResources dependency graph")
-        for aws_resource in deduped_resources_to_delete:
-            # Logic to follow if resource has dependencies
-            if aws_resource.depends_on is not None and len(aws_resource.depends_on) > 0:
-                # 1. Reverse the order of dependencies
-                aws_resource.depends_on.reverse()
-
-                # 2. Remove the dependencies if they are already added to the final_aws_resources
-                for dep in aws_resource.depends_on:
-                    if dep in final_aws_resources:
-                        logger.debug(f"-*- Removing {dep.name}, dependency of {aws_resource.name}")
-                        final_aws_resources.remove(dep)
-
-                # 3. Add the resource to be deleted before its dependencies
-                if aws_resource not in final_aws_resources:
-                    logger.debug(f"-*- Adding {aws_resource.name}")
-                    final_aws_resources.append(aws_resource)
-
-                # 4. Add the dependencies back in reverse order
-                for dep in aws_resource.depends_on:
-                    if isinstance(dep, AwsResource):
-                        if dep not in final_aws_resources:
-                            logger.debug(f"-*- Adding {dep.name}, dependency of {aws_resource.name}")
-                            final_aws_resources.append(dep)
-            else:
-                # Add the resource to be deleted if it has no dependencies
-                if aws_resource not in final_aws_resources:
-                    logger.debug(f"-*- Adding {aws_resource.name}")
-                    final_aws_resources.append(aws_resource)
+        resource_graph = ResourceGraph(
+            resources_to_delete,
+            install_order=AwsResourceInstallOrder,
+            type_dependencies=AwsResourceDependencies,
+            reverse=True,
+        )
+        final_aws_resources: List[AwsResource] = resource_graph.ordered()  # type: ignore
 
         # Track the total number of AwsResources to delete for validation
         num_resources_to_delete: int = len(final_aws_resources)
-        num_resources_deleted: int = 0
         if num_resources_to_delete == 0:
             return 0, 0
 
@@ -362,22 +318,33 @@ class AwsResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_aws_resources:
+        def _delete(resource: AwsResource) -> bool:
             print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
             if force is True:
                 resource.force = True
-            # logger.debug(resource)
             try:
-                _resource_deleted = resource.delete(aws_client=self.aws_client)
-                if _resource_deleted:
-                    num_resources_deleted += 1
-                else:
-                    if self.workspace_settings is not None and not self.workspace_settings.continue_on_delete_failure:
-                        return num_resources_deleted, num_resources_to_delete
+                return resource.delete(aws_client=self.aws_client)
             except Exception as e:
                 logger.error(f"Failed to delete {resource.get_resource_type()}: {resource.get_resource_name()}")
                 logger.error(e)
                 logger.error("Please fix and try again...")
+                return False
+
+        # Create the boto3 session before resources are deleted concurrently
+        self.aws_client.boto3_session
+
+        # State is read with one batched call per resource type and cached for this operation
+        self.aws_client.state_cache.clear()
+        for resource in final_aws_resources:
+            resource.register_state(self.aws_client)
+
+        # Independent resources are deleted concurrently, each after the resources it depends on
+        num_resources_deleted = resource_graph.run(
+            _delete,
+            max_workers=self.get_max_concurrent_resources(),
+            stop_on_failure=self.workspace_settings is not None
+            and not self.workspace_settings.continue_on_delete_failure,
+        )
 
         print_heading(f"\n--**-- Resources deleted: {num_resources_deleted}/{num_resources_to_delete}")
         if num_resources_to_delete != num_resources_deleted:
@@ -396,7 +363,7 @@ class AwsResources(InfraResources):
         force: Optional[bool] = None,
         pull: Optional[bool] = None,
     ) -> Tuple[int, int]:
-        from agno.aws.resource.types import AwsResourceInstallOrder
+        from agno.aws.resource.types import AwsResourceDependencies, AwsResourceInstallOrder
         from agno.cli.console import confirm_yes_no, print_heading, print_info
 
         logger.debug("-*- Updating AwsResources")
@@ -442,41 +409,17 @@ class AwsResources(InfraResources):
                         ):
                             resources_to_update.append(app_resource)
 
-        # Sort the AwsResources in install order
-        resources_to_update.sort(key=lambda x: AwsResourceInstallOrder.get(x.__class__.__name__, 5000))
-
-        # Deduplicate AwsResources
-        deduped_resources_to_update: List[AwsResource] = []
-        for r in resources_to_update:
-            if r not in deduped_resources_to_update:
-                deduped_resources_to_update.append(r)
-
-        # Implement dependency sorting
-        final_aws_resources: List[AwsResource] = []
+        # Build the dependency graph of AwsResources
         logger.debug("-*- Building AwsResources dependency graph")
-        for aws_resource in deduped_resources_to_update:
-            # Logic to follow if resource has dependencies
-            if aws_resource.depends_on is not None and len(aws_resource.depends_on) > 0:
-                # Add the dependencies before the resource itself
-                for dep in aws_resource.depends_on:
-                    if isinstance(dep, AwsResource):
-                        if dep not in final_aws_resources:
-                            logger.debug(f"-*- Adding {dep.name}, dependency of {aws_resource.name}")
-                            final_aws_resources.append(dep)
-
-                # Add the resource to be created after its dependencies
-                if aws_resource not in final_aws_resources:
-                    logger.debug(f"-*- Adding {aws_resource.name}")
-                    final_aws_resources.append(aws_resource)
-            else:
-                # Add the resource to be created if it has no dependencies
-                if aws_resource not in final_aws_resources:
-                    logger.debug(f"-*- Adding {aws_resource.name}")
-                    final_aws_resources.append(aws_resource)
+        resource_graph = ResourceGraph(
+            resources_to_update,
+            install_order=AwsResourceInstallOrder,
+            type_dependencies=AwsResourceDependencies,
+        )
+        final_aws_resources: List[AwsResource] = resource_graph.ordered()  # type: ignore
 
         # Track the total number of AwsResources to update for validation
         num_resources_to_update: int = len(final_aws_resources)
-        num_resources_updated: int = 0
         if num_resources_to_update == 0:
             return 0, 0
 
@@ -510,22 +453,33 @@ class AwsResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_aws_resources:
+        def _update(resource: AwsResource) -> bool:
             print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
             if force is True:
                 resource.force = True
-            # logger.debug(resource)
             try:
-                _resource_updated = resource.update(aws_client=self.aws_client)
-                if _resource_updated:
-                    num_resources_updated += 1
-                else:
-                    if self.workspace_settings is not None and not self.workspace_settings.continue_on_patch_failure:
-                        return num_resources_updated, num_resources_to_update
+                return resource.update(aws_client=self.aws_client)
             except Exception as e:
                 logger.error(f"Failed to update {resource.get_resource_type()}: {resource.get_resource_name()}")
                 logger.error(e)
                 logger.error("Please fix and try again...")
+                return False
+
+        # Create the boto3 session before resources are updated concurrently
+        self.aws_client.boto3_session
+
+        # State is read with one batched call per resource type and cached for this operation
+        self.aws_client.state_cache.clear()
+        for resource in final_aws_resources:
+            resource.register_state(self.aws_client)
+
+        # Independent resources are updated concurrently, each after the resources it depends on
+        num_resources_updated = resource_graph.run(
+            _update,
+            max_workers=self.get_max_concurrent_resources(),
+            stop_on_failure=self.workspace_settings is not None
+            and not self.workspace_settings.continue_on_patch_failure,
+        )
 
         print_heading(f"\n--**-- Resources updated: {num_resources_updated}/{num_resources_to_update}")
         if num_resources_to_update != num_resources_updated:
@@ -1,5 +1,6 @@
 from typing import Any, Optional
 
+from agno.infra.state import ResourceStateCache
 from agno.utils.log import logger
 
 
@@ -11,6 +12,8 @@ class DockerApiClient:
 
         # DockerClient
         self._api_client: Optional[Any] = None
+        # State of the resources read during the current operation
+        self.state_cache = ResourceStateCache()
         logger.debug("**-+-** DockerApiClient created")
 
     def create_api_client(self) -> Optional[Any]:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from agno.cli.console import print_info
 from agno.docker.api_client import DockerApiClient
@@ -31,10 +31,47 @@ class DockerResource(InfraResource):
         self.docker_client = DockerApiClient()
         return self.docker_client
 
+    def get_state_key(self) -> Optional[str]:
+        """Key of the resource in the state cache, resources that return None are always read on their own"""
+        return None
+
+    def _read_batch(self, docker_client: DockerApiClient, keys: List[str]) -> Optional[Dict[str, Any]]:
+        """Reads the resources of this type with `keys` in one API call, by state key"""
+        logger.warning(f"@_read_batch method not defined for {self.get_resource_name()}")
+        return None
+
     def _read(self, docker_client: DockerApiClient) -> Any:
         logger.warning(f"@_read method not defined for {self.get_resource_name()}")
         return True
 
+    def _read_state(self, docker_client: DockerApiClient) -> Any:
+        """Reads the resource using the state cache of the docker_client, resources of a type are listed together"""
+        state_key = self.get_state_key()
+        if not self.use_cache or state_key is None:
+            return self._read(docker_client)
+
+        state = docker_client.state_cache.get(
+            self.get_resource_type(),
+            state_key,
+            load_group=lambda keys: self._read_batch(docker_client, keys),
+            load_one=lambda: self._read(docker_client),
+        )
+        if state is not None:
+            self.active_resource = state
+        return state
+
+    def register_state(self, docker_client: DockerApiClient) -> None:
+        """Registers the resource with the state cache, so it is read in the same batch as the other resources"""
+        state_key = self.get_state_key()
+        if self.use_cache and state_key is not None:
+            docker_client.state_cache.register(self.get_resource_type(), state_key)
+
+    def _invalidate_state(self, docker_client: DockerApiClient) -> None:
+        """Drops the cached state of the resource, called when the resource is changed"""
+        state_key = self.get_state_key()
+        if state_key is not None:
+            docker_client.state_cache.invalidate(self.get_resource_type(), state_key)
+
     def read(self, docker_client: DockerApiClient) -> Any:
         """Reads the resource from the docker cluster"""
         # Step 1: Use cached value if available
@@ -48,11 +85,11 @@ class DockerResource(InfraResource):
 
         # Step 3: Read resource
         client: DockerApiClient = docker_client or self.get_docker_client()
-        return self._read(client)
+        return self._read_state(client)
 
     def is_active(self, docker_client: DockerApiClient) -> bool:
         """Returns True if the active is active on the docker cluster"""
-        self.active_resource = self._read(docker_client=docker_client)
+        self.active_resource = self._read_state(docker_client)
         return True if self.active_resource is not None else False
 
     def _create(self, docker_client: DockerApiClient) -> bool:
@@ -74,7 +111,10 @@ class DockerResource(InfraResource):
             print_info(f"{self.get_resource_type()}: {self.get_resource_name()} already exists")
         # Step 3: Create the resource
         else:
-            self.resource_created = self._create(client)
+            try:
+                self.resource_created = self._create(client)
+            finally:
+                self._invalidate_state(client)
             if self.resource_created:
                 print_info(f"{self.get_resource_type()}: {self.get_resource_name()} created")
 
@@ -105,7 +145,10 @@ class DockerResource(InfraResource):
         # Step 2: Update the resource
         client: DockerApiClient = docker_client or self.get_docker_client()
         if self.is_active(client):
-            self.resource_updated = self._update(client)
+            try:
+                self.resource_updated = self._update(client)
+            finally:
+                self._invalidate_state(client)
         else:
             print_info(f"{self.get_resource_type()}: {self.get_resource_name()} not active, creating...")
             return self.create(client)
@@ -138,7 +181,10 @@ class DockerResource(InfraResource):
         # Step 2: Delete the resource
         client: DockerApiClient = docker_client or self.get_docker_client()
         if self.is_active(client):
-            self.resource_deleted = self._delete(client)
+            try:
+                self.resource_deleted = self._delete(client)
+            finally:
+                self._invalidate_state(client)
         else:
             print_info(f"{self.get_resource_type()}: {self.get_resource_name()} does not exist")
             return True
@@ -181,7 +181,7 @@ class DockerContainer(DockerResource):
         from docker.models.containers import Container
 
         logger.debug("Creating: {}".format(self.get_resource_name()))
-        container_object: Optional[Container] = self._read(docker_client)
+        container_object: Optional[Container] = self._read_state(docker_client)
 
         # Delete the container if it exists
         if container_object is not None:
@@ -230,6 +230,19 @@ class DockerContainer(DockerResource):
         logger.debug("Container not found")
         return False
 
+    def get_state_key(self) -> Optional[str]:
+        return self.name
+
+    def _read_batch(self, docker_client: DockerApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Lists the containers with these names in one call"""
+        from docker import DockerClient
+        from docker.models.containers import Container
+
+        _api_client: DockerClient = docker_client.api_client
+        # The name filter matches substrings, so only exact matches are kept
+        container_list: Optional[List[Container]] = _api_client.containers.list(all=True, filters={"name": keys})
+        return {container.name: container for container in container_list or [] if container.name in keys}
+
     def _read(self, docker_client: DockerApiClient) -> Optional[Any]:
         """Returns a Container object if the container is active
 
@@ -276,7 +289,7 @@ class DockerContainer(DockerResource):
 
         logger.debug("Deleting: {}".format(self.get_resource_name()))
         container_name: Optional[str] = self.name
-        container_object: Optional[Container] = self._read(docker_client)
+        container_object: Optional[Container] = self._read_state(docker_client)
         # Return True if there is no Container to delete
         if container_object is None:
             return True
@@ -334,7 +347,10 @@ class DockerContainer(DockerResource):
                 print_info(f"{self.get_resource_type()}: {self.get_resource_name()} already exists")
                 return True
 
-        resource_created = self._create(docker_client=docker_client)
+        try:
+            resource_created = self._create(docker_client=docker_client)
+        finally:
+            self._invalidate_state(docker_client)
         if resource_created:
             print_info(f"{self.get_resource_type()}: {self.get_resource_name()} created")
             return True
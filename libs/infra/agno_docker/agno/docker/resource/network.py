@@ -67,6 +67,18 @@ class DockerNetwork(DockerResource):
         logger.debug("Network not found")
         return False
 
+    def get_state_key(self) -> Optional[str]:
+        return self.name
+
+    def _read_batch(self, docker_client: DockerApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Lists the networks in one call"""
+        from docker import DockerClient
+        from docker.models.networks import Network
+
+        _api_client: DockerClient = docker_client.api_client
+        network_list: Optional[List[Network]] = _api_client.networks.list()
+        return {network.name: network for network in network_list or [] if network.name in keys}
+
     def _read(self, docker_client: DockerApiClient) -> Any:
         """Returns a Network object if the network is active
 
@@ -103,7 +115,7 @@ class DockerNetwork(DockerResource):
         from docker.models.networks import Network
 
         logger.debug("Deleting: {}".format(self.get_resource_name()))
-        network_object: Optional[Network] = self._read(docker_client)
+        network_object: Optional[Network] = self._read_state(docker_client)
         # Return True if there is no Network to delete
         if network_object is None:
             return True
@@ -30,3 +30,11 @@ DockerResourceTypeList: List[Type[DockerResource]] = [
 DockerResourceInstallOrder: Dict[str, int] = OrderedDict(
     {resource_type.__name__: idx for idx, resource_type in enumerate(DockerResourceTypeList, start=1)}
 )
+
+# Maps each DockerResource to the resource types it needs, used to create independent resources concurrently
+DockerResourceDependencies: Dict[str, List[str]] = {
+    "DockerNetwork": [],
+    "DockerImage": [],
+    "DockerVolume": [],
+    "DockerContainer": ["DockerNetwork", "DockerImage", "DockerVolume"],
+}
@@ -70,6 +70,18 @@ class DockerVolume(DockerResource):
             return True
         return False
 
+    def get_state_key(self) -> Optional[str]:
+        return self.name
+
+    def _read_batch(self, docker_client: DockerApiClient, keys: List[str]) -> Dict[str, Any]:
+        """Lists the volumes in one call"""
+        from docker import DockerClient
+        from docker.models.volumes import Volume
+
+        _api_client: DockerClient = docker_client.api_client
+        volume_list: Optional[List[Volume]] = _api_client.volumes.list()
+        return {volume.name: volume for volume in volume_list or [] if volume.name in keys}
+
     def _read(self, docker_client: DockerApiClient) -> Any:
         """Returns a Volume object if the volume is active on the docker_client"""
         from docker import DockerClient
@@ -104,7 +116,7 @@ class DockerVolume(DockerResource):
         from docker.models.volumes import Volume
 
         logger.debug("Deleting: {}".format(self.get_resource_name()))
-        volume_object: Optional[Volume] = self._read(docker_client)
+        volume_object: Optional[Volume] = self._read_state(docker_client)
         # Return True if there is no Volume to delete
         if volume_object is None:
             return True
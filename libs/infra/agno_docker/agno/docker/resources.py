@@ -4,6 +4,7 @@ from agno.docker.api_client import DockerApiClient
 from agno.docker.app.base import DockerApp
 from agno.docker.context import DockerBuildContext
 from agno.docker.resource.base import DockerResource
+from agno.infra.graph import ResourceGraph
 from agno.infra.resources import InfraResources
 from agno.utils.log import logger
 from agno.workspace.settings import WorkspaceSettings
@@ -39,7 +40,11 @@ class DockerResources(InfraResources):
         pull: Optional[bool] = None,
     ) -> Tuple[int, int]:
         from agno.cli.console import confirm_yes_no, print_heading, print_info
-        from agno.docker.resource.types import DockerContainer, DockerResourceInstallOrder
+        from agno.docker.resource.types import (
+            DockerContainer,
+            DockerResourceDependencies,
+            DockerResourceInstallOrder,
+        )
 
         logger.debug("-*- Creating DockerResources")
         # Build a list of DockerResources to create
@@ -95,45 +100,17 @@ class DockerResources(InfraResources):
                         ):
                             resources_to_create.append(app_resource)
 
-        # Sort the DockerResources in install order
-        resources_to_create.sort(key=lambda x: DockerResourceInstallOrder.get(x.__class__.__name__, 5000))
-
-        # Deduplicate DockerResources
-        deduped_resources_to_create: List[DockerResource] = []
-        for r in resources_to_create:
-            if r not in deduped_resources_to_create:
-                deduped_resources_to_create.append(r)
-
-        # Implement dependency sorting
-        final_docker_resources: List[DockerResource] = []
+        # Build the dependency graph of DockerResources
         logger.debug("-*- Building DockerResources dependency graph")
-        for docker_resource in deduped_resources_to_create:
-            # Logic to follow if resource has dependencies
-            if docker_resource.depends_on is not None:
-                # Add the dependencies before the resource itself
-                for dep in docker_resource.depends_on:
-                    if isinstance(dep, DockerResource):
-                        if dep not in final_docker_resources:
-                            logger.debug(f"-*- Adding {dep.name}, dependency of {docker_resource.name}")
-                            final_docker_resources.append(dep)
-
-                # Add the resource to be created after its dependencies
-                if docker_resource not in final_docker_resources:
-                    logger.debug(
-                        f"-*- Adding {docker_resource.get_resource_type()}: {docker_resource.get_resource_name()}"
-                    )
-                    final_docker_resources.append(docker_resource)
-            else:
-                # Add the resource to be created if it has no dependencies
-                if docker_resource not in final_docker_resources:
-                    logger.debug(
-                        f"-*- Adding {docker_resource.get_resource_type()}: {docker_resource.get_resource_name()}"
-                    )
-                    final_docker_resources.append(docker_resource)
+        resource_graph = ResourceGraph(
+            resources_to_create,
+            install_order=DockerResourceInstallOrder,
+            type_dependencies=DockerResourceDependencies,
+        )
+        final_docker_resources: List[DockerResource] = resource_graph.ordered()  # type: ignore
 
         # Track the total number of DockerResources to create for validation
         num_resources_to_create: int = len(final_docker_resources)
-        num_resources_created: int = 0
         if num_resources_to_create == 0:
             return 0, 0
 
@@ -159,7 +136,7 @@ class DockerResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_docker_resources:
+        def _create(resource: DockerResource) -> bool:
             print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
             if force is True:
                 resource.force = True
@@ -168,18 +145,26 @@ class DockerResources(InfraResources):
             if isinstance(resource, DockerContainer):
                 if resource.network is None and self.network is not None:
                     resource.network = self.network
-            # logger.debug(resource)
             try:
-                _resource_created = resource.create(docker_client=self.docker_client)
-                if _resource_created:
-                    num_resources_created += 1
-                else:
-                    if self.workspace_settings is not None and not self.workspace_settings.continue_on_create_failure:
-                        return num_resources_created, num_resources_to_create
+                return resource.create(docker_client=self.docker_client)
             except Exception as e:
                 logger.error(f"Failed to create {resource.get_resource_type()}: {resource.get_resource_name()}")
                 logger.error(e)
                 logger.error("Please fix and try again...")
+                return False
+
+        # State is read with one batched call per resource type and cached for this operation
+        self.docker_client.state_cache.clear()
+        for resource in final_docker_resources:
+            resource.register_state(self.docker_client)
+
+        # Independent resources are created concurrently, each after the resources it depends on
+        num_resources_created = resource_graph.run(
+            _create,
+            max_workers=self.get_max_concurrent_resources(),
+            stop_on_failure=self.workspace_settings is not None
+            and not self.workspace_settings.continue_on_create_failure,
+        )
 
         print_heading(f"\n--**-- Resources created: {num_resources_created}/{num_resources_to_create}")
         if num_resources_to_create != num_resources_created:
@@ -198,7 +183,11 @@ class DockerResources(InfraResources):
         force: Optional[bool] = None,
     ) -> Tuple[int, int]:
         from agno.cli.console import confirm_yes_no, print_heading, print_info
-        from agno.docker.resource.types import DockerContainer, DockerResourceInstallOrder
+        from agno.docker.resource.types import (
+            DockerContainer,
+            DockerResourceDependencies,
+            DockerResourceInstallOrder,
+        )
 
         logger.debug("-*- Deleting DockerResources")
         # Build a list of DockerResources to delete
@@ -254,50 +243,18 @@ class DockerResources(InfraResources):
                     #                     if isinstance(dep_resource, DockerResource):
                     #                         resources_to_delete.append(dep_resource)
 
-        # Sort the DockerResources in install order
-        resources_to_delete.sort(key=lambda x: DockerResourceInstallOrder.get(x.__class__.__name__, 5000), reverse=True)
-
-        # Deduplicate DockerResources
-        deduped_resources_to_delete: List[DockerResource] = []
-        for r in resources_to_delete:
-            if r not in deduped_resources_to_delete:
-                deduped_resources_to_delete.append(r)
-
-        # Implement dependency sorting
-        final_docker_resources: List[DockerResource] = []
+        # Build the dependency graph of DockerResources
         logger.debug("-*- Building DockerResources dependency graph")
-        for docker_resource in deduped_resources_to_delete:
-            # Logic to follow if resource has dependencies
-            if docker_resource.depends_on is not None:
-                # 1. Reverse the order of dependencies
-                docker_resource.depends_on.reverse()
-
-                # 2. Remove the dependencies if they are already added to the final_docker_resources
-                for dep in docker_resource.depends_on:
-                    if dep in final_docker_resources:
-                        logger.debug(f"-*- Removing {dep.name}, dependency of {docker_resource.name}")
-                        final_docker_resources.remove(dep)
-
-                # 3. Add the resource to be deleted before its dependencies
-                if docker_resource not in final_docker_resources:
-                    logger.debug(f"-*- Adding {docker_resource.name}")
-                    final_docker_resources.append(docker_resource)
-
-                # 4. Add the dependencies back in reverse order
-                for dep in docker_resource.depends_on:
-                    if isinstance(dep, DockerResource):
-                        if dep not in final_docker_resources:
-                            logger.debug(f"-*- Adding {dep.name}, dependency of {docker_resource.name}")
-                            final_docker_resources.append(dep)
-            else:
-                # Add the resource to be deleted if it has no dependencies
-                if docker_resource not in final_docker_resources:
-                    logger.debug(f"-*- Adding {docker_resource.name}")
-                    final_docker_resources.append(docker_resource)
+        resource_graph = ResourceGraph(
+            resources_to_delete,
+            install_order=DockerResourceInstallOrder,
+            type_dependencies=DockerResourceDependencies,
+            reverse=True,
+        )
+        final_docker_resources: List[DockerResource] = resource_graph.ordered()  # type: ignore
 
         # Track the total number of DockerResources to delete for validation
         num_resources_to_delete: int = len(final_docker_resources)
-        num_resources_deleted: int = 0
         if num_resources_to_delete == 0:
             return 0, 0
 
@@ -325,25 +282,33 @@ class DockerResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_docker_resources:
+        def _delete(resource: DockerResource) -> bool:
             print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
             if force is True:
                 resource.force = True
             if isinstance(resource, DockerContainer):
                 if resource.network is None and self.network is not None:
                     resource.network = self.network
-            # logger.debug(resource)
             try:
-                _resource_deleted = resource.delete(docker_client=self.docker_client)
-                if _resource_deleted:
-                    num_resources_deleted += 1
-                else:
-                    if self.workspace_settings is not None and not self.workspace_settings.continue_on_delete_failure:
-                        return num_resources_deleted, num_resources_to_delete
+                return resource.delete(docker_client=self.docker_client)
             except Exception as e:
                 logger.error(f"Failed to delete {resource.get_resource_type()}: {resource.get_resource_name()}")
                 logger.error(e)
                 logger.error("Please fix and try again...")
+                return False
+
+        # State is read with one batched call per resource type and cached for this operation
+        self.docker_client.state_cache.clear()
+        for resource in final_docker_resources:
+            resource.register_state(self.docker_client)
+
+        # Independent resources are deleted concurrently, each after the resources it depends on
+        num_resources_deleted = resource_graph.run(
+            _delete,
+            max_workers=self.get_max_concurrent_resources(),
+            stop_on_failure=self.workspace_settings is not None
+            and not self.workspace_settings.continue_on_delete_failure,
+        )
 
         print_heading(f"\n--**-- Resources deleted: {num_resources_deleted}/{num_resources_to_delete}")
         if num_resources_to_delete != num_resources_deleted:
@@ -363,7 +328,11 @@ class DockerResources(InfraResources):
         pull: Optional[bool] = None,
     ) -> Tuple[int, int]:
         from agno.cli.console import confirm_yes_no, print_heading, print_info
-        from agno.docker.resource.types import DockerContainer, DockerResourceInstallOrder
+        from agno.docker.resource.types import (
+            DockerContainer,
+            DockerResourceDependencies,
+            DockerResourceInstallOrder,
+        )
 
         logger.debug("-*- Updating DockerResources")
         # Build a list of DockerResources to update
@@ -419,41 +388,18 @@ class DockerResources(InfraResources):
                         ):
                             resources_to_update.append(app_resource)
 
-        # Sort the DockerResources in install order
-        resources_to_update.sort(key=lambda x: DockerResourceInstallOrder.get(x.__class__.__name__, 5000), reverse=True)
-
-        # Deduplicate DockerResources
-        deduped_resources_to_update: List[DockerResource] = []
-        for r in resources_to_update:
-            if r not in deduped_resources_to_update:
-                deduped_resources_to_update.append(r)
-
-        # Implement dependency sorting
-        final_docker_resources: List[DockerResource] = []
+        # Build the dependency graph of DockerResources
         logger.debug("-*- Building DockerResources dependency graph")
-        for docker_resource in deduped_resources_to_update:
-            # Logic to follow if resource has dependencies
-            if docker_resource.depends_on is not None:
-                # Add the dependencies before the resource itself
-                for dep in docker_resource.depends_on:
-                    if isinstance(dep, DockerResource):
-                        if dep not in final_docker_resources:
-                            logger.debug(f"-*- Adding {dep.name}, dependency of {docker_resource.name}")
-                            final_docker_resources.append(dep)
-
-                # Add the resource to be created after its dependencies
-                if docker_resource not in final_docker_resources:
-                    logger.debug(f"-*- Adding {docker_resource.name}")
-                    final_docker_resources.append(docker_resource)
-            else:
-                # Add the resource to be created if it has no dependencies
-                if docker_resource not in final_docker_resources:
-                    logger.debug(f"-*- Adding {docker_resource.name}")
-                    final_docker_resources.append(docker_resource)
+        resource_graph = ResourceGraph(
+            resources_to_update,
+            install_order=DockerResourceInstallOrder,
+            type_dependencies=DockerResourceDependencies,
+            reverse=True,
+        )
+        final_docker_resources: List[DockerResource] = resource_graph.ordered()  # type: ignore
 
         # Track the total number of DockerResources to update for validation
         num_resources_to_update: int = len(final_docker_resources)
-        num_resources_updated: int = 0
         if num_resources_to_update == 0:
             return 0, 0
 
@@ -481,7 +427,7 @@ class DockerResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_docker_resources:
+        def _update(resource: DockerResource) -> bool:
             print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
             if force is True:
                 resource.force = True
@@ -490,18 +436,26 @@ class DockerResources(InfraResources):
             if isinstance(resource, DockerContainer):
                 if resource.network is None and self.network is not None:
                     resource.network = self.network
-            # logger.debug(resource)
             try:
-                _resource_updated = resource.update(docker_client=self.docker_client)
-                if _resource_updated:
-                    num_resources_updated += 1
-                else:
-                    if self.workspace_settings is not None and not self.workspace_settings.continue_on_patch_failure:
-                        return num_resources_updated, num_resources_to_update
+                return resource.update(docker_client=self.docker_client)
             except Exception as e:
                 logger.error(f"Failed to update {resource.get_resource_type()}: {resource.get_resource_name()}")
                 logger.error(e)
                 logger.error("Please fix and try again...")
+                return False
+
+        # State is read with one batched call per resource type and cached for this operation
+        self.docker_client.state_cache.clear()
+        for resource in final_docker_resources:
+            resource.register_state(self.docker_client)
+
+        # Independent resources are updated concurrently, each after the resources it depends on
+        num_resources_updated = resource_graph.run(
+            _update,
+            max_workers=self.get_max_concurrent_resources(),
+            stop_on_failure=self.workspace_settings is not None
+            and not self.workspace_settings.continue_on_patch_failure,
+        )
 
         print_heading(f"\n--**-- Resources updated: {num_resources_updated}/{num_resources_to_update}")
         if num_resources_to_update != num_resources_updated: